@@ -1,6 +1,6 @@
 from flask import Flask
 import os
-from src.controllers import analysis_bp
+from src.controllers import analysis_bp, analysis_controller
 from src.config import config
 from src.utils import setup_logging
 
@@ -12,6 +12,7 @@ def create_app(config_name: str = None) -> Flask:
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     setup_logging(app.config.get('LOG_LEVEL', 'INFO'))
+    analysis_controller.init_app(app)
     app.register_blueprint(analysis_bp)
 
     return app
@@ -20,7 +21,7 @@ def create_app(config_name: str = None) -> Flask:
 if __name__ == '__main__':
     app = create_app()
     app.run(
-        debug=app.config.get('DEBUG', True),
+        debug=app.config.get('DEBUG', False),
         host=app.config.get('HOST', '0.0.0.0'),
         port=app.config.get('PORT', 8082)
     )
@@ -0,0 +1,18 @@
+import os
+from flask import Config
+from src.config import config
+from src.controllers import AsyncAnalysisController
+from src.utils import setup_logging
+
+
+def create_asgi_app(config_name: str = None) -> AsyncAnalysisController:
+    if config_name is None:
+        config_name = os.getenv('FLASK_ENV', 'default')
+
+    app_config = Config(os.path.dirname(os.path.abspath(__file__)))
+    app_config.from_object(config[config_name])
+    setup_logging(app_config.get('LOG_LEVEL', 'INFO'))
+    return AsyncAnalysisController.from_config(app_config)
+
+
+app = create_asgi_app()
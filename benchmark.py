@@ -0,0 +1,7 @@
+import sys
+from app import create_app
+from src.benchmark import main
+
+
+if __name__ == '__main__':
+    sys.exit(main(create_app=create_app))
@@ -0,0 +1,8 @@
+import os
+from flask import Config
+from src.config import ServerConfig, config as environments
+
+_app_config = Config(os.path.dirname(os.path.abspath(__file__)))
+_app_config.from_object(environments.get(os.getenv('FLASK_ENV', 'production'), environments['production']))
+
+globals().update(ServerConfig.gunicorn_options(_app_config))
@@ -0,0 +1,16 @@
+from .fake_upstream_servers import FakeUpstreamServer, FakeJobBoardServer, FakeCompletionServer, FakeRedisServer
+from .benchmark_runner import BenchmarkRunner, BenchmarkReport, StageTimer
+from .benchmark_cli import main
+from .parser_benchmark import ParserBenchmark
+
+__all__ = [
+    'FakeUpstreamServer',
+    'FakeJobBoardServer',
+    'FakeCompletionServer',
+    'FakeRedisServer',
+    'BenchmarkRunner',
+    'BenchmarkReport',
+    'StageTimer',
+    'ParserBenchmark',
+    'main'
+]
@@ -0,0 +1,107 @@
+import argparse
+import contextlib
+import io
+import json
+from typing import Callable, List, Optional
+
+from flask import Flask
+from src.controllers import analysis_controller
+from .benchmark_runner import BenchmarkRunner, StageTimer
+from .fake_upstream_servers import FakeCompletionServer, FakeJobBoardServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark de /analyse com servidores locais simulando vagas e a API de completion"
+    )
+    parser.add_argument('--requests', type=int, default=200, help="Total de requisições")
+    parser.add_argument('--concurrency', type=int, default=10, help="Requisições simultâneas")
+    parser.add_argument('--positions', type=int, default=50, help="Quantidade de URLs de vagas distintas")
+    parser.add_argument('--skills', default='Python,Flask,SQL,Docker', help="Habilidades separadas por vírgula")
+    parser.add_argument('--page-latency-ms', type=float, default=50, help="Latência do servidor de vagas")
+    parser.add_argument('--page-size', type=int, default=64 * 1024, help="Tamanho da página de vaga em bytes")
+    parser.add_argument('--page-error-rate', type=float, default=0.0, help="Fração de páginas com erro 503")
+    parser.add_argument('--completion-latency-ms', type=float, default=300, help="Latência da API de completion")
+    parser.add_argument('--completion-error-rate', type=float, default=0.0, help="Fração de completions com erro 503")
+    parser.add_argument('--with-cache', action='store_true', help="Mantém os caches de páginas e análises ativos")
+    parser.add_argument('--seed', type=int, default=None, help="Semente para a injeção de erros")
+    parser.add_argument('--json', action='store_true', help="Imprime o relatório em JSON")
+    parser.add_argument('--verbose', action='store_true', help="Mostra os logs da aplicação durante o benchmark")
+    parser.add_argument('--max-p95-ms', type=float, default=None, help="Falha se o p95 total ultrapassar este valor")
+    parser.add_argument('--max-error-rate', type=float, default=None, help="Falha se a taxa de erro ultrapassar este valor")
+    return parser
+
+
+def configure_app(app: Flask, completion_url: str, args: argparse.Namespace) -> None:
+    app.config.update(
+        OPENAI_API_KEY='benchmark',
+        OPENAI_API_URL=f"{completion_url}/chat/completions",
+        PAGE_CACHE_ENABLED=args.with_cache,
+        ANALYSIS_CACHE_ENABLED=args.with_cache,
+        HTTP_POOL_MAXSIZE=max(args.concurrency, app.config.get('HTTP_POOL_MAXSIZE', 10))
+    )
+    analysis_controller.init_app(app)
+
+
+def main(argv: Optional[List[str]] = None, create_app: Callable[[], Flask] = None) -> int:
+    args = build_parser().parse_args(argv)
+    skills = [skill.strip() for skill in args.skills.split(',') if skill.strip()]
+
+    job_board = FakeJobBoardServer(
+        latency=args.page_latency_ms / 1000,
+        error_rate=args.page_error_rate,
+        page_size=args.page_size,
+        seed=args.seed
+    )
+    completion = FakeCompletionServer(
+        latency=args.completion_latency_ms / 1000,
+        error_rate=args.completion_error_rate,
+        seed=args.seed
+    )
+
+    with job_board, completion:
+        app = create_app()
+        configure_app(app, completion.url, args)
+
+        stage_timer = StageTimer()
+        stage_timer.instrument(analysis_controller.analysis_service)
+
+        runner = BenchmarkRunner(
+            app,
+            positions=[job_board.job_url(index) for index in range(max(1, args.positions))],
+            skills=skills,
+            total_requests=args.requests,
+            concurrency=args.concurrency,
+            stage_timer=stage_timer
+        )
+
+        if not args.json:
+            print(f"[BENCHMARK] Executando {args.requests} requisições com concorrência {args.concurrency}")
+        logs = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with logs:
+            report = runner.run()
+
+    summary = report.summary()
+    summary['upstreams'] = {
+        'job_board': {'requests': job_board.requests, 'errors': job_board.errors},
+        'completion': {'requests': completion.requests, 'errors': completion.errors}
+    }
+
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        print(report.format())
+        print(f"\nUpstreams: {summary['upstreams']}")
+
+    return _check_thresholds(summary, args)
+
+
+def _check_thresholds(summary: dict, args: argparse.Namespace) -> int:
+    failed = False
+    if args.max_p95_ms is not None and summary['latency']['p95_ms'] > args.max_p95_ms:
+        print(f"[BENCHMARK] ERRO: p95 de {summary['latency']['p95_ms']}ms acima do limite de {args.max_p95_ms}ms")
+        failed = True
+    if args.max_error_rate is not None and summary['error_rate'] > args.max_error_rate:
+        print(f"[BENCHMARK] ERRO: taxa de erro {summary['error_rate']} acima do limite de {args.max_error_rate}")
+        failed = True
+    return 1 if failed else 0
@@ -0,0 +1,170 @@
+import math
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+import requests
+from flask import Flask
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+
+    def log_request(self, code='-', size='-'):
+        pass
+
+
+class StageTimer:
+
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - started)
+        return timed
+
+    def record(self, stage: str, duration: float) -> None:
+        with self._lock:
+            self.timings[stage].append(duration)
+
+    def instrument(self, analysis_service) -> None:
+        web_scraper = analysis_service.web_scraper
+        text_processor = analysis_service.text_processor
+        openai_service = analysis_service.openai_service
+
+        web_scraper.fetch_meta_description = self.wrap('scrape', web_scraper.fetch_meta_description)
+        text_processor.format_description = self.wrap('format', text_processor.format_description)
+        openai_service.analyze_match = self.wrap('completion', openai_service.analyze_match)
+
+
+@dataclass
+class BenchmarkReport:
+    duration: float
+    latencies: List[float]
+    status_counts: Dict[str, int]
+    stage_timings: Dict[str, List[float]] = field(default_factory=dict)
+
+    @property
+    def total_requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def failures(self) -> int:
+        return sum(count for status, count in self.status_counts.items() if status != '200')
+
+    @property
+    def throughput(self) -> float:
+        return self.total_requests / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failures / self.total_requests if self.total_requests else 0.0
+
+    @staticmethod
+    def percentile(values: List[float], percent: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    @classmethod
+    def distribution(cls, values: List[float]) -> dict:
+        return {
+            'count': len(values),
+            'p50_ms': round(cls.percentile(values, 50) * 1000, 2),
+            'p95_ms': round(cls.percentile(values, 95) * 1000, 2),
+            'p99_ms': round(cls.percentile(values, 99) * 1000, 2),
+            'max_ms': round(max(values, default=0.0) * 1000, 2)
+        }
+
+    def summary(self) -> dict:
+        return {
+            'requests': self.total_requests,
+            'failures': self.failures,
+            'error_rate': round(self.error_rate, 4),
+            'duration_s': round(self.duration, 3),
+            'throughput_rps': round(self.throughput, 2),
+            'status_counts': dict(self.status_counts),
+            'latency': self.distribution(self.latencies),
+            'stages': {stage: self.distribution(values) for stage, values in self.stage_timings.items()}
+        }
+
+    def format(self) -> str:
+        summary = self.summary()
+        lines = [
+            f"Requisições: {summary['requests']} ({summary['failures']} falhas, status {summary['status_counts']})",
+            f"Duração: {summary['duration_s']}s | Throughput: {summary['throughput_rps']} req/s",
+            "",
+            f"{'etapa':<12}{'n':>8}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}{'max ms':>12}"
+        ]
+        rows = [('total', summary['latency'])] + list(summary['stages'].items())
+        for name, stats in rows:
+            lines.append(
+                f"{name:<12}{stats['count']:>8}{stats['p50_ms']:>12}{stats['p95_ms']:>12}"
+                f"{stats['p99_ms']:>12}{stats['max_ms']:>12}"
+            )
+        return "\n".join(lines)
+
+
+class BenchmarkRunner:
+
+    def __init__(self, app: Flask, positions: List[str], skills: List[str], total_requests: int = 100,
+                 concurrency: int = 10, path: str = '/analyse', timeout: float = 60,
+                 stage_timer: StageTimer = None):
+        self.app = app
+        self.positions = positions
+        self.skills = skills
+        self.total_requests = total_requests
+        self.concurrency = concurrency
+        self.path = path
+        self.timeout = timeout
+        self.stage_timer = stage_timer or StageTimer()
+        self._local = threading.local()
+
+    def run(self) -> BenchmarkReport:
+        server = make_server('127.0.0.1', 0, self.app, threaded=True, request_handler=QuietRequestHandler)
+        thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as executor:
+                outcomes = list(executor.map(lambda index: self._send(base_url, index), range(self.total_requests)))
+            duration = time.perf_counter() - started
+        finally:
+            server.shutdown()
+            thread.join()
+
+        return BenchmarkReport(
+            duration=duration,
+            latencies=[latency for latency, _ in outcomes],
+            status_counts=dict(Counter(status for _, status in outcomes)),
+            stage_timings=dict(self.stage_timer.timings)
+        )
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _send(self, base_url: str, index: int) -> tuple:
+        payload = {'position': self.positions[index % len(self.positions)], 'skills': self.skills}
+        started = time.perf_counter()
+        try:
+            response = self._session().post(f"{base_url}{self.path}", json=payload, timeout=self.timeout)
+            status = str(response.status_code)
+        except requests.exceptions.RequestException:
+            status = 'error'
+        return time.perf_counter() - started, status
@@ -0,0 +1,279 @@
+import fnmatch
+import json
+import random
+import socketserver
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FakeUpstreamServer(ABC):
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeUpstreamServer':
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                upstream._handle(self)
+
+            def do_POST(self):
+                upstream._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = QuietHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+
+    def __enter__(self) -> 'FakeUpstreamServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length else b''
+
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if failed:
+            self._send(handler, 503, b'Service Unavailable', 'text/plain')
+            return
+
+        status, payload, content_type = self.respond(handler.command, handler.path, body)
+        self._send(handler, status, payload, content_type)
+
+    @abstractmethod
+    def respond(self, method: str, path: str, body: bytes) -> tuple:
+        pass
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, payload: bytes, content_type: str) -> None:
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+class FakeJobBoardServer(FakeUpstreamServer):
+
+    PARAGRAPH = b'<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>'
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, page_size: int = 32 * 1024,
+                 seed: Optional[int] = None, sitemap_size: int = 0):
+        super().__init__(latency=latency, error_rate=error_rate, seed=seed)
+        self.page_size = page_size
+        self.sitemap_size = sitemap_size
+
+    def job_url(self, index: int) -> str:
+        return f"{self.url}/jobs/{index}"
+
+    @property
+    def sitemap_url(self) -> str:
+        return f"{self.url}/sitemap.xml"
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple:
+        if path == '/sitemap.xml':
+            locations = ''.join(f"<url><loc>{self.job_url(index)}</loc></url>" for index in range(self.sitemap_size))
+            sitemap = f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{locations}</urlset>'
+            return 200, sitemap.encode('utf-8'), 'application/xml'
+
+        head = (
+            '<!DOCTYPE html><html><head><meta charset="utf-8">'
+            f'<title>Vaga {path}</title>'
+            f'<meta name="description" content="Vaga {path}: Python, Flask, SQL, Docker e AWS. '
+            'Experiência com APIs REST e testes automatizados.">'
+            '</head><body>'
+        ).encode('utf-8')
+        tail = b'</body></html>'
+        filler = max(0, self.page_size - len(head) - len(tail))
+        padding = (self.PARAGRAPH * (filler // len(self.PARAGRAPH) + 1))[:filler]
+        return 200, head + padding + tail, 'text/html; charset=utf-8'
+
+
+class FakeCompletionServer(FakeUpstreamServer):
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0,
+                 message: str = "Match estimado de 75%. Estude Kubernetes para aumentar suas chances.",
+                 seed: Optional[int] = None):
+        super().__init__(latency=latency, error_rate=error_rate, seed=seed)
+        self.message = message
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple:
+        if method != 'POST':
+            return 405, b'Method Not Allowed', 'text/plain'
+
+        payload = json.loads(body or b'{}')
+        if payload.get('stream'):
+            tokens = [word if index == 0 else f" {word}" for index, word in enumerate(self.message.split(' '))]
+            events = ''.join(
+                f"data: {json.dumps({'choices': [{'delta': {'content': token}}]}, ensure_ascii=False)}\n\n"
+                for token in tokens
+            )
+            return 200, (events + 'data: [DONE]\n\n').encode('utf-8'), 'text/event-stream'
+
+        result = {'choices': [{'message': {'role': 'assistant', 'content': self.message}}]}
+        return 200, json.dumps(result, ensure_ascii=False).encode('utf-8'), 'application/json'
+
+
+class FakeRedisServer:
+
+    def __init__(self, password: Optional[str] = None):
+        self.password = password
+        self.commands = 0
+        self._data = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        credentials = f":{self.password}@" if self.password else ''
+        return f"redis://{credentials}{host}:{port}/0"
+
+    def start(self) -> 'FakeRedisServer':
+        redis = self
+
+        class Handler(socketserver.StreamRequestHandler):
+
+            def handle(self):
+                authenticated = redis.password is None
+                while True:
+                    try:
+                        command = redis._read_command(self.rfile)
+                    except (ConnectionError, ValueError):
+                        return
+                    if command is None:
+                        return
+
+                    name = command[0].upper()
+                    if name == b'AUTH':
+                        authenticated = command[-1].decode() == redis.password
+                        reply = b'+OK\r\n' if authenticated else b'-WRONGPASS invalid password\r\n'
+                    elif not authenticated:
+                        reply = b'-NOAUTH Authentication required.\r\n'
+                    else:
+                        reply = redis._execute(name, command[1:])
+                    self.wfile.write(reply)
+
+        self._server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+
+    def __enter__(self) -> 'FakeRedisServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def keys(self) -> list:
+        with self._lock:
+            return [key.decode() for key in self._live_keys()]
+
+    @staticmethod
+    def _read_command(rfile) -> Optional[list]:
+        line = rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b'*'):
+            raise ValueError("Comando RESP inválido")
+
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(rfile.readline()[1:])
+            args.append(rfile.read(length + 2)[:-2])
+        return args
+
+    def _execute(self, name: bytes, args: list) -> bytes:
+        with self._lock:
+            self.commands += 1
+            if name == b'PING':
+                return b'+PONG\r\n'
+            if name == b'SELECT':
+                return b'+OK\r\n'
+            if name == b'GET':
+                value, expires_at = self._data.get(args[0], (None, None))
+                if value is None or (expires_at is not None and time.time() >= expires_at):
+                    return b'$-1\r\n'
+                return b'$%d\r\n%s\r\n' % (len(value), value)
+            if name == b'SET':
+                expires_at = None
+                if len(args) >= 4 and args[2].upper() == b'PX':
+                    expires_at = time.time() + int(args[3]) / 1000
+                self._data[args[0]] = (args[1], expires_at)
+                return b'+OK\r\n'
+            if name == b'DEL':
+                removed = sum(1 for key in args if self._data.pop(key, None) is not None)
+                return b':%d\r\n' % removed
+            if name == b'SCAN':
+                pattern = args[args.index(b'MATCH') + 1].decode() if b'MATCH' in args else '*'
+                keys = [key for key in self._live_keys() if fnmatch.fnmatchcase(key.decode(), pattern)]
+                items = b''.join(b'$%d\r\n%s\r\n' % (len(key), key) for key in keys)
+                return b'*2\r\n$1\r\n0\r\n*%d\r\n%s' % (len(keys), items)
+            return b'-ERR unknown command\r\n'
+
+    def _live_keys(self) -> list:
+        now = time.time()
+        for key, (_, expires_at) in list(self._data.items()):
+            if expires_at is not None and now >= expires_at:
+                del self._data[key]
+        return list(self._data.keys())
@@ -0,0 +1,141 @@
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+from src.services import WebScrapingService
+from src.services.meta_description_parser import MetaDescriptionStream
+from .benchmark_runner import BenchmarkReport
+
+
+class ParserBenchmark:
+
+    FULL_DOCUMENT = 'bs4'
+    REFERENCE = MetaDescriptionStream.DEFAULT_BACKEND
+    PARAGRAPH = '<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>'
+    HEADS = (
+        '<meta charset="utf-8"><title>{title}</title><meta name="description" content="{description}">',
+        "<title>{title}</title><meta content='{description}' name='description'>",
+        '<style>body {{ color: #333; }} .x > .y {{ margin: 0 }}</style>'
+        '<script>var html = \'<meta name="description" content="falsa">\'; if (a < b) {{}}</script>'
+        '<meta name="description" content="{description}">',
+        '<!-- <meta name="description" content="comentada"> --><meta name="description" content="{description}">',
+        '<META NAME="description" CONTENT="{description}">',
+        '<meta name="description" content="{description} &amp; DevOps &#8211; S&atilde;o Paulo">',
+        '<title>{title}</title><link rel="stylesheet" href="/app.css">',
+        '{links}<meta property="og:title" content="{title}"><meta name="description" content="{description}">'
+    )
+
+    def __init__(self, pages: Dict[str, bytes], backends: Optional[List[str]] = None, repeat: int = 5):
+        self.pages = pages
+        self.backends = backends or self.default_backends()
+        self.repeat = max(1, repeat)
+
+    @classmethod
+    def default_backends(cls) -> List[str]:
+        return MetaDescriptionStream.available_backends() + [cls.FULL_DOCUMENT]
+
+    @staticmethod
+    def load_corpus(directory: str) -> Dict[str, bytes]:
+        pages = {}
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(('.html', '.htm')):
+                with open(os.path.join(directory, name), 'rb') as f:
+                    pages[name] = f.read()
+        return pages
+
+    @classmethod
+    def synthetic_corpus(cls, count: int = 24, page_size: int = 64 * 1024) -> Dict[str, bytes]:
+        pages = {}
+        links = ''.join(f'<link rel="preload" href="/static/chunk-{index}.js" as="script">' for index in range(200))
+        for index in range(count):
+            head = cls.HEADS[index % len(cls.HEADS)].format(
+                title=f"Vaga {index}",
+                description=f"Vaga {index}: Python, Flask, SQL, Docker e AWS",
+                links=links
+            )
+            document = f'<!DOCTYPE html><html><head>{head}</head><body>'
+            filler = max(0, page_size - len(document) - len('</body></html>'))
+            body = (cls.PARAGRAPH * (filler // len(cls.PARAGRAPH) + 1))[:filler]
+            pages[f"synthetic-{index}.html"] = (document + body + '</body></html>').encode('utf-8')
+        return pages
+
+    def run(self) -> dict:
+        reference = {name: self._extract(self.REFERENCE, page)[0] for name, page in self.pages.items()}
+        total_bytes = sum(len(page) for page in self.pages.values())
+
+        results = {}
+        for backend in self.backends:
+            timings, fallbacks, mismatches = [], 0, 0
+            for name, page in self.pages.items():
+                for _ in range(self.repeat):
+                    started = time.perf_counter()
+                    description, fell_back = self._extract(backend, page)
+                    timings.append(time.perf_counter() - started)
+                fallbacks += fell_back
+                mismatches += description != reference[name]
+
+            elapsed = sum(timings)
+            results[backend] = {
+                'pages': len(self.pages),
+                'mean_us': round(elapsed / len(timings) * 1e6, 1) if timings else 0.0,
+                'p95_us': round(BenchmarkReport.percentile(timings, 95) * 1e6, 1),
+                'mb_per_s': round(total_bytes * self.repeat / elapsed / 1e6, 1) if elapsed else 0.0,
+                'fallbacks': fallbacks,
+                'mismatches': mismatches
+            }
+        return results
+
+    def _extract(self, backend: str, page: bytes) -> tuple:
+        if backend == self.FULL_DOCUMENT:
+            return MetaDescriptionStream.soup_description(page.decode('utf-8', errors='replace')), False
+
+        stream = WebScrapingService.stream_content(page, 'utf-8', backend)
+        return stream.finish(), stream.fell_back
+
+    @staticmethod
+    def format(results: dict) -> str:
+        lines = [f"{'parser':<14}{'páginas':>9}{'média µs':>12}{'p95 µs':>12}{'MB/s':>10}{'fallbacks':>11}{'divergências':>14}"]
+        for backend, stats in results.items():
+            lines.append(
+                f"{backend:<14}{stats['pages']:>9}{stats['mean_us']:>12}{stats['p95_us']:>12}"
+                f"{stats['mb_per_s']:>10}{stats['fallbacks']:>11}{stats['mismatches']:>14}"
+            )
+        return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compara os backends de extração de meta description em um corpus de páginas de vagas"
+    )
+    parser.add_argument('--corpus', default=None, help="Diretório com páginas .html salvas (padrão: corpus sintético)")
+    parser.add_argument('--pages', type=int, default=24, help="Páginas do corpus sintético")
+    parser.add_argument('--page-size', type=int, default=64 * 1024, help="Tamanho das páginas sintéticas em bytes")
+    parser.add_argument('--repeat', type=int, default=5, help="Execuções por página e backend")
+    parser.add_argument('--backends', default=None, help="Backends separados por vírgula (padrão: todos os disponíveis)")
+    parser.add_argument('--json', action='store_true', help="Imprime o relatório em JSON")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    pages = ParserBenchmark.load_corpus(args.corpus) if args.corpus else \
+        ParserBenchmark.synthetic_corpus(args.pages, args.page_size)
+    if not pages:
+        print(f"[BENCHMARK] ERRO: nenhuma página .html encontrada em {args.corpus}")
+        return 1
+
+    backends = [backend.strip() for backend in args.backends.split(',')] if args.backends else None
+    unknown = set(backends or []) - set(ParserBenchmark.default_backends())
+    if unknown:
+        print(f"[BENCHMARK] ERRO: backends indisponíveis: {', '.join(sorted(unknown))}")
+        return 1
+
+    results = ParserBenchmark(pages, backends, args.repeat).run()
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        print(f"[BENCHMARK] {len(pages)} páginas, {args.repeat} execuções por backend")
+        print(ParserBenchmark.format(results))
+    return 0
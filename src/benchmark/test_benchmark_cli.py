@@ -0,0 +1,67 @@
+import json
+import unittest
+from unittest.mock import patch
+from flask import Flask
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark import main
+from src.benchmark.benchmark_cli import build_parser
+from src.controllers import analysis_bp
+
+
+def create_test_app() -> Flask:
+    app = Flask(__name__)
+    app.register_blueprint(analysis_bp)
+    return app
+
+
+class TestBenchmarkCli(unittest.TestCase):
+
+    BASE_ARGS = ['--requests', '6', '--concurrency', '3', '--positions', '2',
+                 '--page-latency-ms', '0', '--completion-latency-ms', '0', '--page-size', '2048']
+
+    def test_parser_defaults(self):
+        args = build_parser().parse_args([])
+
+        self.assertEqual(args.requests, 200)
+        self.assertEqual(args.concurrency, 10)
+        self.assertFalse(args.with_cache)
+
+    @patch('builtins.print')
+    def test_main_prints_json_report(self, mock_print):
+        exit_code = main(self.BASE_ARGS + ['--json', '--concurrency', '1'], create_app=create_test_app)
+
+        summary = json.loads(mock_print.call_args_list[-1][0][0])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(summary['requests'], 6)
+        self.assertEqual(summary['status_counts'], {'200': 6})
+        self.assertEqual(summary['upstreams']['job_board']['requests'], 6)
+        self.assertEqual(summary['upstreams']['completion']['requests'], 6)
+        self.assertEqual(sorted(summary['stages'].keys()), ['completion', 'format', 'scrape'])
+
+    @patch('builtins.print')
+    def test_main_with_cache_reuses_upstream_results(self, mock_print):
+        exit_code = main(self.BASE_ARGS + ['--json', '--with-cache', '--concurrency', '1'], create_app=create_test_app)
+
+        summary = json.loads(mock_print.call_args_list[-1][0][0])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(summary['upstreams']['job_board']['requests'], 2)
+        self.assertEqual(summary['upstreams']['completion']['requests'], 2)
+
+    @patch('builtins.print')
+    def test_main_fails_when_thresholds_exceeded(self, mock_print):
+        exit_code = main(
+            self.BASE_ARGS + ['--completion-error-rate', '1', '--max-error-rate', '0.1', '--max-p95-ms', '0'],
+            create_app=create_test_app
+        )
+
+        self.assertEqual(exit_code, 1)
+        printed = [call[0][0] for call in mock_print.call_args_list]
+        self.assertTrue(any(line.startswith("[BENCHMARK] ERRO: taxa de erro") for line in printed))
+        self.assertTrue(any(line.startswith("[BENCHMARK] ERRO: p95") for line in printed))
+
+
+if __name__ == '__main__':
+    unittest.main()
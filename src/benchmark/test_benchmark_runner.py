@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import Mock
+from flask import Flask, jsonify, request
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark import BenchmarkRunner, BenchmarkReport, StageTimer
+
+
+class TestBenchmarkReport(unittest.TestCase):
+
+    def test_percentile_nearest_rank(self):
+        values = [0.1 * i for i in range(1, 11)]
+
+        self.assertAlmostEqual(BenchmarkReport.percentile(values, 50), 0.5)
+        self.assertAlmostEqual(BenchmarkReport.percentile(values, 95), 1.0)
+        self.assertAlmostEqual(BenchmarkReport.percentile(values, 1), 0.1)
+        self.assertEqual(BenchmarkReport.percentile([], 50), 0.0)
+
+    def test_summary(self):
+        report = BenchmarkReport(
+            duration=2.0,
+            latencies=[0.1, 0.2, 0.3, 0.4],
+            status_counts={'200': 3, '500': 1},
+            stage_timings={'scrape': [0.05, 0.15]}
+        )
+
+        summary = report.summary()
+
+        self.assertEqual(summary['requests'], 4)
+        self.assertEqual(summary['failures'], 1)
+        self.assertEqual(summary['error_rate'], 0.25)
+        self.assertEqual(summary['throughput_rps'], 2.0)
+        self.assertEqual(summary['latency']['p50_ms'], 200.0)
+        self.assertEqual(summary['latency']['max_ms'], 400.0)
+        self.assertEqual(summary['stages']['scrape']['count'], 2)
+
+    def test_empty_report(self):
+        report = BenchmarkReport(duration=0.0, latencies=[], status_counts={})
+
+        self.assertEqual(report.throughput, 0.0)
+        self.assertEqual(report.error_rate, 0.0)
+
+    def test_format(self):
+        report = BenchmarkReport(duration=1.0, latencies=[0.1], status_counts={'200': 1}, stage_timings={'completion': [0.08]})
+
+        text = report.format()
+
+        self.assertIn("Throughput: 1.0 req/s", text)
+        self.assertIn("total", text)
+        self.assertIn("completion", text)
+
+
+class TestStageTimer(unittest.TestCase):
+
+    def test_wrap_records_duration_on_error(self):
+        timer = StageTimer()
+
+        def failing():
+            raise ValueError("falhou")
+
+        with self.assertRaises(ValueError):
+            timer.wrap('scrape', failing)()
+
+        self.assertEqual(len(timer.timings['scrape']), 1)
+
+    def test_instrument_wraps_pipeline_stages(self):
+        timer = StageTimer()
+        service = Mock()
+        service.web_scraper.fetch_meta_description.return_value = "Vaga"
+        service.text_processor.format_description.return_value = "Vaga"
+        service.openai_service.analyze_match.return_value = "Match"
+
+        timer.instrument(service)
+        service.web_scraper.fetch_meta_description("https://example.com")
+        service.text_processor.format_description("Vaga")
+        service.openai_service.analyze_match([], "Vaga", "key")
+
+        self.assertEqual(sorted(timer.timings.keys()), ['completion', 'format', 'scrape'])
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+
+    def test_run_drives_app_concurrently(self):
+        app = Flask(__name__)
+        received = []
+
+        @app.route('/analyse', methods=['POST'])
+        def analyse():
+            received.append(request.get_json()['position'])
+            if request.get_json()['position'].endswith('/2'):
+                return jsonify({'error': 'falhou'}), 500
+            return jsonify({'message': 'ok'})
+
+        runner = BenchmarkRunner(
+            app,
+            positions=['https://example.com/1', 'https://example.com/2'],
+            skills=['Python'],
+            total_requests=6,
+            concurrency=3
+        )
+        report = runner.run()
+
+        self.assertEqual(report.total_requests, 6)
+        self.assertEqual(report.status_counts, {'200': 3, '500': 3})
+        self.assertEqual(sorted(received), ['https://example.com/1'] * 3 + ['https://example.com/2'] * 3)
+
+    def test_connection_errors_are_counted(self):
+        runner = BenchmarkRunner(Flask(__name__), positions=['https://example.com'], skills=[], total_requests=1, timeout=5)
+
+        self.assertEqual(runner._send('http://127.0.0.1:1', 0)[1], 'error')
+
+
+if __name__ == '__main__':
+    unittest.main()
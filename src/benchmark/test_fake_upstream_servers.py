@@ -0,0 +1,132 @@
+import json
+import socket
+import unittest
+from unittest.mock import patch
+import requests
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark import FakeJobBoardServer, FakeCompletionServer, FakeUpstreamServer, FakeRedisServer
+from src.services import WebScrapingService, OpenAIService, RedisCacheBackend
+
+
+class TestFakeJobBoardServer(unittest.TestCase):
+
+    def test_serves_page_with_meta_description(self):
+        with FakeJobBoardServer(page_size=4096) as server:
+            response = requests.get(server.job_url(7), timeout=5)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.content), 4096)
+        self.assertIn(b'<meta name="description" content="Vaga /jobs/7:', response.content)
+        self.assertEqual(server.requests, 1)
+
+    def test_page_is_readable_by_scraper(self):
+        with FakeJobBoardServer() as server:
+            description = WebScrapingService(timeout=5).fetch_meta_description(server.job_url(1))
+
+        self.assertTrue(description.startswith("Vaga /jobs/1: Python"))
+
+    def test_serves_sitemap_with_job_urls(self):
+        with FakeJobBoardServer(sitemap_size=3) as server:
+            response = requests.get(server.sitemap_url, timeout=5)
+            expected = f"<loc>{server.job_url(2)}</loc>".encode()
+
+        self.assertEqual(response.headers['Content-Type'], 'application/xml')
+        self.assertEqual(response.content.count(b'<url>'), 3)
+        self.assertIn(expected, response.content)
+
+    def test_error_rate_returns_503(self):
+        with FakeJobBoardServer(error_rate=1.0) as server:
+            response = requests.get(server.job_url(1), timeout=5)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(server.errors, 1)
+
+    def test_latency_is_applied(self):
+        with FakeJobBoardServer(latency=0.05) as server:
+            response = requests.get(server.job_url(1), timeout=5)
+
+        self.assertGreaterEqual(response.elapsed.total_seconds(), 0.05)
+
+    def test_stop_is_idempotent(self):
+        server = FakeJobBoardServer().start()
+        server.stop()
+        server.stop()
+
+
+class TestFakeCompletionServer(unittest.TestCase):
+
+    def test_returns_completion(self):
+        with FakeCompletionServer(message="Match de 90%") as server:
+            result = OpenAIService().analyze_match(["Python"], "Vaga", "key", f"{server.url}/chat/completions")
+
+        self.assertEqual(result, "Match de 90%")
+
+    def test_streams_completion(self):
+        with FakeCompletionServer(message="Match de 90%") as server:
+            chunks = list(OpenAIService().stream_match(["Python"], "Vaga", "key", server.url))
+
+        self.assertEqual(chunks, ["Match", " de", " 90%"])
+
+    def test_rejects_get(self):
+        with FakeCompletionServer() as server:
+            response = requests.get(server.url, timeout=5)
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_error_rate_returns_503(self):
+        with FakeCompletionServer(error_rate=1.0) as server:
+            response = requests.post(server.url, data=json.dumps({}), timeout=5)
+
+        self.assertEqual(response.status_code, 503)
+
+
+class TestFakeUpstreamServer(unittest.TestCase):
+
+    def test_respond_must_be_implemented(self):
+        with self.assertRaises(TypeError):
+            FakeUpstreamServer()
+
+
+
+class TestFakeRedisServer(unittest.TestCase):
+
+    def test_serves_cache_backend(self):
+        with FakeRedisServer() as server:
+            backend = RedisCacheBackend(url=server.url, timeout=1.0, key_prefix='')
+            backend.set('vaga', b'html')
+            value = backend.get('vaga')
+            backend.close()
+
+        self.assertEqual(value, b'html')
+        self.assertEqual(server.commands, 2)
+
+    def test_unknown_command_and_garbage_input(self):
+        with FakeRedisServer() as server:
+            host, port = server._server.server_address[:2]
+            with socket.create_connection((host, port), timeout=1.0) as sock:
+                sock.sendall(b'*1\r\n$4\r\nPING\r\n*1\r\n$4\r\nNOPE\r\n')
+                reply = b''
+                while not reply.endswith(b'command\r\n'):
+                    reply += sock.recv(1024)
+                sock.sendall(b'garbage\r\n')
+
+        self.assertEqual(reply, b'+PONG\r\n-ERR unknown command\r\n')
+
+    def test_requires_authentication(self):
+        with FakeRedisServer(password='segredo') as server:
+            backend = RedisCacheBackend(url=server.url.replace(':segredo@', ''), timeout=1.0)
+            with patch('builtins.print'):
+                self.assertIsNone(backend.get('a'))
+
+        self.assertEqual(backend.stats()['errors'], 1)
+
+    def test_stop_is_idempotent(self):
+        server = FakeRedisServer().start()
+        server.stop()
+        server.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark import ParserBenchmark
+from src.benchmark.parser_benchmark import main
+
+
+class TestParserBenchmark(unittest.TestCase):
+
+    def test_synthetic_corpus(self):
+        pages = ParserBenchmark.synthetic_corpus(count=8, page_size=4096)
+
+        self.assertEqual(len(pages), 8)
+        self.assertTrue(all(len(page) >= 4096 for page in pages.values()))
+        self.assertIn(b"S&atilde;o Paulo", pages['synthetic-5.html'])
+
+    def test_backends_agree_with_reference(self):
+        results = ParserBenchmark(ParserBenchmark.synthetic_corpus(count=8, page_size=4096), repeat=1).run()
+
+        self.assertEqual(set(results), set(ParserBenchmark.default_backends()))
+        for backend in ('html.parser', 'regex'):
+            self.assertEqual(results[backend]['mismatches'], 0)
+            self.assertEqual(results[backend]['fallbacks'], 0)
+            self.assertGreater(results[backend]['mean_us'], 0)
+        self.assertEqual(results['bs4']['pages'], 8)
+
+    def test_format(self):
+        output = ParserBenchmark.format({'regex': {
+            'pages': 2, 'mean_us': 10.0, 'p95_us': 12.0, 'mb_per_s': 500.0, 'fallbacks': 0, 'mismatches': 0
+        }})
+
+        self.assertIn('regex', output.splitlines()[1])
+
+    def test_load_corpus(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ('a.html', 'b.htm', 'notes.txt'):
+                with open(os.path.join(tmp, name), 'wb') as f:
+                    f.write(b'<meta name="description" content="x">')
+
+            self.assertEqual(sorted(ParserBenchmark.load_corpus(tmp)), ['a.html', 'b.htm'])
+
+    @patch('builtins.print')
+    def test_main_prints_json(self, mock_print):
+        exit_code = main(['--pages', '4', '--page-size', '2048', '--repeat', '1', '--backends', 'regex,bs4', '--json'])
+
+        results = json.loads(mock_print.call_args[0][0])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(sorted(results), ['bs4', 'regex'])
+
+    @patch('builtins.print')
+    def test_main_text_report_and_errors(self, mock_print):
+        self.assertEqual(main(['--pages', '2', '--page-size', '1024', '--repeat', '1']), 0)
+        self.assertIn('html.parser', mock_print.call_args[0][0])
+
+        self.assertEqual(main(['--backends', 'selectolax']), 1)
+        mock_print.assert_called_with("[BENCHMARK] ERRO: backends indisponíveis: selectolax")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(main(['--corpus', tmp]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
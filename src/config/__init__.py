@@ -1,4 +1,5 @@
 from .app_config import Config, DevelopmentConfig, ProductionConfig
+from .server_config import ServerConfig
 
 config = {
     'development': DevelopmentConfig,
@@ -10,5 +11,6 @@ __all__ = [
     'Config',
     'DevelopmentConfig',
     'ProductionConfig',
+    'ServerConfig',
     'config'
 ]
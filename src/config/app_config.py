@@ -5,13 +5,110 @@ load_dotenv()
 
 
 class Config:
-    DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
+    DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
     HOST = os.getenv('HOST', '0.0.0.0')
     PORT = int(os.getenv('PORT', 8082))
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 10))
+    HTML_PARSER_BACKEND = os.getenv('HTML_PARSER_BACKEND', 'html.parser')
+    STRUCTURED_DATA_ENABLED = os.getenv('STRUCTURED_DATA_ENABLED', 'False').lower() == 'true'
+    STRUCTURED_DATA_MAX_BYTES = int(os.getenv('STRUCTURED_DATA_MAX_BYTES', 256 * 1024))
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
     OPENAI_API_URL = os.getenv('OPENAI_API_URL', '')
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 10))
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+    HTTP_POOL_BLOCK = os.getenv('HTTP_POOL_BLOCK', 'False').lower() == 'true'
+    HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', 0))
+    HTTP_RETRY_BACKOFF = float(os.getenv('HTTP_RETRY_BACKOFF', 0.0))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', 30.0))
+    BATCH_MAX_POSITIONS = int(os.getenv('BATCH_MAX_POSITIONS', 20))
+    BATCH_MAX_CONCURRENCY = int(os.getenv('BATCH_MAX_CONCURRENCY', 5))
+    PAGE_CACHE_ENABLED = os.getenv('PAGE_CACHE_ENABLED', 'True').lower() == 'true'
+    PAGE_CACHE_MAX_ENTRIES = int(os.getenv('PAGE_CACHE_MAX_ENTRIES', 256))
+    PAGE_CACHE_MAX_BYTES = int(os.getenv('PAGE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    PAGE_CACHE_TTL = int(os.getenv('PAGE_CACHE_TTL', 300))
+    PAGE_CACHE_DIR = os.getenv('PAGE_CACHE_DIR', '')
+    ANALYSIS_CACHE_ENABLED = os.getenv('ANALYSIS_CACHE_ENABLED', 'True').lower() == 'true'
+    ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', 1024))
+    ANALYSIS_CACHE_TTL = int(os.getenv('ANALYSIS_CACHE_TTL', 3600))
+    PRESCORE_GATE_BELOW = int(os.getenv('PRESCORE_GATE_BELOW', 0))
+    SKILL_TAXONOMY_ENABLED = os.getenv('SKILL_TAXONOMY_ENABLED', 'True').lower() == 'true'
+    SKILL_TAXONOMY_PATH = os.getenv('SKILL_TAXONOMY_PATH', '')
+    SKILL_TAXONOMY_COMPILED_PATH = os.getenv('SKILL_TAXONOMY_COMPILED_PATH', 'cache/skill_taxonomy.bin')
+    PROMPT_BUDGET_ENABLED = os.getenv('PROMPT_BUDGET_ENABLED', 'False').lower() == 'true'
+    PROMPT_BUDGET_MAX_DESCRIPTION_TOKENS = int(os.getenv('PROMPT_BUDGET_MAX_DESCRIPTION_TOKENS', 1500))
+    PROMPT_BUDGET_MIN_COMPLETION_TOKENS = int(os.getenv('PROMPT_BUDGET_MIN_COMPLETION_TOKENS', 256))
+    PROMPT_BUDGET_COMPLETION_TOKENS_PER_SKILL = int(os.getenv('PROMPT_BUDGET_COMPLETION_TOKENS_PER_SKILL', 32))
+    SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE_ENABLED', 'False').lower() == 'true'
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', 0.85))
+    SEMANTIC_CACHE_MAX_DESCRIPTIONS = int(os.getenv('SEMANTIC_CACHE_MAX_DESCRIPTIONS', 256))
+    SEMANTIC_CACHE_MAX_PROFILES = int(os.getenv('SEMANTIC_CACHE_MAX_PROFILES', 32))
+    SEMANTIC_CACHE_TTL = int(os.getenv('SEMANTIC_CACHE_TTL', 3600))
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', '').lower()
+    CACHE_SQLITE_PATH = os.getenv('CACHE_SQLITE_PATH', 'cache/shared_cache.sqlite3')
+    CACHE_SQLITE_MAX_ENTRIES = int(os.getenv('CACHE_SQLITE_MAX_ENTRIES', 100000))
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_REDIS_TIMEOUT = float(os.getenv('CACHE_REDIS_TIMEOUT', 0.2))
+    CACHE_KEY_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'job-analysis:')
+    CACHE_COMPRESS_THRESHOLD = int(os.getenv('CACHE_COMPRESS_THRESHOLD', 1024))
+    OPENAI_LIMITER_ENABLED = os.getenv('OPENAI_LIMITER_ENABLED', 'True').lower() == 'true'
+    OPENAI_LIMITER_INITIAL_CONCURRENCY = int(os.getenv('OPENAI_LIMITER_INITIAL_CONCURRENCY', 8))
+    OPENAI_LIMITER_MIN_CONCURRENCY = int(os.getenv('OPENAI_LIMITER_MIN_CONCURRENCY', 1))
+    OPENAI_LIMITER_MAX_CONCURRENCY = int(os.getenv('OPENAI_LIMITER_MAX_CONCURRENCY', 64))
+    OPENAI_LIMITER_MAX_QUEUE = int(os.getenv('OPENAI_LIMITER_MAX_QUEUE', 32))
+    OPENAI_LIMITER_QUEUE_TIMEOUT = float(os.getenv('OPENAI_LIMITER_QUEUE_TIMEOUT', 5.0))
+    OPENAI_LIMITER_RATE = float(os.getenv('OPENAI_LIMITER_RATE', 0.0))
+    OPENAI_LIMITER_BURST = int(os.getenv('OPENAI_LIMITER_BURST', 10))
+    OPENAI_BATCH_ENABLED = os.getenv('OPENAI_BATCH_ENABLED', 'False').lower() == 'true'
+    OPENAI_BATCH_WINDOW = float(os.getenv('OPENAI_BATCH_WINDOW', 0.05))
+    OPENAI_BATCH_MAX_PROFILES = int(os.getenv('OPENAI_BATCH_MAX_PROFILES', 8))
+    SCRAPE_RETRY_MAX_ATTEMPTS = int(os.getenv('SCRAPE_RETRY_MAX_ATTEMPTS', 3))
+    SCRAPE_RETRY_BASE_DELAY = float(os.getenv('SCRAPE_RETRY_BASE_DELAY', 0.1))
+    SCRAPE_RETRY_MAX_DELAY = float(os.getenv('SCRAPE_RETRY_MAX_DELAY', 2.0))
+    SCRAPE_RETRY_BUDGET_RATIO = float(os.getenv('SCRAPE_RETRY_BUDGET_RATIO', 0.2))
+    SCRAPE_HEDGE_ENABLED = os.getenv('SCRAPE_HEDGE_ENABLED', 'False').lower() == 'true'
+    SCRAPE_HEDGE_QUANTILE = float(os.getenv('SCRAPE_HEDGE_QUANTILE', 0.95))
+    SCRAPE_HEDGE_MIN_DELAY = float(os.getenv('SCRAPE_HEDGE_MIN_DELAY', 0.05))
+    SCRAPE_HEDGE_INITIAL_DELAY = float(os.getenv('SCRAPE_HEDGE_INITIAL_DELAY', 1.0))
+    SCRAPE_HEDGE_BUDGET_RATIO = float(os.getenv('SCRAPE_HEDGE_BUDGET_RATIO', 0.1))
+    OPENAI_RETRY_MAX_ATTEMPTS = int(os.getenv('OPENAI_RETRY_MAX_ATTEMPTS', 2))
+    OPENAI_RETRY_BASE_DELAY = float(os.getenv('OPENAI_RETRY_BASE_DELAY', 0.5))
+    OPENAI_RETRY_MAX_DELAY = float(os.getenv('OPENAI_RETRY_MAX_DELAY', 4.0))
+    OPENAI_RETRY_BUDGET_RATIO = float(os.getenv('OPENAI_RETRY_BUDGET_RATIO', 0.1))
+    CIRCUIT_BREAKER_ENABLED = os.getenv('CIRCUIT_BREAKER_ENABLED', 'True').lower() == 'true'
+    SCRAPE_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('SCRAPE_CIRCUIT_FAILURE_THRESHOLD', 5))
+    SCRAPE_CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv('SCRAPE_CIRCUIT_RECOVERY_TIMEOUT', 30.0))
+    SCRAPE_CIRCUIT_HALF_OPEN_MAX_CALLS = int(os.getenv('SCRAPE_CIRCUIT_HALF_OPEN_MAX_CALLS', 1))
+    SCRAPE_CIRCUIT_MAX_HOSTS = int(os.getenv('SCRAPE_CIRCUIT_MAX_HOSTS', 1024))
+    OPENAI_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('OPENAI_CIRCUIT_FAILURE_THRESHOLD', 5))
+    OPENAI_CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv('OPENAI_CIRCUIT_RECOVERY_TIMEOUT', 30.0))
+    OPENAI_CIRCUIT_HALF_OPEN_MAX_CALLS = int(os.getenv('OPENAI_CIRCUIT_HALF_OPEN_MAX_CALLS', 1))
+    JOBS_ENABLED = os.getenv('JOBS_ENABLED', 'False').lower() == 'true'
+    JOBS_MAX_WORKERS = int(os.getenv('JOBS_MAX_WORKERS', 4))
+    JOBS_MAX_QUEUE = int(os.getenv('JOBS_MAX_QUEUE', 100))
+    JOBS_RESULT_TTL = int(os.getenv('JOBS_RESULT_TTL', 3600))
+    JOBS_MAX_STORED = int(os.getenv('JOBS_MAX_STORED', 10000))
+    JOBS_WEBHOOK_TIMEOUT = float(os.getenv('JOBS_WEBHOOK_TIMEOUT', 5.0))
+    JOBS_WEBHOOK_MAX_ATTEMPTS = int(os.getenv('JOBS_WEBHOOK_MAX_ATTEMPTS', 3))
+    JOBS_WEBHOOK_ALLOWED_HOSTS = [host.strip() for host in os.getenv('JOBS_WEBHOOK_ALLOWED_HOSTS', '').split(',') if host.strip()]
+    DESCRIPTION_STORE_ENABLED = os.getenv('DESCRIPTION_STORE_ENABLED', 'False').lower() == 'true'
+    DESCRIPTION_STORE_PATH = os.getenv('DESCRIPTION_STORE_PATH', 'cache/descriptions.sqlite3')
+    DESCRIPTION_STORE_MAX_ENTRIES = int(os.getenv('DESCRIPTION_STORE_MAX_ENTRIES', 100000))
+    DESCRIPTION_STORE_MAX_AGE = int(os.getenv('DESCRIPTION_STORE_MAX_AGE', 604800))
+    DESCRIPTION_REFRESH_ENABLED = os.getenv('DESCRIPTION_REFRESH_ENABLED', 'True').lower() == 'true'
+    DESCRIPTION_REFRESH_INTERVAL = int(os.getenv('DESCRIPTION_REFRESH_INTERVAL', 21600))
+    DESCRIPTION_REFRESH_TICK = float(os.getenv('DESCRIPTION_REFRESH_TICK', 60))
+    DESCRIPTION_REFRESH_BATCH = int(os.getenv('DESCRIPTION_REFRESH_BATCH', 20))
+    SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', 0))
+    SERVER_THREADS = int(os.getenv('SERVER_THREADS', 8))
+    SERVER_WORKER_CLASS = os.getenv('SERVER_WORKER_CLASS', 'gthread')
+    SERVER_PRELOAD = os.getenv('SERVER_PRELOAD', 'True').lower() == 'true'
+    SERVER_TIMEOUT = int(os.getenv('SERVER_TIMEOUT', 120))
+    SERVER_GRACEFUL_TIMEOUT = int(os.getenv('SERVER_GRACEFUL_TIMEOUT', 30))
+    SERVER_KEEPALIVE = int(os.getenv('SERVER_KEEPALIVE', 5))
+    SERVER_BACKLOG = int(os.getenv('SERVER_BACKLOG', 2048))
+    SERVER_MAX_REQUESTS = int(os.getenv('SERVER_MAX_REQUESTS', 0))
+    SERVER_MAX_REQUESTS_JITTER = int(os.getenv('SERVER_MAX_REQUESTS_JITTER', 0))
 
 
 class DevelopmentConfig(Config):
@@ -0,0 +1,27 @@
+import multiprocessing
+
+
+class ServerConfig:
+
+    @staticmethod
+    def default_workers() -> int:
+        return multiprocessing.cpu_count()
+
+    @staticmethod
+    def gunicorn_options(config) -> dict:
+        return {
+            'bind': f"{config.get('HOST', '0.0.0.0')}:{config.get('PORT', 8082)}",
+            'workers': config.get('SERVER_WORKERS') or ServerConfig.default_workers(),
+            'threads': config.get('SERVER_THREADS', 8),
+            'worker_class': config.get('SERVER_WORKER_CLASS', 'gthread'),
+            'preload_app': config.get('SERVER_PRELOAD', True),
+            'timeout': config.get('SERVER_TIMEOUT', 120),
+            'graceful_timeout': config.get('SERVER_GRACEFUL_TIMEOUT', 30),
+            'keepalive': config.get('SERVER_KEEPALIVE', 5),
+            'backlog': config.get('SERVER_BACKLOG', 2048),
+            'max_requests': config.get('SERVER_MAX_REQUESTS', 0),
+            'max_requests_jitter': config.get('SERVER_MAX_REQUESTS_JITTER', 0),
+            'loglevel': config.get('LOG_LEVEL', 'INFO').lower(),
+            'accesslog': '-',
+            'errorlog': '-'
+        }
@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import ServerConfig, ProductionConfig
+
+
+class TestServerConfig(unittest.TestCase):
+
+    def test_gunicorn_options_from_config(self):
+        options = ServerConfig.gunicorn_options({
+            'HOST': '127.0.0.1',
+            'PORT': 9000,
+            'SERVER_WORKERS': 3,
+            'SERVER_THREADS': 4,
+            'SERVER_WORKER_CLASS': 'uvicorn.workers.UvicornWorker',
+            'SERVER_PRELOAD': False,
+            'SERVER_TIMEOUT': 60,
+            'SERVER_GRACEFUL_TIMEOUT': 10,
+            'SERVER_KEEPALIVE': 15,
+            'SERVER_MAX_REQUESTS': 1000,
+            'SERVER_MAX_REQUESTS_JITTER': 100,
+            'LOG_LEVEL': 'DEBUG'
+        })
+
+        self.assertEqual(options['bind'], '127.0.0.1:9000')
+        self.assertEqual(options['workers'], 3)
+        self.assertEqual(options['threads'], 4)
+        self.assertEqual(options['worker_class'], 'uvicorn.workers.UvicornWorker')
+        self.assertFalse(options['preload_app'])
+        self.assertEqual(options['timeout'], 60)
+        self.assertEqual(options['graceful_timeout'], 10)
+        self.assertEqual(options['keepalive'], 15)
+        self.assertEqual(options['max_requests'], 1000)
+        self.assertEqual(options['max_requests_jitter'], 100)
+        self.assertEqual(options['loglevel'], 'debug')
+
+    @patch('src.config.server_config.multiprocessing.cpu_count', return_value=6)
+    def test_workers_default_to_cpu_count(self, mock_cpu_count):
+        options = ServerConfig.gunicorn_options({'SERVER_WORKERS': 0})
+
+        self.assertEqual(options['workers'], 6)
+        self.assertEqual(options['bind'], '0.0.0.0:8082')
+        self.assertEqual(options['worker_class'], 'gthread')
+        self.assertTrue(options['preload_app'])
+
+    def test_production_config_disables_debug(self):
+        self.assertFalse(ProductionConfig.DEBUG)
+
+
+if __name__ == '__main__':
+    unittest.main()
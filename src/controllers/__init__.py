@@ -1,9 +1,12 @@
 from .analysis_controller import AnalysisController
+from .async_analysis_controller import AsyncAnalysisController
 
 analysis_controller = AnalysisController()
 analysis_bp = analysis_controller.blueprint
 
 __all__ = [
     'analysis_bp',
-    'AnalysisController'
+    'analysis_controller',
+    'AnalysisController',
+    'AsyncAnalysisController'
 ]
@@ -1,7 +1,10 @@
-from flask import Blueprint, request, jsonify, current_app
-from src.services import AnalysisService
-from src.models import AnalysisRequest, ErrorResponse
+from flask import Blueprint, Flask, Response, request, jsonify, current_app, g, stream_with_context
+from src.services import AnalysisService, MetricsService, UpstreamOverloadedError
+from src.models import AnalysisRequest, BatchAnalysisRequest, ErrorResponse
+from src.utils import SseUtils, validate_url
+import itertools
 import requests
+import time
 
 
 class AnalysisController:
@@ -10,13 +13,117 @@ class AnalysisController:
         self.analysis_service = AnalysisService()
         self.blueprint = self._create_blueprint()
 
+    def init_app(self, app: Flask) -> None:
+        self.analysis_service = AnalysisService.from_config(app.config)
+
     def _create_blueprint(self) -> Blueprint:
         bp = Blueprint('analysis', __name__)
         bp.add_url_rule('/analyse', 'analyse_position', self.analyse_position, methods=['POST'])
+        bp.add_url_rule('/analyse/stream', 'analyse_stream', self.analyse_stream, methods=['POST'])
+        bp.add_url_rule('/analyse/batch', 'analyse_batch', self.analyse_batch, methods=['POST'])
+        bp.add_url_rule('/analyse/<job_id>', 'analyse_job', self.analyse_job, methods=['GET'])
         bp.add_url_rule('/health', 'health_check', self.health_check, methods=['GET'])
+        bp.add_url_rule('/stats', 'stats', self.stats, methods=['GET'])
+        bp.add_url_rule('/metrics', 'metrics', self.metrics, methods=['GET'])
+        bp.before_request(self._start_request_timer)
+        bp.after_request(self._record_request)
         return bp
 
+    def _start_request_timer(self) -> None:
+        g.request_started = time.perf_counter()
+
+    def _record_request(self, response: Response) -> Response:
+        started = g.pop('request_started', None)
+        if started is not None and request.url_rule is not None:
+            self.analysis_service.metrics.observe_request(
+                request.url_rule.rule,
+                response.status_code,
+                time.perf_counter() - started
+            )
+        return response
+
     def analyse_position(self):
+        if self.analysis_service.jobs is not None and self._wants_job(request.get_json(silent=True)):
+            return self._handle_analysis(self._job_response)
+        return self._handle_analysis(self._analysis_response)
+
+    def analyse_stream(self):
+        return self._handle_analysis(self._stream_response)
+
+    def _analysis_response(self, analysis_request: AnalysisRequest, api_key: str, api_url: str):
+        result = self.analysis_service.analyze_position(analysis_request, api_key, api_url)
+        return jsonify(result), 200
+
+    @staticmethod
+    def _wants_job(data) -> bool:
+        return isinstance(data, dict) and data.get('mode') != AnalysisRequest.FAST and \
+            (data.get('async') is True or bool(data.get('callback_url')))
+
+    def _job_response(self, analysis_request: AnalysisRequest, api_key: str, api_url: str):
+        callback_url = request.get_json().get('callback_url')
+        if callback_url and not self._valid_callback_url(callback_url):
+            error = ErrorResponse("Campo callback_url deve ser uma URL http(s)")
+            return jsonify(error.to_dict()), 400
+        if callback_url and not self.analysis_service.jobs.accepts_callback(callback_url):
+            error = ErrorResponse("Campo callback_url não pode apontar para endereços internos")
+            return jsonify(error.to_dict()), 400
+
+        job = self.analysis_service.jobs.submit(analysis_request, api_key, api_url, callback_url=callback_url)
+        return jsonify(job.to_dict()), 202, {'Location': f"/analyse/{job.id}"}
+
+    @staticmethod
+    def _valid_mode(data: dict) -> bool:
+        return (data.get('mode') or AnalysisRequest.FULL) in AnalysisRequest.MODES
+
+    @staticmethod
+    def _valid_callback_url(callback_url) -> bool:
+        return isinstance(callback_url, str) and validate_url(callback_url) and \
+            callback_url.split(':', 1)[0].lower() in ('http', 'https')
+
+    def analyse_job(self, job_id: str):
+        if self.analysis_service.jobs is None:
+            error = ErrorResponse("Modo assíncrono desabilitado")
+            return jsonify(error.to_dict()), 404
+
+        job = self.analysis_service.jobs.get(job_id)
+        if job is None:
+            error = ErrorResponse("Job não encontrado ou expirado")
+            return jsonify(error.to_dict()), 404
+
+        return jsonify(job.to_dict()), 200
+
+    def _stream_response(self, analysis_request: AnalysisRequest, api_key: str, api_url: str):
+        chunks = self._prime_stream(self.analysis_service.stream_position(analysis_request, api_key, api_url))
+        return Response(
+            stream_with_context(self._sse_events(chunks)),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
+    @staticmethod
+    def _prime_stream(chunks):
+        iterator = iter(chunks)
+        try:
+            first_chunk = next(iterator)
+        except StopIteration:
+            return iter(())
+        return itertools.chain([first_chunk], iterator)
+
+    @staticmethod
+    def _sse_events(chunks):
+        parts = []
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                yield SseUtils.format_event('delta', {'delta': chunk})
+
+            yield SseUtils.format_event('done', {'message': ''.join(parts)})
+
+        except Exception as e:
+            print(f"[CONTROLLER] ERRO no streaming: {str(e)}")
+            yield SseUtils.format_event('error', ErrorResponse("Erro ao gerar análise").to_dict())
+
+    def _handle_analysis(self, build_response):
         try:
             data = request.get_json()
             if not data:
@@ -27,6 +134,10 @@ class AnalysisController:
                 error = ErrorResponse("Campo position é obrigatório")
                 return jsonify(error.to_dict()), 400
 
+            if not self._valid_mode(data):
+                error = ErrorResponse("Campo mode deve ser full ou fast")
+                return jsonify(error.to_dict()), 400
+
             api_key = current_app.config.get('OPENAI_API_KEY')
             if not api_key:
                 error = ErrorResponse("API key da OpenAI não configurada")
@@ -38,9 +149,10 @@ class AnalysisController:
                 return jsonify(error.to_dict()), 500
 
             analysis_request = AnalysisRequest.from_dict(data)
-            result = self.analysis_service.analyze_position(analysis_request, api_key, api_url)
+            return build_response(analysis_request, api_key, api_url)
 
-            return jsonify(result), 200
+        except UpstreamOverloadedError as e:
+            return self._overloaded_response(e)
 
         except requests.exceptions.RequestException as e:
             print(f"[CONTROLLER] ERRO de requisição: {str(e)}")
@@ -57,5 +169,77 @@ class AnalysisController:
             error = ErrorResponse("Erro interno do servidor")
             return jsonify(error.to_dict()), 500
 
+    def analyse_batch(self):
+        try:
+            data = request.get_json()
+            if not data:
+                error = ErrorResponse("JSON não fornecido")
+                return jsonify(error.to_dict()), 400
+
+            positions = data.get('positions')
+            if not isinstance(positions, list) or not positions:
+                error = ErrorResponse("Campo positions é obrigatório")
+                return jsonify(error.to_dict()), 400
+
+            max_positions = current_app.config.get('BATCH_MAX_POSITIONS', 20)
+            if len(positions) > max_positions:
+                error = ErrorResponse(f"Máximo de {max_positions} vagas por requisição")
+                return jsonify(error.to_dict()), 400
+
+            if not self._valid_mode(data):
+                error = ErrorResponse("Campo mode deve ser full ou fast")
+                return jsonify(error.to_dict()), 400
+
+            api_key = current_app.config.get('OPENAI_API_KEY')
+            if not api_key:
+                error = ErrorResponse("API key da OpenAI não configurada")
+                return jsonify(error.to_dict()), 500
+
+            api_url = current_app.config.get('OPENAI_API_URL')
+            if not api_url:
+                error = ErrorResponse("URL da API OpenAI não configurada")
+                return jsonify(error.to_dict()), 500
+
+            batch_request = BatchAnalysisRequest.from_dict(data)
+            outcomes = self.analysis_service.analyze_batch(batch_request, api_key, api_url)
+            results = [self._batch_item(position, outcome) for position, outcome in outcomes.items()]
+
+            return jsonify({'results': results}), 200
+
+        except Exception as e:
+            print(f"[CONTROLLER] ERRO: {str(e)}")
+            error = ErrorResponse("Erro interno do servidor")
+            return jsonify(error.to_dict()), 500
+
+    @staticmethod
+    def _overloaded_response(e: UpstreamOverloadedError):
+        print(f"[CONTROLLER] Serviço sobrecarregado: {str(e)}")
+        error = ErrorResponse(str(e))
+        return jsonify(error.to_dict()), 503, {'Retry-After': str(e.retry_after_seconds)}
+
+    @staticmethod
+    def _batch_item(position: str, outcome) -> dict:
+        if not isinstance(outcome, BaseException):
+            return {'position': position, **outcome}
+
+        print(f"[CONTROLLER] ERRO na vaga {position}: {str(outcome)}")
+        if isinstance(outcome, UpstreamOverloadedError):
+            return {'position': position, 'status': 503, 'retry_after': outcome.retry_after_seconds,
+                    **ErrorResponse(str(outcome)).to_dict()}
+        if isinstance(outcome, requests.exceptions.RequestException):
+            error, status = ErrorResponse(f"Erro ao acessar a URL: {str(outcome)}"), 500
+        elif isinstance(outcome, ValueError):
+            error, status = ErrorResponse(str(outcome)), 404
+        else:
+            error, status = ErrorResponse("Erro interno do servidor"), 500
+
+        return {'position': position, 'status': status, **error.to_dict()}
+
     def health_check(self):
-        return jsonify({'status': 'OK'}), 200
+        return jsonify(self.analysis_service.health()), 200
+
+    def stats(self):
+        return jsonify(self.analysis_service.stats()), 200
+
+    def metrics(self):
+        return Response(self.analysis_service.metrics.render(), content_type=MetricsService.CONTENT_TYPE)
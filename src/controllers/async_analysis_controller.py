@@ -0,0 +1,320 @@
+import asyncio
+import json
+import time
+import httpx
+from src.services import AsyncAnalysisService, MetricsService, UpstreamOverloadedError
+from src.models import AnalysisRequest, BatchAnalysisRequest, ErrorResponse
+from src.utils import SseUtils, validate_url
+
+
+class AsyncAnalysisController:
+
+    JOB_PATH_PREFIX = '/analyse/'
+    JOB_ROUTE = '/analyse/<job_id>'
+
+    def __init__(self, analysis_service: AsyncAnalysisService = None, config: dict = None):
+        self.analysis_service = analysis_service or AsyncAnalysisService()
+        self.config = config or {}
+        self.routes = {
+            '/analyse': ('POST', self.analyse_position),
+            '/analyse/stream': ('POST', self.analyse_stream),
+            '/analyse/batch': ('POST', self.analyse_batch),
+            '/health': ('GET', self.health_check),
+            '/stats': ('GET', self.stats),
+            '/metrics': ('GET', self.metrics)
+        }
+
+    @classmethod
+    def from_config(cls, config) -> 'AsyncAnalysisController':
+        return cls(analysis_service=AsyncAnalysisService.from_config(config), config=config)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._handle_lifespan(receive, send)
+            return
+
+        if scope['type'] != 'http':
+            return
+
+        path, path_params = scope['path'], {}
+        route = self.routes.get(path)
+        if route is None and path.startswith(self.JOB_PATH_PREFIX) and scope['method'] == 'GET':
+            path, path_params = self.JOB_ROUTE, {'job_id': path[len(self.JOB_PATH_PREFIX):]}
+            route = ('GET', self.analyse_job)
+
+        if route is None:
+            await self._send_json(send, ErrorResponse("Rota não encontrada").to_dict(), 404)
+            return
+
+        method, handler = route
+        if scope['method'] != method:
+            await self._send_json(send, ErrorResponse("Método não permitido").to_dict(), 405)
+            return
+
+        started = time.perf_counter()
+        body = await self._read_body(receive)
+        data, status_code, *extra = await handler(body, **path_params)
+
+        if hasattr(data, '__aiter__'):
+            await self._send_sse(send, data, status_code)
+        elif isinstance(data, str):
+            await self._send_text(send, data, status_code, MetricsService.CONTENT_TYPE)
+        else:
+            await self._send_json(send, data, status_code, *extra)
+
+        self.analysis_service.metrics.observe_request(path, status_code, time.perf_counter() - started)
+
+    async def analyse_position(self, body: bytes):
+        if self.analysis_service.jobs is not None and self._wants_job(body):
+            return await self._handle_analysis(body, self._submit_job(body))
+        return await self._handle_analysis(body, self.analysis_service.analyze_position)
+
+    @staticmethod
+    def _wants_job(body: bytes) -> bool:
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            return False
+        return isinstance(data, dict) and data.get('mode') != AnalysisRequest.FAST and \
+            (data.get('async') is True or bool(data.get('callback_url')))
+
+    def _submit_job(self, body: bytes):
+        callback_url = json.loads(body).get('callback_url')
+
+        async def submit(analysis_request: AnalysisRequest, api_key: str, api_url: str):
+            if callback_url and not self._valid_callback_url(callback_url):
+                return ErrorResponse("Campo callback_url deve ser uma URL http(s)").to_dict(), 400
+            if callback_url and not await asyncio.to_thread(self.analysis_service.jobs.accepts_callback, callback_url):
+                return ErrorResponse("Campo callback_url não pode apontar para endereços internos").to_dict(), 400
+
+            job = self.analysis_service.jobs.submit(analysis_request, api_key, api_url, callback_url=callback_url)
+            return job.to_dict(), 202, {'Location': f"{self.JOB_PATH_PREFIX}{job.id}"}
+
+        return submit
+
+    @staticmethod
+    def _valid_mode(data: dict) -> bool:
+        return (data.get('mode') or AnalysisRequest.FULL) in AnalysisRequest.MODES
+
+    @staticmethod
+    def _valid_callback_url(callback_url) -> bool:
+        return isinstance(callback_url, str) and validate_url(callback_url) and \
+            callback_url.split(':', 1)[0].lower() in ('http', 'https')
+
+    async def analyse_job(self, body: bytes = b'', job_id: str = ''):
+        if self.analysis_service.jobs is None:
+            return ErrorResponse("Modo assíncrono desabilitado").to_dict(), 404
+
+        job = self.analysis_service.jobs.get(job_id)
+        if job is None:
+            return ErrorResponse("Job não encontrado ou expirado").to_dict(), 404
+
+        return job.to_dict(), 200
+
+    async def analyse_stream(self, body: bytes):
+        return await self._handle_analysis(body, self._primed_stream)
+
+    async def _primed_stream(self, analysis_request: AnalysisRequest, api_key: str, api_url: str):
+        chunks = await self.analysis_service.stream_position(analysis_request, api_key, api_url)
+        try:
+            first_chunk = await chunks.__anext__()
+        except StopAsyncIteration:
+            first_chunk = None
+
+        async def primed():
+            if first_chunk is not None:
+                yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+
+        return primed()
+
+    async def _handle_analysis(self, body: bytes, run_analysis):
+        try:
+            try:
+                data = json.loads(body) if body else None
+            except ValueError:
+                data = None
+
+            if not data:
+                return ErrorResponse("JSON não fornecido").to_dict(), 400
+
+            if 'position' not in data:
+                return ErrorResponse("Campo position é obrigatório").to_dict(), 400
+
+            if not self._valid_mode(data):
+                return ErrorResponse("Campo mode deve ser full ou fast").to_dict(), 400
+
+            api_key = self.config.get('OPENAI_API_KEY')
+            if not api_key:
+                return ErrorResponse("API key da OpenAI não configurada").to_dict(), 500
+
+            api_url = self.config.get('OPENAI_API_URL')
+            if not api_url:
+                return ErrorResponse("URL da API OpenAI não configurada").to_dict(), 500
+
+            analysis_request = AnalysisRequest.from_dict(data)
+            result = await run_analysis(analysis_request, api_key, api_url)
+
+            return result if isinstance(result, tuple) else (result, 200)
+
+        except UpstreamOverloadedError as e:
+            return self._overloaded_response(e)
+
+        except httpx.HTTPError as e:
+            print(f"[CONTROLLER] ERRO de requisição: {str(e)}")
+            return ErrorResponse(f"Erro ao acessar a URL: {str(e)}").to_dict(), 500
+
+        except ValueError as e:
+            print(f"[CONTROLLER] ERRO de validação: {str(e)}")
+            return ErrorResponse(str(e)).to_dict(), 404
+
+        except Exception as e:
+            print(f"[CONTROLLER] ERRO: {str(e)}")
+            return ErrorResponse("Erro interno do servidor").to_dict(), 500
+
+    async def analyse_batch(self, body: bytes):
+        try:
+            try:
+                data = json.loads(body) if body else None
+            except ValueError:
+                data = None
+
+            if not data:
+                return ErrorResponse("JSON não fornecido").to_dict(), 400
+
+            positions = data.get('positions')
+            if not isinstance(positions, list) or not positions:
+                return ErrorResponse("Campo positions é obrigatório").to_dict(), 400
+
+            max_positions = self.config.get('BATCH_MAX_POSITIONS', 20)
+            if len(positions) > max_positions:
+                return ErrorResponse(f"Máximo de {max_positions} vagas por requisição").to_dict(), 400
+
+            if not self._valid_mode(data):
+                return ErrorResponse("Campo mode deve ser full ou fast").to_dict(), 400
+
+            api_key = self.config.get('OPENAI_API_KEY')
+            if not api_key:
+                return ErrorResponse("API key da OpenAI não configurada").to_dict(), 500
+
+            api_url = self.config.get('OPENAI_API_URL')
+            if not api_url:
+                return ErrorResponse("URL da API OpenAI não configurada").to_dict(), 500
+
+            batch_request = BatchAnalysisRequest.from_dict(data)
+            outcomes = await self.analysis_service.analyze_batch(batch_request, api_key, api_url)
+            results = [self._batch_item(position, outcome) for position, outcome in outcomes.items()]
+
+            return {'results': results}, 200
+
+        except Exception as e:
+            print(f"[CONTROLLER] ERRO: {str(e)}")
+            return ErrorResponse("Erro interno do servidor").to_dict(), 500
+
+    @staticmethod
+    def _overloaded_response(e: UpstreamOverloadedError):
+        print(f"[CONTROLLER] Serviço sobrecarregado: {str(e)}")
+        return ErrorResponse(str(e)).to_dict(), 503, {'Retry-After': str(e.retry_after_seconds)}
+
+    @staticmethod
+    def _batch_item(position: str, outcome) -> dict:
+        if not isinstance(outcome, BaseException):
+            return {'position': position, **outcome}
+
+        print(f"[CONTROLLER] ERRO na vaga {position}: {str(outcome)}")
+        if isinstance(outcome, UpstreamOverloadedError):
+            return {'position': position, 'status': 503, 'retry_after': outcome.retry_after_seconds,
+                    **ErrorResponse(str(outcome)).to_dict()}
+        if isinstance(outcome, httpx.HTTPError):
+            error, status = ErrorResponse(f"Erro ao acessar a URL: {str(outcome)}"), 500
+        elif isinstance(outcome, ValueError):
+            error, status = ErrorResponse(str(outcome)), 404
+        else:
+            error, status = ErrorResponse("Erro interno do servidor"), 500
+
+        return {'position': position, 'status': status, **error.to_dict()}
+
+    async def health_check(self, body: bytes = b''):
+        return self.analysis_service.health(), 200
+
+    async def stats(self, body: bytes = b''):
+        return self.analysis_service.stats(), 200
+
+    async def metrics(self, body: bytes = b''):
+        return self.analysis_service.metrics.render(), 200
+
+    async def _handle_lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.analysis_service.aclose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+        return body
+
+    @staticmethod
+    async def _sse_events(chunks):
+        parts = []
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield SseUtils.format_event('delta', {'delta': chunk})
+
+            yield SseUtils.format_event('done', {'message': ''.join(parts)})
+
+        except Exception as e:
+            print(f"[CONTROLLER] ERRO no streaming: {str(e)}")
+            yield SseUtils.format_event('error', ErrorResponse("Erro ao gerar análise").to_dict())
+
+    async def _send_sse(self, send, chunks, status_code: int) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': status_code,
+            'headers': [
+                (b'content-type', b'text/event-stream; charset=utf-8'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no')
+            ]
+        })
+        async for event in self._sse_events(chunks):
+            await send({'type': 'http.response.body', 'body': event.encode('utf-8'), 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+    @staticmethod
+    async def _send_text(send, text: str, status_code: int, content_type: str) -> None:
+        payload = text.encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': status_code,
+            'headers': [
+                (b'content-type', content_type.encode()),
+                (b'content-length', str(len(payload)).encode())
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': payload})
+
+    @staticmethod
+    async def _send_json(send, data: dict, status_code: int, headers: dict = None) -> None:
+        payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': status_code,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(payload)).encode()),
+                *((name.lower().encode(), value.encode()) for name, value in (headers or {}).items())
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': payload})
@@ -9,6 +9,8 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.controllers.analysis_controller import AnalysisController
+from src.services import MetricsService, UpstreamOverloadedError, CircuitOpenError, JobQueueFullError
+from src.models import AnalysisJob
 
 
 class TestAnalysisController(unittest.TestCase):
@@ -24,6 +26,7 @@ class TestAnalysisController(unittest.TestCase):
         self.client = self.app.test_client()
 
         self.mock_analysis_service = Mock()
+        self.mock_analysis_service.health.return_value = {'status': 'OK', 'circuits': {'scraping': None, 'openai': None}}
         self.controller.analysis_service = self.mock_analysis_service
 
     def test_init_creates_blueprint(self):
@@ -43,6 +46,10 @@ class TestAnalysisController(unittest.TestCase):
             rules = [rule.rule for rule in test_app.url_map.iter_rules()]
             self.assertIn('/analyse', rules)
             self.assertIn('/health', rules)
+            self.assertIn('/stats', rules)
+            self.assertIn('/analyse/batch', rules)
+            self.assertIn('/analyse/stream', rules)
+            self.assertIn('/metrics', rules)
 
     def test_health_check_returns_ok(self):
         with self.app.app_context():
@@ -50,7 +57,39 @@ class TestAnalysisController(unittest.TestCase):
             data, status_code = response
 
             self.assertEqual(status_code, 200)
-            self.assertEqual(data.get_json(), {'status': 'OK'})
+            self.assertEqual(data.get_json()['status'], 'OK')
+
+    def test_health_check_reports_circuit_state(self):
+        self.mock_analysis_service.health.return_value = {
+            'status': 'DEGRADED',
+            'circuits': {'scraping': None, 'openai': {'state': 'open'}}
+        }
+
+        response = self.client.get('/health')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['status'], 'DEGRADED')
+        self.assertEqual(response.get_json()['circuits']['openai']['state'], 'open')
+
+    def test_init_app_configures_analysis_service(self):
+        controller = AnalysisController()
+        app = Flask(__name__)
+        app.config['REQUEST_TIMEOUT'] = 7
+        app.config['PAGE_CACHE_ENABLED'] = True
+
+        controller.init_app(app)
+
+        self.assertEqual(controller.analysis_service.web_scraper.timeout, 7)
+        self.assertIsNotNone(controller.analysis_service.web_scraper.cache)
+
+    def test_stats_returns_service_stats(self):
+        self.mock_analysis_service.stats.return_value = {'page_cache': {'hits': 3}}
+
+        with self.app.app_context():
+            response = self.client.get('/stats')
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json(), {'page_cache': {'hits': 3}})
 
     def test_analyse_position_success(self):
         self.mock_analysis_service.analyze_position.return_value = {
@@ -98,6 +137,23 @@ class TestAnalysisController(unittest.TestCase):
             response_data = json.loads(response.data)
             self.assertEqual(response_data['error'], 'Campo position é obrigatório')
 
+    def test_analyse_position_fast_mode(self):
+        self.mock_analysis_service.analyze_position.return_value = {"message": "Match estimado de 100%", "mode": "fast"}
+
+        response = self.client.post('/analyse', data=json.dumps({"position": "p", "skills": ["Python"], "mode": "fast"}),
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.mock_analysis_service.analyze_position.call_args[0][0].mode, 'fast')
+
+    def test_analyse_position_invalid_mode(self):
+        response = self.client.post('/analyse', data=json.dumps({"position": "p", "mode": "turbo"}),
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Campo mode deve ser full ou fast')
+        self.mock_analysis_service.analyze_position.assert_not_called()
+
     def test_analyse_position_missing_api_key(self):
         self.app.config['OPENAI_API_KEY'] = None
 
@@ -166,6 +222,38 @@ class TestAnalysisController(unittest.TestCase):
             response_data = json.loads(response.data)
             self.assertEqual(response_data['error'], 'URL inválida')
 
+    @patch('builtins.print')
+    def test_analyse_position_overloaded_returns_503_with_retry_after(self, mock_print):
+        self.mock_analysis_service.analyze_position.side_effect = UpstreamOverloadedError(
+            "Serviço de análise sobrecarregado, tente novamente em instantes", 2.5
+        )
+
+        test_data = {
+            "position": "https://example.com/job",
+            "skills": ["Python"]
+        }
+
+        with self.app.app_context():
+            response = self.client.post('/analyse',
+                                      data=json.dumps(test_data),
+                                      content_type='application/json')
+
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers['Retry-After'], '3')
+            response_data = json.loads(response.data)
+            self.assertEqual(response_data['error'], 'Serviço de análise sobrecarregado, tente novamente em instantes')
+
+    @patch('builtins.print')
+    def test_analyse_position_open_circuit_returns_503(self, mock_print):
+        self.mock_analysis_service.analyze_position.side_effect = CircuitOpenError("jobs.example.com", 12.5)
+
+        response = self.client.post('/analyse', data=json.dumps({"position": "https://jobs.example.com/1"}),
+                                    content_type='application/json')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '13')
+        self.assertEqual(response.get_json()['error'], 'Circuito aberto para jobs.example.com, tente novamente em instantes')
+
     def test_analyse_position_generic_exception(self):
         self.mock_analysis_service.analyze_position.side_effect = Exception("Erro interno")
 
@@ -249,5 +337,330 @@ class TestAnalysisController(unittest.TestCase):
             response = self.client.get('/analyse')
             self.assertEqual(response.status_code, 405)
 
+class TestAnalysisControllerBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['OPENAI_API_KEY'] = 'test_api_key'
+        self.app.config['OPENAI_API_URL'] = 'https://test-openai-url.com'
+        self.app.config['BATCH_MAX_POSITIONS'] = 3
+
+        self.controller = AnalysisController()
+        self.app.register_blueprint(self.controller.blueprint)
+        self.client = self.app.test_client()
+
+        self.mock_analysis_service = Mock()
+        self.controller.analysis_service = self.mock_analysis_service
+
+    def _post(self, data):
+        return self.client.post('/analyse/batch', data=json.dumps(data), content_type='application/json')
+
+    @patch('builtins.print')
+    def test_analyse_batch_returns_per_position_results(self, mock_print):
+        self.mock_analysis_service.analyze_batch.return_value = {
+            "https://example.com/a": {"message": "Match de 80%"},
+            "https://example.com/b": ValueError("Meta description não encontrada"),
+            "https://example.com/c": requests.exceptions.ConnectionError("Connection error"),
+            "https://example.com/d": Exception("boom")
+        }
+        self.app.config['BATCH_MAX_POSITIONS'] = 4
+
+        response = self._post({
+            "positions": ["https://example.com/a", "https://example.com/b", "https://example.com/c", "https://example.com/d"],
+            "skills": ["Python"]
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['results'], [
+            {"position": "https://example.com/a", "message": "Match de 80%"},
+            {"position": "https://example.com/b", "status": 404, "error": "Meta description não encontrada"},
+            {"position": "https://example.com/c", "status": 500, "error": "Erro ao acessar a URL: Connection error"},
+            {"position": "https://example.com/d", "status": 500, "error": "Erro interno do servidor"}
+        ])
+        batch_request, api_key, api_url = self.mock_analysis_service.analyze_batch.call_args[0]
+        self.assertEqual(batch_request.skills, ["Python"])
+        self.assertEqual(api_key, 'test_api_key')
+        self.assertEqual(api_url, 'https://test-openai-url.com')
+
+    @patch('builtins.print')
+    def test_analyse_batch_reports_overloaded_positions(self, mock_print):
+        self.mock_analysis_service.analyze_batch.return_value = {
+            "https://example.com/a": UpstreamOverloadedError("Limite de requisições da OpenAI atingido", 4.2)
+        }
+
+        response = self._post({"positions": ["https://example.com/a"]})
+
+        self.assertEqual(response.get_json()['results'], [{
+            "position": "https://example.com/a",
+            "status": 503,
+            "retry_after": 5,
+            "error": "Limite de requisições da OpenAI atingido"
+        }])
+
+    def test_analyse_batch_empty_json(self):
+        response = self._post({})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'JSON não fornecido')
+
+    def test_analyse_batch_missing_positions(self):
+        response = self._post({"skills": ["Python"], "positions": []})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Campo positions é obrigatório')
+
+    def test_analyse_batch_too_many_positions(self):
+        response = self._post({"positions": ["a", "b", "c", "d"], "skills": []})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Máximo de 3 vagas por requisição')
+
+    def test_analyse_batch_invalid_mode(self):
+        response = self._post({"positions": ["a"], "mode": "turbo"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Campo mode deve ser full ou fast')
+
+    def test_analyse_batch_missing_api_key(self):
+        self.app.config['OPENAI_API_KEY'] = None
+
+        response = self._post({"positions": ["https://example.com/a"]})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.get_json()['error'], 'API key da OpenAI não configurada')
+
+    def test_analyse_batch_missing_api_url(self):
+        self.app.config['OPENAI_API_URL'] = None
+
+        response = self._post({"positions": ["https://example.com/a"]})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.get_json()['error'], 'URL da API OpenAI não configurada')
+
+    @patch('builtins.print')
+    def test_analyse_batch_unexpected_error(self, mock_print):
+        self.mock_analysis_service.analyze_batch.side_effect = Exception("boom")
+
+        response = self._post({"positions": ["https://example.com/a"]})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.get_json()['error'], 'Erro interno do servidor')
+
+
+class TestAnalysisControllerStream(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['OPENAI_API_KEY'] = 'test_api_key'
+        self.app.config['OPENAI_API_URL'] = 'https://test-openai-url.com'
+
+        self.controller = AnalysisController()
+        self.app.register_blueprint(self.controller.blueprint)
+        self.client = self.app.test_client()
+
+        self.mock_analysis_service = Mock()
+        self.controller.analysis_service = self.mock_analysis_service
+
+    def _post(self, data):
+        return self.client.post('/analyse/stream', data=json.dumps(data), content_type='application/json')
+
+    def test_analyse_stream_sends_sse_events(self):
+        self.mock_analysis_service.stream_position.return_value = iter(["Match ", "de 80%"])
+
+        response = self._post({"position": "https://example.com/job", "skills": ["Python"]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+        self.assertEqual(response.get_data(as_text=True), (
+            'event: delta\ndata: {"delta": "Match "}\n\n'
+            'event: delta\ndata: {"delta": "de 80%"}\n\n'
+            'event: done\ndata: {"message": "Match de 80%"}\n\n'
+        ))
+
+    @patch('builtins.print')
+    def test_analyse_stream_emits_error_event(self, mock_print):
+        def failing_stream():
+            yield "Match"
+            raise requests.exceptions.ConnectionError("Connection reset")
+
+        self.mock_analysis_service.stream_position.return_value = failing_stream()
+
+        response = self._post({"position": "https://example.com/job", "skills": ["Python"]})
+
+        body = response.get_data(as_text=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(body.endswith('event: error\ndata: {"error": "Erro ao gerar análise"}\n\n'))
+        mock_print.assert_called_with("[CONTROLLER] ERRO no streaming: Connection reset")
+
+    @patch('builtins.print')
+    def test_analyse_stream_scrape_error_returns_json(self, mock_print):
+        self.mock_analysis_service.stream_position.side_effect = ValueError("Meta description não encontrada")
+
+        response = self._post({"position": "https://example.com/job", "skills": ["Python"]})
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], 'Meta description não encontrada')
+
+    @patch('builtins.print')
+    def test_analyse_stream_overloaded_before_first_chunk_returns_503(self, mock_print):
+        def overloaded_stream():
+            raise UpstreamOverloadedError("Serviço de análise sobrecarregado, tente novamente em instantes", 2)
+            yield
+
+        self.mock_analysis_service.stream_position.return_value = overloaded_stream()
+
+        response = self._post({"position": "https://example.com/job", "skills": ["Python"]})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '2')
+
+    def test_analyse_stream_empty_stream_sends_done(self):
+        self.mock_analysis_service.stream_position.return_value = iter([])
+
+        response = self._post({"position": "https://example.com/job", "skills": ["Python"]})
+
+        self.assertEqual(response.get_data(as_text=True), 'event: done\ndata: {"message": ""}\n\n')
+
+    def test_analyse_stream_missing_position(self):
+        response = self._post({"skills": ["Python"]})
+
+        self.assertEqual(response.status_code, 400)
+
+
+    def _post_job(self, payload):
+        return self.client.post('/analyse', data=json.dumps(payload), content_type='application/json')
+
+    def test_analyse_position_async_returns_accepted_job(self):
+        job = AnalysisJob(position="https://example.com/job", skills=["Python"], id="abc123")
+        self.mock_analysis_service.jobs.submit.return_value = job
+
+        response = self._post_job({"position": "https://example.com/job", "skills": ["Python"], "async": True})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.headers['Location'], '/analyse/abc123')
+        self.assertEqual(response.get_json()['status'], 'queued')
+        args, kwargs = self.mock_analysis_service.jobs.submit.call_args
+        self.assertEqual(args[0].skills, ["Python"])
+        self.assertEqual(args[1:], ('test_api_key', 'https://test-openai-url.com'))
+        self.assertIsNone(kwargs['callback_url'])
+        self.mock_analysis_service.analyze_position.assert_not_called()
+
+    def test_analyse_position_with_callback_url_is_async(self):
+        self.mock_analysis_service.jobs.submit.return_value = AnalysisJob(position="p", skills=[], id="abc123")
+
+        response = self._post_job({"position": "p", "callback_url": "https://client.example.com/hook"})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(self.mock_analysis_service.jobs.submit.call_args[1]['callback_url'],
+                         "https://client.example.com/hook")
+
+    def test_analyse_position_rejects_invalid_callback_url(self):
+        response = self._post_job({"position": "p", "callback_url": "file:///etc/passwd"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], "Campo callback_url deve ser uma URL http(s)")
+        self.mock_analysis_service.jobs.submit.assert_not_called()
+
+    def test_analyse_position_rejects_internal_callback_url(self):
+        self.mock_analysis_service.jobs.accepts_callback.return_value = False
+
+        response = self._post_job({"position": "p", "callback_url": "http://169.254.169.254/latest/meta-data"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], "Campo callback_url não pode apontar para endereços internos")
+        self.mock_analysis_service.jobs.accepts_callback.assert_called_once_with("http://169.254.169.254/latest/meta-data")
+        self.mock_analysis_service.jobs.submit.assert_not_called()
+
+    @patch('builtins.print')
+    def test_analyse_position_async_queue_full(self, mock_print):
+        self.mock_analysis_service.jobs.submit.side_effect = JobQueueFullError(retry_after=4)
+
+        response = self._post_job({"position": "p", "async": True})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers['Retry-After'], '4')
+
+    def test_analyse_position_fast_mode_is_never_async(self):
+        self.mock_analysis_service.analyze_position.return_value = {"message": "ok", "mode": "fast"}
+
+        response = self._post_job({"position": "p", "async": True, "mode": "fast"})
+
+        self.assertEqual(response.status_code, 200)
+        self.mock_analysis_service.jobs.submit.assert_not_called()
+
+    def test_analyse_position_async_ignored_when_jobs_disabled(self):
+        self.mock_analysis_service.jobs = None
+        self.mock_analysis_service.analyze_position.return_value = {"message": "ok"}
+
+        response = self._post_job({"position": "p", "async": True})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_analyse_job_returns_job(self):
+        job = AnalysisJob(position="p", skills=[], id="abc123", status=AnalysisJob.SUCCEEDED, result={"message": "ok"})
+        self.mock_analysis_service.jobs.get.return_value = job
+
+        response = self.client.get('/analyse/abc123')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['result'], {"message": "ok"})
+        self.mock_analysis_service.jobs.get.assert_called_once_with('abc123')
+
+    def test_analyse_job_not_found(self):
+        self.mock_analysis_service.jobs.get.return_value = None
+
+        response = self.client.get('/analyse/missing')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], "Job não encontrado ou expirado")
+
+    def test_analyse_job_when_disabled(self):
+        self.mock_analysis_service.jobs = None
+
+        response = self.client.get('/analyse/abc123')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], "Modo assíncrono desabilitado")
+
+class TestAnalysisControllerMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+
+        self.controller = AnalysisController()
+        self.app.register_blueprint(self.controller.blueprint)
+        self.client = self.app.test_client()
+
+    def test_metrics_endpoint_renders_prometheus_text(self):
+        self.controller.analysis_service.metrics.observe_stage('completion', 0.2)
+
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, MetricsService.CONTENT_TYPE)
+        self.assertIn('analysis_stage_duration_seconds_count{stage="completion"} 1', response.get_data(as_text=True))
+
+    def test_requests_are_counted_by_route_and_status(self):
+        self.client.get('/health')
+        self.client.get('/health')
+        self.client.post('/analyse', data='{}', content_type='application/json')
+
+        output = self.client.get('/metrics').get_data(as_text=True)
+
+        self.assertIn('analysis_http_requests_total{route="/health",status="200"} 2', output)
+        self.assertIn('analysis_http_requests_total{route="/analyse",status="400"} 1', output)
+        self.assertIn('analysis_http_request_duration_seconds_count{route="/health"} 2', output)
+
+    def test_init_app_replaces_metrics(self):
+        previous = self.controller.analysis_service.metrics
+        self.controller.init_app(self.app)
+
+        self.assertIsNot(self.controller.analysis_service.metrics, previous)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,427 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+import json
+import httpx
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.controllers.async_analysis_controller import AsyncAnalysisController
+from src.services import AsyncAnalysisService, MetricsService, UpstreamOverloadedError, JobQueueFullError
+from src.models import AnalysisJob
+
+
+class TestAsyncAnalysisController(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.mock_analysis_service = Mock()
+        self.mock_analysis_service.analyze_position = AsyncMock()
+        self.mock_analysis_service.aclose = AsyncMock()
+        self.mock_analysis_service.health.return_value = {'status': 'OK', 'circuits': {'scraping': None, 'openai': None}}
+        self.controller = AsyncAnalysisController(
+            analysis_service=self.mock_analysis_service,
+            config={'OPENAI_API_KEY': 'test_api_key', 'OPENAI_API_URL': 'https://test-openai-url.com'}
+        )
+
+    async def _request(self, method, path, body=b''):
+        messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await self.controller({'type': 'http', 'method': method, 'path': path}, receive, send)
+
+        status_code = sent[0]['status']
+        return status_code, json.loads(sent[1]['body'])
+
+    def test_from_config_creates_async_service(self):
+        controller = AsyncAnalysisController.from_config({'OPENAI_API_KEY': 'key'})
+
+        self.assertIsInstance(controller.analysis_service, AsyncAnalysisService)
+        self.assertEqual(controller.config['OPENAI_API_KEY'], 'key')
+
+    async def test_health_check(self):
+        status_code, data = await self._request('GET', '/health')
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data, {'status': 'OK', 'circuits': {'scraping': None, 'openai': None}})
+
+    async def test_stats(self):
+        self.mock_analysis_service.stats.return_value = {'page_cache': None}
+
+        status_code, data = await self._request('GET', '/stats')
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data, {'page_cache': None})
+
+    async def test_unknown_route(self):
+        status_code, data = await self._request('GET', '/unknown')
+        self.assertEqual(status_code, 404)
+
+    async def test_method_not_allowed(self):
+        status_code, data = await self._request('GET', '/analyse')
+        self.assertEqual(status_code, 405)
+
+    async def test_analyse_position_success(self):
+        self.mock_analysis_service.analyze_position.return_value = {"message": "Match de 85%"}
+
+        body = json.dumps({"position": "https://example.com/job", "skills": ["Python"]}).encode()
+        status_code, data = await self._request('POST', '/analyse', body)
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data, {"message": "Match de 85%"})
+        call_args = self.mock_analysis_service.analyze_position.call_args
+        self.assertEqual(call_args[0][0].skills, ["Python"])
+        self.assertEqual(call_args[0][1], 'test_api_key')
+        self.assertEqual(call_args[0][2], 'https://test-openai-url.com')
+
+    async def test_analyse_position_invalid_json(self):
+        status_code, data = await self._request('POST', '/analyse', b'not json')
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(data['error'], 'JSON não fornecido')
+
+    async def test_analyse_position_missing_position(self):
+        status_code, data = await self._request('POST', '/analyse', b'{"skills": []}')
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(data['error'], 'Campo position é obrigatório')
+
+    async def test_analyse_position_invalid_mode(self):
+        status_code, data = await self._request('POST', '/analyse', b'{"position": "p", "mode": "turbo"}')
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(data['error'], 'Campo mode deve ser full ou fast')
+
+    async def test_analyse_position_missing_api_key(self):
+        self.controller.config['OPENAI_API_KEY'] = ''
+
+        status_code, data = await self._request('POST', '/analyse', b'{"position": "https://example.com"}')
+
+        self.assertEqual(status_code, 500)
+        self.assertEqual(data['error'], 'API key da OpenAI não configurada')
+
+    async def test_analyse_position_missing_api_url(self):
+        self.controller.config['OPENAI_API_URL'] = ''
+
+        status_code, data = await self._request('POST', '/analyse', b'{"position": "https://example.com"}')
+
+        self.assertEqual(status_code, 500)
+        self.assertEqual(data['error'], 'URL da API OpenAI não configurada')
+
+    @patch('builtins.print')
+    async def test_analyse_position_request_error(self, mock_print):
+        self.mock_analysis_service.analyze_position.side_effect = httpx.ConnectError("Connection error")
+
+        status_code, data = await self._request('POST', '/analyse', b'{"position": "https://example.com"}')
+
+        self.assertEqual(status_code, 500)
+        self.assertEqual(data['error'], 'Erro ao acessar a URL: Connection error')
+
+    @patch('builtins.print')
+    async def test_analyse_position_value_error(self, mock_print):
+        self.mock_analysis_service.analyze_position.side_effect = ValueError("Meta description não encontrada")
+
+        status_code, data = await self._request('POST', '/analyse', b'{"position": "https://example.com"}')
+
+        self.assertEqual(status_code, 404)
+        self.assertEqual(data['error'], 'Meta description não encontrada')
+
+    @patch('builtins.print')
+    async def test_analyse_position_generic_exception(self, mock_print):
+        self.mock_analysis_service.analyze_position.side_effect = Exception("boom")
+
+        status_code, data = await self._request('POST', '/analyse', b'{"position": "https://example.com"}')
+
+        self.assertEqual(status_code, 500)
+        self.assertEqual(data['error'], 'Erro interno do servidor')
+
+    @patch('builtins.print')
+    async def test_analyse_batch(self, mock_print):
+        self.mock_analysis_service.analyze_batch = AsyncMock(return_value={
+            "https://example.com/a": {"message": "Match"},
+            "https://example.com/b": httpx.ConnectError("Connection error"),
+            "https://example.com/c": ValueError("Meta description não encontrada"),
+            "https://example.com/d": Exception("boom")
+        })
+
+        body = json.dumps({"positions": ["https://example.com/a", "https://example.com/b"], "skills": ["Python"]}).encode()
+        status_code, data = await self._request('POST', '/analyse/batch', body)
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data['results'], [
+            {"position": "https://example.com/a", "message": "Match"},
+            {"position": "https://example.com/b", "status": 500, "error": "Erro ao acessar a URL: Connection error"},
+            {"position": "https://example.com/c", "status": 404, "error": "Meta description não encontrada"},
+            {"position": "https://example.com/d", "status": 500, "error": "Erro interno do servidor"}
+        ])
+
+    async def test_analyse_batch_validation(self):
+        self.controller.config['BATCH_MAX_POSITIONS'] = 1
+
+        self.assertEqual((await self._request('POST', '/analyse/batch', b'x'))[0], 400)
+        self.assertEqual((await self._request('POST', '/analyse/batch', b'{"positions": "a"}'))[0], 400)
+        status_code, data = await self._request('POST', '/analyse/batch', b'{"positions": ["a", "b"]}')
+        self.assertEqual(status_code, 400)
+        self.assertEqual(data['error'], 'Máximo de 1 vagas por requisição')
+        status_code, data = await self._request('POST', '/analyse/batch', b'{"positions": ["a"], "mode": "turbo"}')
+        self.assertEqual(status_code, 400)
+
+    async def test_analyse_batch_missing_api_config(self):
+        self.controller.config['OPENAI_API_URL'] = ''
+        status_code, data = await self._request('POST', '/analyse/batch', b'{"positions": ["a"]}')
+        self.assertEqual(data['error'], 'URL da API OpenAI não configurada')
+
+        self.controller.config['OPENAI_API_KEY'] = ''
+        status_code, data = await self._request('POST', '/analyse/batch', b'{"positions": ["a"]}')
+        self.assertEqual(data['error'], 'API key da OpenAI não configurada')
+
+    @patch('builtins.print')
+    async def test_analyse_batch_unexpected_error(self, mock_print):
+        self.mock_analysis_service.analyze_batch = AsyncMock(side_effect=Exception("boom"))
+
+        status_code, data = await self._request('POST', '/analyse/batch', b'{"positions": ["a"]}')
+
+        self.assertEqual(status_code, 500)
+
+    async def _raw_request(self, method, path, body=b''):
+        messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await self.controller({'type': 'http', 'method': method, 'path': path}, receive, send)
+        return sent
+
+    async def test_analyse_stream_sends_sse_events(self):
+        async def chunks():
+            yield "Match "
+            yield "de 90%"
+
+        self.mock_analysis_service.stream_position = AsyncMock(return_value=chunks())
+
+        body = json.dumps({"position": "https://example.com/job", "skills": ["Python"]}).encode()
+        sent = await self._raw_request('POST', '/analyse/stream', body)
+
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertIn((b'content-type', b'text/event-stream; charset=utf-8'), sent[0]['headers'])
+        stream = b''.join(message.get('body', b'') for message in sent[1:]).decode('utf-8')
+        self.assertEqual(stream, (
+            'event: delta\ndata: {"delta": "Match "}\n\n'
+            'event: delta\ndata: {"delta": "de 90%"}\n\n'
+            'event: done\ndata: {"message": "Match de 90%"}\n\n'
+        ))
+        self.assertFalse(sent[-1]['more_body'])
+
+    @patch('builtins.print')
+    async def test_analyse_stream_emits_error_event(self, mock_print):
+        async def chunks():
+            yield "Match"
+            raise httpx.ReadError("Connection reset")
+
+        self.mock_analysis_service.stream_position = AsyncMock(return_value=chunks())
+
+        sent = await self._raw_request('POST', '/analyse/stream', b'{"position": "https://example.com/job"}')
+
+        stream = b''.join(message.get('body', b'') for message in sent[1:]).decode('utf-8')
+        self.assertTrue(stream.endswith('event: error\ndata: {"error": "Erro ao gerar análise"}\n\n'))
+
+    @patch('builtins.print')
+    async def test_analyse_stream_scrape_error_returns_json(self, mock_print):
+        self.mock_analysis_service.stream_position = AsyncMock(side_effect=ValueError("Meta description não encontrada"))
+
+        status_code, data = await self._request('POST', '/analyse/stream', b'{"position": "https://example.com/job"}')
+
+        self.assertEqual(status_code, 404)
+
+    @patch('builtins.print')
+    async def test_analyse_overloaded_returns_503_with_retry_after(self, mock_print):
+        self.mock_analysis_service.analyze_position.side_effect = UpstreamOverloadedError("Limite de requisições da OpenAI atingido", 7)
+
+        sent = await self._raw_request('POST', '/analyse', b'{"position": "https://example.com/job"}')
+
+        self.assertEqual(sent[0]['status'], 503)
+        self.assertIn((b'retry-after', b'7'), sent[0]['headers'])
+        self.assertEqual(json.loads(sent[1]['body'])['error'], 'Limite de requisições da OpenAI atingido')
+
+    @patch('builtins.print')
+    async def test_analyse_stream_overloaded_before_first_chunk_returns_503(self, mock_print):
+        async def chunks():
+            raise UpstreamOverloadedError("Serviço de análise sobrecarregado, tente novamente em instantes")
+            yield
+
+        self.mock_analysis_service.stream_position = AsyncMock(return_value=chunks())
+
+        sent = await self._raw_request('POST', '/analyse/stream', b'{"position": "https://example.com/job"}')
+
+        self.assertEqual(sent[0]['status'], 503)
+        self.assertIn((b'retry-after', b'1'), sent[0]['headers'])
+
+    async def test_analyse_stream_empty_stream_sends_done(self):
+        async def chunks():
+            return
+            yield
+
+        self.mock_analysis_service.stream_position = AsyncMock(return_value=chunks())
+
+        sent = await self._raw_request('POST', '/analyse/stream', b'{"position": "https://example.com/job"}')
+
+        stream = b''.join(message.get('body', b'') for message in sent[1:]).decode('utf-8')
+        self.assertEqual(stream, 'event: done\ndata: {"message": ""}\n\n')
+
+    @patch('builtins.print')
+    async def test_analyse_batch_reports_overloaded_positions(self, mock_print):
+        self.mock_analysis_service.analyze_batch = AsyncMock(return_value={
+            "https://example.com/a": UpstreamOverloadedError("Limite de requisições da OpenAI atingido", 3)
+        })
+
+        status_code, data = await self._request('POST', '/analyse/batch', b'{"positions": ["https://example.com/a"]}')
+
+        self.assertEqual(data['results'][0]['status'], 503)
+        self.assertEqual(data['results'][0]['retry_after'], 3)
+
+    @patch('builtins.print')
+    async def test_analyse_batch_reports_cancelled_positions(self, mock_print):
+        import asyncio
+        self.mock_analysis_service.analyze_batch = AsyncMock(return_value={
+            "https://example.com/a": {"message": "Match de 85%"},
+            "https://example.com/b": asyncio.CancelledError()
+        })
+
+        status_code, data = await self._request('POST', '/analyse/batch', b'{"positions": ["https://example.com/a", "https://example.com/b"]}')
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data['results'][0]['message'], "Match de 85%")
+        self.assertEqual(data['results'][1]['status'], 500)
+
+    async def test_metrics_endpoint_renders_prometheus_text(self):
+        self.mock_analysis_service.metrics = MetricsService()
+        self.mock_analysis_service.metrics.observe_stage('fetch', 0.01)
+
+        await self._request('GET', '/health')
+        sent = await self._raw_request('GET', '/metrics')
+
+        output = sent[1]['body'].decode('utf-8')
+        self.assertEqual(sent[0]['status'], 200)
+        self.assertIn((b'content-type', MetricsService.CONTENT_TYPE.encode()), sent[0]['headers'])
+        self.assertIn('analysis_stage_duration_seconds_count{stage="fetch"} 1', output)
+        self.assertIn('analysis_http_requests_total{route="/health",status="200"} 1', output)
+
+    async def test_lifespan_closes_service(self):
+        messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await self.controller({'type': 'lifespan'}, receive, send)
+
+        self.assertEqual([m['type'] for m in sent], ['lifespan.startup.complete', 'lifespan.shutdown.complete'])
+        self.mock_analysis_service.aclose.assert_awaited_once()
+
+    async def test_ignores_other_scope_types(self):
+        send = AsyncMock()
+        await self.controller({'type': 'websocket'}, AsyncMock(), send)
+        send.assert_not_awaited()
+
+
+    async def test_analyse_position_async_returns_accepted_job(self):
+        self.mock_analysis_service.jobs.submit.return_value = AnalysisJob(position="p", skills=["Python"], id="abc123")
+        body = json.dumps({"position": "p", "skills": ["Python"], "async": True}).encode()
+
+        sent = await self._raw_request('POST', '/analyse', body)
+
+        self.assertEqual(sent[0]['status'], 202)
+        self.assertIn((b'location', b'/analyse/abc123'), sent[0]['headers'])
+        self.assertEqual(json.loads(sent[1]['body'])['id'], 'abc123')
+        self.mock_analysis_service.analyze_position.assert_not_awaited()
+
+    async def test_analyse_position_fast_mode_is_never_async(self):
+        self.mock_analysis_service.analyze_position.return_value = {"message": "ok", "mode": "fast"}
+        body = json.dumps({"position": "p", "skills": ["Python"], "async": True, "mode": "fast"}).encode()
+
+        status_code, data = await self._request('POST', '/analyse', body)
+
+        self.assertEqual(status_code, 200)
+        self.mock_analysis_service.jobs.submit.assert_not_called()
+
+    async def test_analyse_position_rejects_invalid_callback_url(self):
+        body = json.dumps({"position": "p", "callback_url": "ftp://client.example.com"}).encode()
+
+        status_code, data = await self._request('POST', '/analyse', body)
+
+        self.assertEqual(status_code, 400)
+        self.mock_analysis_service.jobs.submit.assert_not_called()
+
+    async def test_analyse_position_rejects_internal_callback_url(self):
+        self.mock_analysis_service.jobs.accepts_callback.return_value = False
+        body = json.dumps({"position": "p", "callback_url": "http://127.0.0.1:8080/hook"}).encode()
+
+        status_code, data = await self._request('POST', '/analyse', body)
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(data['error'], "Campo callback_url não pode apontar para endereços internos")
+        self.mock_analysis_service.jobs.submit.assert_not_called()
+
+    @patch('builtins.print')
+    async def test_analyse_position_async_queue_full(self, mock_print):
+        self.mock_analysis_service.jobs.submit.side_effect = JobQueueFullError(retry_after=2)
+        body = json.dumps({"position": "p", "callback_url": "https://client.example.com/hook"}).encode()
+
+        sent = await self._raw_request('POST', '/analyse', body)
+
+        self.assertEqual(sent[0]['status'], 503)
+        self.assertIn((b'retry-after', b'2'), sent[0]['headers'])
+
+    async def test_analyse_position_invalid_json_is_not_async(self):
+        status_code, data = await self._request('POST', '/analyse', b'{"async": tru')
+
+        self.assertEqual(status_code, 400)
+        self.mock_analysis_service.jobs.submit.assert_not_called()
+
+    async def test_analyse_job_returns_job(self):
+        self.mock_analysis_service.jobs.get.return_value = AnalysisJob(position="p", skills=[], id="abc123")
+        self.mock_analysis_service.metrics = MetricsService()
+
+        status_code, data = await self._request('GET', '/analyse/abc123')
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(data['status'], 'queued')
+        self.mock_analysis_service.jobs.get.assert_called_once_with('abc123')
+        self.assertIn('route="/analyse/<job_id>"', self.mock_analysis_service.metrics.render())
+
+    async def test_analyse_job_not_found(self):
+        self.mock_analysis_service.jobs.get.return_value = None
+
+        status_code, data = await self._request('GET', '/analyse/missing')
+
+        self.assertEqual(status_code, 404)
+        self.assertEqual(data['error'], "Job não encontrado ou expirado")
+
+    async def test_analyse_job_when_disabled(self):
+        self.mock_analysis_service.jobs = None
+
+        status_code, data = await self._request('GET', '/analyse/abc123')
+
+        self.assertEqual(status_code, 404)
+        self.assertEqual(data['error'], "Modo assíncrono desabilitado")
+
+    async def test_analyse_job_prefix_requires_get(self):
+        status_code, data = await self._request('DELETE', '/analyse/abc123')
+
+        self.assertEqual(status_code, 404)
+
+if __name__ == '__main__':
+    unittest.main()
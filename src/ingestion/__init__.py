@@ -0,0 +1,12 @@
+from .url_source import UrlSource
+from .host_politeness import HostPoliteness
+from .description_ingester import DescriptionIngester, IngestionReport
+from .ingestion_cli import main
+
+__all__ = [
+    'UrlSource',
+    'HostPoliteness',
+    'DescriptionIngester',
+    'IngestionReport',
+    'main'
+]
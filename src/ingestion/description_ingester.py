@@ -0,0 +1,148 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import List, Optional
+import requests
+from src.services import DescriptionStoreService, TextProcessingService, WebScrapingService
+from .host_politeness import HostPoliteness
+
+
+@dataclass
+class IngestionReport:
+    total: int = 0
+    stored: int = 0
+    skipped: int = 0
+    missing: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    hosts: dict = field(default_factory=dict)
+
+    OUTCOMES = ('stored', 'skipped', 'missing', 'failed')
+
+    @property
+    def processed(self) -> int:
+        return self.stored + self.skipped + self.missing + self.failed
+
+    @property
+    def throughput(self) -> float:
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failed / self.processed if self.processed else 0.0
+
+    def record(self, host: str, outcome: str) -> None:
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        counts = self.hosts.setdefault(host, dict.fromkeys(self.OUTCOMES, 0))
+        counts[outcome] += 1
+
+    def progress(self) -> str:
+        percent = 100 * self.processed / self.total if self.total else 100.0
+        return (f"[INGEST] {self.processed}/{self.total} ({percent:.1f}%) - "
+                f"{self.throughput:.1f} URLs/s - {self.failed} falhas")
+
+    def summary(self) -> dict:
+        return {
+            'total': self.total,
+            'stored': self.stored,
+            'skipped': self.skipped,
+            'missing': self.missing,
+            'failed': self.failed,
+            'failure_rate': round(self.failure_rate, 4),
+            'elapsed_seconds': round(self.elapsed, 3),
+            'throughput_per_second': round(self.throughput, 2),
+            'hosts': self.hosts
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"URLs: {self.total} ({self.stored} gravadas, {self.skipped} já na base, "
+            f"{self.missing} sem descrição, {self.failed} com erro)",
+            f"Tempo: {self.elapsed:.2f}s - {self.throughput:.1f} URLs/s",
+            "Por host:"
+        ]
+        for host, counts in sorted(self.hosts.items()):
+            lines.append(f"  {host}: " + ', '.join(f"{outcome}={counts[outcome]}" for outcome in self.OUTCOMES))
+        return '\n'.join(lines)
+
+
+class DescriptionIngester:
+
+    def __init__(self, store: DescriptionStoreService, web_scraper: WebScrapingService,
+                 text_processor: TextProcessingService = None, politeness: HostPoliteness = None,
+                 concurrency: int = 8, force: bool = False, progress_interval: float = 2.0):
+        self.store = store
+        self.web_scraper = web_scraper
+        self.text_processor = text_processor or TextProcessingService()
+        self.politeness = politeness or HostPoliteness()
+        self.concurrency = concurrency
+        self.force = force
+        self.progress_interval = progress_interval
+
+    def run(self, urls: List[str]) -> IngestionReport:
+        report = IngestionReport(total=len(urls))
+        if not urls:
+            return report
+
+        started = last_progress = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(urls)))) as executor:
+            futures = [executor.submit(self._ingest, url) for url in self.interleave(urls)]
+            for future in as_completed(futures):
+                report.record(*future.result())
+                now = time.perf_counter()
+                report.elapsed = now - started
+                if now - last_progress >= self.progress_interval:
+                    last_progress = now
+                    print(report.progress())
+
+        report.elapsed = time.perf_counter() - started
+        print(report.progress())
+        return report
+
+    @staticmethod
+    def interleave(urls: List[str]) -> List[str]:
+        by_host = {}
+        for url in urls:
+            by_host.setdefault(HostPoliteness.host_of(url), deque()).append(url)
+
+        queues = deque(by_host.values())
+        ordered = []
+        while queues:
+            queue = queues.popleft()
+            ordered.append(queue.popleft())
+            if queue:
+                queues.append(queue)
+        return ordered
+
+    def _ingest(self, url: str) -> tuple:
+        host = HostPoliteness.host_of(url)
+        if not self.force and self.store.get(url) is not None:
+            return host, 'skipped'
+
+        try:
+            with self.politeness.slot(url):
+                fetched = self.web_scraper.fetch_description(url)
+        except requests.exceptions.HTTPError as e:
+            self._respect_retry_after(url, e.response)
+            return host, 'failed'
+        except Exception as e:
+            print(f"[INGEST] ERRO em {url}: {str(e)}")
+            return host, 'failed'
+
+        if fetched is None or not fetched.description:
+            return host, 'missing'
+
+        description = self.text_processor.format_description(fetched.description)
+        self.store.put(url, description, fetched.etag, fetched.last_modified)
+        return host, 'stored'
+
+    def _respect_retry_after(self, url: str, response: Optional[requests.Response]) -> None:
+        if response is None or response.status_code not in (429, 503):
+            return
+
+        try:
+            seconds = float(response.headers.get('Retry-After', ''))
+        except ValueError:
+            seconds = self.politeness.min_interval * 10
+        self.politeness.back_off(url, seconds)
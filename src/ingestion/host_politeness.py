@@ -0,0 +1,65 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from src.utils import normalize_url
+
+
+class _HostState:
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.next_at = 0.0
+
+
+class HostPoliteness:
+
+    def __init__(self, max_per_host: int = 2, min_interval: float = 0.5, max_backoff: float = 300.0):
+        self.max_per_host = max(1, max_per_host)
+        self.min_interval = min_interval
+        self.max_backoff = max_backoff
+        self.waited_seconds = 0.0
+        self.backoffs = 0
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(normalize_url(url)).netloc
+
+    @contextmanager
+    def slot(self, url: str):
+        state = self._state(self.host_of(url))
+        with state.semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, state.next_at)
+                state.next_at = start + self.min_interval
+                self.waited_seconds += start - now
+
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+    def back_off(self, url: str, seconds: float) -> None:
+        state = self._state(self.host_of(url))
+        with self._lock:
+            state.next_at = max(state.next_at, time.monotonic() + min(seconds, self.max_backoff))
+            self.backoffs += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hosts': len(self._hosts),
+                'max_per_host': self.max_per_host,
+                'min_interval': self.min_interval,
+                'waited_seconds': round(self.waited_seconds, 3),
+                'backoffs': self.backoffs
+            }
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.max_per_host)
+            return state
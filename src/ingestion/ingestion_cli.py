@@ -0,0 +1,88 @@
+import argparse
+import contextlib
+import json
+import sys
+from typing import List, Optional
+
+from src.services import DescriptionStoreService, WebScrapingService
+from src.utils import HttpSessionUtils
+from .description_ingester import DescriptionIngester
+from .host_politeness import HostPoliteness
+from .url_source import UrlSource
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Pré-carrega a base de descrições a partir de uma lista de URLs ou de um sitemap"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--file', help="Arquivo com uma URL de vaga por linha")
+    source.add_argument('--sitemap', help="URL ou caminho de um sitemap (aceita sitemap index e .gz)")
+    parser.add_argument('--match', default=None, help="Padrão glob para filtrar as URLs (ex.: '*/vagas/*')")
+    parser.add_argument('--limit', type=int, default=None, help="Máximo de URLs processadas")
+    parser.add_argument('--store-path', default=None, help="Arquivo SQLite da base (padrão: DESCRIPTION_STORE_PATH)")
+    parser.add_argument('--concurrency', type=int, default=8, help="Downloads simultâneos no total")
+    parser.add_argument('--per-host', type=int, default=2, help="Downloads simultâneos por host")
+    parser.add_argument('--min-interval-ms', type=float, default=500, help="Intervalo mínimo entre requisições ao mesmo host")
+    parser.add_argument('--force', action='store_true', help="Baixa novamente URLs que já estão na base")
+    parser.add_argument('--progress-interval', type=float, default=2.0, help="Segundos entre relatórios de progresso")
+    parser.add_argument('--json', action='store_true', help="Imprime o relatório final em JSON")
+    parser.add_argument('--max-failure-rate', type=float, default=None, help="Falha se a taxa de erro ultrapassar este valor")
+    return parser
+
+
+def build_web_scraper(config, concurrency: int) -> WebScrapingService:
+    pool_maxsize = max(concurrency, config.get('HTTP_POOL_MAXSIZE', 10))
+    return WebScrapingService.from_config(
+        config, session=HttpSessionUtils.create_session_from_config({**config, 'HTTP_POOL_MAXSIZE': pool_maxsize})
+    )
+
+
+def main(argv: Optional[List[str]] = None, config=None) -> int:
+    args = build_parser().parse_args(argv)
+    config = config or {}
+
+    web_scraper = build_web_scraper(config, args.concurrency)
+    source = UrlSource(session=web_scraper.session, timeout=web_scraper.timeout)
+    if args.file:
+        urls = source.read_url_file(args.file, args.match)
+    else:
+        urls = source.read_sitemap(args.sitemap, args.match)
+    urls = urls[:args.limit] if args.limit is not None else urls
+
+    store = DescriptionStoreService(
+        args.store_path or config.get('DESCRIPTION_STORE_PATH', 'cache/descriptions.sqlite3'),
+        max_entries=config.get('DESCRIPTION_STORE_MAX_ENTRIES', 100000),
+        max_age=config.get('DESCRIPTION_STORE_MAX_AGE', 7 * 24 * 3600),
+        refresh_interval=config.get('DESCRIPTION_REFRESH_INTERVAL', 6 * 3600)
+    )
+    politeness = HostPoliteness(max_per_host=args.per_host, min_interval=args.min_interval_ms / 1000)
+    ingester = DescriptionIngester(
+        store,
+        web_scraper,
+        politeness=politeness,
+        concurrency=args.concurrency,
+        force=args.force,
+        progress_interval=args.progress_interval
+    )
+
+    if not args.json:
+        print(f"[INGEST] {len(urls)} URLs para processar com concorrência {args.concurrency}")
+    logs = contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext()
+    try:
+        with logs:
+            report = ingester.run(urls)
+    finally:
+        store.close()
+
+    summary = report.summary()
+    summary['politeness'] = politeness.stats()
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        print(report.format())
+
+    if args.max_failure_rate is not None and report.failure_rate > args.max_failure_rate:
+        print(f"[INGEST] ERRO: taxa de erro {round(report.failure_rate, 4)} acima do limite de {args.max_failure_rate}")
+        return 1
+    return 0
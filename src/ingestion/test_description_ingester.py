@@ -0,0 +1,118 @@
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+import requests
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ingestion import DescriptionIngester, HostPoliteness, IngestionReport
+from src.services import DescriptionStoreService, FetchedDescription
+
+
+class TestDescriptionIngester(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DescriptionStoreService(os.path.join(self.tmp.name, 'd.sqlite3'))
+        self.web_scraper = Mock()
+        self.politeness = HostPoliteness(min_interval=0)
+        self.ingester = DescriptionIngester(self.store, self.web_scraper, politeness=self.politeness, concurrency=4)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_interleave_round_robins_hosts(self):
+        urls = ["https://a.com/1", "https://a.com/2", "https://a.com/3", "https://b.com/1", "https://c.com/1"]
+
+        self.assertEqual(DescriptionIngester.interleave(urls), [
+            "https://a.com/1", "https://b.com/1", "https://c.com/1", "https://a.com/2", "https://a.com/3"
+        ])
+
+    @patch('builtins.print')
+    def test_run_classifies_outcomes(self, mock_print):
+        self.store.put("https://a.com/cached", "Já na base")
+
+        def fetch(url):
+            if url.endswith('/gone'):
+                raise requests.exceptions.HTTPError("404", response=Mock(status_code=404))
+            if url.endswith('/down'):
+                raise requests.exceptions.ConnectionError("down")
+            if url.endswith('/empty'):
+                return FetchedDescription(None)
+            return FetchedDescription("  Vaga   Python ", '"v1"')
+
+        self.web_scraper.fetch_description.side_effect = fetch
+        urls = ["https://a.com/1", "https://a.com/cached", "https://b.com/gone", "https://b.com/down", "https://b.com/empty"]
+
+        report = self.ingester.run(urls)
+
+        self.assertEqual((report.stored, report.skipped, report.failed, report.missing), (1, 1, 2, 1))
+        self.assertEqual(report.hosts['b.com'], {'stored': 0, 'skipped': 0, 'missing': 1, 'failed': 2})
+        self.assertEqual(self.store.get("https://a.com/1").description, "Vaga Python")
+        self.assertEqual(self.store.get("https://a.com/1").etag, '"v1"')
+        self.assertEqual(self.web_scraper.fetch_description.call_count, 4)
+        mock_print.assert_any_call("[INGEST] ERRO em https://b.com/down: down")
+        self.assertTrue(mock_print.call_args[0][0].startswith("[INGEST] 5/5 (100.0%)"))
+
+    @patch('builtins.print')
+    def test_force_refetches_cached_urls(self, mock_print):
+        self.store.put("https://a.com/1", "Antiga")
+        self.web_scraper.fetch_description.return_value = FetchedDescription("Nova")
+        self.ingester.force = True
+
+        report = self.ingester.run(["https://a.com/1"])
+
+        self.assertEqual(report.stored, 1)
+        self.assertEqual(self.store.get("https://a.com/1").description, "Nova")
+
+    @patch('builtins.print')
+    def test_rate_limited_host_backs_off(self, mock_print):
+        responses = [
+            Mock(status_code=429, headers={'Retry-After': '30'}),
+            Mock(status_code=503, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+            Mock(status_code=500, headers={})
+        ]
+        self.web_scraper.fetch_description.side_effect = [
+            requests.exceptions.HTTPError(response=response) for response in responses
+        ]
+        self.politeness.back_off = Mock()
+        self.ingester.concurrency = 1
+
+        self.ingester.run(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+
+        self.assertEqual([call.args[1] for call in self.politeness.back_off.call_args_list], [30.0, 0.0])
+
+    @patch('builtins.print')
+    def test_reports_progress_periodically(self, mock_print):
+        self.web_scraper.fetch_description.return_value = FetchedDescription("Vaga")
+        self.ingester.progress_interval = 0
+
+        self.ingester.run(["https://a.com/1", "https://a.com/2"])
+
+        progress = [call.args[0] for call in mock_print.call_args_list if call.args[0].startswith("[INGEST] ")]
+        self.assertEqual(len(progress), 3)
+
+    def test_run_without_urls(self):
+        self.assertEqual(self.ingester.run([]).summary()['total'], 0)
+
+
+class TestIngestionReport(unittest.TestCase):
+
+    def test_summary_and_format(self):
+        report = IngestionReport(total=3, elapsed=2.0)
+        report.record('a.com', 'stored')
+        report.record('a.com', 'stored')
+        report.record('b.com', 'failed')
+
+        summary = report.summary()
+        self.assertEqual(summary['throughput_per_second'], 1.5)
+        self.assertEqual(summary['failure_rate'], 0.3333)
+        self.assertIn("a.com: stored=2, skipped=0, missing=0, failed=0", report.format())
+        self.assertEqual(IngestionReport().throughput, 0.0)
+        self.assertEqual(IngestionReport().failure_rate, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
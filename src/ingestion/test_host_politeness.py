@@ -0,0 +1,63 @@
+import threading
+import time
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ingestion import HostPoliteness
+
+
+class TestHostPoliteness(unittest.TestCase):
+
+    def test_host_of_normalizes(self):
+        self.assertEqual(HostPoliteness.host_of("HTTPS://Example.com:443/vagas/1"), "example.com")
+
+    def test_spaces_requests_to_same_host(self):
+        politeness = HostPoliteness(max_per_host=4, min_interval=0.05)
+        started = []
+
+        for url in ["https://a.com/1", "https://a.com/2", "https://b.com/1"]:
+            with politeness.slot(url):
+                started.append(time.monotonic())
+
+        self.assertGreaterEqual(started[1] - started[0], 0.045)
+        self.assertLess(started[2] - started[1], 0.04)
+        self.assertEqual(politeness.stats()['hosts'], 2)
+        self.assertGreater(politeness.stats()['waited_seconds'], 0)
+
+    def test_limits_concurrency_per_host(self):
+        politeness = HostPoliteness(max_per_host=2, min_interval=0)
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def fetch():
+            with politeness.slot("https://a.com/job"):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=fetch) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(peak[0], 2)
+
+    def test_back_off_delays_next_request(self):
+        politeness = HostPoliteness(min_interval=0, max_backoff=0.05)
+        politeness.back_off("https://a.com/1", 60)
+
+        started = time.monotonic()
+        with politeness.slot("https://a.com/2"):
+            waited = time.monotonic() - started
+
+        self.assertGreaterEqual(waited, 0.04)
+        self.assertEqual(politeness.stats()['backoffs'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
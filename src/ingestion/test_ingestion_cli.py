@@ -0,0 +1,88 @@
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark import FakeJobBoardServer
+from src.ingestion import main
+from src.ingestion.ingestion_cli import build_parser, build_web_scraper
+from src.services import DescriptionStoreService
+
+
+class TestIngestionCli(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.tmp.name, 'descriptions.sqlite3')
+        self.base_args = ['--store-path', self.store_path, '--min-interval-ms', '0', '--concurrency', '4']
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parser_requires_a_source(self):
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            build_parser().parse_args([])
+
+        args = build_parser().parse_args(['--file', 'urls.txt'])
+        self.assertEqual((args.concurrency, args.per_host, args.min_interval_ms), (8, 2, 500))
+
+    def test_build_web_scraper_from_config(self):
+        web_scraper = build_web_scraper({'REQUEST_TIMEOUT': 3, 'SCRAPE_RETRY_MAX_ATTEMPTS': 2,
+                                         'CIRCUIT_BREAKER_ENABLED': True}, concurrency=32)
+
+        self.assertEqual(web_scraper.timeout, 3)
+        self.assertEqual(web_scraper.retry_policy.max_attempts, 2)
+        self.assertIsNotNone(web_scraper.circuit_breakers)
+        self.assertEqual(web_scraper.session.get_adapter('https://a.com')._pool_maxsize, 32)
+
+    @patch('builtins.print')
+    def test_warms_store_from_sitemap(self, mock_print):
+        with FakeJobBoardServer(page_size=2048, sitemap_size=5) as server:
+            exit_code = main(self.base_args + ['--sitemap', server.sitemap_url, '--json'])
+            requests_served = server.requests
+            cached_url = server.job_url(3)
+
+        summary = json.loads(mock_print.call_args_list[-1][0][0])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual((summary['total'], summary['stored'], summary['failed']), (5, 5, 0))
+        self.assertEqual(summary['politeness']['hosts'], 1)
+        self.assertEqual(requests_served, 6)
+
+        store = DescriptionStoreService(self.store_path)
+        self.assertTrue(store.get(cached_url).description.startswith("Vaga /jobs/3: Python"))
+        store.close()
+
+    @patch('builtins.print')
+    def test_skips_urls_already_in_store(self, mock_print):
+        with FakeJobBoardServer(page_size=1024) as server:
+            urls_file = os.path.join(self.tmp.name, 'urls.txt')
+            with open(urls_file, 'w') as f:
+                f.write('\n'.join(server.job_url(index) for index in range(3)))
+
+            main(self.base_args + ['--file', urls_file, '--limit', '2'])
+            exit_code = main(self.base_args + ['--file', urls_file])
+            requests_served = server.requests
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(requests_served, 3)
+        mock_print.assert_any_call("[INGEST] 3 URLs para processar com concorrência 4")
+        self.assertTrue(mock_print.call_args[0][0].startswith("URLs: 3 (1 gravadas, 2 já na base"))
+
+    @patch('builtins.print')
+    def test_fails_when_failure_rate_exceeded(self, mock_print):
+        with FakeJobBoardServer(error_rate=1.0, sitemap_size=0) as server:
+            urls_file = os.path.join(self.tmp.name, 'urls.txt')
+            with open(urls_file, 'w') as f:
+                f.write(server.job_url(1))
+
+            exit_code = main(self.base_args + ['--file', urls_file, '--max-failure-rate', '0.5'])
+
+        self.assertEqual(exit_code, 1)
+        mock_print.assert_called_with("[INGEST] ERRO: taxa de erro 1.0 acima do limite de 0.5")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import gzip
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ingestion import UrlSource
+
+
+SITEMAP_INDEX = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-1.xml</loc></sitemap>
+  <sitemap><loc>https://example.com/sitemap-2.xml.gz</loc></sitemap>
+</sitemapindex>'''
+
+URLSET = b'''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc> https://example.com/vagas/1 </loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>https://example.com/sobre</loc></url>
+</urlset>'''
+
+
+class TestUrlSource(unittest.TestCase):
+
+    @patch('builtins.print')
+    def test_read_url_file_skips_comments_invalid_and_duplicates(self, mock_print):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write("# vagas da campanha\nhttps://example.com/vagas/1\n\nnot-a-url\n"
+                    "HTTPS://EXAMPLE.COM/vagas/1\nhttps://other.com/vagas/2\n")
+
+        try:
+            urls = UrlSource.read_url_file(f.name)
+            filtered = UrlSource.read_url_file(f.name, '*other.com*')
+        finally:
+            os.remove(f.name)
+
+        self.assertEqual(urls, ["https://example.com/vagas/1", "https://other.com/vagas/2"])
+        self.assertEqual(filtered, ["https://other.com/vagas/2"])
+        mock_print.assert_any_call("[INGEST] URL inválida ignorada: not-a-url")
+
+    def test_parse_sitemap_index_and_urlset(self):
+        self.assertEqual(UrlSource.parse_sitemap(SITEMAP_INDEX), (
+            [], ["https://example.com/sitemap-1.xml", "https://example.com/sitemap-2.xml.gz"]
+        ))
+        self.assertEqual(UrlSource.parse_sitemap(gzip.compress(URLSET)), (
+            ["https://example.com/vagas/1", "https://example.com/sobre"], []
+        ))
+
+    def test_parse_sitemap_rejects_invalid_xml(self):
+        with self.assertRaises(ValueError):
+            UrlSource.parse_sitemap(b'<urlset><url>')
+
+    def test_read_sitemap_follows_index(self):
+        documents = {
+            "https://example.com/sitemap.xml": SITEMAP_INDEX,
+            "https://example.com/sitemap-1.xml": URLSET,
+            "https://example.com/sitemap-2.xml.gz": gzip.compress(
+                URLSET.replace(b'/vagas/1', b'/vagas/3').replace(b'/sobre', b'/vagas/1')
+            )
+        }
+        session = Mock()
+        session.get.side_effect = lambda url, timeout: Mock(content=documents[url])
+
+        urls = UrlSource(session=session, timeout=3).read_sitemap("https://example.com/sitemap.xml", '*/vagas/*')
+
+        self.assertEqual(urls, ["https://example.com/vagas/1", "https://example.com/vagas/3"])
+        session.get.assert_any_call("https://example.com/sitemap-1.xml", timeout=3)
+
+    @patch('builtins.print')
+    def test_read_sitemap_limits_nested_sitemaps(self, mock_print):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sitemap.xml')
+            with open(path, 'wb') as f:
+                f.write(SITEMAP_INDEX)
+
+            urls = UrlSource(max_sitemaps=1).read_sitemap(path)
+
+        self.assertEqual(urls, [])
+        mock_print.assert_called_with("[INGEST] Limite de 1 sitemaps atingido; 2 ignorados")
+
+
+if __name__ == '__main__':
+    unittest.main()
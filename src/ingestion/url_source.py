@@ -0,0 +1,80 @@
+import fnmatch
+import gzip
+import xml.etree.ElementTree as ElementTree
+from typing import Iterable, List, Optional, Tuple
+import requests
+from src.utils import normalize_url, validate_url
+
+
+class UrlSource:
+
+    GZIP_MAGIC = b'\x1f\x8b'
+
+    def __init__(self, session: Optional[requests.Session] = None, timeout: int = 10, max_sitemaps: int = 100):
+        self.session = session
+        self.timeout = timeout
+        self.max_sitemaps = max_sitemaps
+
+    @staticmethod
+    def read_url_file(path: str, pattern: Optional[str] = None) -> List[str]:
+        with open(path, encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
+        return UrlSource.unique((line for line in lines if line and not line.startswith('#')), pattern)
+
+    @staticmethod
+    def unique(urls: Iterable[str], pattern: Optional[str] = None) -> List[str]:
+        unique = {}
+        for url in urls:
+            if not validate_url(url):
+                print(f"[INGEST] URL inválida ignorada: {url}")
+                continue
+            if pattern and not fnmatch.fnmatch(url, pattern):
+                continue
+            unique.setdefault(normalize_url(url), url)
+        return list(unique.values())
+
+    @staticmethod
+    def parse_sitemap(content: bytes) -> Tuple[List[str], List[str]]:
+        if content.startswith(UrlSource.GZIP_MAGIC):
+            content = gzip.decompress(content)
+
+        try:
+            root = ElementTree.fromstring(content)
+        except ElementTree.ParseError as e:
+            raise ValueError(f"Sitemap inválido: {e}")
+
+        pages, sitemaps = [], []
+        target = sitemaps if UrlSource._local_name(root.tag) == 'sitemapindex' else pages
+        for element in root.iter():
+            if UrlSource._local_name(element.tag) == 'loc' and element.text and element.text.strip():
+                target.append(element.text.strip())
+        return pages, sitemaps
+
+    def read_sitemap(self, location: str, pattern: Optional[str] = None) -> List[str]:
+        pending, seen, pages = [location], set(), []
+        while pending and len(seen) < self.max_sitemaps:
+            current = pending.pop(0)
+            if current in seen:
+                continue
+            seen.add(current)
+
+            found, children = self.parse_sitemap(self._load(current))
+            pages.extend(found)
+            pending.extend(children)
+
+        if pending:
+            print(f"[INGEST] Limite de {self.max_sitemaps} sitemaps atingido; {len(pending)} ignorados")
+        return self.unique(pages, pattern)
+
+    def _load(self, location: str) -> bytes:
+        if not validate_url(location):
+            with open(location, 'rb') as f:
+                return f.read()
+
+        response = (self.session or requests).get(location, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+
+    @staticmethod
+    def _local_name(tag: str) -> str:
+        return tag.rsplit('}', 1)[-1]
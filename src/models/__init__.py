@@ -1,9 +1,13 @@
 from .analysis_request import AnalysisRequest
 from .analysis_response import AnalysisResponse
 from .error_response import ErrorResponse
+from .batch_analysis_request import BatchAnalysisRequest
+from .analysis_job import AnalysisJob
 
 __all__ = [
     'AnalysisRequest',
     'AnalysisResponse',
-    'ErrorResponse'
+    'ErrorResponse',
+    'BatchAnalysisRequest',
+    'AnalysisJob'
 ]
@@ -0,0 +1,59 @@
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import ClassVar, List, Optional
+
+
+@dataclass
+class AnalysisJob:
+    QUEUED: ClassVar[str] = 'queued'
+    RUNNING: ClassVar[str] = 'running'
+    SUCCEEDED: ClassVar[str] = 'succeeded'
+    FAILED: ClassVar[str] = 'failed'
+
+    position: str
+    skills: List[str]
+    callback_url: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = QUEUED
+    result: Optional[dict] = None
+    error: Optional[dict] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    callback_delivered: Optional[bool] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (self.SUCCEEDED, self.FAILED)
+
+    def is_expired(self, ttl: float) -> bool:
+        return self.finished and time.time() - self.finished_at >= ttl
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'status': self.status,
+            'position': self.position,
+            'skills': self.skills,
+            'callback_url': self.callback_url,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+            'callback_delivered': self.callback_delivered
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AnalysisJob':
+        return cls(
+            id=data['id'],
+            status=data['status'],
+            position=data['position'],
+            skills=data.get('skills', []),
+            callback_url=data.get('callback_url'),
+            result=data.get('result'),
+            error=data.get('error'),
+            created_at=data['created_at'],
+            finished_at=data.get('finished_at'),
+            callback_delivered=data.get('callback_delivered')
+        )
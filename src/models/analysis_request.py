@@ -1,15 +1,21 @@
 from dataclasses import dataclass
-from typing import List
+from typing import ClassVar, List
 
 
 @dataclass
 class AnalysisRequest:
+    FULL: ClassVar[str] = 'full'
+    FAST: ClassVar[str] = 'fast'
+    MODES: ClassVar[tuple] = (FULL, FAST)
+
     position: str
     skills: List[str]
+    mode: str = FULL
 
     @classmethod
     def from_dict(cls, data: dict) -> 'AnalysisRequest':
         return cls(
             position=data.get('position', ''),
-            skills=data.get('skills', [])
+            skills=data.get('skills', []),
+            mode=data.get('mode') or cls.FULL
         )
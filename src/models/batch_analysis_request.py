@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import List
+from .analysis_request import AnalysisRequest
+
+
+@dataclass
+class BatchAnalysisRequest:
+    positions: List[str]
+    skills: List[str]
+    mode: str = AnalysisRequest.FULL
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BatchAnalysisRequest':
+        return cls(
+            positions=data.get('positions', []),
+            skills=data.get('skills', []),
+            mode=data.get('mode') or AnalysisRequest.FULL
+        )
@@ -1,11 +1,83 @@
+from .cache_serializer import CacheSerializer
+from .cache_backend_service import CacheBackend, MemoryCacheBackend, SqliteCacheBackend
+from .redis_cache_backend_service import RedisCacheBackend, RedisProtocolError
+from .analysis_cache_service import AnalysisCacheService
+from .semantic_cache_service import SemanticCacheService, SkillVectorizer
+from .prompt_budget_service import PromptBudgetService, PromptBudget
+from .adaptive_limiter_service import AdaptiveLimiterService, UpstreamOverloadedError
+from .metrics_service import MetricsService
+from .profile_batcher_service import ProfileBatcherService
 from .openai_service import OpenAIService
-from .web_scraping_service import WebScrapingService
+from .page_cache_service import PageCacheService, CachedPage
+from .single_flight_service import SingleFlightService
+from .retry_policy_service import RetryBudget, RetryPolicy
+from .hedged_request_service import HedgedRequestService
+from .circuit_breaker_service import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from .web_scraping_service import WebScrapingService, FetchedDescription
 from .text_processing_service import TextProcessingService
+from .skill_taxonomy import SkillTaxonomy
+from .match_scorer_service import MatchScorerService, MatchScore
+from .analysis_job_service import AnalysisJobService, JobQueueFullError
+from .description_store_service import DescriptionStoreService, DescriptionRecord
+from .description_refresher_service import DescriptionRefresherService
 from .analysis_service import AnalysisService
+from .async_web_scraping_service import AsyncWebScrapingService
+from .async_openai_service import AsyncOpenAIService
+from .async_single_flight_service import AsyncSingleFlightService
+from .async_profile_batcher_service import AsyncProfileBatcherService
+from .async_adaptive_limiter_service import AsyncAdaptiveLimiterService
+from .async_retry_policy_service import AsyncRetryPolicy
+from .async_hedged_request_service import AsyncHedgedRequestService
+from .async_circuit_breaker_service import AsyncCircuitBreaker
+from .async_analysis_job_service import AsyncAnalysisJobService
+from .async_analysis_service import AsyncAnalysisService
 
 __all__ = [
+    'CacheSerializer',
+    'CacheBackend',
+    'MemoryCacheBackend',
+    'SqliteCacheBackend',
+    'RedisCacheBackend',
+    'RedisProtocolError',
+    'AnalysisCacheService',
+    'SemanticCacheService',
+    'SkillVectorizer',
+    'PromptBudgetService',
+    'PromptBudget',
+    'AdaptiveLimiterService',
+    'UpstreamOverloadedError',
+    'MetricsService',
+    'ProfileBatcherService',
     'OpenAIService',
+    'PageCacheService',
+    'CachedPage',
+    'SingleFlightService',
+    'RetryBudget',
+    'RetryPolicy',
+    'HedgedRequestService',
+    'CircuitBreaker',
+    'CircuitBreakerRegistry',
+    'CircuitOpenError',
     'WebScrapingService',
+    'FetchedDescription',
     'TextProcessingService',
-    'AnalysisService'
+    'SkillTaxonomy',
+    'MatchScorerService',
+    'MatchScore',
+    'AnalysisJobService',
+    'JobQueueFullError',
+    'DescriptionStoreService',
+    'DescriptionRecord',
+    'DescriptionRefresherService',
+    'AnalysisService',
+    'AsyncWebScrapingService',
+    'AsyncOpenAIService',
+    'AsyncSingleFlightService',
+    'AsyncProfileBatcherService',
+    'AsyncAdaptiveLimiterService',
+    'AsyncRetryPolicy',
+    'AsyncHedgedRequestService',
+    'AsyncCircuitBreaker',
+    'AsyncAnalysisJobService',
+    'AsyncAnalysisService'
 ]
@@ -0,0 +1,155 @@
+import math
+import re
+import threading
+import time
+from typing import Optional
+
+
+class UpstreamOverloadedError(Exception):
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.retry_after))
+
+
+class AdaptiveLimiterService:
+
+    DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+    DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+    def __init__(self, initial_limit: int = 8, min_limit: int = 1, max_limit: int = 64, max_queue: int = 32,
+                 queue_timeout: float = 5.0, rate: float = 0.0, burst: int = 10, backoff_ratio: float = 0.5):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.rate = rate
+        self.burst = burst
+        self.backoff_ratio = backoff_ratio
+        self.tokens = float(burst)
+        self.blocked_until = 0.0
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+        self.throttled = 0
+        self._refilled_at = time.monotonic()
+        self._condition = threading.Condition()
+
+    @classmethod
+    def parse_duration(cls, value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        matches = cls.DURATION_PATTERN.findall(value)
+        if not matches:
+            return None
+        return sum(float(amount) * cls.DURATION_UNITS[unit] for amount, unit in matches)
+
+    @classmethod
+    def retry_after_from_headers(cls, headers) -> Optional[float]:
+        retry_after_ms = headers.get('retry-after-ms')
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+
+        retry_after = cls.parse_duration(headers.get('retry-after'))
+        if retry_after is not None:
+            return retry_after
+
+        if headers.get('x-ratelimit-remaining-requests') == '0':
+            return cls.parse_duration(headers.get('x-ratelimit-reset-requests'))
+
+        return None
+
+    def acquire(self) -> None:
+        deadline = time.monotonic() + self.queue_timeout
+        with self._condition:
+            wait = self._try_acquire(time.monotonic())
+            if wait == 0.0:
+                return
+            self._check_queue(wait)
+
+            self.queued += 1
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._reject()
+                    self._condition.wait(remaining if wait is None else min(wait, remaining))
+                    wait = self._try_acquire(time.monotonic())
+                    if wait == 0.0:
+                        return
+            finally:
+                self.queued -= 1
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def record(self, status_code: int, headers) -> None:
+        with self._condition:
+            now = time.monotonic()
+            retry_after = self.retry_after_from_headers(headers)
+
+            if status_code == 429:
+                self.throttled += 1
+                self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+                retry_after = retry_after if retry_after is not None else 1.0
+            elif 200 <= status_code < 300:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                'limit': round(self.limit, 2),
+                'in_flight': self.in_flight,
+                'queued': self.queued,
+                'max_queue': self.max_queue,
+                'rejected': self.rejected,
+                'throttled': self.throttled,
+                'blocked_for': round(max(0.0, self.blocked_until - time.monotonic()), 3)
+            }
+
+    def _try_acquire(self, now: float) -> Optional[float]:
+        if now < self.blocked_until:
+            return self.blocked_until - now
+
+        if self.in_flight >= int(self.limit):
+            return None
+
+        if self.rate > 0:
+            self.tokens = min(float(self.burst), self.tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+
+        self.in_flight += 1
+        return 0.0
+
+    def _check_queue(self, wait: Optional[float]) -> None:
+        if self.queued >= self.max_queue or (wait is not None and wait > self.queue_timeout):
+            self._reject(wait)
+
+    def _reject(self, wait: Optional[float] = None) -> None:
+        self.rejected += 1
+        retry_after = max(wait or 0.0, self.blocked_until - time.monotonic(), 1.0)
+        print(f"[LIMITER] Requisição rejeitada: {self.in_flight} em andamento, {self.queued} na fila")
+        raise UpstreamOverloadedError("Serviço de análise sobrecarregado, tente novamente em instantes", retry_after)
+
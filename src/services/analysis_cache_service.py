@@ -0,0 +1,133 @@
+import hashlib
+import json
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from .cache_backend_service import CacheBackend
+from .cache_serializer import CacheSerializer
+
+
+class AnalysisCacheService:
+
+    KEY_PREFIX = 'analysis:'
+    TEXT_FIELDS = struct.Struct('>d')
+
+    def __init__(self, max_entries: int = 1024, ttl: int = 3600, backend: Optional[CacheBackend] = None,
+                 serializer: Optional[CacheSerializer] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.backend = backend
+        self.serializer = serializer or CacheSerializer()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.backend_hits = 0
+
+    @staticmethod
+    def canonicalize_skills(skills: list) -> list:
+        return sorted({skill.strip().casefold() for skill in skills if skill and skill.strip()})
+
+    @staticmethod
+    def build_key(skills: list, description: str, system_prompt: str, model_params: dict) -> str:
+        material = json.dumps({
+            'skills': AnalysisCacheService.canonicalize_skills(skills),
+            'description': description,
+            'system_prompt': system_prompt,
+            'model_params': model_params
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None or self.backend is None:
+                self._account(value)
+                return value
+
+        item = self._read_backend(key)
+        with self._lock:
+            if item is not None:
+                self.backend_hits += 1
+                self._store(key, *item)
+                value = item[0]
+            self._account(value)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        stored_at = time.time()
+        with self._lock:
+            self._store(key, value, stored_at)
+
+        if self.backend is not None:
+            self.backend.set(self.KEY_PREFIX + key, self.encode(value, stored_at), ttl=self.ttl)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'backend_hits': self.backend_hits
+            }
+
+    def encode(self, value: str, stored_at: float) -> bytes:
+        body = self.TEXT_FIELDS.pack(stored_at) + value.encode('utf-8')
+        return self.serializer.dumps(CacheSerializer.KIND_TEXT, body)
+
+    def decode(self, data: bytes) -> tuple:
+        body = self.serializer.loads(CacheSerializer.KIND_TEXT, data)
+        stored_at, = self.TEXT_FIELDS.unpack_from(body)
+        return body[self.TEXT_FIELDS.size:].decode('utf-8'), stored_at
+
+    def _lookup(self, key: str) -> Optional[str]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+
+        value, stored_at = item
+        if time.time() - stored_at >= self.ttl:
+            del self._entries[key]
+            self.evictions += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _account(self, value: Optional[str]) -> None:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+    def _store(self, key: str, value: str, stored_at: float) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (value, stored_at)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _read_backend(self, key: str) -> Optional[tuple]:
+        data = self.backend.get(self.KEY_PREFIX + key)
+        if data is None:
+            return None
+
+        try:
+            value, stored_at = self.decode(data)
+        except (ValueError, struct.error) as e:
+            print(f"[ANALYSIS_CACHE] ERRO ao ler cache compartilhado: {e}")
+            return None
+
+        if time.time() - stored_at >= self.ttl:
+            return None
+        return value, stored_at
@@ -0,0 +1,245 @@
+import json
+import threading
+import time
+import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from urllib.parse import urlparse
+from src.models import AnalysisJob, AnalysisRequest
+from src.utils import is_public_url
+from .adaptive_limiter_service import UpstreamOverloadedError
+from .cache_backend_service import CacheBackend
+from .retry_policy_service import RetryPolicy
+
+
+class JobQueueFullError(UpstreamOverloadedError):
+
+    def __init__(self, retry_after: float = 1.0):
+        super().__init__("Fila de análises cheia, tente novamente em instantes", retry_after)
+
+
+class AnalysisJobService:
+
+    KEY_PREFIX = 'job:'
+    PURGE_INTERVAL = 1.0
+    DURATION_SMOOTHING = 0.2
+    REQUEST_ERRORS = (requests.exceptions.RequestException,)
+    WEBHOOK_NETWORK_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+    def __init__(self, analysis_service, max_workers: int = 4, max_queue: int = 100, result_ttl: float = 3600,
+                 max_jobs: int = 10000, webhook_timeout: float = 5.0, webhook_retry_policy: Optional[RetryPolicy] = None,
+                 session: Optional[requests.Session] = None, backend: Optional[CacheBackend] = None,
+                 webhook_allowed_hosts: Optional[list] = None):
+        self.analysis_service = analysis_service
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+        self.max_jobs = max_jobs
+        self.webhook_timeout = webhook_timeout
+        self.webhook_retry_policy = webhook_retry_policy
+        self.webhook_allowed_hosts = {host.lower() for host in webhook_allowed_hosts or ()}
+        self.session = session
+        self.backend = backend
+        self.queued = 0
+        self.running = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.webhooks_delivered = 0
+        self.webhooks_failed = 0
+        self.average_seconds = 0.0
+        self._jobs = OrderedDict()
+        self._purged_at = 0.0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def submit(self, request: AnalysisRequest, api_key: str, api_url: str = None,
+               callback_url: Optional[str] = None) -> AnalysisJob:
+        job = self._enqueue(request, callback_url)
+        self._save(job)
+        self._start_worker(job, api_key, api_url)
+        return job
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        with self._lock:
+            self._purge()
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return job
+
+        job = self._load(job_id)
+        if job is None or job.is_expired(self.result_ttl):
+            return None
+        return job
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'queued': self.queued,
+                'running': self.running,
+                'stored': len(self._jobs),
+                'max_queue': self.max_queue,
+                'max_workers': self.max_workers,
+                'submitted': self.submitted,
+                'rejected': self.rejected,
+                'succeeded': self.succeeded,
+                'failed': self.failed,
+                'average_seconds': round(self.average_seconds, 3),
+                'webhooks': {
+                    'delivered': self.webhooks_delivered,
+                    'failed': self.webhooks_failed
+                }
+            }
+
+    def describe_error(self, error: Exception) -> dict:
+        if isinstance(error, UpstreamOverloadedError):
+            return {'error': str(error), 'status': 503, 'retry_after': error.retry_after_seconds}
+        if isinstance(error, self.REQUEST_ERRORS):
+            return {'error': f"Erro ao acessar a URL: {str(error)}", 'status': 500}
+        if isinstance(error, ValueError):
+            return {'error': str(error), 'status': 404}
+        return {'error': "Erro interno do servidor", 'status': 500}
+
+    def _enqueue(self, request: AnalysisRequest, callback_url: Optional[str]) -> AnalysisJob:
+        with self._lock:
+            self._purge()
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise JobQueueFullError(retry_after=self._estimated_wait())
+
+            job = AnalysisJob(position=request.position, skills=request.skills, callback_url=callback_url)
+            self._jobs[job.id] = job
+            self.queued += 1
+            self.submitted += 1
+
+        print(f"[JOBS] Job {job.id} enfileirado para {job.position}")
+        return job
+
+    def _start_worker(self, job: AnalysisJob, api_key: str, api_url: str) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='analysis-job')
+        self._executor.submit(self._run, job, api_key, api_url)
+
+    def accepts_callback(self, callback_url: str) -> bool:
+        if self.webhook_allowed_hosts:
+            return (urlparse(callback_url).hostname or '') in self.webhook_allowed_hosts
+        return is_public_url(callback_url)
+
+    def _run(self, job: AnalysisJob, api_key: str, api_url: str) -> None:
+        started = self._mark_running(job)
+        try:
+            result = self.analysis_service.analyze_position(
+                AnalysisRequest(position=job.position, skills=job.skills), api_key, api_url
+            )
+            self._finish(job, started, result=result)
+        except Exception as e:
+            self._finish(job, started, error=self.describe_error(e))
+
+        if job.callback_url:
+            self._record_delivery(job, self._deliver(job))
+
+    def _mark_running(self, job: AnalysisJob) -> float:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            job.status = AnalysisJob.RUNNING
+        self._save(job)
+        return time.perf_counter()
+
+    def _finish(self, job: AnalysisJob, started: float, result: dict = None, error: dict = None) -> None:
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.running -= 1
+            job.result = result
+            job.error = error
+            job.finished_at = time.time()
+            if error is None:
+                job.status = AnalysisJob.SUCCEEDED
+                self.succeeded += 1
+            else:
+                job.status = AnalysisJob.FAILED
+                self.failed += 1
+            self.average_seconds += self.DURATION_SMOOTHING * (elapsed - self.average_seconds)
+
+        print(f"[JOBS] Job {job.id} finalizado com status {job.status} em {elapsed:.2f}s")
+        self._save(job)
+
+    def _deliver(self, job: AnalysisJob) -> bool:
+        if not self.accepts_callback(job.callback_url):
+            print(f"[JOBS] ERRO ao entregar webhook do job {job.id}: destino não permitido")
+            return False
+
+        try:
+            if self.webhook_retry_policy is not None:
+                self.webhook_retry_policy.run(lambda: self._post_webhook(job), self._is_retryable_webhook)
+            else:
+                self._post_webhook(job)
+            return True
+        except Exception as e:
+            print(f"[JOBS] ERRO ao entregar webhook do job {job.id}: {str(e)}")
+            return False
+
+    def _post_webhook(self, job: AnalysisJob) -> None:
+        response = (self.session or requests).post(job.callback_url, json=job.to_dict(), timeout=self.webhook_timeout,
+                                                   allow_redirects=False)
+        if response.status_code >= 300:
+            raise requests.exceptions.HTTPError(f"Webhook respondeu {response.status_code}", response=response)
+
+    def _is_retryable_webhook(self, error: Exception) -> bool:
+        if isinstance(error, self.WEBHOOK_NETWORK_ERRORS):
+            return True
+        response = getattr(error, 'response', None)
+        return response is not None and self.webhook_retry_policy.retries_status(response.status_code)
+
+    def _record_delivery(self, job: AnalysisJob, delivered: bool) -> None:
+        with self._lock:
+            job.callback_delivered = delivered
+            if delivered:
+                self.webhooks_delivered += 1
+            else:
+                self.webhooks_failed += 1
+        self._save(job)
+
+    def _estimated_wait(self) -> float:
+        return max(1.0, self.queued / max(1, self.max_workers) * self.average_seconds)
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        if now - self._purged_at < self.PURGE_INTERVAL:
+            return
+        self._purged_at = now
+
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.is_expired(self.result_ttl)]:
+            del self._jobs[job_id]
+
+        overflow = len(self._jobs) - self.max_jobs
+        if overflow > 0:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished][:overflow]
+            for job_id in finished:
+                del self._jobs[job_id]
+
+    def _save(self, job: AnalysisJob) -> None:
+        if self.backend is None:
+            return
+        payload = json.dumps(job.to_dict(), ensure_ascii=False).encode('utf-8')
+        self.backend.set(self.KEY_PREFIX + job.id, payload, ttl=self.result_ttl)
+
+    def _load(self, job_id: str) -> Optional[AnalysisJob]:
+        if self.backend is None:
+            return None
+
+        data = self.backend.get(self.KEY_PREFIX + job_id)
+        if data is None:
+            return None
+
+        try:
+            return AnalysisJob.from_dict(json.loads(data))
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"[JOBS] ERRO ao ler job compartilhado {job_id}: {str(e)}")
+            return None
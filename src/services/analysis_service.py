@@ -1,34 +1,547 @@
-from src.models import AnalysisRequest
-from .web_scraping_service import WebScrapingService
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+from src.models import AnalysisRequest, BatchAnalysisRequest
+from src.utils import HttpSessionUtils, normalize_url
+from .page_cache_service import PageCacheService
+from .analysis_cache_service import AnalysisCacheService
+from .semantic_cache_service import SemanticCacheService
+from .prompt_budget_service import PromptBudgetService
+from .profile_batcher_service import ProfileBatcherService
+from .cache_backend_service import CacheBackend, MemoryCacheBackend, SqliteCacheBackend
+from .redis_cache_backend_service import RedisCacheBackend
+from .cache_serializer import CacheSerializer
+from .single_flight_service import SingleFlightService
+from .metrics_service import MetricsService
+from .adaptive_limiter_service import AdaptiveLimiterService
+from .retry_policy_service import RetryPolicy
+from .circuit_breaker_service import CircuitBreaker
+from .analysis_job_service import AnalysisJobService
+from .description_store_service import DescriptionStoreService
+from .description_refresher_service import DescriptionRefresherService
+from .web_scraping_service import WebScrapingService, FetchedDescription
 from .text_processing_service import TextProcessingService
+from .skill_taxonomy import SkillTaxonomy
+from .match_scorer_service import MatchScorerService
 from .openai_service import OpenAIService
 
 
 class AnalysisService:
 
-    def __init__(self):
-        self.web_scraper = WebScrapingService()
-        self.text_processor = TextProcessingService()
-        self.openai_service = OpenAIService()
+    OPENAI_RETRY_STATUSES = (500, 502, 503, 504)
+    WEBHOOK_RETRY_STATUSES = (502, 503, 504)
+
+    def __init__(self, web_scraper: WebScrapingService = None, text_processor: TextProcessingService = None,
+                 openai_service: OpenAIService = None, batch_max_concurrency: int = 5,
+                 metrics: MetricsService = None):
+        self.metrics = metrics or MetricsService()
+        self.web_scraper = web_scraper or WebScrapingService(metrics=self.metrics)
+        self.text_processor = text_processor or TextProcessingService()
+        self.openai_service = openai_service or OpenAIService()
+        self.batch_max_concurrency = batch_max_concurrency
+        self.scrape_flight = SingleFlightService()
+        self.analysis_flight = SingleFlightService()
+        self.taxonomy = None
+        self.scorer = MatchScorerService()
+        self.jobs = None
+        self.description_store = None
+        self.refresher = None
+
+    @classmethod
+    def from_config(cls, config) -> 'AnalysisService':
+        metrics = MetricsService()
+        backend = cls._cache_backend_from_config(config)
+        web_scraper = WebScrapingService.from_config(
+            config, cache=cls._page_cache_from_config(config, backend), metrics=metrics
+        )
+        limiter = cls._limiter_from_config(config, AdaptiveLimiterService)
+        openai_service = OpenAIService(
+            cache=cls._analysis_cache_from_config(config, backend),
+            session=HttpSessionUtils.create_session_from_config(config),
+            limiter=limiter,
+            retry_policy=RetryPolicy.from_config(config, 'OPENAI', cls.OPENAI_RETRY_STATUSES),
+            circuit_breaker=cls._circuit_breaker_from_config(config, CircuitBreaker),
+            semantic_cache=cls._semantic_cache_from_config(config),
+            budget=cls._prompt_budget_from_config(config),
+            batcher=cls._batcher_from_config(config, ProfileBatcherService)
+        )
+        cls._register_limiter_metrics(metrics, limiter)
+        cls._register_semantic_cache_metrics(metrics, openai_service.semantic_cache)
+        cls._register_prompt_budget_metrics(metrics, openai_service.budget)
+        cls._register_batcher_metrics(metrics, openai_service.batcher)
+        cls._register_circuit_metrics(metrics, web_scraper, openai_service)
+        service = cls(
+            web_scraper=web_scraper,
+            openai_service=openai_service,
+            batch_max_concurrency=config.get('BATCH_MAX_CONCURRENCY', 5),
+            metrics=metrics
+        )
+        service.taxonomy = cls._taxonomy_from_config(config)
+        service.scorer = MatchScorerService(taxonomy=service.taxonomy, gate_below=config.get('PRESCORE_GATE_BELOW', 0))
+        service.jobs = cls._jobs_from_config(
+            config, service, AnalysisJobService, RetryPolicy, backend,
+            session=HttpSessionUtils.create_session_from_config(config)
+        )
+        cls._register_job_metrics(metrics, service.jobs)
+        service.description_store = cls._description_store_from_config(config)
+        service.refresher = cls._refresher_from_config(config, service.description_store)
+        return service
+
+    @staticmethod
+    def _cache_backend_from_config(config) -> Optional[CacheBackend]:
+        backend = config.get('CACHE_BACKEND')
+        if not backend:
+            return None
+
+        if backend == 'memory':
+            return MemoryCacheBackend()
+        if backend == 'sqlite':
+            return SqliteCacheBackend(
+                config.get('CACHE_SQLITE_PATH', 'cache/shared_cache.sqlite3'),
+                max_entries=config.get('CACHE_SQLITE_MAX_ENTRIES', 100000)
+            )
+        if backend == 'redis':
+            return RedisCacheBackend(
+                url=config.get('CACHE_REDIS_URL', 'redis://localhost:6379/0'),
+                timeout=config.get('CACHE_REDIS_TIMEOUT', 0.2),
+                key_prefix=config.get('CACHE_KEY_PREFIX', 'job-analysis:')
+            )
+        raise ValueError(f"CACHE_BACKEND inválido: {backend}")
+
+    @staticmethod
+    def _taxonomy_from_config(config) -> Optional[SkillTaxonomy]:
+        if not config.get('SKILL_TAXONOMY_ENABLED'):
+            return None
+
+        return SkillTaxonomy.load(
+            config.get('SKILL_TAXONOMY_PATH') or SkillTaxonomy.BUNDLED_PATH,
+            compiled_path=config.get('SKILL_TAXONOMY_COMPILED_PATH') or None
+        )
+
+    @staticmethod
+    def _page_cache_from_config(config, backend: Optional[CacheBackend] = None) -> Optional[PageCacheService]:
+        if not config.get('PAGE_CACHE_ENABLED'):
+            return None
+
+        return PageCacheService(
+            max_entries=config.get('PAGE_CACHE_MAX_ENTRIES', 256),
+            max_bytes=config.get('PAGE_CACHE_MAX_BYTES', 64 * 1024 * 1024),
+            ttl=config.get('PAGE_CACHE_TTL', 300),
+            disk_dir=config.get('PAGE_CACHE_DIR') or None,
+            backend=backend,
+            serializer=CacheSerializer(compress_threshold=config.get('CACHE_COMPRESS_THRESHOLD', 1024))
+        )
+
+    @staticmethod
+    def _analysis_cache_from_config(config, backend: Optional[CacheBackend] = None) -> Optional[AnalysisCacheService]:
+        if not config.get('ANALYSIS_CACHE_ENABLED'):
+            return None
+
+        return AnalysisCacheService(
+            max_entries=config.get('ANALYSIS_CACHE_MAX_ENTRIES', 1024),
+            ttl=config.get('ANALYSIS_CACHE_TTL', 3600),
+            backend=backend,
+            serializer=CacheSerializer(compress_threshold=config.get('CACHE_COMPRESS_THRESHOLD', 1024))
+        )
+
+    @staticmethod
+    def _semantic_cache_from_config(config) -> Optional[SemanticCacheService]:
+        if not config.get('SEMANTIC_CACHE_ENABLED'):
+            return None
+
+        return SemanticCacheService(
+            threshold=config.get('SEMANTIC_CACHE_THRESHOLD', 0.85),
+            max_descriptions=config.get('SEMANTIC_CACHE_MAX_DESCRIPTIONS', 256),
+            max_profiles=config.get('SEMANTIC_CACHE_MAX_PROFILES', 32),
+            ttl=config.get('SEMANTIC_CACHE_TTL', 3600)
+        )
+
+    @staticmethod
+    def _prompt_budget_from_config(config) -> Optional[PromptBudgetService]:
+        if not config.get('PROMPT_BUDGET_ENABLED'):
+            return None
+
+        return PromptBudgetService(
+            max_description_tokens=config.get('PROMPT_BUDGET_MAX_DESCRIPTION_TOKENS', 1500),
+            min_completion_tokens=config.get('PROMPT_BUDGET_MIN_COMPLETION_TOKENS', 256),
+            completion_tokens_per_skill=config.get('PROMPT_BUDGET_COMPLETION_TOKENS_PER_SKILL', 32)
+        )
+
+    @staticmethod
+    def _batcher_from_config(config, batcher_class):
+        if not config.get('OPENAI_BATCH_ENABLED'):
+            return None
+
+        return batcher_class(
+            window=config.get('OPENAI_BATCH_WINDOW', 0.05),
+            max_profiles=config.get('OPENAI_BATCH_MAX_PROFILES', 8)
+        )
+
+    @staticmethod
+    def _description_store_from_config(config) -> Optional[DescriptionStoreService]:
+        if not config.get('DESCRIPTION_STORE_ENABLED'):
+            return None
+
+        return DescriptionStoreService(
+            config.get('DESCRIPTION_STORE_PATH', 'cache/descriptions.sqlite3'),
+            max_entries=config.get('DESCRIPTION_STORE_MAX_ENTRIES', 100000),
+            max_age=config.get('DESCRIPTION_STORE_MAX_AGE', 7 * 24 * 3600),
+            refresh_interval=config.get('DESCRIPTION_REFRESH_INTERVAL', 6 * 3600)
+        )
+
+    @staticmethod
+    def _refresher_from_config(config, store: Optional[DescriptionStoreService]) -> Optional[DescriptionRefresherService]:
+        if store is None or not config.get('DESCRIPTION_REFRESH_ENABLED'):
+            return None
+
+        return DescriptionRefresherService(
+            store,
+            WebScrapingService.from_config(config, resilient=False),
+            interval=config.get('DESCRIPTION_REFRESH_TICK', 60.0),
+            batch_size=config.get('DESCRIPTION_REFRESH_BATCH', 20)
+        )
+
+    @staticmethod
+    def _limiter_from_config(config, limiter_class):
+        if not config.get('OPENAI_LIMITER_ENABLED'):
+            return None
+
+        return limiter_class(
+            initial_limit=config.get('OPENAI_LIMITER_INITIAL_CONCURRENCY', 8),
+            min_limit=config.get('OPENAI_LIMITER_MIN_CONCURRENCY', 1),
+            max_limit=config.get('OPENAI_LIMITER_MAX_CONCURRENCY', 64),
+            max_queue=config.get('OPENAI_LIMITER_MAX_QUEUE', 32),
+            queue_timeout=config.get('OPENAI_LIMITER_QUEUE_TIMEOUT', 5.0),
+            rate=config.get('OPENAI_LIMITER_RATE', 0.0),
+            burst=config.get('OPENAI_LIMITER_BURST', 10)
+        )
+
+    @staticmethod
+    def _circuit_breaker_from_config(config, breaker_class):
+        if not config.get('CIRCUIT_BREAKER_ENABLED'):
+            return None
+
+        return breaker_class(
+            'openai',
+            failure_threshold=config.get('OPENAI_CIRCUIT_FAILURE_THRESHOLD', 5),
+            recovery_timeout=config.get('OPENAI_CIRCUIT_RECOVERY_TIMEOUT', 30.0),
+            half_open_max_calls=config.get('OPENAI_CIRCUIT_HALF_OPEN_MAX_CALLS', 1)
+        )
+
+    @classmethod
+    def _jobs_from_config(cls, config, analysis_service, job_class, policy_class, backend: Optional[CacheBackend],
+                          **transport):
+        if not config.get('JOBS_ENABLED'):
+            return None
+
+        webhook_attempts = config.get('JOBS_WEBHOOK_MAX_ATTEMPTS', 3)
+        webhook_retry_policy = None
+        if webhook_attempts > 1:
+            webhook_retry_policy = policy_class(
+                name='webhook',
+                max_attempts=webhook_attempts,
+                base_delay=0.5,
+                max_delay=5.0,
+                retry_statuses=cls.WEBHOOK_RETRY_STATUSES
+            )
+
+        return job_class(
+            analysis_service,
+            max_workers=config.get('JOBS_MAX_WORKERS', 4),
+            max_queue=config.get('JOBS_MAX_QUEUE', 100),
+            result_ttl=config.get('JOBS_RESULT_TTL', 3600),
+            max_jobs=config.get('JOBS_MAX_STORED', 10000),
+            webhook_timeout=config.get('JOBS_WEBHOOK_TIMEOUT', 5.0),
+            webhook_retry_policy=webhook_retry_policy,
+            webhook_allowed_hosts=config.get('JOBS_WEBHOOK_ALLOWED_HOSTS'),
+            backend=backend,
+            **transport
+        )
+
+    @staticmethod
+    def _register_job_metrics(metrics: MetricsService, jobs: Optional[AnalysisJobService]) -> None:
+        if jobs is None:
+            return
+
+        metrics.register_gauge(
+            'analysis_jobs_queued',
+            'Análises assíncronas aguardando um worker',
+            lambda: jobs.queued
+        )
+        metrics.register_gauge(
+            'analysis_jobs_running',
+            'Análises assíncronas em execução',
+            lambda: jobs.running
+        )
+
+    @staticmethod
+    def _register_circuit_metrics(metrics: MetricsService, web_scraper: WebScrapingService,
+                                  openai_service: OpenAIService) -> None:
+        if web_scraper.circuit_breakers is not None:
+            metrics.register_gauge(
+                'analysis_scraping_open_circuits',
+                'Hosts de vagas com circuit breaker aberto ou meio-aberto',
+                web_scraper.circuit_breakers.open_count
+            )
+        if openai_service.circuit_breaker is not None:
+            metrics.register_gauge(
+                'analysis_openai_circuit_open',
+                'Circuit breaker da API de completion aberto (1) ou fechado (0)',
+                lambda: int(openai_service.circuit_breaker.state != CircuitBreaker.CLOSED)
+            )
+
+    @staticmethod
+    def _register_semantic_cache_metrics(metrics: MetricsService, semantic_cache: Optional[SemanticCacheService]) -> None:
+        if semantic_cache is None:
+            return
+
+        metrics.register_gauge(
+            'analysis_semantic_cache_reuse_ratio',
+            'Fração das consultas ao cache semântico atendidas por um perfil de habilidades similar',
+            semantic_cache.reuse_rate
+        )
+        metrics.register_gauge(
+            'analysis_semantic_cache_mean_similarity',
+            'Similaridade média (cosseno) entre o perfil consultado e o perfil reaproveitado',
+            semantic_cache.mean_similarity
+        )
+
+    @staticmethod
+    def _register_prompt_budget_metrics(metrics: MetricsService, budget: Optional[PromptBudgetService]) -> None:
+        if budget is None:
+            return
+
+        metrics.register_gauge(
+            'analysis_prompt_tokens_saved',
+            'Tokens de prompt (estimados) removidos das descrições enviadas à API de completion',
+            budget.tokens_saved
+        )
+        metrics.register_gauge(
+            'analysis_prompt_compression_ratio',
+            'Razão entre os tokens de prompt enviados e os tokens antes da compressão',
+            budget.compression_ratio
+        )
+
+    @staticmethod
+    def _register_batcher_metrics(metrics: MetricsService, batcher: Optional[ProfileBatcherService]) -> None:
+        if batcher is None:
+            return
+
+        metrics.register_gauge(
+            'analysis_openai_batched_profiles',
+            'Perfis de habilidades analisados em chamadas agrupadas à API de completion',
+            lambda: batcher.batched_profiles
+        )
+        metrics.register_gauge(
+            'analysis_openai_calls_saved_by_batching',
+            'Chamadas à API de completion evitadas pelo agrupamento de perfis da mesma vaga',
+            batcher.calls_saved
+        )
+
+    @staticmethod
+    def _register_limiter_metrics(metrics: MetricsService, limiter: Optional[AdaptiveLimiterService]) -> None:
+        if limiter is None:
+            return
+
+        metrics.register_gauge(
+            'analysis_openai_queue_depth',
+            'Requisições aguardando vaga para a API de completion',
+            lambda: limiter.queued
+        )
+        metrics.register_gauge(
+            'analysis_openai_in_flight',
+            'Requisições em andamento na API de completion',
+            lambda: limiter.in_flight
+        )
+        metrics.register_gauge(
+            'analysis_openai_concurrency_limit',
+            'Limite adaptativo de concorrência da API de completion',
+            lambda: round(limiter.limit, 2)
+        )
+
+    def stats(self) -> dict:
+        page_cache = self.web_scraper.cache
+        analysis_cache = self.openai_service.cache
+        semantic_cache = self.openai_service.semantic_cache
+        budget = self.openai_service.budget
+        batcher = self.openai_service.batcher
+        limiter = self.openai_service.limiter
+        scrape_retries = self.web_scraper.retry_policy
+        openai_retries = self.openai_service.retry_policy
+        hedging = self.web_scraper.hedging
+        return {
+            'page_cache': page_cache.stats() if page_cache else None,
+            'analysis_cache': analysis_cache.stats() if analysis_cache else None,
+            'semantic_cache': semantic_cache.stats() if semantic_cache else None,
+            'prompt_budget': budget.stats() if budget else None,
+            'cache_backend': self._cache_backend_stats(page_cache, analysis_cache),
+            'openai_limiter': limiter.stats() if limiter else None,
+            'openai_batcher': batcher.stats() if batcher else None,
+            'retries': {
+                'scraping': scrape_retries.stats() if scrape_retries else None,
+                'openai': openai_retries.stats() if openai_retries else None
+            },
+            'hedging': hedging.stats() if hedging else None,
+            'prescorer': self.scorer.stats(),
+            'taxonomy': self.taxonomy.stats() if self.taxonomy else None,
+            'jobs': self.jobs.stats() if self.jobs else None,
+            'description_store': self.description_store.stats() if self.description_store else None,
+            'refresher': self.refresher.stats() if self.refresher else None,
+            'http_pools': {
+                'scraping': HttpSessionUtils.pool_stats(self.web_scraper.session),
+                'openai': HttpSessionUtils.pool_stats(self.openai_service.session)
+            },
+            'single_flight': {
+                'scraping': self.scrape_flight.stats(),
+                'analysis': self.analysis_flight.stats()
+            }
+        }
+
+    @staticmethod
+    def _cache_backend_stats(page_cache: Optional[PageCacheService],
+                             analysis_cache: Optional[AnalysisCacheService]) -> Optional[dict]:
+        backend = (page_cache and page_cache.backend) or (analysis_cache and analysis_cache.backend)
+        if backend is None:
+            return None
+
+        serializers = [cache.serializer for cache in (page_cache, analysis_cache) if cache is not None]
+        return {
+            **backend.stats(),
+            'compressed': sum(serializer.compressed for serializer in serializers),
+            'bytes_saved': sum(serializer.bytes_saved for serializer in serializers)
+        }
+
+    def health(self) -> dict:
+        scrape_breakers = self.web_scraper.circuit_breakers
+        openai_breaker = self.openai_service.circuit_breaker
+        degraded = openai_breaker is not None and openai_breaker.state != CircuitBreaker.CLOSED
+        return {
+            'status': 'DEGRADED' if degraded else 'OK',
+            'circuits': {
+                'scraping': scrape_breakers.stats() if scrape_breakers else None,
+                'openai': openai_breaker.stats() if openai_breaker else None
+            }
+        }
 
     def analyze_position(self, request: AnalysisRequest, api_key: str, api_url: str = None) -> dict:
         try:
-            html_content = self.web_scraper.fetch_page_content(request.position)
-            raw_description = self.web_scraper.extract_meta_description(html_content)
-
-            if not raw_description:
-                raise ValueError("Meta description não encontrada")
-
-            formatted_description = self.text_processor.format_description(raw_description)
-            ai_analysis = self.openai_service.analyze_match(
-                request.skills,
-                formatted_description,
-                api_key,
-                api_url
-            )
+            formatted_description = self._describe(request.position)
+            fast_result = self._prescore(request, formatted_description)
+            if fast_result is not None:
+                return fast_result
+
+            with self.metrics.track('completion'):
+                ai_analysis = self.analysis_flight.do(
+                    self._analysis_key(request.position, request.skills, self.taxonomy),
+                    self.openai_service.analyze_match,
+                    request.skills,
+                    formatted_description,
+                    api_key,
+                    api_url
+                )
 
             return {"message": ai_analysis}
 
         except Exception as e:
             print(f"[ANALYSIS] ERRO: {str(e)}")
             raise
+
+    def stream_position(self, request: AnalysisRequest, api_key: str, api_url: str = None) -> Iterator[str]:
+        try:
+            formatted_description = self._describe(request.position)
+        except Exception as e:
+            print(f"[ANALYSIS] ERRO: {str(e)}")
+            raise
+
+        fast_result = self._prescore(request, formatted_description)
+        if fast_result is not None:
+            return iter([fast_result['message']])
+        return self.openai_service.stream_match(request.skills, formatted_description, api_key, api_url)
+
+    def _prescore(self, request: AnalysisRequest, description: str) -> Optional[dict]:
+        if request.mode != AnalysisRequest.FAST and not self.scorer.gate_below:
+            return None
+
+        with self.metrics.track('prescore'):
+            score = self.scorer.score(request.skills, description)
+        if request.mode == AnalysisRequest.FAST or self.scorer.should_skip_completion(score):
+            return score.to_dict()
+        return None
+
+    def analyze_batch(self, request: BatchAnalysisRequest, api_key: str, api_url: str = None) -> dict:
+        positions = self._unique_positions(request.positions)
+        print(f"[ANALYSIS] Analisando lote com {len(positions)} vagas")
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.batch_max_concurrency, len(positions)))) as executor:
+            futures = {
+                position: executor.submit(
+                    self.analyze_position,
+                    AnalysisRequest(position=position, skills=request.skills, mode=request.mode),
+                    api_key,
+                    api_url
+                )
+                for position in positions
+            }
+
+            for position, future in futures.items():
+                try:
+                    results[position] = future.result()
+                except Exception as e:
+                    results[position] = e
+
+        return results
+
+    def _describe(self, position: str) -> str:
+        if self.description_store is None:
+            return self._prepare_description(self._scrape(position))
+
+        if self.refresher is not None:
+            self.refresher.ensure_started()
+        record = self.description_store.get(position)
+        if record is not None:
+            return record.description
+
+        fetched = self._fetch(position)
+        return self._store_description(position, fetched)
+
+    def _fetch(self, position: str) -> Optional[FetchedDescription]:
+        with self.metrics.count_errors('fetch'):
+            return self.scrape_flight.do(self._scrape_key(position), self.web_scraper.fetch_description, position)
+
+    def _store_description(self, position: str, fetched: Optional[FetchedDescription]) -> str:
+        description = self._prepare_description(fetched.description if fetched else None)
+        self.description_store.put(position, description, fetched.etag, fetched.last_modified)
+        return description
+
+    def _scrape(self, position: str) -> Optional[str]:
+        with self.metrics.count_errors('fetch'):
+            return self.scrape_flight.do(self._scrape_key(position), self.web_scraper.fetch_meta_description, position)
+
+    @staticmethod
+    def _scrape_key(position: str) -> str:
+        return normalize_url(position)
+
+    @staticmethod
+    def _analysis_key(position: str, skills: List[str], taxonomy: Optional[SkillTaxonomy] = None) -> tuple:
+        if taxonomy is not None:
+            skills = taxonomy.normalize_skills(skills)
+        return normalize_url(position), tuple(AnalysisCacheService.canonicalize_skills(skills))
+
+    @staticmethod
+    def _unique_positions(positions: List[str]) -> List[str]:
+        unique = {}
+        for position in positions:
+            try:
+                key = normalize_url(position)
+            except ValueError:
+                key = position
+            unique.setdefault(key, position)
+        return list(unique.values())
+
+    def _prepare_description(self, raw_description: Optional[str]) -> str:
+        if not raw_description:
+            self.metrics.count_error('extract')
+            raise ValueError("Meta description não encontrada")
+
+        with self.metrics.track('format'):
+            return self.text_processor.format_description(raw_description)
@@ -0,0 +1,39 @@
+import asyncio
+import time
+from .adaptive_limiter_service import AdaptiveLimiterService
+
+
+class AsyncAdaptiveLimiterService(AdaptiveLimiterService):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._async_condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        deadline = time.monotonic() + self.queue_timeout
+        async with self._async_condition:
+            wait = self._try_acquire(time.monotonic())
+            if wait == 0.0:
+                return
+            self._check_queue(wait)
+
+            self.queued += 1
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._reject()
+                    try:
+                        await asyncio.wait_for(self._async_condition.wait(), remaining if wait is None else min(wait, remaining))
+                    except asyncio.TimeoutError:
+                        pass
+                    wait = self._try_acquire(time.monotonic())
+                    if wait == 0.0:
+                        return
+            finally:
+                self.queued -= 1
+
+    async def release(self) -> None:
+        async with self._async_condition:
+            self.in_flight -= 1
+            self._async_condition.notify_all()
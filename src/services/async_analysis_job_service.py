@@ -0,0 +1,101 @@
+import asyncio
+import httpx
+from typing import Optional
+from src.models import AnalysisJob, AnalysisRequest
+from .analysis_job_service import AnalysisJobService
+from .async_retry_policy_service import AsyncRetryPolicy
+from .cache_backend_service import CacheBackend
+
+
+class AsyncAnalysisJobService(AnalysisJobService):
+
+    REQUEST_ERRORS = (httpx.HTTPError,)
+    WEBHOOK_NETWORK_ERRORS = (httpx.TransportError,)
+
+    def __init__(self, analysis_service, max_workers: int = 4, max_queue: int = 100, result_ttl: float = 3600,
+                 max_jobs: int = 10000, webhook_timeout: float = 5.0,
+                 webhook_retry_policy: Optional[AsyncRetryPolicy] = None, client: Optional[httpx.AsyncClient] = None,
+                 backend: Optional[CacheBackend] = None, webhook_allowed_hosts: Optional[list] = None):
+        super().__init__(
+            analysis_service,
+            max_workers=max_workers,
+            max_queue=max_queue,
+            result_ttl=result_ttl,
+            max_jobs=max_jobs,
+            webhook_timeout=webhook_timeout,
+            webhook_retry_policy=webhook_retry_policy,
+            backend=backend,
+            webhook_allowed_hosts=webhook_allowed_hosts
+        )
+        self.client = client
+        self._queue = None
+        self._workers = []
+
+    def _start_worker(self, job: AnalysisJob, api_key: str, api_url: str) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._workers = [asyncio.create_task(self._work()) for _ in range(self.max_workers)]
+        self._queue.put_nowait((job, api_key, api_url))
+
+    async def _work(self) -> None:
+        while True:
+            job, api_key, api_url = await self._queue.get()
+            try:
+                await self._run(job, api_key, api_url)
+            finally:
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def _run(self, job: AnalysisJob, api_key: str, api_url: str) -> None:
+        started = self._mark_running(job)
+        try:
+            result = await self.analysis_service.analyze_position(
+                AnalysisRequest(position=job.position, skills=job.skills), api_key, api_url
+            )
+            self._finish(job, started, result=result)
+        except Exception as e:
+            self._finish(job, started, error=self.describe_error(e))
+
+        if job.callback_url:
+            self._record_delivery(job, await self._deliver(job))
+
+    async def _deliver(self, job: AnalysisJob) -> bool:
+        if not await asyncio.to_thread(self.accepts_callback, job.callback_url):
+            print(f"[JOBS] ERRO ao entregar webhook do job {job.id}: destino não permitido")
+            return False
+
+        try:
+            if self.webhook_retry_policy is not None:
+                await self.webhook_retry_policy.run(lambda: self._post_webhook(job), self._is_retryable_webhook)
+            else:
+                await self._post_webhook(job)
+            return True
+        except Exception as e:
+            print(f"[JOBS] ERRO ao entregar webhook do job {job.id}: {str(e)}")
+            return False
+
+    async def _post_webhook(self, job: AnalysisJob) -> None:
+        response = await self._get_client().post(job.callback_url, json=job.to_dict(), timeout=self.webhook_timeout,
+                                                 follow_redirects=False)
+        if response.status_code >= 300:
+            raise httpx.HTTPStatusError(
+                f"Webhook respondeu {response.status_code}", request=response.request, response=response
+            )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=self.webhook_timeout)
+        return self.client
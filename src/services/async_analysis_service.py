@@ -0,0 +1,159 @@
+import asyncio
+from typing import AsyncIterator, Optional
+from src.models import AnalysisRequest, BatchAnalysisRequest
+from src.utils import HttpSessionUtils
+from .analysis_service import AnalysisService
+from .async_web_scraping_service import AsyncWebScrapingService
+from .web_scraping_service import FetchedDescription
+from .async_openai_service import AsyncOpenAIService
+from .async_single_flight_service import AsyncSingleFlightService
+from .text_processing_service import TextProcessingService
+from .match_scorer_service import MatchScorerService
+from .metrics_service import MetricsService
+from .async_adaptive_limiter_service import AsyncAdaptiveLimiterService
+from .async_retry_policy_service import AsyncRetryPolicy
+from .async_circuit_breaker_service import AsyncCircuitBreaker
+from .async_analysis_job_service import AsyncAnalysisJobService
+from .async_profile_batcher_service import AsyncProfileBatcherService
+
+
+class AsyncAnalysisService(AnalysisService):
+
+    def __init__(self, web_scraper: AsyncWebScrapingService = None, text_processor: TextProcessingService = None,
+                 openai_service: AsyncOpenAIService = None, batch_max_concurrency: int = 5,
+                 metrics: MetricsService = None):
+        metrics = metrics or MetricsService()
+        super().__init__(
+            web_scraper=web_scraper or AsyncWebScrapingService(metrics=metrics),
+            text_processor=text_processor,
+            openai_service=openai_service or AsyncOpenAIService(),
+            batch_max_concurrency=batch_max_concurrency,
+            metrics=metrics
+        )
+        self.scrape_flight = AsyncSingleFlightService()
+        self.analysis_flight = AsyncSingleFlightService()
+
+    @classmethod
+    def from_config(cls, config) -> 'AsyncAnalysisService':
+        metrics = MetricsService()
+        backend = cls._cache_backend_from_config(config)
+        web_scraper = AsyncWebScrapingService.from_config(
+            config, cache=cls._page_cache_from_config(config, backend), metrics=metrics
+        )
+        limiter = cls._limiter_from_config(config, AsyncAdaptiveLimiterService)
+        openai_service = AsyncOpenAIService(
+            cache=cls._analysis_cache_from_config(config, backend),
+            client=HttpSessionUtils.create_async_client_from_config(config, 30),
+            limiter=limiter,
+            retry_policy=AsyncRetryPolicy.from_config(config, 'OPENAI', cls.OPENAI_RETRY_STATUSES),
+            circuit_breaker=cls._circuit_breaker_from_config(config, AsyncCircuitBreaker),
+            semantic_cache=cls._semantic_cache_from_config(config),
+            budget=cls._prompt_budget_from_config(config),
+            batcher=cls._batcher_from_config(config, AsyncProfileBatcherService)
+        )
+        cls._register_limiter_metrics(metrics, limiter)
+        cls._register_semantic_cache_metrics(metrics, openai_service.semantic_cache)
+        cls._register_prompt_budget_metrics(metrics, openai_service.budget)
+        cls._register_batcher_metrics(metrics, openai_service.batcher)
+        cls._register_circuit_metrics(metrics, web_scraper, openai_service)
+        service = cls(
+            web_scraper=web_scraper,
+            openai_service=openai_service,
+            batch_max_concurrency=config.get('BATCH_MAX_CONCURRENCY', 5),
+            metrics=metrics
+        )
+        service.taxonomy = cls._taxonomy_from_config(config)
+        service.scorer = MatchScorerService(taxonomy=service.taxonomy, gate_below=config.get('PRESCORE_GATE_BELOW', 0))
+        service.jobs = cls._jobs_from_config(
+            config, service, AsyncAnalysisJobService, AsyncRetryPolicy, backend,
+            client=HttpSessionUtils.create_async_client_from_config(config, config.get('JOBS_WEBHOOK_TIMEOUT', 5.0))
+        )
+        cls._register_job_metrics(metrics, service.jobs)
+        service.description_store = cls._description_store_from_config(config)
+        service.refresher = cls._refresher_from_config(config, service.description_store)
+        return service
+
+    async def analyze_position(self, request: AnalysisRequest, api_key: str, api_url: str = None) -> dict:
+        try:
+            formatted_description = await self._describe(request.position)
+            fast_result = self._prescore(request, formatted_description)
+            if fast_result is not None:
+                return fast_result
+
+            with self.metrics.track('completion'):
+                ai_analysis = await self.analysis_flight.do(
+                    self._analysis_key(request.position, request.skills, self.taxonomy),
+                    self.openai_service.analyze_match,
+                    request.skills,
+                    formatted_description,
+                    api_key,
+                    api_url
+                )
+
+            return {"message": ai_analysis}
+
+        except Exception as e:
+            print(f"[ANALYSIS] ERRO: {str(e)}")
+            raise
+
+    async def stream_position(self, request: AnalysisRequest, api_key: str, api_url: str = None) -> AsyncIterator[str]:
+        try:
+            formatted_description = await self._describe(request.position)
+        except Exception as e:
+            print(f"[ANALYSIS] ERRO: {str(e)}")
+            raise
+
+        fast_result = self._prescore(request, formatted_description)
+        if fast_result is not None:
+            return self._single_chunk(fast_result['message'])
+        return self.openai_service.stream_match(request.skills, formatted_description, api_key, api_url)
+
+    @staticmethod
+    async def _single_chunk(message: str) -> AsyncIterator[str]:
+        yield message
+
+    async def _describe(self, position: str) -> str:
+        if self.description_store is None:
+            return self._prepare_description(await self._scrape(position))
+
+        if self.refresher is not None:
+            self.refresher.ensure_started()
+        record = await asyncio.to_thread(self.description_store.get, position)
+        if record is not None:
+            return record.description
+
+        fetched = await self._fetch(position)
+        return await asyncio.to_thread(self._store_description, position, fetched)
+
+    async def _fetch(self, position: str) -> Optional[FetchedDescription]:
+        with self.metrics.count_errors('fetch'):
+            return await self.scrape_flight.do(self._scrape_key(position), self.web_scraper.fetch_description, position)
+
+    async def _scrape(self, position: str):
+        with self.metrics.count_errors('fetch'):
+            return await self.scrape_flight.do(self._scrape_key(position), self.web_scraper.fetch_meta_description, position)
+
+    async def analyze_batch(self, request: BatchAnalysisRequest, api_key: str, api_url: str = None) -> dict:
+        positions = self._unique_positions(request.positions)
+        print(f"[ANALYSIS] Analisando lote com {len(positions)} vagas")
+
+        semaphore = asyncio.Semaphore(max(1, self.batch_max_concurrency))
+
+        async def analyze(position: str):
+            async with semaphore:
+                return await self.analyze_position(
+                    AnalysisRequest(position=position, skills=request.skills, mode=request.mode), api_key, api_url
+                )
+
+        outcomes = await asyncio.gather(*(analyze(position) for position in positions), return_exceptions=True)
+        return dict(zip(positions, outcomes))
+
+    async def aclose(self) -> None:
+        if self.jobs is not None:
+            await self.jobs.aclose()
+        if self.refresher is not None:
+            self.refresher.stop()
+        if self.description_store is not None:
+            self.description_store.close()
+        await self.web_scraper.aclose()
+        await self.openai_service.aclose()
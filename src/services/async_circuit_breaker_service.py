@@ -0,0 +1,19 @@
+from typing import Any, Awaitable, Callable, Optional
+from .circuit_breaker_service import CircuitBreaker
+
+
+class AsyncCircuitBreaker(CircuitBreaker):
+
+    async def call(self, operation: Callable[[], Awaitable], is_failure: Callable[[Exception], Optional[bool]]) -> Any:
+        probe = self.before_call()
+        try:
+            result = await operation()
+        except Exception as e:
+            self.record(is_failure(e), probe)
+            raise
+        except BaseException:
+            self.record(None, probe)
+            raise
+
+        self.record(False, probe)
+        return result
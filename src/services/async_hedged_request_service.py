@@ -0,0 +1,43 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+from .hedged_request_service import HedgedRequestService
+
+
+class AsyncHedgedRequestService(HedgedRequestService):
+
+    async def run(self, operation: Callable[[], Awaitable]) -> Any:
+        if self.budget is not None:
+            self.budget.deposit()
+
+        delay = self.delay()
+        primary = asyncio.ensure_future(self._timed(operation))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._allow_hedge(delay):
+                await asyncio.wait(tasks)
+                return self._settle(primary)
+
+            secondary = asyncio.ensure_future(self._timed(operation))
+            tasks.add(secondary)
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return self._settle(task, hedge=task is secondary)
+                    error = error or task.exception()
+
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    @staticmethod
+    async def _timed(operation: Callable[[], Awaitable]):
+        started = time.perf_counter()
+        result = await operation()
+        return result, time.perf_counter() - started
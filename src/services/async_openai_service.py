@@ -0,0 +1,184 @@
+import json
+import httpx
+from typing import AsyncIterator, Optional
+from src.utils import SseUtils
+from .analysis_cache_service import AnalysisCacheService
+from .semantic_cache_service import SemanticCacheService
+from .prompt_budget_service import PromptBudgetService
+from .async_profile_batcher_service import AsyncProfileBatcherService
+from .adaptive_limiter_service import UpstreamOverloadedError
+from .async_adaptive_limiter_service import AsyncAdaptiveLimiterService
+from .async_retry_policy_service import AsyncRetryPolicy
+from .async_circuit_breaker_service import AsyncCircuitBreaker
+from .openai_service import OpenAIService
+
+
+class AsyncOpenAIService(OpenAIService):
+
+    def __init__(self, cache: Optional[AnalysisCacheService] = None,
+                 client: Optional[httpx.AsyncClient] = None, limiter: Optional[AsyncAdaptiveLimiterService] = None,
+                 retry_policy: Optional[AsyncRetryPolicy] = None, circuit_breaker: Optional[AsyncCircuitBreaker] = None,
+                 semantic_cache: Optional[SemanticCacheService] = None, budget: Optional[PromptBudgetService] = None,
+                 batcher: Optional[AsyncProfileBatcherService] = None):
+        super().__init__(cache=cache, limiter=limiter, retry_policy=retry_policy, circuit_breaker=circuit_breaker,
+                         semantic_cache=semantic_cache, budget=budget, batcher=batcher)
+        self.client = client
+
+    async def _acquire_slot(self) -> None:
+        if self.limiter is not None:
+            await self.limiter.acquire()
+
+    async def _release_slot(self) -> None:
+        if self.limiter is not None:
+            await self.limiter.release()
+
+    async def _resilient(self, operation):
+        attempt = self._guarded(operation)
+        if self.retry_policy is None:
+            return await attempt()
+        return await self.retry_policy.run(attempt, self._is_retryable)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return self.retry_policy.retries_status(error.response.status_code)
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+    @staticmethod
+    def _is_breaker_failure(error: Exception) -> Optional[bool]:
+        if isinstance(error, UpstreamOverloadedError):
+            return None
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    async def _post_completion(self, url: str, payload: dict, api_key: str) -> httpx.Response:
+        await self._acquire_slot()
+        try:
+            response = await self._get_client().post(url, json=payload, headers=self._build_headers(api_key), timeout=30)
+            self._record_response(response)
+        finally:
+            await self._release_slot()
+
+        self._check_status(response)
+        return response
+
+    async def _open_stream(self, url: str, payload: dict, api_key: str) -> httpx.Response:
+        await self._acquire_slot()
+        try:
+            client = self._get_client()
+            request = client.build_request('POST', url, json=payload, headers=self._build_headers(api_key), timeout=30)
+            response = await client.send(request, stream=True)
+            self._record_response(response)
+        except Exception:
+            await self._release_slot()
+            raise
+
+        try:
+            if response.status_code != 200:
+                await response.aread()
+            self._check_status(response)
+        except Exception:
+            await response.aclose()
+            await self._release_slot()
+            raise
+        return response
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=30)
+        return self.client
+
+    async def analyze_match(self, skills: list, description: str, api_key: str, api_url: str = None) -> str:
+        url_to_use = self._resolve_url(api_url)
+
+        cache_key = self._build_cache_key(skills, description, url_to_use)
+        cached_analysis = self._get_cached_analysis(cache_key) or self._get_similar_analysis(skills, description, url_to_use)
+        if cached_analysis is not None:
+            return cached_analysis
+
+        try:
+            ai_message = await self._batched_analysis(skills, description, api_key, url_to_use)
+            if ai_message is None:
+                payload = self._build_payload(skills, description)
+                response = await self._resilient(lambda: self._post_completion(url_to_use, payload, api_key))
+                ai_message = self._parse_result(response.json())
+
+            self._store_cached_analysis(cache_key, ai_message)
+            self._store_similar_analysis(skills, description, url_to_use, ai_message)
+            return ai_message
+
+        except httpx.HTTPStatusError as e:
+            print(f"[OPENAI] ERRO HTTP: {e}")
+            raise
+        except httpx.HTTPError as e:
+            print(f"[OPENAI] ERRO de requisição: {e}")
+            raise
+        except Exception as e:
+            print(f"[OPENAI] ERRO: {e}")
+            raise
+
+    async def _batched_analysis(self, skills: list, description: str, api_key: str, url_to_use: str) -> Optional[str]:
+        if self.batcher is None:
+            return None
+
+        return await self.batcher.submit(
+            (url_to_use, api_key, description),
+            skills,
+            lambda profiles: self._complete_profiles(profiles, description, api_key, url_to_use)
+        )
+
+    async def _complete_profiles(self, profiles: list, description: str, api_key: str, url_to_use: str) -> list:
+        payload = self._build_batch_payload(profiles, description)
+        response = await self._resilient(lambda: self._post_completion(url_to_use, payload, api_key))
+        return self._parse_batch_result(response.json(), len(profiles))
+
+    async def stream_match(self, skills: list, description: str, api_key: str, api_url: str = None) -> AsyncIterator[str]:
+        url_to_use = self._resolve_url(api_url)
+
+        cache_key = self._build_cache_key(skills, description, url_to_use)
+        cached_analysis = self._get_cached_analysis(cache_key) or self._get_similar_analysis(skills, description, url_to_use)
+        if cached_analysis is not None:
+            yield cached_analysis
+            return
+
+        payload = self._build_payload(skills, description)
+        payload["stream"] = True
+
+        try:
+            response = await self._resilient(lambda: self._open_stream(url_to_use, payload, api_key))
+
+            try:
+                parts = []
+                async for line in response.aiter_lines():
+                    data = SseUtils.parse_data_line(line)
+                    if data is None:
+                        continue
+                    if data == '[DONE]':
+                        break
+
+                    delta = self._parse_stream_delta(json.loads(data))
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            finally:
+                await response.aclose()
+                await self._release_slot()
+
+            print(f"[OPENAI] Análise em streaming concluída com sucesso")
+            self._store_cached_analysis(cache_key, "".join(parts))
+            self._store_similar_analysis(skills, description, url_to_use, "".join(parts))
+
+        except httpx.HTTPStatusError as e:
+            print(f"[OPENAI] ERRO HTTP: {e}")
+            raise
+        except httpx.HTTPError as e:
+            print(f"[OPENAI] ERRO de requisição: {e}")
+            raise
+        except Exception as e:
+            print(f"[OPENAI] ERRO: {e}")
+            raise
+
+    async def aclose(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
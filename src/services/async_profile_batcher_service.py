@@ -0,0 +1,35 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, List, Optional
+from .profile_batcher_service import ProfileBatch, ProfileBatcherService
+
+
+class AsyncProfileBatcherService(ProfileBatcherService):
+
+    async def submit(self, key: Hashable, skills: list,
+                     run_batch: Callable[[List[list]], Awaitable[List[Optional[str]]]]) -> Optional[str]:
+        batch, index, leader = self._join(key, skills)
+        if not leader:
+            return (await asyncio.shield(batch.future))[index]
+
+        try:
+            try:
+                await asyncio.wait_for(batch.full.wait(), self.window)
+            except asyncio.TimeoutError:
+                pass
+            self._close(key, batch)
+            results = await run_batch(batch.profiles) if len(batch.profiles) > 1 else [None]
+        except asyncio.CancelledError:
+            self._close(key, batch)
+            batch.future.set_result([None] * len(batch.profiles))
+            raise
+        except Exception as e:
+            batch.future.set_exception(e)
+            batch.future.exception()
+            raise
+
+        self._record(batch)
+        batch.future.set_result(results)
+        return results[index]
+
+    def _new_batch(self) -> ProfileBatch:
+        return ProfileBatch(asyncio.Event(), asyncio.get_running_loop().create_future())
@@ -0,0 +1,20 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+from .retry_policy_service import RetryPolicy
+
+
+class AsyncRetryPolicy(RetryPolicy):
+
+    async def run(self, operation: Callable[[], Awaitable], is_retryable: Callable[[Exception], bool]) -> Any:
+        self._start()
+        attempt = 1
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                delay = self._next_delay(attempt, e, is_retryable)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,18 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+from .single_flight_service import SingleFlightService
+
+
+class AsyncSingleFlightService(SingleFlightService):
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable], *args, **kwargs) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._calls[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
@@ -0,0 +1,182 @@
+import time
+import httpx
+from typing import Optional
+from src.utils import HttpSessionUtils, normalize_url
+from .page_cache_service import PageCacheService, CachedPage
+from .metrics_service import MetricsService
+from .meta_description_parser import MetaDescriptionStream
+from .async_retry_policy_service import AsyncRetryPolicy
+from .async_hedged_request_service import AsyncHedgedRequestService
+from .async_circuit_breaker_service import AsyncCircuitBreaker
+from .circuit_breaker_service import CircuitBreakerRegistry
+from .web_scraping_service import WebScrapingService, FetchedDescription
+
+
+class AsyncWebScrapingService(WebScrapingService):
+
+    RETRY_POLICY_CLASS = AsyncRetryPolicy
+    HEDGING_CLASS = AsyncHedgedRequestService
+    BREAKER_CLASS = AsyncCircuitBreaker
+
+    def __init__(self, timeout: int = 10, cache: Optional[PageCacheService] = None,
+                 client: Optional[httpx.AsyncClient] = None, metrics: Optional[MetricsService] = None,
+                 retry_policy: Optional[AsyncRetryPolicy] = None, hedging: Optional[AsyncHedgedRequestService] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 parser_backend: str = MetaDescriptionStream.DEFAULT_BACKEND, structured_data_max_bytes: int = 0):
+        super().__init__(timeout=timeout, cache=cache, metrics=metrics, retry_policy=retry_policy, hedging=hedging,
+                         circuit_breakers=circuit_breakers, parser_backend=parser_backend,
+                         structured_data_max_bytes=structured_data_max_bytes)
+        self.client = client
+
+    @staticmethod
+    def _transport_from_config(config, timeout: float) -> dict:
+        return {'client': HttpSessionUtils.create_async_client_from_config(config, timeout, follow_redirects=True)}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        return self.client
+
+    async def _resilient(self, url: str, operation):
+        attempt = self._guarded(url, self._hedged(operation))
+        if self.retry_policy is None:
+            return await attempt()
+        return await self.retry_policy.run(attempt, self._is_retryable)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return self.retry_policy.retries_status(error.response.status_code)
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+    @staticmethod
+    def _is_breaker_failure(error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    async def fetch_page_content(self, url: str) -> bytes:
+        try:
+            if self.cache is None:
+                return await self._resilient(url, lambda: self._get_content(url))
+
+            return await self._fetch_with_cache(url)
+
+        except httpx.TimeoutException:
+            print(f"[WEB_SCRAPING] ERRO: Timeout após {self.timeout}s")
+            raise
+        except httpx.HTTPStatusError as e:
+            print(f"[WEB_SCRAPING] ERRO HTTP: {e}")
+            raise
+        except httpx.HTTPError as e:
+            print(f"[WEB_SCRAPING] ERRO de requisição: {e}")
+            raise
+
+    async def _get_content(self, url: str) -> bytes:
+        response = await self._get_client().get(url)
+        response.raise_for_status()
+        return response.content
+
+    async def _fetch_with_cache(self, url: str) -> bytes:
+        key = normalize_url(url)
+        cached = self.cache.get(key)
+
+        if cached is not None and not cached.complete:
+            cached = None
+
+        if cached is not None and cached.is_fresh(self.cache.ttl):
+            return cached.content
+
+        return await self._resilient(url, lambda: self._revalidate_content(url, key, cached))
+
+    async def _revalidate_content(self, url: str, key: str, cached: Optional[CachedPage]) -> bytes:
+        headers = cached.conditional_headers() if cached is not None else {}
+        response = await self._get_client().get(url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.revalidate(key)
+            return cached.content
+
+        response.raise_for_status()
+        self._store_page(key, url, response.content, response.headers)
+        return response.content
+
+    async def fetch_meta_description(self, url: str) -> Optional[str]:
+        try:
+            key, cached = self._lookup_cache(url)
+
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                return self._extract_cached(cached)
+
+            return await self._resilient(url, lambda: self._download_description(url, key, cached))
+
+        except httpx.TimeoutException:
+            print(f"[WEB_SCRAPING] ERRO: Timeout após {self.timeout}s")
+            raise
+        except httpx.HTTPStatusError as e:
+            print(f"[WEB_SCRAPING] ERRO HTTP: {e}")
+            raise
+        except httpx.HTTPError as e:
+            print(f"[WEB_SCRAPING] ERRO de requisição: {e}")
+            raise
+
+    async def fetch_description(self, url: str, etag: Optional[str] = None,
+                                last_modified: Optional[str] = None) -> Optional[FetchedDescription]:
+        try:
+            headers = self._conditional_headers(etag, last_modified)
+            return await self._resilient(url, lambda: self._download_fetched(url, headers))
+
+        except httpx.TimeoutException:
+            print(f"[WEB_SCRAPING] ERRO: Timeout após {self.timeout}s")
+            raise
+        except httpx.HTTPStatusError as e:
+            print(f"[WEB_SCRAPING] ERRO HTTP: {e}")
+            raise
+        except httpx.HTTPError as e:
+            print(f"[WEB_SCRAPING] ERRO de requisição: {e}")
+            raise
+
+    async def _download_fetched(self, url: str, headers: dict) -> Optional[FetchedDescription]:
+        started = time.perf_counter()
+
+        async with self._get_client().stream('GET', url, headers=headers) as response:
+            if response.status_code == 304:
+                self._observe('fetch', time.perf_counter() - started)
+                return None
+
+            response.raise_for_status()
+
+            stream = self._stream(response.headers)
+            async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                if stream.feed(chunk):
+                    break
+
+        self._observe_stream(started, stream)
+        return FetchedDescription(stream.description, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+    async def _download_description(self, url: str, key: Optional[str], cached: Optional[CachedPage]) -> Optional[str]:
+        started = time.perf_counter()
+        headers = cached.conditional_headers() if cached is not None else {}
+
+        async with self._get_client().stream('GET', url, headers=headers) as response:
+            if response.status_code == 304 and cached is not None:
+                self.cache.revalidate(key)
+                self._observe('fetch', time.perf_counter() - started)
+                return self._extract_cached(cached)
+
+            response.raise_for_status()
+
+            stream = self._stream(response.headers)
+            async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                if stream.feed(chunk):
+                    break
+
+        if key is not None:
+            self._store_page(key, url, stream.consumed, response.headers, complete=not stream.done)
+
+        self._observe_stream(started, stream)
+        return stream.description
+
+    async def aclose(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
@@ -0,0 +1,210 @@
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+from src.utils import ForkSafeConnection
+
+
+class CacheBackend(ABC):
+
+    name = 'base'
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = self._get(key)
+        except Exception as e:
+            self._record_error('ler', e)
+            return None
+
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        try:
+            self._set(key, value, ttl)
+        except Exception as e:
+            self._record_error('gravar', e)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._delete(key)
+        except Exception as e:
+            self._record_error('remover', e)
+
+    def clear(self) -> None:
+        try:
+            self._clear()
+        except Exception as e:
+            self._record_error('limpar', e)
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                'backend': self.name,
+                'hits': self.hits,
+                'misses': self.misses,
+                'errors': self.errors
+            }
+
+    def _record_error(self, action: str, error: Exception) -> None:
+        with self._stats_lock:
+            self.errors += 1
+        print(f"[CACHE] ERRO ao {action} no backend {self.name}: {error}")
+
+    @staticmethod
+    def _expires_at(ttl: Optional[float]) -> Optional[float]:
+        return time.time() + ttl if ttl else None
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        pass
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def _clear(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+
+    name = 'memory'
+
+    def __init__(self, max_entries: int = 4096):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = len(self._entries)
+        return {**super().stats(), 'entries': entries}
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+
+            value, expires_at = item
+            if expires_at is not None and time.time() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, self._expires_at(ttl))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteCacheBackend(CacheBackend):
+
+    name = 'sqlite'
+    EVICT_EVERY = 64
+
+    def __init__(self, path: str, max_entries: int = 100000, mmap_size: int = 256 * 1024 * 1024):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db = ForkSafeConnection(path, mmap_size, schema=(
+            'CREATE TABLE IF NOT EXISTS cache_entries ('
+            'key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)',
+            'CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed_at)'
+        ))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict:
+        try:
+            with self._lock:
+                entries, = self._db.get().execute('SELECT COUNT(*) FROM cache_entries').fetchone()
+        except sqlite3.Error:
+            entries = None
+        return {**super().stats(), 'entries': entries, 'path': self.path}
+
+    def _get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._db.get().execute(
+                'SELECT value, expires_at FROM cache_entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and now >= expires_at:
+                self._db.get().execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+                return None
+
+            self._db.get().execute('UPDATE cache_entries SET accessed_at = ? WHERE key = ?', (now, key))
+            return bytes(value)
+
+    def _set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        with self._lock:
+            self._db.get().execute(
+                'INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, sqlite3.Binary(value), self._expires_at(ttl), time.time())
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._db.get().execute('DELETE FROM cache_entries WHERE key = ?', (key,))
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._db.get().execute('DELETE FROM cache_entries')
+
+    def _evict(self) -> None:
+        count, = self._db.get().execute('SELECT COUNT(*) FROM cache_entries').fetchone()
+        if count <= self.max_entries:
+            return
+
+        self._db.get().execute('DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),))
+        self._db.get().execute(
+            'DELETE FROM cache_entries WHERE key IN '
+            '(SELECT key FROM cache_entries ORDER BY accessed_at LIMIT '
+            '(SELECT MAX(COUNT(*) - ?, 0) FROM cache_entries))',
+            (self.max_entries,)
+        )
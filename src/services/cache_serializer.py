@@ -0,0 +1,71 @@
+import struct
+import zlib
+from typing import Optional, Tuple
+
+
+class CacheSerializer:
+
+    MAGIC = b'JB'
+    VERSION = 1
+    KIND_PAGE = 1
+    KIND_TEXT = 2
+    FLAG_ZLIB = 0x01
+    HEADER = struct.Struct('>2sBBB')
+    LENGTH = struct.Struct('>H')
+    NONE_LENGTH = 0xFFFF
+
+    def __init__(self, compress_threshold: int = 1024, compress_level: int = 6):
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+        self.compressed = 0
+        self.bytes_saved = 0
+
+    def dumps(self, kind: int, body: bytes) -> bytes:
+        flags = 0
+        if self.compress_threshold and len(body) >= self.compress_threshold:
+            compressed = zlib.compress(body, self.compress_level)
+            if len(compressed) < len(body):
+                self.compressed += 1
+                self.bytes_saved += len(body) - len(compressed)
+                body = compressed
+                flags |= self.FLAG_ZLIB
+        return self.HEADER.pack(self.MAGIC, self.VERSION, kind, flags) + body
+
+    def loads(self, kind: int, data: bytes) -> bytes:
+        if len(data) < self.HEADER.size:
+            raise ValueError("Entrada de cache truncada")
+
+        magic, version, stored_kind, flags = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != self.VERSION or stored_kind != kind:
+            raise ValueError("Formato de entrada de cache desconhecido")
+
+        body = data[self.HEADER.size:]
+        if flags & self.FLAG_ZLIB:
+            try:
+                body = zlib.decompress(body)
+            except zlib.error as e:
+                raise ValueError(f"Entrada de cache corrompida: {e}")
+        return body
+
+    @classmethod
+    def pack_optional(cls, value: Optional[str]) -> bytes:
+        if value is None:
+            return cls.LENGTH.pack(cls.NONE_LENGTH)
+
+        encoded = value.encode('utf-8')[:cls.NONE_LENGTH - 1]
+        return cls.LENGTH.pack(len(encoded)) + encoded
+
+    @classmethod
+    def unpack_optional(cls, body: bytes, offset: int) -> Tuple[Optional[str], int]:
+        length, = cls.LENGTH.unpack_from(body, offset)
+        offset += cls.LENGTH.size
+        if length == cls.NONE_LENGTH:
+            return None, offset
+        return body[offset:offset + length].decode('utf-8', errors='replace'), offset + length
+
+    def stats(self) -> dict:
+        return {
+            'compress_threshold': self.compress_threshold,
+            'compressed': self.compressed,
+            'bytes_saved': self.bytes_saved
+        }
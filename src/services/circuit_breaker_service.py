@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+from .adaptive_limiter_service import UpstreamOverloadedError
+
+
+class CircuitOpenError(UpstreamOverloadedError):
+
+    def __init__(self, name: str, retry_after: float = 1.0):
+        super().__init__(f"Circuito aberto para {name}, tente novamente em instantes", retry_after)
+        self.name = name
+
+
+class CircuitBreaker:
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self.opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def call(self, operation: Callable[[], Any], is_failure: Callable[[Exception], Optional[bool]]) -> Any:
+        probe = self.before_call()
+        try:
+            result = operation()
+        except Exception as e:
+            self.record(is_failure(e), probe)
+            raise
+        except BaseException:
+            self.record(None, probe)
+            raise
+
+        self.record(False, probe)
+        return result
+
+    def before_call(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, remaining)
+
+                self.state = self.HALF_OPEN
+                self._probes = 0
+                print(f"[CIRCUIT] {self.name}: meio-aberto, testando recuperação")
+
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name)
+                self._probes += 1
+                return True
+
+            return False
+
+    def record(self, failure: Optional[bool], probe: bool = False) -> None:
+        with self._lock:
+            if probe:
+                self._probes -= 1
+
+            if failure is None:
+                return
+
+            if not failure:
+                self.failures = 0
+                if probe and self.state == self.HALF_OPEN:
+                    self.state = self.CLOSED
+                    print(f"[CIRCUIT] {self.name}: fechado, dependência recuperada")
+                return
+
+            self.failures += 1
+            if (probe and self.state == self.HALF_OPEN) or \
+                    (self.state == self.CLOSED and self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.opened += 1
+                print(f"[CIRCUIT] {self.name}: aberto após {self.failures} falhas consecutivas")
+
+    def stats(self) -> dict:
+        with self._lock:
+            retry_after = 0.0
+            if self.state == self.OPEN:
+                retry_after = max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'opened': self.opened,
+                'rejected': self.rejected,
+                'retry_after': round(retry_after, 2)
+            }
+
+
+class CircuitBreakerRegistry:
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1,
+                 max_hosts: int = 1024, breaker_class=CircuitBreaker):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.max_hosts = max_hosts
+        self.breaker_class = breaker_class
+        self._breakers = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_for(url: str) -> str:
+        return (urlsplit(url).hostname or url).lower()
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        return self.get(self.host_for(url))
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self.breaker_class(
+                    name,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls
+                )
+                self._breakers[name] = breaker
+                while len(self._breakers) > self.max_hosts:
+                    self._breakers.popitem(last=False)
+            else:
+                self._breakers.move_to_end(name)
+            return breaker
+
+    def open_count(self) -> int:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return sum(1 for breaker in breakers if breaker.state != CircuitBreaker.CLOSED)
+
+    def stats(self) -> dict:
+        with self._lock:
+            breakers = list(self._breakers.items())
+
+        not_closed = {name: breaker.stats() for name, breaker in breakers if breaker.state != CircuitBreaker.CLOSED}
+        return {
+            'hosts': len(breakers),
+            'open': len(not_closed),
+            'breakers': not_closed
+        }
@@ -0,0 +1,113 @@
+import os
+import threading
+import requests
+from .description_store_service import DescriptionStoreService, DescriptionRecord
+from .text_processing_service import TextProcessingService
+from .web_scraping_service import WebScrapingService
+
+
+class DescriptionRefresherService:
+
+    GONE_STATUSES = (404, 410)
+
+    def __init__(self, store: DescriptionStoreService, web_scraper: WebScrapingService,
+                 text_processor: TextProcessingService = None, interval: float = 60.0, batch_size: int = 20):
+        self.store = store
+        self.web_scraper = web_scraper
+        self.text_processor = text_processor or TextProcessingService()
+        self.interval = interval
+        self.batch_size = batch_size
+        self.runs = 0
+        self.unchanged = 0
+        self.updated = 0
+        self.removed = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def ensure_started(self) -> None:
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._loop, name='description-refresher', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and self._pid == os.getpid():
+            thread.join(timeout=self.interval)
+        self._thread = None
+
+    def run_once(self) -> int:
+        records = self.store.claim_due(self.batch_size)
+        for record in records:
+            self._refresh(record)
+
+        with self._lock:
+            self.runs += 1
+        if records:
+            print(f"[REFRESHER] {len(records)} descrições revalidadas")
+        return len(records)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'running': self._thread is not None and self._thread.is_alive(),
+                'runs': self.runs,
+                'unchanged': self.unchanged,
+                'updated': self.updated,
+                'removed': self.removed,
+                'failed': self.failed
+            }
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"[REFRESHER] ERRO: {str(e)}")
+
+    def _refresh(self, record: DescriptionRecord) -> None:
+        try:
+            fetched = self.web_scraper.fetch_description(record.url, record.etag, record.last_modified)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code in self.GONE_STATUSES:
+                self._remove(record, f"vaga removida ({e.response.status_code})")
+            else:
+                self._fail(record, e)
+            return
+        except Exception as e:
+            self._fail(record, e)
+            return
+
+        if fetched is None:
+            self.store.mark_unchanged(record.url)
+            self._count('unchanged')
+        elif not fetched.description:
+            self._remove(record, "meta description não encontrada")
+        else:
+            description = self.text_processor.format_description(fetched.description)
+            self.store.put(record.url, description, fetched.etag, fetched.last_modified)
+            self._count('updated')
+
+    def _remove(self, record: DescriptionRecord, reason: str) -> None:
+        print(f"[REFRESHER] Removendo {record.url}: {reason}")
+        self.store.remove(record.url)
+        self._count('removed')
+
+    def _fail(self, record: DescriptionRecord, error: Exception) -> None:
+        print(f"[REFRESHER] ERRO ao revalidar {record.url}: {str(error)}")
+        self.store.mark_failed(record.url, record.failures)
+        self._count('failed')
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
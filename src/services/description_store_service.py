@@ -0,0 +1,148 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+from src.utils import ForkSafeConnection, normalize_url
+
+
+@dataclass
+class DescriptionRecord:
+    url: str
+    description: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.time)
+    checked_at: float = field(default_factory=time.time)
+    failures: int = 0
+
+    def is_servable(self, max_age: float) -> bool:
+        return time.time() - self.checked_at < max_age
+
+
+class DescriptionStoreService:
+
+    EVICT_EVERY = 64
+    COLUMNS = 'url, description, etag, last_modified, fetched_at, checked_at, failures'
+
+    def __init__(self, path: str, max_entries: int = 100000, max_age: float = 7 * 24 * 3600,
+                 refresh_interval: float = 6 * 3600, lease: float = 300, mmap_size: int = 64 * 1024 * 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self.lease = lease
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._db = ForkSafeConnection(path, mmap_size, schema=(
+            'CREATE TABLE IF NOT EXISTS descriptions ('
+            'key TEXT PRIMARY KEY, url TEXT NOT NULL, description TEXT NOT NULL, etag TEXT, last_modified TEXT, '
+            'fetched_at REAL NOT NULL, checked_at REAL NOT NULL, next_check_at REAL NOT NULL, '
+            'failures INTEGER NOT NULL DEFAULT 0, accessed_at REAL NOT NULL)',
+            'CREATE INDEX IF NOT EXISTS descriptions_next_check ON descriptions (next_check_at)',
+            'CREATE INDEX IF NOT EXISTS descriptions_accessed ON descriptions (accessed_at)'
+        ))
+
+    def get(self, url: str) -> Optional[DescriptionRecord]:
+        key = normalize_url(url)
+        with self._lock:
+            connection = self._db.get()
+            row = connection.execute(
+                f'SELECT {self.COLUMNS} FROM descriptions WHERE key = ?', (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            record = DescriptionRecord(*row)
+            if not record.is_servable(self.max_age):
+                self.stale += 1
+                self.misses += 1
+                return None
+
+            connection.execute('UPDATE descriptions SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self.hits += 1
+            return record
+
+    def put(self, url: str, description: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        now = time.time()
+        with self._lock:
+            connection = self._db.get()
+            connection.execute(
+                'INSERT OR REPLACE INTO descriptions (key, url, description, etag, last_modified, fetched_at, '
+                'checked_at, next_check_at, failures, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, '
+                'COALESCE((SELECT accessed_at FROM descriptions WHERE key = ?), ?))',
+                (normalize_url(url), url, description, etag, last_modified, now, now, now + self.refresh_interval,
+                 normalize_url(url), now)
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict(connection)
+
+    def claim_due(self, limit: int) -> List[DescriptionRecord]:
+        now = time.time()
+        with self._lock:
+            connection = self._db.get()
+            rows = connection.execute(
+                f'SELECT key, {self.COLUMNS} FROM descriptions WHERE next_check_at <= ? ORDER BY next_check_at LIMIT ?',
+                (now, limit)
+            ).fetchall()
+
+            claimed = []
+            for key, *columns in rows:
+                cursor = connection.execute(
+                    'UPDATE descriptions SET next_check_at = ? WHERE key = ? AND next_check_at <= ?',
+                    (now + self.lease, key, now)
+                )
+                if cursor.rowcount == 1:
+                    claimed.append(DescriptionRecord(*columns))
+            return claimed
+
+    def mark_unchanged(self, url: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.get().execute(
+                'UPDATE descriptions SET checked_at = ?, next_check_at = ?, failures = 0 WHERE key = ?',
+                (now, now + self.refresh_interval, normalize_url(url))
+            )
+
+    def mark_failed(self, url: str, failures: int) -> None:
+        delay = min(self.refresh_interval, self.lease * 2 ** failures)
+        with self._lock:
+            self._db.get().execute(
+                'UPDATE descriptions SET next_check_at = ?, failures = ? WHERE key = ?',
+                (time.time() + delay, failures + 1, normalize_url(url))
+            )
+
+    def remove(self, url: str) -> None:
+        with self._lock:
+            self._db.get().execute('DELETE FROM descriptions WHERE key = ?', (normalize_url(url),))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, due = self._db.get().execute(
+                'SELECT COUNT(*), COALESCE(SUM(next_check_at <= ?), 0) FROM descriptions', (time.time(),)
+            ).fetchone()
+            return {
+                'entries': entries,
+                'due': due,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale
+            }
+
+    def _evict(self, connection) -> None:
+        connection.execute(
+            'DELETE FROM descriptions WHERE key IN '
+            '(SELECT key FROM descriptions ORDER BY accessed_at LIMIT '
+            '(SELECT MAX(COUNT(*) - ?, 0) FROM descriptions))',
+            (self.max_entries,)
+        )
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+from .retry_policy_service import RetryBudget
+
+
+class HedgedRequestService:
+
+    def __init__(self, quantile: float = 0.95, min_delay: float = 0.05, initial_delay: float = 1.0,
+                 window: int = 256, min_samples: int = 20, budget: Optional[RetryBudget] = None,
+                 max_workers: int = 32):
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.budget = budget
+        self.max_workers = max_workers
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def delay(self) -> float:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return max(self.min_delay, self.initial_delay)
+            ordered = sorted(self._samples)
+
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def run(self, operation: Callable[[], Any]) -> Any:
+        if self.budget is not None:
+            self.budget.deposit()
+
+        delay = self.delay()
+        primary = self._get_executor().submit(self._timed, operation)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._allow_hedge(delay):
+            return self._settle(primary)
+
+        secondary = self._get_executor().submit(self._timed, operation)
+        pending = {primary, secondary}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return self._settle(future, hedge=future is secondary)
+                error = error or future.exception()
+
+        raise error
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                'samples': len(self._samples),
+                'hedged': self.hedged,
+                'hedge_wins': self.hedge_wins
+            }
+        stats['delay'] = round(self.delay(), 4)
+        stats['budget'] = self.budget.stats() if self.budget else None
+        return stats
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='hedge')
+            return self._executor
+
+    def _allow_hedge(self, delay: float) -> bool:
+        if self.budget is not None and not self.budget.withdraw():
+            return False
+
+        with self._lock:
+            self.hedged += 1
+        print(f"[HEDGE] Sem resposta após {delay:.2f}s, disparando requisição redundante")
+        return True
+
+    def _settle(self, future, hedge: bool = False) -> Any:
+        result, elapsed = future.result()
+        self.observe(elapsed)
+        if hedge:
+            with self._lock:
+                self.hedge_wins += 1
+        return result
+
+    @staticmethod
+    def _timed(operation: Callable[[], Any]):
+        started = time.perf_counter()
+        result = operation()
+        return result, time.perf_counter() - started
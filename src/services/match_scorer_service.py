@@ -0,0 +1,99 @@
+import re
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+from .skill_taxonomy import SkillTaxonomy
+
+
+@dataclass
+class MatchScore:
+    percentage: int
+    matched_skills: List[str]
+    missing_skills: List[str]
+
+    def message(self) -> str:
+        total = len(self.matched_skills) + len(self.missing_skills)
+        text = f"Match estimado de {self.percentage}% ({len(self.matched_skills)} de {total} habilidades encontradas na descrição da vaga)."
+        if self.missing_skills:
+            text += f" Habilidades não encontradas: {', '.join(self.missing_skills)}."
+        return text
+
+    def to_dict(self) -> dict:
+        return {
+            'message': self.message(),
+            'mode': 'fast',
+            'match_percentage': self.percentage,
+            'matched_skills': self.matched_skills,
+            'missing_skills': self.missing_skills
+        }
+
+
+class MatchScorerService:
+
+    TOKEN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None, gate_below: int = 0):
+        self.taxonomy = taxonomy or SkillTaxonomy.default()
+        self.gate_below = gate_below
+        self._lock = threading.Lock()
+        self.scored = 0
+        self.gated = 0
+
+    @classmethod
+    def phrase(cls, text: str) -> tuple:
+        return tuple(cls.TOKEN.findall(SkillTaxonomy.normalize(text)))
+
+    @classmethod
+    def ngrams(cls, text: str, max_size: int) -> set:
+        tokens = cls.phrase(text)
+        grams = set()
+        for size in range(1, max_size + 1):
+            grams.update(zip(*(tokens[start:] for start in range(size))))
+        return grams
+
+    def score(self, skills: list, description: str) -> MatchScore:
+        unique_skills = list(dict.fromkeys(skill.strip() for skill in skills if skill and skill.strip()))
+        canonical = {skill: self.taxonomy.canonical(skill) for skill in unique_skills}
+        mentions = self.taxonomy.mentions(description)
+
+        unknown = {skill: self.phrase(skill) for skill, name in canonical.items() if name is None}
+        grams = self.ngrams(description, max(map(len, unknown.values()))) if unknown else set()
+
+        matched, missing = [], []
+        for skill in unique_skills:
+            if canonical[skill]:
+                found = canonical[skill] in mentions
+            else:
+                found = unknown[skill] in grams and self._spelled(skill, description)
+            (matched if found else missing).append(skill)
+
+        with self._lock:
+            self.scored += 1
+
+        percentage = round(100 * len(matched) / len(unique_skills)) if unique_skills else 0
+        return MatchScore(percentage, matched, missing)
+
+    @staticmethod
+    def _spelled(skill: str, description: str) -> bool:
+        if not SkillTaxonomy.is_ambiguous(SkillTaxonomy.normalize(skill)):
+            return True
+        return SkillTaxonomy.spelling_pattern({skill, skill.upper()}).search(description) is not None
+
+    def should_skip_completion(self, score: MatchScore) -> bool:
+        if not score.matched_skills and not score.missing_skills:
+            return False
+        if score.percentage >= self.gate_below:
+            return False
+
+        with self._lock:
+            self.gated += 1
+        print(f"[PRESCORE] Match estimado de {score.percentage}% abaixo de {self.gate_below}%, análise por IA dispensada")
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'gate_below': self.gate_below,
+                'scored': self.scored,
+                'gated': self.gated
+            }
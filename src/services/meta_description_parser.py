@@ -0,0 +1,404 @@
+import codecs
+import html
+import json
+import re
+import time
+from html.parser import HTMLParser
+from typing import Optional
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+
+class MetaDescriptionParser(HTMLParser):
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.description = None
+        self.done = False
+        self.failed = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+
+        if tag == 'meta':
+            attributes = dict(attrs)
+            if attributes.get('name') == 'description':
+                self.description = attributes.get('content') or None
+                self.done = True
+        elif tag == 'body':
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.done = True
+
+
+class RegexMetaDescriptionParser:
+
+    MAX_CHARS = 512 * 1024
+    RAW_TEXT_END = {tag: re.compile(f'</{tag}', re.IGNORECASE) for tag in ('script', 'style')}
+    ATTRS = r'''[^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*'''
+    TAG = re.compile(r'<(/?)([a-zA-Z][^\s/>"\']*)((?:[\s/]' + ATTRS + r')?)>')
+    PARTIAL_TAG = re.compile(
+        r'<(?:/?(?:[a-zA-Z][^\s/>"\']*(?:[\s/]' + ATTRS + r'''(?:"[^"]*|'[^']*)?)?)?|!-?)\Z'''
+    )
+    ATTRIBUTE = re.compile(r'''([^\s=/>"']+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+)))?''')
+
+    def __init__(self):
+        self.description = None
+        self.done = False
+        self.failed = False
+        self._buffer = ''
+        self._fed = 0
+        self._raw_text = None
+
+    def feed(self, data: str) -> None:
+        if self.done:
+            return
+
+        self._fed += len(data)
+        buffer = self._buffer + data
+        pos = 0
+        while not self.done:
+            if self._raw_text is not None:
+                end = self._raw_text.search(buffer, pos)
+                if end is None:
+                    pos = max(pos, len(buffer) - 16)
+                    break
+                self._raw_text = None
+                pos = end.start()
+                continue
+
+            start = buffer.find('<', pos)
+            if start < 0:
+                pos = len(buffer)
+                break
+
+            if buffer.startswith('<!--', start):
+                end = buffer.find('-->', start + 4)
+                if end < 0:
+                    pos = start
+                    break
+                pos = end + 3
+                continue
+
+            match = self.TAG.match(buffer, start)
+            if match is None:
+                if self.PARTIAL_TAG.match(buffer, start):
+                    pos = start
+                    break
+                pos = start + 1
+                continue
+
+            pos = match.end()
+            self._handle(match.group(1) == '/', match.group(2).lower(), match.group(3))
+
+        self._buffer = buffer[pos:]
+        if not self.done and self._fed > self.MAX_CHARS:
+            self.failed = self.done = True
+
+    def _handle(self, closing: bool, tag: str, attrs: str) -> None:
+        if closing:
+            self.done = tag == 'head'
+            return
+
+        if tag == 'meta':
+            attributes = self.parse_attributes(attrs)
+            if attributes.get('name') == 'description':
+                self.description = attributes.get('content') or None
+                self.done = True
+        elif tag == 'body':
+            self.done = True
+        elif tag in self.RAW_TEXT_END:
+            self._raw_text = self.RAW_TEXT_END[tag]
+
+    @classmethod
+    def parse_attributes(cls, attrs: str) -> dict:
+        attributes = {}
+        for name, double_quoted, single_quoted, unquoted in cls.ATTRIBUTE.findall(attrs):
+            value = double_quoted or single_quoted or unquoted
+            attributes[name.lower()] = html.unescape(value) if value else value
+        return attributes
+
+
+class LxmlMetaDescriptionParser:
+
+    def __init__(self):
+        self.description = None
+        self.done = False
+        self.failed = False
+        self._parser = etree.HTMLPullParser(events=('start', 'end'))
+
+    def feed(self, data: str) -> None:
+        if self.done:
+            return
+
+        self._parser.feed(data)
+        for event, element in self._parser.read_events():
+            tag = element.tag if isinstance(element.tag, str) else ''
+            if event == 'start' and tag == 'meta' and element.get('name') == 'description':
+                self.description = element.get('content') or None
+                self.done = True
+            elif (event == 'start' and tag == 'body') or (event == 'end' and tag == 'head'):
+                self.done = True
+
+            if self.done:
+                return
+
+
+class StructuredDataScanner:
+
+    TAG = re.compile(r'<(script|meta)\b(' + RegexMetaDescriptionParser.ATTRS + ')>', re.IGNORECASE)
+    SCRIPT_END = re.compile(r'</script\s*>', re.IGNORECASE)
+    HTML_TAG = re.compile(r'<[^>]*>')
+    LIST_ITEM = re.compile(r'<li\b[^>]*>', re.IGNORECASE)
+    BLOCK_TAG = re.compile(r'</?(?:p|div|br|h[1-6]|ul|ol|li|tr|table|section|article|blockquote|pre|dt|dd)\b[^>]*>',
+                           re.IGNORECASE)
+    MAX_PENDING = 1024 * 1024
+    MAX_DEPTH = 8
+
+    def __init__(self):
+        self.job_posting = None
+        self.og_description = None
+        self.invalid_json = 0
+        self.done = False
+        self._buffer = ''
+
+    def feed(self, data: str) -> None:
+        if self.done:
+            return
+
+        buffer = self._buffer + data
+        pos = 0
+        while True:
+            match = self.TAG.search(buffer, pos)
+            if match is None:
+                tail = buffer.rfind('<', pos)
+                pos = tail if tail >= 0 else len(buffer)
+                break
+
+            attributes = RegexMetaDescriptionParser.parse_attributes(match.group(2))
+            if match.group(1).lower() == 'meta':
+                if attributes.get('property') == 'og:description' and self.og_description is None:
+                    self.og_description = attributes.get('content') or None
+                pos = match.end()
+                continue
+
+            end = self.SCRIPT_END.search(buffer, match.end())
+            if end is None:
+                pos = match.start()
+                break
+
+            if 'ld+json' in (attributes.get('type') or '').lower():
+                self._read_json_ld(buffer[match.end():end.start()])
+            pos = end.end()
+            if self.job_posting is not None:
+                self.done = True
+                break
+
+        self._buffer = buffer[pos:] if len(buffer) - pos <= self.MAX_PENDING else ''
+
+    def candidates(self) -> dict:
+        return {'json-ld': self.job_posting, 'og': self.og_description}
+
+    def _read_json_ld(self, text: str) -> None:
+        text = text.strip()
+        for marker in ('<!--', '-->', '//<![CDATA[', '//]]>', '<![CDATA[', ']]>'):
+            text = text.replace(marker, '')
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            self.invalid_json += 1
+            return
+
+        for node in self._nodes(data):
+            node_type = node.get('@type')
+            types = node_type if isinstance(node_type, list) else [node_type]
+            description = node.get('description')
+            if any(isinstance(item, str) and item.endswith('JobPosting') for item in types) \
+                    and isinstance(description, str):
+                self.job_posting = self.html_to_text(description) or None
+                return
+
+    @classmethod
+    def _nodes(cls, data, depth: int = 0):
+        if depth > cls.MAX_DEPTH:
+            return
+        if isinstance(data, list):
+            for item in data:
+                yield from cls._nodes(item, depth + 1)
+        elif isinstance(data, dict):
+            yield data
+            if '@graph' in data:
+                yield from cls._nodes(data['@graph'], depth + 1)
+
+    @classmethod
+    def html_to_text(cls, value: str) -> str:
+        text = cls.LIST_ITEM.sub('\n• ', html.unescape(value))
+        text = cls.HTML_TAG.sub(' ', cls.BLOCK_TAG.sub('\n', text))
+        lines = (' '.join(line.split()) for line in html.unescape(text).splitlines())
+        return '\n'.join(line for line in lines if line.strip('• '))
+
+
+class MetaDescriptionStream:
+
+    DEFAULT_BACKEND = 'html.parser'
+    SNIFF_BYTES = 1024
+    META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+    SOURCES = ('json-ld', 'meta', 'og')
+    BACKENDS = {
+        'html.parser': MetaDescriptionParser,
+        'regex': RegexMetaDescriptionParser,
+        'lxml': LxmlMetaDescriptionParser
+    }
+
+    def __init__(self, encoding: Optional[str] = None, backend: str = DEFAULT_BACKEND,
+                 structured_data_max_bytes: int = 0):
+        self._start_decoder(encoding)
+        self._sniffing = not encoding
+
+        self.backend = backend
+        self.fell_back = False
+        self.source = None
+        self.structured_data_max_bytes = structured_data_max_bytes
+        self._parser = self.BACKENDS[backend]()
+        self._scanner = StructuredDataScanner() if structured_data_max_bytes > 0 else None
+        self._consumed_bytes = 0
+        self._chunks = []
+        self._finished = False
+        self._description = None
+        self.parse_seconds = 0.0
+
+    def _start_decoder(self, encoding: Optional[str]) -> None:
+        try:
+            decoder_factory = codecs.getincrementaldecoder(encoding or 'utf-8')
+            self.encoding = encoding or 'utf-8'
+        except LookupError:
+            decoder_factory = codecs.getincrementaldecoder('utf-8')
+            self.encoding = 'utf-8'
+        self._decoder = decoder_factory(errors='replace')
+
+    @classmethod
+    def sniff_encoding(cls, head: bytes) -> Optional[str]:
+        match = cls.META_CHARSET.search(head[:cls.SNIFF_BYTES])
+        return match.group(1).decode('ascii') if match else None
+
+    @staticmethod
+    def encoding_from_headers(headers) -> Optional[str]:
+        match = re.search(r'charset=["\']?([\w.:-]+)', headers.get('Content-Type', ''), re.IGNORECASE)
+        return match.group(1) if match else None
+
+    @classmethod
+    def available_backends(cls) -> list:
+        return [backend for backend in cls.BACKENDS if backend != 'lxml' or etree is not None]
+
+    @classmethod
+    def resolve_backend(cls, backend: Optional[str]) -> str:
+        backend = backend or cls.DEFAULT_BACKEND
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"HTML_PARSER_BACKEND inválido: {backend}")
+        if backend not in cls.available_backends():
+            print(f"[WEB_SCRAPING] Parser {backend} indisponível, usando {cls.DEFAULT_BACKEND}")
+            return cls.DEFAULT_BACKEND
+        return backend
+
+    @staticmethod
+    def soup_description(html_content: str) -> Optional[str]:
+        meta_description = BeautifulSoup(html_content, 'html.parser').find('meta', attrs={'name': 'description'})
+        if meta_description:
+            return meta_description.get('content') or None
+        return None
+
+    @classmethod
+    def parse_text(cls, html_content: str, backend: str) -> Optional[str]:
+        parser = cls.BACKENDS[backend]()
+        try:
+            parser.feed(html_content)
+        except Exception:
+            return None
+        return None if parser.failed else parser.description
+
+    @classmethod
+    def rank(cls, candidates: dict) -> tuple:
+        for source in cls.SOURCES:
+            if candidates.get(source):
+                return source, candidates[source]
+        return None, None
+
+    @property
+    def done(self) -> bool:
+        return self._parser.done and (self._scanner is None or self._scanner.done)
+
+    @property
+    def description(self) -> Optional[str]:
+        return self.finish()
+
+    @property
+    def consumed(self) -> bytes:
+        return b''.join(self._chunks)
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.done:
+            return True
+
+        started = time.perf_counter()
+        self._chunks.append(chunk)
+        self._consumed_bytes += len(chunk)
+        if self._sniffing and self._restart_with_declared_encoding():
+            text = self._decoder.decode(self.consumed)
+        else:
+            text = self._decoder.decode(chunk)
+        self._feed_text(text)
+        self.parse_seconds += time.perf_counter() - started
+        return self.done
+
+    def _restart_with_declared_encoding(self) -> bool:
+        declared = self.sniff_encoding(self.consumed)
+        self._sniffing = declared is None and self._consumed_bytes < self.SNIFF_BYTES
+        if declared is None:
+            return False
+
+        try:
+            if codecs.lookup(declared).name == codecs.lookup(self.encoding).name:
+                return False
+        except LookupError:
+            return False
+
+        self._start_decoder(declared)
+        self._parser = self.BACKENDS[self.backend]()
+        self._scanner = StructuredDataScanner() if self._scanner is not None else None
+        return True
+
+    def _feed_text(self, text: str) -> None:
+        if not self._parser.done:
+            try:
+                self._parser.feed(text)
+            except Exception:
+                self._parser.failed = self._parser.done = True
+        if self._scanner is not None and not self._scanner.done:
+            self._scanner.feed(text)
+            self._scanner.done = self._scanner.done or self._consumed_bytes >= self.structured_data_max_bytes
+
+    def finish(self) -> Optional[str]:
+        if self._finished:
+            return self._description
+
+        self._finished = True
+        candidates = self._scanner.candidates() if self._scanner is not None else {}
+        candidates['meta'] = self._parser.description
+        inconclusive = self.backend != self.DEFAULT_BACKEND and not self._parser.done
+        needs_fallback = self._parser.failed or (candidates['meta'] is None and inconclusive)
+        if needs_fallback and not candidates.get('json-ld'):
+            started = time.perf_counter()
+            self.fell_back = True
+            candidates['meta'] = self.soup_description(self.consumed.decode(self.encoding, errors='replace'))
+            self.parse_seconds += time.perf_counter() - started
+
+        self.source, self._description = self.rank(candidates)
+        return self._description
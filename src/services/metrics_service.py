@@ -0,0 +1,172 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Tuple
+
+
+class Histogram:
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self) -> Dict[Tuple[str, ...], tuple]:
+        with self._lock:
+            return {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self.snapshot().items()):
+            base = MetricsService.format_labels(self.label_names, labels)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append(f"{self.name}_bucket{{{base}{',' if base else ''}le=\"{le}\"}} {cumulative}")
+            lines.append(f"{self.name}_sum{{{base}}} {total}")
+            lines.append(f"{self.name}_count{{{base}}} {count}")
+        return lines
+
+
+class Counter:
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self.snapshot().items()):
+            lines.append(f"{self.name}{{{MetricsService.format_labels(self.label_names, labels)}}} {value}")
+        return lines
+
+
+class Gauge:
+
+    def __init__(self, name: str, description: str, callback: Callable[[], float]):
+        self.name = name
+        self.description = description
+        self.callback = callback
+
+    def render(self) -> list:
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} gauge", f"{self.name} {self.callback()}"]
+
+
+class MetricsService:
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.stage_duration = Histogram(
+            'analysis_stage_duration_seconds',
+            'Duração de cada etapa do pipeline de análise (fetch, extract, format, completion)',
+            ('stage',),
+            buckets
+        )
+        self.stage_errors = Counter(
+            'analysis_stage_errors_total',
+            'Erros por etapa do pipeline de análise',
+            ('stage',)
+        )
+        self.parser_fallbacks = Counter(
+            'analysis_parser_fallbacks_total',
+            'Extrações de meta description refeitas com BeautifulSoup, por backend de parser',
+            ('backend',)
+        )
+        self.description_sources = Counter(
+            'analysis_description_sources_total',
+            'Descrições extraídas por origem (json-ld, meta ou og)',
+            ('source',)
+        )
+        self.request_duration = Histogram(
+            'analysis_http_request_duration_seconds',
+            'Duração das requisições HTTP por rota',
+            ('route',),
+            buckets
+        )
+        self.requests = Counter(
+            'analysis_http_requests_total',
+            'Requisições HTTP por rota e status code',
+            ('route', 'status')
+        )
+        self.gauges = []
+
+    @staticmethod
+    def format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+        return ','.join(f'{name}="{MetricsService.escape_label(value)}"' for name, value in zip(names, values))
+
+    @staticmethod
+    def escape_label(value) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def register_gauge(self, name: str, description: str, callback: Callable[[], float]) -> None:
+        self.gauges.append(Gauge(name, description, callback))
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        self.stage_duration.observe((stage,), seconds)
+
+    def count_error(self, stage: str) -> None:
+        self.stage_errors.inc((stage,))
+
+    def count_parser_fallback(self, backend: str) -> None:
+        self.parser_fallbacks.inc((backend,))
+
+    def count_description_source(self, source: str) -> None:
+        self.description_sources.inc((source,))
+
+    def observe_request(self, route: str, status: int, seconds: float) -> None:
+        self.request_duration.observe((route,), seconds)
+        self.requests.inc((route, str(status)))
+
+    @contextmanager
+    def track(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.count_error(stage)
+            raise
+        finally:
+            self.observe_stage(stage, time.perf_counter() - started)
+
+    @contextmanager
+    def count_errors(self, stage: str):
+        try:
+            yield
+        except Exception:
+            self.count_error(stage)
+            raise
+
+    def render(self) -> str:
+        lines = []
+        for metric in (self.stage_duration, self.stage_errors, self.parser_fallbacks, self.description_sources,
+                       self.request_duration, self.requests, *self.gauges):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
@@ -1,32 +1,275 @@
+import json
 import requests
 import os
+from typing import Iterator, Optional
 from dotenv import load_dotenv
+from src.utils import SseUtils
+from .analysis_cache_service import AnalysisCacheService
+from .semantic_cache_service import SemanticCacheService
+from .prompt_budget_service import PromptBudgetService
+from .profile_batcher_service import ProfileBatcherService
+from .adaptive_limiter_service import AdaptiveLimiterService, UpstreamOverloadedError
+from .retry_policy_service import RetryPolicy
+from .circuit_breaker_service import CircuitBreaker
 
 load_dotenv()
 
 
 class OpenAIService:
 
-    def __init__(self):
+    BATCH_INSTRUCTIONS = ("Analise cada perfil separadamente e responda somente com JSON no formato "
+                          "{\"analyses\": [{\"profile\": 1, \"analysis\": \"...\"}]}, com um item por perfil.")
+
+    def __init__(self, cache: Optional[AnalysisCacheService] = None, session: Optional[requests.Session] = None,
+                 limiter: Optional[AdaptiveLimiterService] = None, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None, semantic_cache: Optional[SemanticCacheService] = None,
+                 budget: Optional[PromptBudgetService] = None, batcher: Optional[ProfileBatcherService] = None):
         self.api_url = os.getenv('OPENAI_API_URL', '')
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.budget = budget
+        self.batcher = batcher
+        self.session = session
+        self.limiter = limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.max_completion_tokens = 1000
         self.system_prompt = {
             "role": "system",
             "content": "Você é um assistente de IA e trabalha fazendo match de habilidades com descrição de vagas. As habilidades chegam no seguinte formato JSON para você: {\"skills\":[]}, a descrição da vaga chega em formato de texto. Responda de maneira resumida com uma porcentagem estimada de match das habilidades do candidato com a vaga e como o candidato pode aumentar suas chances de ser selecionado. É EXTREMAMENTE IMPORTANTE QUE SUAS RESPOSTAS SEJAM SEMPRE EM PORTUGUÊS DO BRASIL"
         }
 
     def analyze_match(self, skills: list, description: str, api_key: str, api_url: str = None) -> str:
+        url_to_use = self._resolve_url(api_url)
+
+        cache_key = self._build_cache_key(skills, description, url_to_use)
+        cached_analysis = self._get_cached_analysis(cache_key) or self._get_similar_analysis(skills, description, url_to_use)
+        if cached_analysis is not None:
+            return cached_analysis
+
+        try:
+            ai_message = self._batched_analysis(skills, description, api_key, url_to_use)
+            if ai_message is None:
+                payload = self._build_payload(skills, description)
+                response = self._resilient(lambda: self._post_completion(url_to_use, payload, api_key))
+                ai_message = self._parse_result(response.json())
+
+            self._store_cached_analysis(cache_key, ai_message)
+            self._store_similar_analysis(skills, description, url_to_use, ai_message)
+            return ai_message
+
+        except requests.exceptions.HTTPError as e:
+            print(f"[OPENAI] ERRO HTTP: {e}")
+            raise
+        except requests.exceptions.RequestException as e:
+            print(f"[OPENAI] ERRO de requisição: {e}")
+            raise
+        except Exception as e:
+            print(f"[OPENAI] ERRO: {e}")
+            raise
+
+    def stream_match(self, skills: list, description: str, api_key: str, api_url: str = None) -> Iterator[str]:
+        url_to_use = self._resolve_url(api_url)
+
+        cache_key = self._build_cache_key(skills, description, url_to_use)
+        cached_analysis = self._get_cached_analysis(cache_key) or self._get_similar_analysis(skills, description, url_to_use)
+        if cached_analysis is not None:
+            yield cached_analysis
+            return
+
+        payload = self._build_payload(skills, description)
+        payload["stream"] = True
+
+        try:
+            response = self._resilient(lambda: self._open_stream(url_to_use, payload, api_key))
+
+            try:
+                parts = []
+                for raw_line in response.iter_lines():
+                    data = SseUtils.parse_data_line(raw_line.decode('utf-8'))
+                    if data is None:
+                        continue
+                    if data == '[DONE]':
+                        break
+
+                    delta = self._parse_stream_delta(json.loads(data))
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            finally:
+                response.close()
+                self._release_slot()
+
+            print(f"[OPENAI] Análise em streaming concluída com sucesso")
+            self._store_cached_analysis(cache_key, "".join(parts))
+            self._store_similar_analysis(skills, description, url_to_use, "".join(parts))
+
+        except requests.exceptions.HTTPError as e:
+            print(f"[OPENAI] ERRO HTTP: {e}")
+            raise
+        except requests.exceptions.RequestException as e:
+            print(f"[OPENAI] ERRO de requisição: {e}")
+            raise
+        except Exception as e:
+            print(f"[OPENAI] ERRO: {e}")
+            raise
+
+    def _batched_analysis(self, skills: list, description: str, api_key: str, url_to_use: str) -> Optional[str]:
+        if self.batcher is None:
+            return None
+
+        return self.batcher.submit(
+            (url_to_use, api_key, description),
+            skills,
+            lambda profiles: self._complete_profiles(profiles, description, api_key, url_to_use)
+        )
+
+    def _complete_profiles(self, profiles: list, description: str, api_key: str, url_to_use: str) -> list:
+        payload = self._build_batch_payload(profiles, description)
+        response = self._resilient(lambda: self._post_completion(url_to_use, payload, api_key))
+        return self._parse_batch_result(response.json(), len(profiles))
+
+    def _http(self):
+        return self.session or requests
+
+    def _resilient(self, operation):
+        attempt = self._guarded(operation)
+        if self.retry_policy is None:
+            return attempt()
+        return self.retry_policy.run(attempt, self._is_retryable)
+
+    def _guarded(self, operation):
+        if self.circuit_breaker is None:
+            return operation
+        return lambda: self.circuit_breaker.call(operation, self._is_breaker_failure)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and self.retry_policy.retries_status(error.response.status_code)
+        return isinstance(error, requests.exceptions.ConnectionError)
+
+    @staticmethod
+    def _is_breaker_failure(error: Exception) -> Optional[bool]:
+        if isinstance(error, UpstreamOverloadedError):
+            return None
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and error.response.status_code >= 500
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def _post_completion(self, url: str, payload: dict, api_key: str):
+        self._acquire_slot()
+        try:
+            response = self._http().post(url, json=payload, headers=self._build_headers(api_key), timeout=30)
+            self._record_response(response)
+        finally:
+            self._release_slot()
+
+        self._check_status(response)
+        return response
+
+    def _open_stream(self, url: str, payload: dict, api_key: str):
+        self._acquire_slot()
+        try:
+            response = self._http().post(url, json=payload, headers=self._build_headers(api_key), timeout=30, stream=True)
+            self._record_response(response)
+        except Exception:
+            self._release_slot()
+            raise
+
+        try:
+            self._check_status(response)
+        except Exception:
+            response.close()
+            self._release_slot()
+            raise
+        return response
+
+    def _check_status(self, response) -> None:
+        if response.status_code != 200:
+            print(f"[OPENAI] ERRO: Status code {response.status_code}")
+            print(f"[OPENAI] Response Content: {response.text}")
+
+        self._raise_if_throttled(response)
+        response.raise_for_status()
+
+    def _acquire_slot(self) -> None:
+        if self.limiter is not None:
+            self.limiter.acquire()
+
+    def _release_slot(self) -> None:
+        if self.limiter is not None:
+            self.limiter.release()
+
+    def _record_response(self, response) -> None:
+        if self.limiter is not None:
+            self.limiter.record(response.status_code, response.headers)
+
+    @staticmethod
+    def _raise_if_throttled(response) -> None:
+        if response.status_code != 429:
+            return
+
+        retry_after = AdaptiveLimiterService.retry_after_from_headers(response.headers)
+        raise UpstreamOverloadedError("Limite de requisições da OpenAI atingido", retry_after or 1.0)
+
+    def _resolve_url(self, api_url: str = None) -> str:
         url_to_use = api_url or self.api_url
 
         if not url_to_use:
             print(f"[OPENAI] ERRO: URL da API não configurada")
             raise ValueError("OPENAI_API_URL não configurada")
 
+        return url_to_use
+
+    def _build_cache_key(self, skills: list, description: str, url_to_use: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+
+        return AnalysisCacheService.build_key(skills, description, self.system_prompt["content"], self._model_params(url_to_use))
+
+    def _build_semantic_scope(self, description: str, url_to_use: str) -> str:
+        return AnalysisCacheService.build_key([], description, self.system_prompt["content"], self._model_params(url_to_use))
+
+    def _model_params(self, url_to_use: str) -> dict:
+        params = {"api_url": url_to_use, "max_completion_tokens": self.max_completion_tokens}
+        if self.budget is not None:
+            params["prompt_budget"] = self.budget.settings()
+        return params
+
+    def _get_similar_analysis(self, skills: list, description: str, url_to_use: str) -> Optional[str]:
+        if self.semantic_cache is None:
+            return None
+        return self.semantic_cache.get(self._build_semantic_scope(description, url_to_use), skills)
+
+    def _store_similar_analysis(self, skills: list, description: str, url_to_use: str, ai_message: str) -> None:
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(self._build_semantic_scope(description, url_to_use), skills, ai_message)
+
+    def _get_cached_analysis(self, cache_key: Optional[str]) -> Optional[str]:
+        if cache_key is None:
+            return None
+
+        cached_analysis = self.cache.get(cache_key)
+        if cached_analysis is not None:
+            print(f"[OPENAI] Análise obtida do cache")
+        return cached_analysis
+
+    def _store_cached_analysis(self, cache_key: Optional[str], ai_message: str) -> None:
+        if cache_key is not None:
+            self.cache.set(cache_key, ai_message)
+
+    def _build_payload(self, skills: list, description: str) -> dict:
+        max_completion_tokens = self.max_completion_tokens
+        if self.budget is not None:
+            budget = self.budget.plan(skills, description, self.system_prompt["content"])
+            description, max_completion_tokens = budget.description, budget.max_completion_tokens
+
         skills_text = ", ".join(skills)
         user_content = f"Habilidades do candidato: {skills_text}\nDescrição da vaga: {description}"
 
         print(f"[OPENAI] Analisando match para {len(skills)} habilidades")
 
-        payload = {
+        return {
             "messages": [
                 self.system_prompt,
                 {
@@ -34,34 +277,70 @@ class OpenAIService:
                     "content": user_content
                 }
             ],
-            "max_completion_tokens": 1000
+            "max_completion_tokens": max_completion_tokens
         }
 
-        try:
-            response = requests.post(url_to_use, json=payload, headers={"Content-Type": "application/json", "api-key": api_key}, timeout=30)
+    def _build_batch_payload(self, profiles: list, description: str) -> dict:
+        max_completion_tokens = self.max_completion_tokens * len(profiles)
+        if self.budget is not None:
+            budget = self.budget.plan([skill for skills in profiles for skill in skills], description, self.system_prompt["content"])
+            description = budget.description
+            max_completion_tokens = sum(self.budget.completion_tokens(skills) for skills in profiles)
 
-            if response.status_code != 200:
-                print(f"[OPENAI] ERRO: Status code {response.status_code}")
-                print(f"[OPENAI] Response Content: {response.text}")
+        profiles_text = "\n".join(f"{number}. {', '.join(skills)}" for number, skills in enumerate(profiles, 1))
+        user_content = f"Perfis de habilidades:\n{profiles_text}\nDescrição da vaga: {description}\n{self.BATCH_INSTRUCTIONS}"
 
-            response.raise_for_status()
-            result = response.json()
+        print(f"[OPENAI] Analisando match em lote para {len(profiles)} perfis de habilidades")
 
-            if "choices" not in result or not result["choices"]:
-                print(f"[OPENAI] ERRO: Resposta inválida da API")
-                raise ValueError("Resposta da OpenAI inválida")
+        return {
+            "messages": [
+                self.system_prompt,
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ],
+            "max_completion_tokens": max_completion_tokens,
+            "response_format": {"type": "json_object"}
+        }
 
-            ai_message = result["choices"][0]["message"]["content"]
-            print(f"[OPENAI] Análise concluída com sucesso")
+    @staticmethod
+    def _build_headers(api_key: str) -> dict:
+        return {"Content-Type": "application/json", "api-key": api_key}
 
-            return ai_message
+    @staticmethod
+    def _parse_stream_delta(chunk: dict) -> Optional[str]:
+        choices = chunk.get("choices") or []
+        if not choices:
+            return None
+        return (choices[0].get("delta") or {}).get("content")
 
-        except requests.exceptions.HTTPError as e:
-            print(f"[OPENAI] ERRO HTTP: {e}")
-            raise
-        except requests.exceptions.RequestException as e:
-            print(f"[OPENAI] ERRO de requisição: {e}")
-            raise
-        except Exception as e:
-            print(f"[OPENAI] ERRO: {e}")
-            raise
+    @staticmethod
+    def _parse_result(result: dict) -> str:
+        if "choices" not in result or not result["choices"]:
+            print(f"[OPENAI] ERRO: Resposta inválida da API")
+            raise ValueError("Resposta da OpenAI inválida")
+
+        ai_message = result["choices"][0]["message"]["content"]
+        print(f"[OPENAI] Análise concluída com sucesso")
+        return ai_message
+
+    @classmethod
+    def _parse_batch_result(cls, result: dict, count: int) -> list:
+        try:
+            analyses = json.loads(cls._parse_result(result)).get("analyses")
+        except (ValueError, AttributeError):
+            analyses = None
+
+        results = [None] * count
+        for item in analyses if isinstance(analyses, list) else []:
+            if not isinstance(item, dict):
+                continue
+            profile, analysis = item.get("profile"), item.get("analysis")
+            if isinstance(profile, int) and 1 <= profile <= count and isinstance(analysis, str) and analysis.strip():
+                results[profile - 1] = analysis
+
+        missing = results.count(None)
+        if missing:
+            print(f"[OPENAI] Resposta em lote sem análise para {missing} perfis, refazendo individualmente")
+        return results
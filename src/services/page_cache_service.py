@@ -0,0 +1,319 @@
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+from .cache_backend_service import CacheBackend
+from .cache_serializer import CacheSerializer
+
+
+@dataclass
+class CachedPage:
+    url: str
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+    complete: bool = True
+    encoding: Optional[str] = None
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class PageCacheService:
+
+    KEY_PREFIX = 'page:'
+    STALE_RETENTION = 24 * 3600
+    PAGE_FIELDS = struct.Struct('>d?')
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: int = 300, disk_dir: Optional[str] = None, backend: Optional[CacheBackend] = None,
+                 serializer: Optional[CacheSerializer] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.backend = backend
+        self.serializer = serializer or CacheSerializer()
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.disk_hits = 0
+        self.backend_hits = 0
+        self._disk = OrderedDict()
+        self._disk_size = 0
+        self._unlinks = []
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._scan_disk()
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        try:
+            return self._get(key)
+        finally:
+            self._flush_unlinks()
+
+    def set(self, key: str, entry: CachedPage) -> None:
+        if len(entry.content) > self.max_bytes:
+            return
+
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+        self._flush_unlinks()
+        self._write_backend(key, entry)
+
+    def revalidate(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.stored_at = time.time()
+            self.revalidations += 1
+        self._write_disk(key, entry)
+        self._flush_unlinks()
+        self._write_backend(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'disk_entries': len(self._disk),
+                'disk_bytes': self._disk_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'revalidations': self.revalidations,
+                'disk_hits': self.disk_hits,
+                'backend_hits': self.backend_hits
+            }
+
+    def _get(self, key: str) -> Optional[CachedPage]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return self._account(key, entry)
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._store(key, entry)
+                self._track_disk(self._disk_path(key), len(entry.content))
+                return self._account(key, entry)
+
+        if self.backend is None:
+            with self._lock:
+                return self._account(key, None)
+
+        entry = self._read_backend(key)
+        with self._lock:
+            if entry is not None:
+                self.backend_hits += 1
+                self._store(key, entry)
+            return self._account(key, entry)
+
+    def _account(self, key: str, entry: Optional[CachedPage]) -> Optional[CachedPage]:
+        if entry is not None and not entry.is_fresh(self.ttl) and not entry.has_validators():
+            self._remove(key)
+            self.evictions += 1
+            entry = None
+
+        if entry is not None and entry.is_fresh(self.ttl):
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        return entry
+
+    def _store(self, key: str, entry: CachedPage) -> None:
+        if key in self._entries:
+            self._size -= len(self._entries.pop(key).content)
+
+        self._entries[key] = entry
+        self._size += len(entry.content)
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.content)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
+
+        path = self._disk_path(key)
+        if path:
+            self._forget_disk(path)
+            self._unlinks.append(path)
+
+    def _track_disk(self, path: str, size: int) -> None:
+        self._forget_disk(path)
+        self._disk[path] = size
+        self._disk_size += size
+
+        while len(self._disk) > self.max_entries or self._disk_size > self.max_bytes:
+            evicted, evicted_size = self._disk.popitem(last=False)
+            self._disk_size -= evicted_size
+            self._unlinks.append(evicted)
+
+    def _forget_disk(self, path: str) -> None:
+        size = self._disk.pop(path, None)
+        if size is not None:
+            self._disk_size -= size
+
+    def _flush_unlinks(self) -> None:
+        with self._lock:
+            paths, self._unlinks = self._unlinks, []
+
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"[PAGE_CACHE] ERRO ao remover cache em disco: {e}")
+
+    def _scan_disk(self) -> None:
+        try:
+            files = [(f.path, f.stat()) for f in os.scandir(self.disk_dir) if f.name.endswith('.page')]
+        except OSError as e:
+            print(f"[PAGE_CACHE] ERRO ao listar cache em disco: {e}")
+            return
+
+        for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+            self._track_disk(path, stat.st_size)
+        self._flush_unlinks()
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.page")
+
+    def _read_disk(self, key: str) -> Optional[CachedPage]:
+        path = self._disk_path(key)
+        if not path or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                header, content = f.read().split(b'\n', 1)
+            meta = json.loads(header)
+            return CachedPage(
+                url=meta['url'],
+                content=content,
+                etag=meta.get('etag'),
+                last_modified=meta.get('last_modified'),
+                stored_at=meta['stored_at'],
+                complete=meta.get('complete', True),
+                encoding=meta.get('encoding')
+            )
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[PAGE_CACHE] ERRO ao ler cache em disco: {e}")
+            return None
+
+    def _write_disk(self, key: str, entry: CachedPage) -> None:
+        path = self._disk_path(key)
+        if not path:
+            return
+
+        meta = {
+            'url': entry.url,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+            'stored_at': entry.stored_at,
+            'complete': entry.complete,
+            'encoding': entry.encoding
+        }
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(meta).encode('utf-8') + b'\n' + entry.content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[PAGE_CACHE] ERRO ao gravar cache em disco: {e}")
+            return
+
+        with self._lock:
+            self._track_disk(path, len(entry.content))
+
+    def encode(self, entry: CachedPage) -> bytes:
+        body = b''.join([
+            self.PAGE_FIELDS.pack(entry.stored_at, entry.complete),
+            self.serializer.pack_optional(entry.url),
+            self.serializer.pack_optional(entry.etag),
+            self.serializer.pack_optional(entry.last_modified),
+            self.serializer.pack_optional(entry.encoding),
+            entry.content
+        ])
+        return self.serializer.dumps(CacheSerializer.KIND_PAGE, body)
+
+    def decode(self, data: bytes) -> CachedPage:
+        body = self.serializer.loads(CacheSerializer.KIND_PAGE, data)
+        stored_at, complete = self.PAGE_FIELDS.unpack_from(body)
+        offset = self.PAGE_FIELDS.size
+        url, offset = self.serializer.unpack_optional(body, offset)
+        etag, offset = self.serializer.unpack_optional(body, offset)
+        last_modified, offset = self.serializer.unpack_optional(body, offset)
+        encoding, offset = self.serializer.unpack_optional(body, offset)
+        return CachedPage(
+            url=url,
+            content=body[offset:],
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+            complete=complete,
+            encoding=encoding
+        )
+
+    def _backend_ttl(self, entry: CachedPage) -> float:
+        remaining = max(1.0, self.ttl - (time.time() - entry.stored_at))
+        return remaining + self.STALE_RETENTION if entry.has_validators() else remaining
+
+    def _read_backend(self, key: str) -> Optional[CachedPage]:
+        data = self.backend.get(self.KEY_PREFIX + key)
+        if data is None:
+            return None
+
+        try:
+            return self.decode(data)
+        except (ValueError, struct.error) as e:
+            print(f"[PAGE_CACHE] ERRO ao ler cache compartilhado: {e}")
+            return None
+
+    def _write_backend(self, key: str, entry: CachedPage) -> None:
+        if self.backend is None:
+            return
+        self.backend.set(self.KEY_PREFIX + key, self.encode(entry), ttl=self._backend_ttl(entry))
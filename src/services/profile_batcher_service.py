@@ -0,0 +1,95 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Hashable, List, Optional
+from .analysis_cache_service import AnalysisCacheService
+
+
+class ProfileBatch:
+
+    def __init__(self, full, future):
+        self.profiles = []
+        self.keys = []
+        self.full = full
+        self.future = future
+
+    def add(self, skills: list) -> int:
+        key = tuple(AnalysisCacheService.canonicalize_skills(skills))
+        if key not in self.keys:
+            self.keys.append(key)
+            self.profiles.append(skills)
+        return self.keys.index(key)
+
+
+class ProfileBatcherService:
+
+    def __init__(self, window: float = 0.05, max_profiles: int = 8):
+        self.window = window
+        self.max_profiles = max_profiles
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.batched_profiles = 0
+
+    def submit(self, key: Hashable, skills: list, run_batch: Callable[[List[list]], List[Optional[str]]]) -> Optional[str]:
+        batch, index, leader = self._join(key, skills)
+        if not leader:
+            return batch.future.result()[index]
+
+        batch.full.wait(self.window)
+        self._close(key, batch)
+        try:
+            results = run_batch(batch.profiles) if len(batch.profiles) > 1 else [None]
+        except BaseException as e:
+            batch.future.set_exception(e)
+            raise
+
+        self._record(batch)
+        batch.future.set_result(results)
+        return results[index]
+
+    def _new_batch(self) -> ProfileBatch:
+        return ProfileBatch(threading.Event(), Future())
+
+    def _join(self, key: Hashable, skills: list) -> tuple:
+        with self._lock:
+            self.requests += 1
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._pending[key] = self._new_batch()
+
+            index = batch.add(skills)
+            if len(batch.profiles) >= self.max_profiles:
+                self._pending.pop(key, None)
+                batch.full.set()
+            return batch, index, leader
+
+    def _close(self, key: Hashable, batch: ProfileBatch) -> None:
+        with self._lock:
+            if self._pending.get(key) is batch:
+                del self._pending[key]
+
+    def _record(self, batch: ProfileBatch) -> None:
+        if len(batch.profiles) < 2:
+            return
+
+        with self._lock:
+            self.batches += 1
+            self.batched_profiles += len(batch.profiles)
+        print(f"[OPENAI_BATCH] {len(batch.profiles)} perfis de habilidades analisados em uma única chamada")
+
+    def calls_saved(self) -> int:
+        return self.batched_profiles - self.batches
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'window': self.window,
+                'max_profiles': self.max_profiles,
+                'pending': len(self._pending),
+                'requests': self.requests,
+                'batches': self.batches,
+                'batched_profiles': self.batched_profiles,
+                'calls_saved': self.calls_saved()
+            }
@@ -0,0 +1,143 @@
+import math
+import re
+import threading
+from dataclasses import dataclass
+from .skill_taxonomy import SkillTaxonomy
+
+
+@dataclass
+class PromptBudget:
+    description: str
+    max_completion_tokens: int
+    original_tokens: int
+    prompt_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.prompt_tokens
+
+
+class PromptBudgetService:
+
+    TOKEN = re.compile(r'\w+|[^\w\s]')
+    WORD = re.compile(r'\w+')
+    SEGMENT_BREAK = re.compile(r'\s*\n\s*|(?<=[.!?;])\s+|\s+(?=•)')
+    BOILERPLATE = re.compile(
+        r'equal opportunity|affirmative action|without regard to|regardless of (?:race|gender|age)|'
+        r'igualdade de oportunidades|sem distin[cç][aã]o de|diversidade e inclus[aã]o|todas as pessoas s[aã]o bem[- ]vindas|'
+        r'vagas? (?:tamb[eé]m )?(?:afirmativa|exclusiva)s? para|pessoas com defici[eê]ncia|'
+        r'benef[ií]cios|benefits|o que oferecemos|what we offer|vale[- ](?:refei[cç][aã]o|alimenta[cç][aã]o|transporte)|'
+        r'plano (?:de sa[uú]de|odontol[oó]gico)|seguro de vida|aux[ií]lio[- ](?:creche|home office)|gympass|wellhub|'
+        r'health insurance|dental insurance|paid time off|401\(k\)|day off|'
+        r'cookies?|pol[ií]tica de privacidade|privacy policy|aceitar todos|accept all|termos de uso|terms of use',
+        re.IGNORECASE
+    )
+    BOILERPLATE_STATEMENT = re.compile(
+        r'(?:we are|\w+ is) an? equal opportunity|somos uma empresa que valoriza a diversidade|'
+        r'(?:this (?:site|website) uses|(?:este|esse|nosso) site (?:usa|utiliza)) cookies|'
+        r'aceit(?:e|ar)(?: todos)? os cookies|accept (?:all )?cookies',
+        re.IGNORECASE
+    )
+    BOILERPLATE_MAX_WORDS = 60
+
+    def __init__(self, max_description_tokens: int = 1500, min_completion_tokens: int = 256,
+                 completion_tokens_per_skill: int = 32, max_completion_tokens: int = 1000):
+        self.max_description_tokens = max_description_tokens
+        self.min_completion_tokens = min_completion_tokens
+        self.completion_tokens_per_skill = completion_tokens_per_skill
+        self.max_completion_tokens = max_completion_tokens
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.original_tokens = 0
+        self.prompt_tokens = 0
+        self.completion_tokens_saved = 0
+
+    @classmethod
+    def count_tokens(cls, text: str) -> int:
+        return sum(max(1, math.ceil(len(token) / 4)) for token in cls.TOKEN.findall(text))
+
+    def compress(self, description: str) -> str:
+        kept, seen, tokens = [], set(), 0
+        for segment in self.SEGMENT_BREAK.split(description.strip()):
+            key = ' '.join(self.WORD.findall(SkillTaxonomy.normalize(segment)))
+            if not key or key in seen or self.is_boilerplate(segment):
+                continue
+
+            segment_tokens = self.count_tokens(segment)
+            if tokens + segment_tokens > self.max_description_tokens:
+                if not kept:
+                    kept.append(self._truncate(segment, self.max_description_tokens))
+                break
+            seen.add(key)
+            kept.append(segment)
+            tokens += segment_tokens
+
+        return ' '.join(kept) or description
+
+    def is_boilerplate(self, segment: str) -> bool:
+        words = len(self.WORD.findall(segment))
+        if words > self.BOILERPLATE_MAX_WORDS:
+            return False
+        if self.BOILERPLATE_STATEMENT.match(segment.lstrip('• ')):
+            return True
+
+        covered = sum(len(self.WORD.findall(match.group())) for match in self.BOILERPLATE.finditer(segment))
+        return covered * 2 >= words
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        words, tokens = [], 0
+        for word in text.split():
+            tokens += self.count_tokens(word)
+            if tokens > max_tokens:
+                break
+            words.append(word)
+        return ' '.join(words)
+
+    def completion_tokens(self, skills: list) -> int:
+        budget = self.min_completion_tokens + self.completion_tokens_per_skill * len(skills)
+        return max(1, min(self.max_completion_tokens, budget))
+
+    def plan(self, skills: list, description: str, system_prompt: str) -> PromptBudget:
+        fixed_tokens = self.count_tokens(system_prompt) + self.count_tokens(", ".join(skills))
+        compressed = self.compress(description)
+        budget = PromptBudget(
+            compressed,
+            self.completion_tokens(skills),
+            fixed_tokens + self.count_tokens(description),
+            fixed_tokens + self.count_tokens(compressed)
+        )
+
+        with self._lock:
+            self.requests += 1
+            self.original_tokens += budget.original_tokens
+            self.prompt_tokens += budget.prompt_tokens
+            self.completion_tokens_saved += self.max_completion_tokens - budget.max_completion_tokens
+
+        print(f"[PROMPT_BUDGET] Prompt com ~{budget.prompt_tokens} tokens ({budget.tokens_saved} economizados), "
+              f"limite de resposta {budget.max_completion_tokens}")
+        return budget
+
+    def settings(self) -> dict:
+        return {
+            'max_description_tokens': self.max_description_tokens,
+            'min_completion_tokens': self.min_completion_tokens,
+            'completion_tokens_per_skill': self.completion_tokens_per_skill
+        }
+
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.prompt_tokens
+
+    def compression_ratio(self) -> float:
+        return self.prompt_tokens / self.original_tokens if self.original_tokens else 1.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **self.settings(),
+                'requests': self.requests,
+                'original_tokens': self.original_tokens,
+                'prompt_tokens': self.prompt_tokens,
+                'tokens_saved': self.tokens_saved(),
+                'completion_tokens_saved': self.completion_tokens_saved,
+                'compression_ratio': round(self.compression_ratio(), 4)
+            }
@@ -0,0 +1,161 @@
+import os
+import queue
+import socket
+from typing import Optional
+from urllib.parse import urlparse, unquote
+from .cache_backend_service import CacheBackend
+
+
+class RedisProtocolError(Exception):
+    pass
+
+
+class RedisConnection:
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile('rb')
+
+    def execute(self, *args):
+        self._sock.sendall(self.encode_command(args))
+        return self._read_reply()
+
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+    @staticmethod
+    def encode_command(args) -> bytes:
+        parts = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode('utf-8')
+            elif isinstance(arg, int):
+                arg = str(arg).encode()
+            parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+        return b''.join(parts)
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError("Conexão com o Redis encerrada")
+
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b'+':
+            return payload.decode()
+        if prefix == b'-':
+            raise RedisProtocolError(payload.decode(errors='replace'))
+        if prefix == b':':
+            return int(payload)
+        if prefix == b'$':
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Conexão com o Redis encerrada")
+            return data[:-2]
+        if prefix == b'*':
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisProtocolError(f"Resposta inválida do Redis: {line!r}")
+
+
+class RedisCacheBackend(CacheBackend):
+
+    name = 'redis'
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', timeout: float = 0.2,
+                 key_prefix: str = 'job-analysis:', pool_size: int = 16):
+        super().__init__()
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.timeout = timeout
+        self.key_prefix = key_prefix
+        self.pool_size = pool_size
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._pid = os.getpid()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def stats(self) -> dict:
+        return {**super().stats(), 'url': f"redis://{self.host}:{self.port}/{self.db}",
+                'idle_connections': self._pool.qsize()}
+
+    def _get(self, key: str) -> Optional[bytes]:
+        return self._execute('GET', self.key_prefix + key)
+
+    def _set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        if ttl:
+            self._execute('SET', self.key_prefix + key, value, 'PX', max(1, int(ttl * 1000)))
+        else:
+            self._execute('SET', self.key_prefix + key, value)
+
+    def _delete(self, key: str) -> None:
+        self._execute('DEL', self.key_prefix + key)
+
+    def _clear(self) -> None:
+        cursor = b'0'
+        while True:
+            cursor, keys = self._execute('SCAN', cursor, 'MATCH', f"{self.key_prefix}*", 'COUNT', 500)
+            if keys:
+                self._execute('DEL', *keys)
+            if cursor in (b'0', '0'):
+                return
+
+    def _execute(self, *args):
+        connection = self._acquire()
+        try:
+            result = connection.execute(*args)
+        except RedisProtocolError:
+            self._release(connection)
+            raise
+        except Exception:
+            connection.close()
+            raise
+
+        self._release(connection)
+        return result
+
+    def _acquire(self) -> RedisConnection:
+        if self._pid != os.getpid():
+            self._pool = queue.LifoQueue(maxsize=self.pool_size)
+            self._pid = os.getpid()
+
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, connection: RedisConnection) -> None:
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _connect(self) -> RedisConnection:
+        connection = RedisConnection(self.host, self.port, self.timeout)
+        try:
+            if self.password:
+                auth = ('AUTH', self.username, self.password) if self.username else ('AUTH', self.password)
+                connection.execute(*auth)
+            if self.db:
+                connection.execute('SELECT', self.db)
+        except Exception:
+            connection.close()
+            raise
+        return connection
@@ -0,0 +1,124 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+
+class RetryBudget:
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, max_balance: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self.balance = max_balance
+        self.exhausted = 0
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self.balance = min(self.max_balance, self.balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self.balance >= 1:
+                self.balance -= 1
+                return True
+
+            self.exhausted += 1
+            return False
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._refill()
+            return {
+                'balance': round(self.balance, 2),
+                'exhausted': self.exhausted
+            }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.balance = min(self.max_balance, self.balance + (now - self._refilled_at) * self.min_per_second)
+        self._refilled_at = now
+
+
+class RetryPolicy:
+
+    def __init__(self, name: str, max_attempts: int = 3, base_delay: float = 0.1, max_delay: float = 2.0,
+                 retry_statuses: Iterable[int] = (502, 503, 504), budget: Optional[RetryBudget] = None):
+        self.name = name
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget = budget
+        self.calls = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, prefix: str, retry_statuses: tuple) -> Optional['RetryPolicy']:
+        max_attempts = config.get(f'{prefix}_RETRY_MAX_ATTEMPTS', 1)
+        if max_attempts <= 1:
+            return None
+
+        return cls(
+            name=prefix.lower(),
+            max_attempts=max_attempts,
+            base_delay=config.get(f'{prefix}_RETRY_BASE_DELAY', 0.1),
+            max_delay=config.get(f'{prefix}_RETRY_MAX_DELAY', 2.0),
+            retry_statuses=retry_statuses,
+            budget=RetryBudget(ratio=config.get(f'{prefix}_RETRY_BUDGET_RATIO', 0.1))
+        )
+
+    def retries_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def run(self, operation: Callable[[], Any], is_retryable: Callable[[Exception], bool]) -> Any:
+        self._start()
+        attempt = 1
+        while True:
+            try:
+                return operation()
+            except Exception as e:
+                delay = self._next_delay(attempt, e, is_retryable)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                'max_attempts': self.max_attempts,
+                'calls': self.calls,
+                'retries': self.retries
+            }
+        stats['budget'] = self.budget.stats() if self.budget else None
+        return stats
+
+    def _start(self) -> None:
+        with self._lock:
+            self.calls += 1
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def _next_delay(self, attempt: int, error: Exception, is_retryable: Callable[[Exception], bool]) -> Optional[float]:
+        if attempt >= self.max_attempts or not is_retryable(error):
+            return None
+
+        if self.budget is not None and not self.budget.withdraw():
+            print(f"[RETRY] {self.name}: orçamento de retentativas esgotado")
+            return None
+
+        delay = self.backoff(attempt)
+        with self._lock:
+            self.retries += 1
+        print(f"[RETRY] {self.name}: tentativa {attempt + 1} de {self.max_attempts} em {delay:.2f}s após erro: {error}")
+        return delay
@@ -0,0 +1,149 @@
+import math
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from .analysis_cache_service import AnalysisCacheService
+
+
+class SkillVectorizer:
+
+    DIMENSIONS = 1 << 20
+    TRIGRAM_WEIGHT = 0.25
+
+    def __init__(self, dimensions: int = DIMENSIONS, trigram_weight: float = TRIGRAM_WEIGHT):
+        self.dimensions = dimensions
+        self.trigram_weight = trigram_weight
+
+    def vectorize(self, skills: list) -> dict:
+        vector = {}
+        for skill in AnalysisCacheService.canonicalize_skills(skills):
+            self._add(vector, f"s:{skill}", 1.0)
+            for word in skill.split():
+                padded = f"#{word}#"
+                for start in range(len(padded) - 2):
+                    self._add(vector, f"t:{padded[start:start + 3]}", self.trigram_weight)
+
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        return {index: weight / norm for index, weight in vector.items()} if norm else {}
+
+    def _add(self, vector: dict, feature: str, weight: float) -> None:
+        index = zlib.crc32(feature.encode('utf-8')) % self.dimensions
+        vector[index] = vector.get(index, 0.0) + weight
+
+    @staticmethod
+    def cosine(left: dict, right: dict) -> float:
+        if len(left) > len(right):
+            left, right = right, left
+        return sum(weight * right.get(index, 0.0) for index, weight in left.items())
+
+
+@dataclass
+class SemanticEntry:
+    vector: dict
+    skills: list
+    analysis: str
+    stored_at: float
+
+
+class SemanticCacheService:
+
+    def __init__(self, threshold: float = 0.85, max_descriptions: int = 256, max_profiles: int = 32,
+                 ttl: int = 3600, vectorizer: Optional[SkillVectorizer] = None):
+        self.threshold = threshold
+        self.max_descriptions = max_descriptions
+        self.max_profiles = max_profiles
+        self.ttl = ttl
+        self.vectorizer = vectorizer or SkillVectorizer()
+        self._scopes = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.similarity_total = 0.0
+        self.min_similarity = None
+
+    def get(self, scope: str, skills: list) -> Optional[str]:
+        vector = self.vectorizer.vectorize(skills)
+        if not vector:
+            return None
+
+        with self._lock:
+            best, similarity = self._nearest(scope, vector)
+            if best is None or similarity < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.similarity_total += similarity
+            self.min_similarity = similarity if self.min_similarity is None else min(self.min_similarity, similarity)
+
+        print(f"[SEMANTIC_CACHE] Análise reaproveitada (similaridade {similarity:.3f}) de {best.skills}")
+        return best.analysis
+
+    def set(self, scope: str, skills: list, analysis: str) -> None:
+        vector = self.vectorizer.vectorize(skills)
+        if not vector or not analysis:
+            return
+
+        entry = SemanticEntry(vector, AnalysisCacheService.canonicalize_skills(skills), analysis, time.time())
+        with self._lock:
+            entries = self._scopes.pop(scope, [])
+            entries = [item for item in entries if item.skills != entry.skills]
+            entries.append(entry)
+            if len(entries) > self.max_profiles:
+                self.evictions += len(entries) - self.max_profiles
+                entries = entries[-self.max_profiles:]
+            self._scopes[scope] = entries
+
+            while len(self._scopes) > self.max_descriptions:
+                _, evicted = self._scopes.popitem(last=False)
+                self.evictions += len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+
+    def reuse_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def mean_similarity(self) -> float:
+        return self.similarity_total / self.hits if self.hits else 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'descriptions': len(self._scopes),
+                'profiles': sum(len(entries) for entries in self._scopes.values()),
+                'threshold': self.threshold,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'reuse_rate': round(self.reuse_rate(), 4),
+                'mean_similarity': round(self.mean_similarity(), 4),
+                'min_similarity': round(self.min_similarity, 4) if self.min_similarity is not None else None
+            }
+
+    def _nearest(self, scope: str, vector: dict) -> tuple:
+        entries = self._scopes.get(scope)
+        if not entries:
+            return None, 0.0
+
+        now = time.time()
+        fresh = [entry for entry in entries if now - entry.stored_at < self.ttl]
+        self.evictions += len(entries) - len(fresh)
+        if not fresh:
+            del self._scopes[scope]
+            return None, 0.0
+
+        self._scopes[scope] = fresh
+        self._scopes.move_to_end(scope)
+        best, similarity = None, 0.0
+        for entry in fresh:
+            score = SkillVectorizer.cosine(vector, entry.vector)
+            if score > similarity:
+                best, similarity = entry, score
+        return best, similarity
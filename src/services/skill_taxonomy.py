@@ -0,0 +1,245 @@
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import unicodedata
+from array import array
+from collections import deque
+from typing import Iterator, List, Optional
+
+
+class SkillTaxonomy:
+
+    BUNDLED_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'skill_taxonomy.json')
+    MAGIC = b'SKTX'
+    VERSION = 1
+    HEADER = struct.Struct('<4sH32sIIIII')
+    WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789+#')
+    SEPARATORS = re.compile(r'[\s_-]+')
+    SHORT_PATTERN = 2
+    COMMON_WORDS = frozenset({'go', 'rust', 'swift', 'express', 'spark', 'helm', 'dart', 'excel', 'oracle', 'ruby',
+                              'react', 'node', 'rails', 'rest'})
+
+    _default = None
+
+    def __init__(self, skills: List[str], patterns: List[str], pattern_skill: List[int], goto: list, fail: list,
+                 outputs: list, digest: bytes = b'', loaded_from: str = 'source'):
+        self.skills = skills
+        self.patterns = patterns
+        self.pattern_skill = pattern_skill
+        self.digest = digest
+        self.loaded_from = loaded_from
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        self._lengths = [len(pattern) for pattern in patterns]
+        self._pattern_ids = {pattern: index for index, pattern in enumerate(patterns)}
+        self._spellings = {}
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        decomposed = unicodedata.normalize('NFKD', text.casefold())
+        stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+        return cls.SEPARATORS.sub(' ', stripped).strip()
+
+    @classmethod
+    def default(cls) -> 'SkillTaxonomy':
+        if cls._default is None:
+            cls._default = cls.load(cls.BUNDLED_PATH)
+        return cls._default
+
+    @classmethod
+    def load(cls, source_path: str, compiled_path: Optional[str] = None) -> 'SkillTaxonomy':
+        with open(source_path, 'rb') as f:
+            source = f.read()
+        digest = hashlib.sha256(source).digest()
+
+        if compiled_path and os.path.exists(compiled_path):
+            taxonomy = cls._read_compiled(compiled_path, digest)
+            if taxonomy is not None:
+                return taxonomy
+
+        taxonomy = cls.compile(json.loads(source).get('skills', {}), digest)
+        if compiled_path:
+            taxonomy.write(compiled_path)
+        return taxonomy
+
+    @classmethod
+    def compile(cls, skills: dict, digest: bytes = b'') -> 'SkillTaxonomy':
+        names, patterns, pattern_skill, seen = [], [], [], set()
+        for name, aliases in skills.items():
+            names.append(name)
+            for term in (name, *aliases):
+                pattern = cls.normalize(term)
+                if pattern and pattern not in seen:
+                    seen.add(pattern)
+                    patterns.append(pattern)
+                    pattern_skill.append(len(names) - 1)
+
+        goto, outputs = [{}], [[]]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for code in map(ord, pattern):
+                target = goto[state].get(code)
+                if target is None:
+                    target = goto[state][code] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = target
+            outputs[state].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for code, target in goto[state].items():
+                queue.append(target)
+                fallback = fail[state]
+                while fallback and code not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[target] = goto[fallback].get(code, 0) if state else 0
+                outputs[target].extend(outputs[fail[target]])
+
+        return cls(names, patterns, pattern_skill, goto, fail, [tuple(output) for output in outputs], digest)
+
+    @staticmethod
+    def spelling_pattern(spellings) -> re.Pattern:
+        alternatives = '|'.join(sorted(map(re.escape, spellings), key=len, reverse=True))
+        return re.compile(r'(?<![\w&-])(?:' + alternatives + r')(?![\w+#&-])')
+
+    @classmethod
+    def is_ambiguous(cls, pattern: str) -> bool:
+        return len(pattern) <= cls.SHORT_PATTERN or pattern in cls.COMMON_WORDS
+
+    def matches(self, text: str) -> Iterator[tuple]:
+        original, text = text, self.normalize(text)
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        state = 0
+        for end, code in enumerate(map(ord, text), 1):
+            while state and code not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(code, 0)
+            for index in outputs[state]:
+                start = end - lengths[index]
+                if self._bounded(text, start, end) and self._spelled(original, index):
+                    yield start, end, self.skills[self.pattern_skill[index]]
+
+    def _bounded(self, text: str, start: int, end: int) -> bool:
+        return (start == 0 or text[start - 1] not in self.WORD_CHARS) and \
+            (end == len(text) or text[end] not in self.WORD_CHARS)
+
+    def _spelled(self, original: str, index: int) -> bool:
+        pattern = self.patterns[index]
+        if not self.is_ambiguous(pattern):
+            return True
+
+        spelling = self._spellings.get(index)
+        if spelling is None:
+            name = self.skills[self.pattern_skill[index]]
+            spellings = {pattern.upper()}
+            if self.normalize(name) == pattern:
+                spellings.add(name)
+            if pattern in self.COMMON_WORDS:
+                spellings.add(pattern.capitalize())
+            spelling = self._spellings[index] = self.spelling_pattern(spellings)
+        return spelling.search(original) is not None
+
+    def mentions(self, text: str) -> set:
+        return {skill for _, _, skill in self.matches(text)}
+
+    def canonical(self, skill: str) -> Optional[str]:
+        index = self._pattern_ids.get(self.normalize(skill))
+        return None if index is None else self.skills[self.pattern_skill[index]]
+
+    def normalize_skills(self, skills: list) -> list:
+        normalized = {}
+        for skill in skills:
+            if not skill or not skill.strip():
+                continue
+            name = self.canonical(skill) or skill.strip()
+            normalized.setdefault(name.casefold(), name)
+        return list(normalized.values())
+
+    def stats(self) -> dict:
+        return {
+            'skills': len(self.skills),
+            'patterns': len(self.patterns),
+            'states': len(self._goto),
+            'loaded_from': self.loaded_from
+        }
+
+    def encode(self) -> bytes:
+        codes, targets, offsets = array('I'), array('I'), array('I', [0])
+        for transitions in self._goto:
+            codes.extend(transitions.keys())
+            targets.extend(transitions.values())
+            offsets.append(len(codes))
+
+        output_offsets, outputs = array('I', [0]), array('I')
+        for output in self._outputs:
+            outputs.extend(output)
+            output_offsets.append(len(outputs))
+
+        strings = '\n'.join(self.skills).encode('utf-8') + b'\0' + '\n'.join(self.patterns).encode('utf-8')
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.digest.ljust(32, b'\0'), len(self.skills),
+                                  len(self.patterns), len(self._goto), len(codes), len(outputs))
+        sections = (offsets, codes, targets, array('I', self._fail), output_offsets, outputs, array('I', self.pattern_skill))
+        return header + b''.join(self._little_endian(section) for section in sections) + strings
+
+    @classmethod
+    def decode(cls, data: bytes) -> 'SkillTaxonomy':
+        magic, version, digest, skill_count, pattern_count, state_count, transition_count, output_count = \
+            cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Arquivo de taxonomia compilada inválido")
+
+        offset = cls.HEADER.size
+        sections = []
+        for length in (state_count + 1, transition_count, transition_count, state_count, state_count + 1,
+                       output_count, pattern_count):
+            section = array('I')
+            section.frombytes(data[offset:offset + length * section.itemsize])
+            if len(section) != length:
+                raise ValueError("Arquivo de taxonomia compilada truncado")
+            if sys.byteorder == 'big':
+                section.byteswap()
+            sections.append(section)
+            offset += length * section.itemsize
+
+        offsets, codes, targets, fail, output_offsets, outputs, pattern_skill = sections
+        skills, patterns = data[offset:].decode('utf-8').split('\0')
+        goto = [dict(zip(codes[offsets[state]:offsets[state + 1]], targets[offsets[state]:offsets[state + 1]]))
+                for state in range(state_count)]
+        state_outputs = [tuple(outputs[output_offsets[state]:output_offsets[state + 1]]) for state in range(state_count)]
+        return cls(skills.split('\n')[:skill_count], patterns.split('\n')[:pattern_count], list(pattern_skill),
+                   goto, list(fail), state_outputs, digest, loaded_from='compiled')
+
+    @staticmethod
+    def _little_endian(section: array) -> bytes:
+        if sys.byteorder == 'big':
+            section = array(section.typecode, section)
+            section.byteswap()
+        return section.tobytes()
+
+    def write(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(self.encode())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[TAXONOMY] ERRO ao gravar taxonomia compilada: {e}")
+
+    @classmethod
+    def _read_compiled(cls, path: str, digest: bytes) -> Optional['SkillTaxonomy']:
+        try:
+            with open(path, 'rb') as f:
+                taxonomy = cls.decode(f.read())
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[TAXONOMY] ERRO ao ler taxonomia compilada: {e}")
+            return None
+
+        return taxonomy if taxonomy.digest == digest else None
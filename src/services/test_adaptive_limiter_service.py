@@ -0,0 +1,169 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AdaptiveLimiterService, UpstreamOverloadedError
+
+
+class TestAdaptiveLimiterService(unittest.TestCase):
+
+    def test_parse_duration(self):
+        self.assertEqual(AdaptiveLimiterService.parse_duration("2"), 2.0)
+        self.assertEqual(AdaptiveLimiterService.parse_duration("1.5"), 1.5)
+        self.assertEqual(AdaptiveLimiterService.parse_duration("20ms"), 0.02)
+        self.assertEqual(AdaptiveLimiterService.parse_duration("6m0s"), 360.0)
+        self.assertEqual(AdaptiveLimiterService.parse_duration("1h2m3s"), 3723.0)
+        self.assertIsNone(AdaptiveLimiterService.parse_duration("soon"))
+        self.assertIsNone(AdaptiveLimiterService.parse_duration(None))
+
+    def test_retry_after_from_headers(self):
+        self.assertEqual(AdaptiveLimiterService.retry_after_from_headers({'retry-after-ms': '1500'}), 1.5)
+        self.assertEqual(AdaptiveLimiterService.retry_after_from_headers({'retry-after-ms': 'x', 'retry-after': '3'}), 3.0)
+        self.assertEqual(AdaptiveLimiterService.retry_after_from_headers({
+            'x-ratelimit-remaining-requests': '0',
+            'x-ratelimit-reset-requests': '12s'
+        }), 12.0)
+        self.assertIsNone(AdaptiveLimiterService.retry_after_from_headers({
+            'x-ratelimit-remaining-requests': '5',
+            'x-ratelimit-reset-requests': '12s'
+        }))
+        self.assertIsNone(AdaptiveLimiterService.retry_after_from_headers({}))
+
+    def test_acquire_and_release(self):
+        limiter = AdaptiveLimiterService(initial_limit=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(limiter.stats()['in_flight'], 2)
+
+        limiter.release()
+        limiter.release()
+        self.assertEqual(limiter.stats()['in_flight'], 0)
+
+    def test_waiter_gets_slot_after_release(self):
+        limiter = AdaptiveLimiterService(initial_limit=1, queue_timeout=5)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def waiter():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        while limiter.queued == 0:
+            time.sleep(0.001)
+
+        self.assertEqual(limiter.stats()['queued'], 1)
+        limiter.release()
+        thread.join()
+
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(limiter.stats()['in_flight'], 1)
+        self.assertEqual(limiter.stats()['queued'], 0)
+
+    @patch('builtins.print')
+    def test_rejects_when_queue_is_full(self, mock_print):
+        limiter = AdaptiveLimiterService(initial_limit=1, max_queue=0)
+        limiter.acquire()
+
+        with self.assertRaises(UpstreamOverloadedError) as context:
+            limiter.acquire()
+
+        self.assertEqual(context.exception.retry_after_seconds, 1)
+        self.assertEqual(limiter.stats()['rejected'], 1)
+        mock_print.assert_called_with("[LIMITER] Requisição rejeitada: 1 em andamento, 0 na fila")
+
+    @patch('builtins.print')
+    def test_rejects_after_queue_timeout(self, mock_print):
+        limiter = AdaptiveLimiterService(initial_limit=1, queue_timeout=0.02)
+        limiter.acquire()
+
+        started = time.monotonic()
+        with self.assertRaises(UpstreamOverloadedError):
+            limiter.acquire()
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(limiter.stats()['queued'], 0)
+
+    @patch('builtins.print')
+    def test_throttled_response_halves_limit_and_sheds_fast(self, mock_print):
+        limiter = AdaptiveLimiterService(initial_limit=8, min_limit=2, queue_timeout=1)
+
+        limiter.record(429, {'retry-after': '30'})
+
+        stats = limiter.stats()
+        self.assertEqual(stats['limit'], 4)
+        self.assertEqual(stats['throttled'], 1)
+        self.assertGreater(stats['blocked_for'], 29)
+
+        started = time.monotonic()
+        with self.assertRaises(UpstreamOverloadedError) as context:
+            limiter.acquire()
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(context.exception.retry_after_seconds, 30)
+
+        limiter.record(429, {})
+        limiter.record(429, {})
+        self.assertEqual(limiter.stats()['limit'], 2)
+
+    def test_throttled_without_headers_blocks_briefly(self):
+        limiter = AdaptiveLimiterService()
+
+        limiter.record(429, {})
+
+        self.assertGreater(limiter.stats()['blocked_for'], 0)
+        self.assertLessEqual(limiter.stats()['blocked_for'], 1)
+
+    def test_success_increases_limit_additively(self):
+        limiter = AdaptiveLimiterService(initial_limit=2, max_limit=3)
+
+        limiter.record(200, {})
+        self.assertEqual(limiter.stats()['limit'], 2.5)
+
+        for _ in range(10):
+            limiter.record(200, {})
+        self.assertEqual(limiter.stats()['limit'], 3)
+
+    def test_server_error_keeps_limit(self):
+        limiter = AdaptiveLimiterService(initial_limit=4)
+
+        limiter.record(500, {})
+
+        self.assertEqual(limiter.stats()['limit'], 4)
+        self.assertEqual(limiter.stats()['blocked_for'], 0)
+
+    def test_exhausted_rate_limit_headers_block_new_requests(self):
+        limiter = AdaptiveLimiterService()
+
+        limiter.record(200, {'x-ratelimit-remaining-requests': '0', 'x-ratelimit-reset-requests': '50ms'})
+
+        started = time.monotonic()
+        limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.03)
+
+    @patch('builtins.print')
+    def test_token_bucket_limits_rate(self, mock_print):
+        limiter = AdaptiveLimiterService(initial_limit=10, rate=50, burst=2, queue_timeout=1)
+
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        elapsed = time.monotonic() - started
+
+        self.assertGreaterEqual(elapsed, 0.03)
+
+        slow = AdaptiveLimiterService(rate=0.1, burst=1, queue_timeout=1)
+        slow.acquire()
+        with self.assertRaises(UpstreamOverloadedError) as context:
+            slow.acquire()
+        self.assertGreaterEqual(context.exception.retry_after_seconds, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import time
+import unittest
+from unittest.mock import patch
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AnalysisCacheService, MemoryCacheBackend
+
+
+class TestAnalysisCacheService(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = AnalysisCacheService(max_entries=2, ttl=60)
+
+    def test_canonicalize_skills(self):
+        result = AnalysisCacheService.canonicalize_skills(["Python", " flask ", "PYTHON", "", "  "])
+        self.assertEqual(result, ["flask", "python"])
+
+    def test_build_key_ignores_skill_order_and_case(self):
+        key_a = AnalysisCacheService.build_key(["Python", "Docker"], "Vaga", "prompt", {"max_completion_tokens": 1000})
+        key_b = AnalysisCacheService.build_key(["docker", "PYTHON", "python"], "Vaga", "prompt", {"max_completion_tokens": 1000})
+        self.assertEqual(key_a, key_b)
+
+    def test_build_key_changes_with_inputs(self):
+        base = AnalysisCacheService.build_key(["Python"], "Vaga", "prompt", {"max_completion_tokens": 1000})
+
+        self.assertNotEqual(base, AnalysisCacheService.build_key(["Java"], "Vaga", "prompt", {"max_completion_tokens": 1000}))
+        self.assertNotEqual(base, AnalysisCacheService.build_key(["Python"], "Outra", "prompt", {"max_completion_tokens": 1000}))
+        self.assertNotEqual(base, AnalysisCacheService.build_key(["Python"], "Vaga", "outro", {"max_completion_tokens": 1000}))
+        self.assertNotEqual(base, AnalysisCacheService.build_key(["Python"], "Vaga", "prompt", {"max_completion_tokens": 500}))
+
+    def test_get_missing_counts_miss(self):
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_set_and_get(self):
+        self.cache.set("key", "Match de 90%")
+
+        self.assertEqual(self.cache.get("key"), "Match de 90%")
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_lru_eviction(self):
+        self.cache.set("a", "1")
+        self.cache.set("b", "2")
+        self.cache.get("a")
+        self.cache.set("c", "3")
+
+        self.assertEqual(self.cache.get("a"), "1")
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    @patch('services.analysis_cache_service.time.time')
+    def test_expired_entry_is_evicted(self, mock_time):
+        mock_time.return_value = 1000
+        self.cache.set("key", "value")
+
+        mock_time.return_value = 1060
+
+        self.assertIsNone(self.cache.get("key"))
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['evictions'], 1)
+
+    def test_clear(self):
+        self.cache.set("key", "value")
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+class TestAnalysisCacheServiceBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = MemoryCacheBackend()
+        self.cache = AnalysisCacheService(max_entries=2, ttl=60, backend=self.backend)
+
+    def test_backend_shared_between_replicas(self):
+        self.cache.set("key", "Match de 80% ✓")
+        replica = AnalysisCacheService(ttl=60, backend=self.backend)
+
+        self.assertEqual(replica.get("key"), "Match de 80% ✓")
+        self.assertEqual(replica.get("key"), "Match de 80% ✓")
+        stats = replica.stats()
+        self.assertEqual(stats['backend_hits'], 1)
+        self.assertEqual(stats['hits'], 2)
+
+    def test_backend_miss_counts_miss(self):
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_expired_backend_entry_is_ignored(self):
+        self.backend.set(AnalysisCacheService.KEY_PREFIX + "key", self.cache.encode("value", time.time() - 120))
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    @patch('builtins.print')
+    def test_corrupted_backend_entry_is_ignored(self, mock_print):
+        self.backend.set(AnalysisCacheService.KEY_PREFIX + "key", b"JB")
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertTrue(mock_print.call_args[0][0].startswith("[ANALYSIS_CACHE] ERRO ao ler cache compartilhado:"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+import threading
+import time
+import unittest
+import requests
+from unittest.mock import Mock, patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models import AnalysisRequest, AnalysisJob
+from src.services import AnalysisJobService, JobQueueFullError, MemoryCacheBackend, RetryPolicy, CircuitOpenError
+
+
+@patch('builtins.print')
+class TestAnalysisJobService(unittest.TestCase):
+
+    def setUp(self):
+        self.analysis_service = Mock()
+        self.analysis_service.analyze_position.return_value = {'message': 'Match de 80%'}
+        self.session = Mock()
+        self.session.post.return_value = Mock(status_code=200)
+        self.service = AnalysisJobService(self.analysis_service, max_workers=2, max_queue=2, session=self.session)
+        self.request = AnalysisRequest(position='https://example.com/job', skills=['Python'])
+        resolver = patch('socket.getaddrinfo', return_value=[(2, 1, 6, '', ('93.184.216.34', 443))])
+        self.getaddrinfo = resolver.start()
+        self.addCleanup(resolver.stop)
+
+    def _wait(self):
+        self.service._executor.shutdown(wait=True)
+
+    def test_submit_runs_analysis_in_background(self, mock_print):
+        job = self.service.submit(self.request, 'key', 'https://api')
+        self._wait()
+
+        stored = self.service.get(job.id)
+        self.assertEqual(stored.status, AnalysisJob.SUCCEEDED)
+        self.assertEqual(stored.result, {'message': 'Match de 80%'})
+        self.assertIsNotNone(stored.finished_at)
+        self.analysis_service.analyze_position.assert_called_once_with(self.request, 'key', 'https://api')
+        stats = self.service.stats()
+        self.assertEqual((stats['queued'], stats['running'], stats['succeeded'], stats['stored']), (0, 0, 1, 1))
+        self.session.post.assert_not_called()
+
+    def test_failed_analysis_records_error(self, mock_print):
+        self.analysis_service.analyze_position.side_effect = ValueError("Meta description não encontrada")
+
+        job = self.service.submit(self.request, 'key', 'https://api')
+        self._wait()
+
+        self.assertEqual(job.status, AnalysisJob.FAILED)
+        self.assertEqual(job.error, {'error': 'Meta description não encontrada', 'status': 404})
+        self.assertEqual(self.service.stats()['failed'], 1)
+
+    def test_describe_error(self, mock_print):
+        self.assertEqual(self.service.describe_error(CircuitOpenError('openai', retry_after=2.5)),
+                         {'error': 'Circuito aberto para openai, tente novamente em instantes', 'status': 503,
+                          'retry_after': 3})
+        self.assertEqual(self.service.describe_error(requests.exceptions.Timeout("lento")),
+                         {'error': 'Erro ao acessar a URL: lento', 'status': 500})
+        self.assertEqual(self.service.describe_error(RuntimeError("boom")),
+                         {'error': 'Erro interno do servidor', 'status': 500})
+
+    def test_queue_full_is_rejected(self, mock_print):
+        with patch.object(self.service, '_start_worker'):
+            self.service.submit(self.request, 'key')
+            self.service.submit(self.request, 'key')
+
+            with self.assertRaises(JobQueueFullError) as context:
+                self.service.submit(self.request, 'key')
+
+        self.assertEqual(context.exception.retry_after_seconds, 1)
+        self.assertEqual(self.service.stats()['rejected'], 1)
+        self.assertEqual(self.service.stats()['queued'], 2)
+
+    def test_queue_slot_is_released_when_job_starts(self, mock_print):
+        release = threading.Event()
+        self.analysis_service.analyze_position.side_effect = lambda *args: release.wait(5) and {'message': 'ok'}
+        service = AnalysisJobService(self.analysis_service, max_workers=1, max_queue=1)
+
+        first = service.submit(self.request, 'key')
+        for _ in range(100):
+            if service.running:
+                break
+            time.sleep(0.01)
+        second = service.submit(self.request, 'key')
+        release.set()
+        service._executor.shutdown(wait=True)
+
+        self.assertEqual(first.status, AnalysisJob.SUCCEEDED)
+        self.assertEqual(second.status, AnalysisJob.SUCCEEDED)
+
+    def test_webhook_receives_finished_job(self, mock_print):
+        job = self.service.submit(self.request, 'key', callback_url='https://client.example.com/hook')
+        self._wait()
+
+        self.session.post.assert_called_once()
+        args, kwargs = self.session.post.call_args
+        self.assertEqual(args[0], 'https://client.example.com/hook')
+        self.assertEqual(kwargs['json']['status'], 'succeeded')
+        self.assertEqual(kwargs['timeout'], 5.0)
+        self.assertTrue(job.callback_delivered)
+        self.assertEqual(self.service.stats()['webhooks'], {'delivered': 1, 'failed': 0})
+
+    def test_webhook_is_retried_on_unavailable_receiver(self, mock_print):
+        self.session.post.side_effect = [Mock(status_code=503), requests.exceptions.ConnectionError("recusada"),
+                                         Mock(status_code=204)]
+        self.service.webhook_retry_policy = RetryPolicy('webhook', max_attempts=3, base_delay=0, max_delay=0)
+
+        job = self.service.submit(self.request, 'key', callback_url='https://client.example.com/hook')
+        self._wait()
+
+        self.assertEqual(self.session.post.call_count, 3)
+        self.assertTrue(job.callback_delivered)
+
+    def test_webhook_client_error_is_not_retried(self, mock_print):
+        self.session.post.return_value = Mock(status_code=404)
+        self.service.webhook_retry_policy = RetryPolicy('webhook', max_attempts=3, base_delay=0, max_delay=0)
+
+        job = self.service.submit(self.request, 'key', callback_url='https://client.example.com/hook')
+        self._wait()
+
+        self.assertEqual(self.session.post.call_count, 1)
+        self.assertFalse(job.callback_delivered)
+        self.assertEqual(self.service.stats()['webhooks'], {'delivered': 0, 'failed': 1})
+        mock_print.assert_any_call(f"[JOBS] ERRO ao entregar webhook do job {job.id}: Webhook respondeu 404")
+
+    def test_webhook_redirect_is_not_followed(self, mock_print):
+        self.session.post.return_value = Mock(status_code=307, headers={'Location': 'http://169.254.169.254/'})
+
+        job = self.service.submit(self.request, 'key', callback_url='https://client.example.com/hook')
+        self._wait()
+
+        self.session.post.assert_called_once()
+        self.assertFalse(self.session.post.call_args[1]['allow_redirects'])
+        self.assertFalse(job.callback_delivered)
+        mock_print.assert_any_call(f"[JOBS] ERRO ao entregar webhook do job {job.id}: Webhook respondeu 307")
+
+    def test_webhook_to_internal_address_is_not_sent(self, mock_print):
+        self.getaddrinfo.return_value = [(2, 1, 6, '', ('169.254.169.254', 80))]
+        job = self.service.submit(self.request, 'key', callback_url='http://169.254.169.254/latest/meta-data')
+        self._wait()
+
+        self.session.post.assert_not_called()
+        self.assertFalse(job.callback_delivered)
+        mock_print.assert_any_call(f"[JOBS] ERRO ao entregar webhook do job {job.id}: destino não permitido")
+
+    def test_allowed_hosts_replace_address_check(self, mock_print):
+        service = AnalysisJobService(self.analysis_service, webhook_allowed_hosts=['Hooks.Internal'])
+
+        self.assertTrue(service.accepts_callback('http://hooks.internal:8080/done'))
+        self.assertFalse(service.accepts_callback('https://client.example.com/hook'))
+
+    def test_unknown_job(self, mock_print):
+        self.assertIsNone(self.service.get('missing'))
+
+    def test_finished_jobs_expire_after_ttl(self, mock_print):
+        job = self.service.submit(self.request, 'key')
+        self._wait()
+
+        with patch('time.time', return_value=time.time() + 3601):
+            self.service._purged_at = 0.0
+            self.assertIsNone(self.service.get(job.id))
+        self.assertEqual(self.service.stats()['stored'], 0)
+
+    def test_oldest_finished_jobs_are_dropped_over_limit(self, mock_print):
+        self.service.max_jobs = 1
+        first = self.service.submit(self.request, 'key')
+        second = self.service.submit(self.request, 'key')
+        self._wait()
+        self.service._purged_at = 0.0
+
+        self.assertIsNotNone(self.service.get(second.id))
+        self.assertIsNone(self.service.get(first.id))
+
+    def test_close_without_jobs(self, mock_print):
+        self.service.close()
+
+    def test_jobs_are_shared_through_backend(self, mock_print):
+        backend = MemoryCacheBackend()
+        self.service.backend = backend
+        job = self.service.submit(self.request, 'key')
+        self._wait()
+        replica = AnalysisJobService(self.analysis_service, backend=backend)
+
+        shared = replica.get(job.id)
+
+        self.assertEqual(shared.status, AnalysisJob.SUCCEEDED)
+        self.assertEqual(shared.result, {'message': 'Match de 80%'})
+        self.assertEqual(shared.skills, ['Python'])
+
+    def test_expired_backend_job_is_ignored(self, mock_print):
+        backend = MemoryCacheBackend()
+        replica = AnalysisJobService(self.analysis_service, result_ttl=60, backend=backend)
+        job = AnalysisJob(position='p', skills=[], status=AnalysisJob.SUCCEEDED, finished_at=time.time() - 120)
+        replica._save(job)
+
+        self.assertIsNone(replica.get(job.id))
+
+    def test_corrupted_backend_job_is_ignored(self, mock_print):
+        backend = MemoryCacheBackend()
+        backend.set(AnalysisJobService.KEY_PREFIX + 'abc', b'{"id": "abc"}')
+        replica = AnalysisJobService(self.analysis_service, backend=backend)
+
+        self.assertIsNone(replica.get('abc'))
+        mock_print.assert_called_with("[JOBS] ERRO ao ler job compartilhado abc: 'status'")
+
+
+if __name__ == '__main__':
+    unittest.main()
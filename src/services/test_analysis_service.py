@@ -1,11 +1,13 @@
+import tempfile
 import unittest
+import requests
 from unittest.mock import Mock, patch
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.services import AnalysisService
-from src.models import AnalysisRequest
+from src.services import AnalysisService, PageCacheService, AnalysisCacheService, MetricsService, AdaptiveLimiterService, RetryPolicy, HedgedRequestService, CircuitBreaker, CircuitBreakerRegistry, MemoryCacheBackend, SqliteCacheBackend, RedisCacheBackend, AnalysisJobService, DescriptionStoreService, DescriptionRefresherService, FetchedDescription, SkillTaxonomy, ProfileBatcherService
+from src.models import AnalysisRequest, BatchAnalysisRequest
 
 
 class TestAnalysisService(unittest.TestCase):
@@ -28,9 +30,82 @@ class TestAnalysisService(unittest.TestCase):
         self.assertIsNotNone(service.text_processor)
         self.assertIsNotNone(service.openai_service)
 
+    def test_init_uses_injected_services(self):
+        service = AnalysisService(web_scraper=self.mock_web_scraper, openai_service=self.mock_openai_service)
+
+        self.assertIs(service.web_scraper, self.mock_web_scraper)
+        self.assertIs(service.openai_service, self.mock_openai_service)
+        self.assertIsNotNone(service.text_processor)
+
+    def test_from_config_creates_page_cache(self):
+        config = {
+            'REQUEST_TIMEOUT': 5,
+            'PAGE_CACHE_ENABLED': True,
+            'PAGE_CACHE_MAX_ENTRIES': 10,
+            'PAGE_CACHE_MAX_BYTES': 1024,
+            'PAGE_CACHE_TTL': 30,
+            'PAGE_CACHE_DIR': ''
+        }
+
+        service = AnalysisService.from_config(config)
+
+        self.assertEqual(service.web_scraper.timeout, 5)
+        self.assertIsInstance(service.web_scraper.cache, PageCacheService)
+        self.assertEqual(service.web_scraper.cache.max_entries, 10)
+        self.assertEqual(service.web_scraper.cache.ttl, 30)
+        self.assertIsNone(service.web_scraper.cache.disk_dir)
+
+    def test_from_config_without_page_cache(self):
+        service = AnalysisService.from_config({'PAGE_CACHE_ENABLED': False})
+
+        self.assertEqual(service.web_scraper.timeout, 10)
+        self.assertIsNone(service.web_scraper.cache)
+        stats = service.stats()
+        self.assertIsNone(stats['page_cache'])
+        self.assertIsNone(stats['analysis_cache'])
+
+    def test_from_config_creates_pooled_sessions(self):
+        config = {'HTTP_POOL_CONNECTIONS': 4, 'HTTP_POOL_MAXSIZE': 8, 'HTTP_MAX_RETRIES': 2}
+
+        service = AnalysisService.from_config(config)
+
+        self.assertIsInstance(service.web_scraper.session, requests.Session)
+        self.assertIsInstance(service.openai_service.session, requests.Session)
+        self.assertIsNot(service.web_scraper.session, service.openai_service.session)
+        adapter = service.web_scraper.session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertEqual(service.stats()['http_pools']['scraping']['hosts'], 0)
+
+    def test_stats_without_sessions(self):
+        service = AnalysisService()
+        self.assertEqual(service.stats()['http_pools'], {'scraping': None, 'openai': None})
+
+    def test_stats_includes_page_cache(self):
+        service = AnalysisService.from_config({'PAGE_CACHE_ENABLED': True})
+
+        stats = service.stats()
+
+        self.assertEqual(stats['page_cache']['hits'], 0)
+        self.assertEqual(stats['page_cache']['misses'], 0)
+        self.assertIsNone(stats['analysis_cache'])
+
+    def test_from_config_creates_analysis_cache(self):
+        config = {
+            'ANALYSIS_CACHE_ENABLED': True,
+            'ANALYSIS_CACHE_MAX_ENTRIES': 5,
+            'ANALYSIS_CACHE_TTL': 60
+        }
+
+        service = AnalysisService.from_config(config)
+
+        self.assertIsInstance(service.openai_service.cache, AnalysisCacheService)
+        self.assertEqual(service.openai_service.cache.max_entries, 5)
+        self.assertEqual(service.openai_service.cache.ttl, 60)
+        self.assertEqual(service.stats()['analysis_cache']['hits'], 0)
+
     def test_analyze_position_success_complete_flow(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html><meta name='description' content='Job description'/></html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Desenvolvedor Python com experiência em Flask"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Desenvolvedor Python com experiência em Flask"
         self.mock_text_processor.format_description.return_value = "Desenvolvedor Python com experiência em Flask"
         self.mock_openai_service.analyze_match.return_value = "Match de 85% - Candidato tem boa compatibilidade"
 
@@ -43,8 +118,7 @@ class TestAnalysisService(unittest.TestCase):
 
         self.assertEqual(result, {"message": "Match de 85% - Candidato tem boa compatibilidade"})
 
-        self.mock_web_scraper.fetch_page_content.assert_called_once_with("https://example.com/job")
-        self.mock_web_scraper.extract_meta_description.assert_called_once_with("<html><meta name='description' content='Job description'/></html>")
+        self.mock_web_scraper.fetch_meta_description.assert_called_once_with("https://example.com/job")
         self.mock_text_processor.format_description.assert_called_once_with("Desenvolvedor Python com experiência em Flask")
         self.mock_openai_service.analyze_match.assert_called_once_with(
             ["Python", "Flask", "API"],
@@ -54,8 +128,7 @@ class TestAnalysisService(unittest.TestCase):
         )
 
     def test_analyze_position_with_default_api_url(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Job description"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
         self.mock_text_processor.format_description.return_value = "Job description"
         self.mock_openai_service.analyze_match.return_value = "Analysis result"
 
@@ -71,8 +144,7 @@ class TestAnalysisService(unittest.TestCase):
         )
 
     def test_analyze_position_no_meta_description_found(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content without meta</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = None
+        self.mock_web_scraper.fetch_meta_description.return_value = None
 
         request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
 
@@ -85,8 +157,7 @@ class TestAnalysisService(unittest.TestCase):
         self.mock_openai_service.analyze_match.assert_not_called()
 
     def test_analyze_position_empty_meta_description(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = ""
+        self.mock_web_scraper.fetch_meta_description.return_value = ""
 
         request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
 
@@ -94,7 +165,7 @@ class TestAnalysisService(unittest.TestCase):
             self.service.analyze_position(request, "test-api-key")
 
     def test_analyze_position_web_scraper_exception(self):
-        self.mock_web_scraper.fetch_page_content.side_effect = Exception("Network error")
+        self.mock_web_scraper.fetch_meta_description.side_effect = Exception("Network error")
 
         request = AnalysisRequest(position="https://invalid-url.com", skills=["Python"])
 
@@ -102,8 +173,7 @@ class TestAnalysisService(unittest.TestCase):
             self.service.analyze_position(request, "test-api-key")
 
     def test_analyze_position_openai_service_exception(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Job description"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
         self.mock_text_processor.format_description.return_value = "Job description"
         self.mock_openai_service.analyze_match.side_effect = Exception("OpenAI API error")
 
@@ -114,7 +184,7 @@ class TestAnalysisService(unittest.TestCase):
 
     @patch('builtins.print')
     def test_analyze_position_logs_error_and_reraises(self, mock_print):
-        self.mock_web_scraper.fetch_page_content.side_effect = ValueError("Test error")
+        self.mock_web_scraper.fetch_meta_description.side_effect = ValueError("Test error")
 
         request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
 
@@ -124,8 +194,7 @@ class TestAnalysisService(unittest.TestCase):
         mock_print.assert_called_with("[ANALYSIS] ERRO: Test error")
 
     def test_analyze_position_with_empty_skills_list(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Job description"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
         self.mock_text_processor.format_description.return_value = "Job description"
         self.mock_openai_service.analyze_match.return_value = "Candidato precisa desenvolver skills"
 
@@ -141,8 +210,7 @@ class TestAnalysisService(unittest.TestCase):
         )
 
     def test_analyze_position_with_many_skills(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Complex job description"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Complex job description"
         self.mock_text_processor.format_description.return_value = "Complex job description"
         self.mock_openai_service.analyze_match.return_value = "Detailed analysis"
 
@@ -159,8 +227,7 @@ class TestAnalysisService(unittest.TestCase):
         )
 
     def test_analyze_position_with_special_characters_in_url(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Job description"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
         self.mock_text_processor.format_description.return_value = "Job description"
         self.mock_openai_service.analyze_match.return_value = "Analysis result"
 
@@ -169,14 +236,13 @@ class TestAnalysisService(unittest.TestCase):
 
         self.service.analyze_position(request, "test-api-key")
 
-        self.mock_web_scraper.fetch_page_content.assert_called_once_with(special_url)
+        self.mock_web_scraper.fetch_meta_description.assert_called_once_with(special_url)
 
     def test_analyze_position_text_processor_formats_correctly(self):
         raw_description = "  Job   description\n\nwith   extra   spaces  "
         formatted_description = "Job description with extra spaces"
 
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = raw_description
+        self.mock_web_scraper.fetch_meta_description.return_value = raw_description
         self.mock_text_processor.format_description.return_value = formatted_description
         self.mock_openai_service.analyze_match.return_value = "Analysis result"
 
@@ -194,8 +260,7 @@ class TestAnalysisService(unittest.TestCase):
         )
 
     def test_analyze_position_preserves_api_key(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Job description"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
         self.mock_text_processor.format_description.return_value = "Job description"
         self.mock_openai_service.analyze_match.return_value = "Analysis result"
 
@@ -212,8 +277,7 @@ class TestAnalysisService(unittest.TestCase):
         )
 
     def test_analyze_position_returns_correct_format(self):
-        self.mock_web_scraper.fetch_page_content.return_value = "<html>content</html>"
-        self.mock_web_scraper.extract_meta_description.return_value = "Job description"
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
         self.mock_text_processor.format_description.return_value = "Job description"
         ai_response = "Match de 90% - Excelente compatibilidade"
         self.mock_openai_service.analyze_match.return_value = ai_response
@@ -227,5 +291,580 @@ class TestAnalysisService(unittest.TestCase):
         self.assertEqual(result["message"], ai_response)
 
 
+    @patch('builtins.print')
+    def test_fast_mode_scores_locally_without_completion(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga Python com Docker"
+        self.mock_text_processor.format_description.return_value = "Vaga Python com Docker"
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Python", "Kubernetes"], mode='fast')
+        result = self.service.analyze_position(request, "test-api-key")
+
+        self.assertEqual(result['match_percentage'], 50)
+        self.assertEqual(result['missing_skills'], ["Kubernetes"])
+        self.mock_openai_service.analyze_match.assert_not_called()
+        self.assertEqual(self.service.metrics.stage_duration.snapshot()[('prescore',)][2], 1)
+        self.assertEqual(list(self.service.stream_position(request, "test-api-key")), [result['message']])
+        self.mock_openai_service.stream_match.assert_not_called()
+
+    @patch('builtins.print')
+    def test_prescore_gate_skips_completion_for_weak_matches(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga Java"
+        self.mock_text_processor.format_description.return_value = "Vaga Java"
+        self.mock_openai_service.analyze_match.return_value = "Match de 90%"
+        self.service.scorer.gate_below = 50
+
+        weak = self.service.analyze_position(AnalysisRequest(position="https://example.com/job", skills=["Python"]), "key")
+        strong = self.service.analyze_position(AnalysisRequest(position="https://example.com/job", skills=["Java"]), "key")
+
+        self.assertEqual(weak['mode'], 'fast')
+        self.assertEqual(strong, {"message": "Match de 90%"})
+        self.mock_openai_service.analyze_match.assert_called_once()
+        self.assertEqual(self.service.scorer.stats(), {'gate_below': 50, 'scored': 2, 'gated': 1})
+
+    def test_full_mode_without_gate_does_not_score(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga"
+        self.mock_text_processor.format_description.return_value = "Vaga"
+        self.mock_openai_service.analyze_match.return_value = "Match"
+
+        self.service.analyze_position(AnalysisRequest(position="https://example.com/job", skills=["Python"]), "key")
+
+        self.assertEqual(self.service.scorer.stats()['scored'], 0)
+
+    def test_from_config_sets_prescore_gate(self):
+        self.assertEqual(AnalysisService.from_config({'PRESCORE_GATE_BELOW': 20}).stats()['prescorer']['gate_below'], 20)
+        self.assertEqual(AnalysisService.from_config({}).scorer.gate_below, 0)
+
+    def test_taxonomy_keeps_request_skills_for_prompt(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga"
+        self.mock_text_processor.format_description.return_value = "Vaga"
+        self.mock_openai_service.analyze_match.return_value = "Match"
+        self.service.taxonomy = SkillTaxonomy.compile({'JavaScript': ['js'], 'Kubernetes': ['k8s']})
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["js", "JavaScript", "k8s", "Flask"])
+        self.service.analyze_position(request, "key")
+
+        self.assertEqual(self.mock_openai_service.analyze_match.call_args[0][0], ["js", "JavaScript", "k8s", "Flask"])
+
+    def test_analysis_key_uses_taxonomy_names(self):
+        taxonomy = SkillTaxonomy.compile({'JavaScript': ['js'], 'Kubernetes': ['k8s']})
+
+        self.assertEqual(
+            AnalysisService._analysis_key("https://example.com/job", ["js", "k8s"], taxonomy),
+            AnalysisService._analysis_key("https://example.com/job", ["Kubernetes", "JavaScript"], taxonomy)
+        )
+
+    def test_from_config_loads_skill_taxonomy(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            compiled_path = os.path.join(tmp_dir, 'taxonomy.bin')
+            config = {'SKILL_TAXONOMY_ENABLED': True, 'SKILL_TAXONOMY_COMPILED_PATH': compiled_path}
+
+            first = AnalysisService.from_config(config)
+            second = AnalysisService.from_config(config)
+
+            self.assertEqual(first.stats()['taxonomy']['loaded_from'], 'source')
+            self.assertEqual(second.stats()['taxonomy']['loaded_from'], 'compiled')
+            self.assertIs(second.scorer.taxonomy, second.taxonomy)
+        self.assertIsNone(AnalysisService.from_config({}).taxonomy)
+
+    def test_from_config_sets_batch_concurrency(self):
+        service = AnalysisService.from_config({'BATCH_MAX_CONCURRENCY': 3})
+        self.assertEqual(service.batch_max_concurrency, 3)
+
+    @patch('builtins.print')
+    def test_analyze_batch_deduplicates_positions(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
+        self.mock_text_processor.format_description.return_value = "Job description"
+        self.mock_openai_service.analyze_match.return_value = "Match de 70%"
+
+        request = BatchAnalysisRequest(
+            positions=["https://example.com/a", "https://EXAMPLE.com/a#top", "https://example.com/b"],
+            skills=["Python"]
+        )
+        results = self.service.analyze_batch(request, "test-api-key", "https://test-api.com")
+
+        self.assertEqual(list(results.keys()), ["https://example.com/a", "https://example.com/b"])
+        self.assertEqual(results["https://example.com/a"], {"message": "Match de 70%"})
+        self.assertEqual(self.mock_web_scraper.fetch_meta_description.call_count, 2)
+        self.assertEqual(self.mock_openai_service.analyze_match.call_count, 2)
+        mock_print.assert_any_call("[ANALYSIS] Analisando lote com 2 vagas")
+
+    @patch('builtins.print')
+    def test_analyze_batch_reports_malformed_position_per_item(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
+        self.mock_text_processor.format_description.return_value = "Job description"
+        self.mock_openai_service.analyze_match.return_value = "Match de 70%"
+
+        request = BatchAnalysisRequest(
+            positions=["https://example.com/a", "https://a.example.com:99999/x"],
+            skills=["Python"]
+        )
+        results = self.service.analyze_batch(request, "test-api-key", "https://test-api.com")
+
+        self.assertEqual(results["https://example.com/a"], {"message": "Match de 70%"})
+        self.assertIsInstance(results["https://a.example.com:99999/x"], ValueError)
+
+    @patch('builtins.print')
+    def test_analyze_batch_forwards_mode(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga Python"
+        self.mock_text_processor.format_description.return_value = "Vaga Python"
+
+        request = BatchAnalysisRequest.from_dict({"positions": ["https://example.com/a"], "skills": ["Python"], "mode": "fast"})
+        results = self.service.analyze_batch(request, "test-api-key")
+
+        self.assertEqual(results["https://example.com/a"]['match_percentage'], 100)
+        self.mock_openai_service.analyze_match.assert_not_called()
+
+    @patch('builtins.print')
+    def test_analyze_batch_collects_per_position_errors(self, mock_print):
+        def fetch(position):
+            if position.endswith("/missing"):
+                return None
+            return "Job description"
+
+        self.mock_web_scraper.fetch_meta_description.side_effect = fetch
+        self.mock_text_processor.format_description.return_value = "Job description"
+        self.mock_openai_service.analyze_match.return_value = "Match de 70%"
+
+        request = BatchAnalysisRequest(positions=["https://example.com/ok", "https://example.com/missing"], skills=["Python"])
+        results = self.service.analyze_batch(request, "test-api-key")
+
+        self.assertEqual(results["https://example.com/ok"], {"message": "Match de 70%"})
+        self.assertIsInstance(results["https://example.com/missing"], ValueError)
+
+    @patch('builtins.print')
+    def test_analyze_batch_respects_concurrency_limit(self, mock_print):
+        import threading
+        import time
+
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fetch(position):
+            with lock:
+                active.append(position)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(position)
+            return "Job description"
+
+        self.service.batch_max_concurrency = 2
+        self.mock_web_scraper.fetch_meta_description.side_effect = fetch
+        self.mock_text_processor.format_description.return_value = "Job description"
+        self.mock_openai_service.analyze_match.return_value = "Match"
+
+        request = BatchAnalysisRequest(positions=[f"https://example.com/{i}" for i in range(6)], skills=["Python"])
+        results = self.service.analyze_batch(request, "test-api-key")
+
+        self.assertEqual(len(results), 6)
+        self.assertLessEqual(max(peak), 2)
+
+
+    def test_stream_position_returns_openai_stream(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
+        self.mock_text_processor.format_description.return_value = "Job description"
+        self.mock_openai_service.stream_match.return_value = iter(["Match", " de 80%"])
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
+        chunks = self.service.stream_position(request, "test-api-key", "https://test-api.com")
+
+        self.assertEqual(list(chunks), ["Match", " de 80%"])
+        self.mock_openai_service.stream_match.assert_called_once_with(
+            ["Python"], "Job description", "test-api-key", "https://test-api.com"
+        )
+
+    @patch('builtins.print')
+    def test_stream_position_raises_before_streaming(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = None
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
+
+        with self.assertRaises(ValueError):
+            self.service.stream_position(request, "test-api-key")
+
+        self.mock_openai_service.stream_match.assert_not_called()
+        mock_print.assert_called_with("[ANALYSIS] ERRO: Meta description não encontrada")
+
+    def test_stats_includes_single_flight(self):
+        stats = AnalysisService().stats()
+
+        self.assertEqual(stats['single_flight']['scraping'], {'in_flight': 0, 'executions': 0, 'coalesced': 0})
+        self.assertEqual(stats['single_flight']['analysis'], {'in_flight': 0, 'executions': 0, 'coalesced': 0})
+
+    def test_analyze_position_coalesces_concurrent_requests(self):
+        import threading
+
+        release = threading.Event()
+
+        def slow_fetch(position):
+            release.wait(5)
+            return "Job description"
+
+        self.mock_web_scraper.fetch_meta_description.side_effect = slow_fetch
+        self.mock_text_processor.format_description.return_value = "Job description"
+        self.mock_openai_service.analyze_match.return_value = "Match de 80%"
+
+        results = []
+        positions = ["https://example.com/job", "https://EXAMPLE.com/job#apply", "https://example.com/job"]
+        skill_sets = [["Python", "SQL"], ["sql", "python "], ["Python", "SQL"]]
+        threads = [
+            threading.Thread(target=lambda p=position, s=skills: results.append(
+                self.service.analyze_position(AnalysisRequest(position=p, skills=s), "test-api-key")
+            ))
+            for position, skills in zip(positions, skill_sets)
+        ]
+        for thread in threads:
+            thread.start()
+
+        flight = self.service.scrape_flight
+        while flight.executions + flight.coalesced < len(threads):
+            release.wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [{"message": "Match de 80%"}] * 3)
+        self.mock_web_scraper.fetch_meta_description.assert_called_once()
+        self.assertEqual(self.service.scrape_flight.coalesced, 2)
+
+    def test_analysis_key_uses_canonical_skills(self):
+        self.assertEqual(
+            AnalysisService._analysis_key("https://Example.com/job#a", ["Python", " SQL", "python"]),
+            AnalysisService._analysis_key("https://example.com/job", ["sql", "python"])
+        )
+        self.assertNotEqual(
+            AnalysisService._analysis_key("https://example.com/job", ["Python"]),
+            AnalysisService._analysis_key("https://example.com/job", ["Java"])
+        )
+
+    def test_from_config_shares_metrics_with_scraper(self):
+        service = AnalysisService.from_config({})
+
+        self.assertIsInstance(service.metrics, MetricsService)
+        self.assertIs(service.web_scraper.metrics, service.metrics)
+
+        default_service = AnalysisService()
+        self.assertIs(default_service.web_scraper.metrics, default_service.metrics)
+
+    def test_from_config_creates_openai_limiter(self):
+        service = AnalysisService.from_config({
+            'OPENAI_LIMITER_ENABLED': True,
+            'OPENAI_LIMITER_INITIAL_CONCURRENCY': 4,
+            'OPENAI_LIMITER_MAX_QUEUE': 2
+        })
+
+        limiter = service.openai_service.limiter
+        self.assertIsInstance(limiter, AdaptiveLimiterService)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(service.stats()['openai_limiter']['max_queue'], 2)
+        output = service.metrics.render()
+        self.assertIn('analysis_openai_queue_depth 0', output)
+        self.assertIn('analysis_openai_concurrency_limit 4', output)
+
+    def test_from_config_without_openai_limiter(self):
+        service = AnalysisService.from_config({'OPENAI_LIMITER_ENABLED': False})
+
+        self.assertIsNone(service.openai_service.limiter)
+        self.assertIsNone(service.stats()['openai_limiter'])
+        self.assertNotIn('analysis_openai_queue_depth', service.metrics.render())
+
+    def test_from_config_creates_retry_policies_and_hedging(self):
+        service = AnalysisService.from_config({
+            'SCRAPE_RETRY_MAX_ATTEMPTS': 3,
+            'SCRAPE_RETRY_BUDGET_RATIO': 0.2,
+            'SCRAPE_HEDGE_ENABLED': True,
+            'SCRAPE_HEDGE_INITIAL_DELAY': 0.5,
+            'OPENAI_RETRY_MAX_ATTEMPTS': 2
+        })
+
+        scrape_policy = service.web_scraper.retry_policy
+        self.assertIsInstance(scrape_policy, RetryPolicy)
+        self.assertEqual(scrape_policy.max_attempts, 3)
+        self.assertEqual(scrape_policy.retry_statuses, frozenset({502, 503, 504}))
+        self.assertEqual(scrape_policy.budget.ratio, 0.2)
+        self.assertTrue(service.openai_service.retry_policy.retries_status(500))
+        self.assertIsInstance(service.web_scraper.hedging, HedgedRequestService)
+        stats = service.stats()
+        self.assertEqual(stats['retries']['openai']['max_attempts'], 2)
+        self.assertEqual(stats['hedging']['delay'], 0.5)
+
+    def test_from_config_without_retries(self):
+        service = AnalysisService.from_config({})
+
+        self.assertIsNone(service.web_scraper.retry_policy)
+        self.assertIsNone(service.web_scraper.hedging)
+        self.assertEqual(service.stats()['retries'], {'scraping': None, 'openai': None})
+        self.assertIsNone(service.stats()['hedging'])
+
+    @patch('builtins.print')
+    def test_from_config_creates_circuit_breakers_and_reports_health(self, mock_print):
+        service = AnalysisService.from_config({
+            'CIRCUIT_BREAKER_ENABLED': True,
+            'SCRAPE_CIRCUIT_FAILURE_THRESHOLD': 2,
+            'OPENAI_CIRCUIT_FAILURE_THRESHOLD': 1,
+            'OPENAI_CIRCUIT_RECOVERY_TIMEOUT': 60
+        })
+
+        self.assertIsInstance(service.web_scraper.circuit_breakers, CircuitBreakerRegistry)
+        self.assertEqual(service.web_scraper.circuit_breakers.failure_threshold, 2)
+        breaker = service.openai_service.circuit_breaker
+        self.assertIsInstance(breaker, CircuitBreaker)
+        self.assertEqual(service.health()['status'], 'OK')
+        self.assertIn('analysis_openai_circuit_open 0', service.metrics.render())
+
+        breaker.record(True)
+        service.web_scraper.circuit_breakers.get('down.example.com').record(True)
+        service.web_scraper.circuit_breakers.get('down.example.com').record(True)
+
+        health = service.health()
+        self.assertEqual(health['status'], 'DEGRADED')
+        self.assertEqual(health['circuits']['openai']['state'], 'open')
+        self.assertEqual(list(health['circuits']['scraping']['breakers']), ['down.example.com'])
+        output = service.metrics.render()
+        self.assertIn('analysis_openai_circuit_open 1', output)
+        self.assertIn('analysis_scraping_open_circuits 1', output)
+
+    def test_from_config_shares_cache_backend(self):
+        service = AnalysisService.from_config({
+            'PAGE_CACHE_ENABLED': True,
+            'ANALYSIS_CACHE_ENABLED': True,
+            'CACHE_BACKEND': 'memory',
+            'CACHE_COMPRESS_THRESHOLD': 2048
+        })
+
+        backend = service.web_scraper.cache.backend
+        self.assertIsInstance(backend, MemoryCacheBackend)
+        self.assertIs(service.openai_service.cache.backend, backend)
+        self.assertEqual(service.web_scraper.cache.serializer.compress_threshold, 2048)
+        self.assertEqual(service.stats()['cache_backend']['backend'], 'memory')
+        self.assertEqual(service.stats()['cache_backend']['bytes_saved'], 0)
+
+    def test_from_config_creates_sqlite_and_redis_backends(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sqlite_backend = AnalysisService._cache_backend_from_config({
+                'CACHE_BACKEND': 'sqlite',
+                'CACHE_SQLITE_PATH': os.path.join(tmp_dir, 'cache.sqlite3'),
+                'CACHE_SQLITE_MAX_ENTRIES': 10
+            })
+            self.assertIsInstance(sqlite_backend, SqliteCacheBackend)
+            self.assertEqual(sqlite_backend.max_entries, 10)
+            sqlite_backend.close()
+
+        redis_backend = AnalysisService._cache_backend_from_config({
+            'CACHE_BACKEND': 'redis',
+            'CACHE_REDIS_URL': 'redis://cache:6380/1',
+            'CACHE_KEY_PREFIX': 'jobs:'
+        })
+        self.assertIsInstance(redis_backend, RedisCacheBackend)
+        self.assertEqual((redis_backend.host, redis_backend.port, redis_backend.key_prefix), ('cache', 6380, 'jobs:'))
+
+    def test_from_config_rejects_unknown_cache_backend(self):
+        with self.assertRaises(ValueError):
+            AnalysisService.from_config({'CACHE_BACKEND': 'memcached'})
+
+    def test_from_config_without_cache_backend(self):
+        service = AnalysisService.from_config({'PAGE_CACHE_ENABLED': True})
+
+        self.assertIsNone(service.web_scraper.cache.backend)
+        self.assertIsNone(service.stats()['cache_backend'])
+
+    def test_from_config_creates_job_service(self):
+        service = AnalysisService.from_config({
+            'JOBS_ENABLED': True,
+            'JOBS_MAX_WORKERS': 2,
+            'JOBS_MAX_QUEUE': 10,
+            'JOBS_RESULT_TTL': 60,
+            'JOBS_WEBHOOK_MAX_ATTEMPTS': 4,
+            'JOBS_WEBHOOK_ALLOWED_HOSTS': ['hooks.example.com'],
+            'CACHE_BACKEND': 'memory'
+        })
+
+        jobs = service.jobs
+        self.assertIsInstance(jobs, AnalysisJobService)
+        self.assertIs(jobs.analysis_service, service)
+        self.assertEqual((jobs.max_workers, jobs.max_queue, jobs.result_ttl), (2, 10, 60))
+        self.assertEqual(jobs.webhook_retry_policy.max_attempts, 4)
+        self.assertEqual(jobs.webhook_allowed_hosts, {'hooks.example.com'})
+        self.assertIsInstance(jobs.backend, MemoryCacheBackend)
+        self.assertEqual(service.stats()['jobs']['max_queue'], 10)
+        self.assertIn('analysis_jobs_queued 0', service.metrics.render())
+
+    def test_from_config_without_job_service(self):
+        service = AnalysisService.from_config({'JOBS_ENABLED': True, 'JOBS_WEBHOOK_MAX_ATTEMPTS': 1})
+        self.assertIsNone(service.jobs.webhook_retry_policy)
+
+        service = AnalysisService.from_config({})
+        self.assertIsNone(service.jobs)
+        self.assertIsNone(service.stats()['jobs'])
+
+    def test_from_config_creates_description_store_and_refresher(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            service = AnalysisService.from_config({
+                'DESCRIPTION_STORE_ENABLED': True,
+                'DESCRIPTION_STORE_PATH': os.path.join(tmp, 'descriptions.sqlite3'),
+                'DESCRIPTION_STORE_MAX_AGE': 120,
+                'DESCRIPTION_REFRESH_ENABLED': True,
+                'DESCRIPTION_REFRESH_INTERVAL': 60,
+                'DESCRIPTION_REFRESH_TICK': 5,
+                'DESCRIPTION_REFRESH_BATCH': 3
+            })
+
+            store, refresher = service.description_store, service.refresher
+            self.assertIsInstance(store, DescriptionStoreService)
+            self.assertEqual((store.max_age, store.refresh_interval), (120, 60))
+            self.assertIsInstance(refresher, DescriptionRefresherService)
+            self.assertIs(refresher.store, store)
+            self.assertIsNot(refresher.web_scraper, service.web_scraper)
+            self.assertEqual((refresher.interval, refresher.batch_size), (5, 3))
+            self.assertEqual(service.stats()['description_store']['entries'], 0)
+            self.assertFalse(service.stats()['refresher']['running'])
+            store.close()
+
+    def test_from_config_without_description_store(self):
+        service = AnalysisService.from_config({'DESCRIPTION_REFRESH_ENABLED': True})
+
+        self.assertIsNone(service.description_store)
+        self.assertIsNone(service.refresher)
+        self.assertIsNone(service.stats()['description_store'])
+        self.assertIsNone(service.stats()['refresher'])
+
+    def test_analyze_position_uses_description_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.service.description_store = DescriptionStoreService(os.path.join(tmp, 'd.sqlite3'))
+            self.service.refresher = Mock()
+            self.mock_web_scraper.fetch_description.return_value = FetchedDescription("Vaga", '"v1"')
+            self.mock_text_processor.format_description.return_value = "Vaga formatada"
+            self.mock_openai_service.analyze_match.return_value = "Match"
+            request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
+
+            self.service.analyze_position(request, "key")
+            self.service.analyze_position(request, "key")
+
+            self.mock_web_scraper.fetch_description.assert_called_once_with("https://example.com/job")
+            self.mock_web_scraper.fetch_meta_description.assert_not_called()
+            self.mock_text_processor.format_description.assert_called_once_with("Vaga")
+            self.mock_openai_service.analyze_match.assert_called_with(["Python"], "Vaga formatada", "key", None)
+            self.assertEqual(self.service.description_store.get(request.position).etag, '"v1"')
+            self.assertEqual(self.service.refresher.ensure_started.call_count, 2)
+            self.service.description_store.close()
+
+    @patch('builtins.print')
+    def test_refresher_starts_on_warm_description_store(self, mock_print):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.service.description_store = DescriptionStoreService(os.path.join(tmp, 'd.sqlite3'))
+            self.service.description_store.put("https://example.com/job", "Vaga", '"v1"', None)
+            self.service.refresher = Mock()
+            self.mock_openai_service.analyze_match.return_value = "Match"
+
+            self.service.analyze_position(AnalysisRequest(position="https://example.com/job", skills=["Python"]), "key")
+
+            self.mock_web_scraper.fetch_description.assert_not_called()
+            self.service.refresher.ensure_started.assert_called_once()
+            self.service.description_store.close()
+
+    @patch('builtins.print')
+    def test_description_store_does_not_keep_missing_descriptions(self, mock_print):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.service.description_store = DescriptionStoreService(os.path.join(tmp, 'd.sqlite3'))
+            self.mock_web_scraper.fetch_description.return_value = FetchedDescription(None)
+
+            with self.assertRaises(ValueError):
+                self.service.stream_position(AnalysisRequest(position="https://example.com/job", skills=[]), "key")
+
+            self.assertEqual(self.service.description_store.stats()['entries'], 0)
+            self.service.description_store.close()
+
+    def test_from_config_selects_parser_backend(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            service = AnalysisService.from_config({
+                'HTML_PARSER_BACKEND': 'regex',
+                'DESCRIPTION_STORE_ENABLED': True,
+                'DESCRIPTION_STORE_PATH': os.path.join(tmp, 'd.sqlite3'),
+                'DESCRIPTION_REFRESH_ENABLED': True
+            })
+
+            self.assertEqual(service.web_scraper.parser_backend, 'regex')
+            self.assertEqual(service.refresher.web_scraper.parser_backend, 'regex')
+            self.assertEqual(service.refresher.web_scraper.structured_data_max_bytes, 0)
+            service.description_store.close()
+
+        self.assertEqual(AnalysisService.from_config({}).web_scraper.parser_backend, 'html.parser')
+        with self.assertRaises(ValueError):
+            AnalysisService.from_config({'HTML_PARSER_BACKEND': 'html5lib'})
+
+    def test_from_config_enables_openai_batcher(self):
+        service = AnalysisService.from_config({'OPENAI_BATCH_ENABLED': True, 'OPENAI_BATCH_WINDOW': 0.02})
+
+        self.assertIsInstance(service.openai_service.batcher, ProfileBatcherService)
+        self.assertEqual(service.stats()['openai_batcher']['window'], 0.02)
+        self.assertIn('analysis_openai_calls_saved_by_batching 0', service.metrics.render())
+        self.assertIsNone(AnalysisService.from_config({}).openai_service.batcher)
+
+    def test_from_config_enables_prompt_budget(self):
+        service = AnalysisService.from_config({'PROMPT_BUDGET_ENABLED': True, 'PROMPT_BUDGET_MAX_DESCRIPTION_TOKENS': 800})
+
+        self.assertEqual(service.openai_service.budget.max_description_tokens, 800)
+        self.assertEqual(service.stats()['prompt_budget']['tokens_saved'], 0)
+        self.assertIn('analysis_prompt_tokens_saved 0', service.metrics.render())
+        self.assertIn('analysis_prompt_compression_ratio 1.0', service.metrics.render())
+        self.assertIsNone(AnalysisService.from_config({}).stats()['prompt_budget'])
+
+    def test_from_config_enables_semantic_cache(self):
+        service = AnalysisService.from_config({'SEMANTIC_CACHE_ENABLED': True, 'SEMANTIC_CACHE_THRESHOLD': 0.9})
+
+        self.assertEqual(service.openai_service.semantic_cache.threshold, 0.9)
+        self.assertEqual(service.stats()['semantic_cache']['hits'], 0)
+        self.assertIn('analysis_semantic_cache_reuse_ratio 0', service.metrics.render())
+        self.assertIn('analysis_semantic_cache_mean_similarity 0', service.metrics.render())
+        self.assertIsNone(AnalysisService.from_config({}).openai_service.semantic_cache)
+        self.assertIsNone(AnalysisService.from_config({}).stats()['semantic_cache'])
+
+    def test_from_config_enables_structured_data(self):
+        service = AnalysisService.from_config({'STRUCTURED_DATA_ENABLED': True, 'STRUCTURED_DATA_MAX_BYTES': 4096})
+
+        self.assertEqual(service.web_scraper.structured_data_max_bytes, 4096)
+        self.assertEqual(AnalysisService.from_config({}).web_scraper.structured_data_max_bytes, 0)
+
+    def test_health_without_circuit_breakers(self):
+        self.assertEqual(AnalysisService().health(), {'status': 'OK', 'circuits': {'scraping': None, 'openai': None}})
+
+    def test_analyze_position_records_stage_metrics(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
+        self.mock_text_processor.format_description.return_value = "Job description"
+        self.mock_openai_service.analyze_match.return_value = "Match"
+
+        self.service.analyze_position(AnalysisRequest(position="https://example.com/job", skills=[]), "key")
+
+        durations = self.service.metrics.stage_duration.snapshot()
+        self.assertEqual(durations[('format',)][2], 1)
+        self.assertEqual(durations[('completion',)][2], 1)
+        self.assertEqual(self.service.metrics.stage_errors.snapshot(), {})
+
+    @patch('builtins.print')
+    def test_analyze_position_counts_errors_by_stage(self, mock_print):
+        request = AnalysisRequest(position="https://example.com/job", skills=[])
+        self.mock_text_processor.format_description.return_value = "Job description"
+
+        self.mock_web_scraper.fetch_meta_description.side_effect = requests.exceptions.Timeout("timeout")
+        with self.assertRaises(requests.exceptions.Timeout):
+            self.service.analyze_position(request, "key")
+
+        self.mock_web_scraper.fetch_meta_description.side_effect = None
+        self.mock_web_scraper.fetch_meta_description.return_value = None
+        with self.assertRaises(ValueError):
+            self.service.analyze_position(request, "key")
+
+        self.mock_web_scraper.fetch_meta_description.return_value = "Job description"
+        self.mock_openai_service.analyze_match.side_effect = requests.exceptions.HTTPError("500")
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.service.analyze_position(request, "key")
+
+        self.assertEqual(self.service.metrics.stage_errors.snapshot(), {
+            ('fetch',): 1,
+            ('extract',): 1,
+            ('completion',): 1
+        })
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncAdaptiveLimiterService, UpstreamOverloadedError
+
+
+class TestAsyncAdaptiveLimiterService(unittest.IsolatedAsyncioTestCase):
+
+    async def test_waiter_gets_slot_after_release(self):
+        limiter = AsyncAdaptiveLimiterService(initial_limit=1, queue_timeout=5)
+        await limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        self.assertEqual(limiter.stats()['queued'], 1)
+
+        await limiter.release()
+        await waiter
+
+        self.assertEqual(limiter.stats()['in_flight'], 1)
+        self.assertEqual(limiter.stats()['queued'], 0)
+
+    @patch('builtins.print')
+    async def test_rejects_when_queue_is_full(self, mock_print):
+        limiter = AsyncAdaptiveLimiterService(initial_limit=1, max_queue=0)
+        await limiter.acquire()
+
+        with self.assertRaises(UpstreamOverloadedError):
+            await limiter.acquire()
+
+        self.assertEqual(limiter.stats()['rejected'], 1)
+
+    @patch('builtins.print')
+    async def test_rejects_after_queue_timeout(self, mock_print):
+        limiter = AsyncAdaptiveLimiterService(initial_limit=1, queue_timeout=0.02)
+        await limiter.acquire()
+
+        with self.assertRaises(UpstreamOverloadedError):
+            await limiter.acquire()
+
+        self.assertEqual(limiter.stats()['queued'], 0)
+
+    async def test_waits_for_rate_limit_reset(self):
+        limiter = AsyncAdaptiveLimiterService()
+        limiter.record(200, {'x-ratelimit-remaining-requests': '0', 'x-ratelimit-reset-requests': '30ms'})
+
+        started = time.monotonic()
+        await limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.02)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import json
+import httpx
+from unittest.mock import AsyncMock, Mock, patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models import AnalysisRequest, AnalysisJob
+from src.services import AsyncAnalysisJobService, AsyncRetryPolicy
+
+
+@patch('builtins.print')
+class TestAsyncAnalysisJobService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.analysis_service = Mock()
+        self.analysis_service.analyze_position = AsyncMock(return_value={'message': 'Match de 80%'})
+        self.webhooks = []
+        self.webhook_statuses = []
+        self.request = AnalysisRequest(position='https://example.com/job', skills=['Python'])
+        resolver = patch('socket.getaddrinfo', return_value=[(2, 1, 6, '', ('93.184.216.34', 443))])
+        self.getaddrinfo = resolver.start()
+        self.addCleanup(resolver.stop)
+
+    def _service(self, **kwargs):
+        def handler(request):
+            self.webhooks.append(json.loads(request.content))
+            return httpx.Response(self.webhook_statuses.pop(0) if self.webhook_statuses else 200)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncAnalysisJobService(self.analysis_service, max_workers=2, client=client, **kwargs)
+
+    async def test_submit_runs_analysis_in_worker(self, mock_print):
+        service = self._service()
+
+        job = service.submit(self.request, 'key', 'https://api')
+        self.assertEqual(job.status, AnalysisJob.QUEUED)
+        await service.join()
+
+        self.assertEqual(service.get(job.id).result, {'message': 'Match de 80%'})
+        self.assertEqual(service.stats()['succeeded'], 1)
+        self.assertEqual(len(service._workers), 2)
+        await service.aclose()
+        self.assertEqual(service._workers, [])
+
+    async def test_failed_analysis_uses_httpx_errors(self, mock_print):
+        self.analysis_service.analyze_position.side_effect = httpx.ConnectTimeout("lento")
+        service = self._service()
+
+        job = service.submit(self.request, 'key')
+        await service.join()
+
+        self.assertEqual(job.status, AnalysisJob.FAILED)
+        self.assertEqual(job.error, {'error': 'Erro ao acessar a URL: lento', 'status': 500})
+        await service.aclose()
+
+    async def test_webhook_is_retried_then_delivered(self, mock_print):
+        self.webhook_statuses = [503, 200]
+        service = self._service(webhook_retry_policy=AsyncRetryPolicy('webhook', base_delay=0, max_delay=0))
+
+        job = service.submit(self.request, 'key', callback_url='https://client.example.com/hook')
+        await service.join()
+
+        self.assertEqual(len(self.webhooks), 2)
+        self.assertEqual(self.webhooks[-1]['id'], job.id)
+        self.assertEqual(self.webhooks[-1]['result'], {'message': 'Match de 80%'})
+        self.assertTrue(job.callback_delivered)
+        await service.aclose()
+
+    async def test_webhook_failure_is_recorded(self, mock_print):
+        self.webhook_statuses = [500]
+        service = self._service()
+
+        job = service.submit(self.request, 'key', callback_url='https://client.example.com/hook')
+        await service.join()
+
+        self.assertFalse(job.callback_delivered)
+        self.assertEqual(service.stats()['webhooks'], {'delivered': 0, 'failed': 1})
+        await service.aclose()
+
+    async def test_webhook_redirect_is_not_followed(self, mock_print):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(str(request.url))
+            return httpx.Response(308, headers={'Location': 'http://127.0.0.1:8080/internal'})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+        service = AsyncAnalysisJobService(self.analysis_service, client=client)
+
+        job = service.submit(self.request, 'key', callback_url='https://client.example.com/hook')
+        await service.join()
+
+        self.assertEqual(requests_seen, ['https://client.example.com/hook'])
+        self.assertFalse(job.callback_delivered)
+        await service.aclose()
+
+    async def test_webhook_to_internal_address_is_not_sent(self, mock_print):
+        self.getaddrinfo.return_value = [(2, 1, 6, '', ('127.0.0.1', 80))]
+        service = self._service()
+
+        job = service.submit(self.request, 'key', callback_url='http://127.0.0.1:8080/hook')
+        await service.join()
+
+        self.assertEqual(self.webhooks, [])
+        self.assertFalse(job.callback_delivered)
+        await service.aclose()
+
+    async def test_default_client_and_idle_close(self, mock_print):
+        service = AsyncAnalysisJobService(self.analysis_service, webhook_timeout=2.0)
+
+        await service.join()
+        self.assertIsInstance(service._get_client(), httpx.AsyncClient)
+        await service.aclose()
+        self.assertIsNone(service.client)
+
+
+if __name__ == '__main__':
+    unittest.main()
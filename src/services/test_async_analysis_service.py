@@ -0,0 +1,299 @@
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+import httpx
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncAnalysisService, AsyncWebScrapingService, AsyncOpenAIService, AsyncAdaptiveLimiterService, AsyncRetryPolicy, AsyncHedgedRequestService, AsyncCircuitBreaker, AsyncAnalysisJobService, DescriptionStoreService, FetchedDescription, SkillTaxonomy, AsyncProfileBatcherService
+from src.models import AnalysisRequest, BatchAnalysisRequest
+
+
+class TestAsyncAnalysisService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.mock_web_scraper = Mock()
+        self.mock_web_scraper.fetch_meta_description = AsyncMock()
+        self.mock_web_scraper.aclose = AsyncMock()
+        self.mock_openai_service = Mock()
+        self.mock_openai_service.analyze_match = AsyncMock(return_value="Match de 85%")
+        self.mock_openai_service.aclose = AsyncMock()
+
+        self.service = AsyncAnalysisService(web_scraper=self.mock_web_scraper, openai_service=self.mock_openai_service)
+
+    def test_init_creates_async_services(self):
+        service = AsyncAnalysisService()
+
+        self.assertIsInstance(service.web_scraper, AsyncWebScrapingService)
+        self.assertIsInstance(service.openai_service, AsyncOpenAIService)
+        self.assertIsNotNone(service.text_processor)
+
+    def test_from_config_creates_async_services(self):
+        service = AsyncAnalysisService.from_config({
+            'REQUEST_TIMEOUT': 3,
+            'PAGE_CACHE_ENABLED': True,
+            'ANALYSIS_CACHE_ENABLED': True
+        })
+
+        self.assertIsInstance(service.web_scraper, AsyncWebScrapingService)
+        self.assertIsInstance(service.openai_service, AsyncOpenAIService)
+        self.assertEqual(service.web_scraper.timeout, 3)
+        self.assertIsNotNone(service.web_scraper.cache)
+        self.assertIsNotNone(service.openai_service.cache)
+        self.assertEqual(AsyncAnalysisService.from_config({'HTML_PARSER_BACKEND': 'regex'}).web_scraper.parser_backend, 'regex')
+        self.assertEqual(
+            AsyncAnalysisService.from_config({'STRUCTURED_DATA_ENABLED': True}).web_scraper.structured_data_max_bytes,
+            256 * 1024
+        )
+        self.assertIsNotNone(AsyncAnalysisService.from_config({'SEMANTIC_CACHE_ENABLED': True}).openai_service.semantic_cache)
+        self.assertEqual(AsyncAnalysisService.from_config({'PRESCORE_GATE_BELOW': 10}).scorer.gate_below, 10)
+        self.assertIsNotNone(AsyncAnalysisService.from_config({'SKILL_TAXONOMY_ENABLED': True}).taxonomy)
+        self.assertIsNotNone(AsyncAnalysisService.from_config({'PROMPT_BUDGET_ENABLED': True}).openai_service.budget)
+        self.assertIsInstance(
+            AsyncAnalysisService.from_config({'OPENAI_BATCH_ENABLED': True}).openai_service.batcher, AsyncProfileBatcherService
+        )
+
+    async def test_from_config_creates_async_job_service(self):
+        service = AsyncAnalysisService.from_config({'JOBS_ENABLED': True})
+
+        self.assertIsInstance(service.jobs, AsyncAnalysisJobService)
+        self.assertIsInstance(service.jobs.webhook_retry_policy, AsyncRetryPolicy)
+        self.assertIsInstance(service.jobs.client, httpx.AsyncClient)
+        await service.aclose()
+        self.assertIsNone(service.jobs.client)
+
+    def test_from_config_shares_cache_backend(self):
+        service = AsyncAnalysisService.from_config({
+            'PAGE_CACHE_ENABLED': True,
+            'ANALYSIS_CACHE_ENABLED': True,
+            'CACHE_BACKEND': 'memory'
+        })
+
+        self.assertIsNotNone(service.web_scraper.cache.backend)
+        self.assertIs(service.openai_service.cache.backend, service.web_scraper.cache.backend)
+
+    def test_from_config_creates_async_limiter(self):
+        service = AsyncAnalysisService.from_config({'OPENAI_LIMITER_ENABLED': True})
+
+        self.assertIsInstance(service.openai_service.limiter, AsyncAdaptiveLimiterService)
+        self.assertEqual(service.stats()['openai_limiter']['in_flight'], 0)
+
+    def test_from_config_creates_async_retry_policies(self):
+        service = AsyncAnalysisService.from_config({
+            'SCRAPE_RETRY_MAX_ATTEMPTS': 3,
+            'SCRAPE_HEDGE_ENABLED': True,
+            'OPENAI_RETRY_MAX_ATTEMPTS': 2
+        })
+
+        self.assertIsInstance(service.web_scraper.retry_policy, AsyncRetryPolicy)
+        self.assertIsInstance(service.web_scraper.hedging, AsyncHedgedRequestService)
+        self.assertIsInstance(service.openai_service.retry_policy, AsyncRetryPolicy)
+
+    def test_from_config_creates_async_circuit_breakers(self):
+        service = AsyncAnalysisService.from_config({'CIRCUIT_BREAKER_ENABLED': True})
+
+        self.assertIsInstance(service.openai_service.circuit_breaker, AsyncCircuitBreaker)
+        self.assertIs(service.web_scraper.circuit_breakers.breaker_class, AsyncCircuitBreaker)
+
+    async def test_analyze_position_success(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "  Vaga   Python "
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
+        result = await self.service.analyze_position(request, "api-key", "https://test-api.com")
+
+        self.assertEqual(result, {"message": "Match de 85%"})
+        self.mock_web_scraper.fetch_meta_description.assert_awaited_once_with("https://example.com/job")
+        self.mock_openai_service.analyze_match.assert_awaited_once_with(
+            ["Python"], "Vaga Python", "api-key", "https://test-api.com"
+        )
+
+    @patch('builtins.print')
+    async def test_analyze_position_no_meta_description(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = None
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
+
+        with self.assertRaises(ValueError):
+            await self.service.analyze_position(request, "api-key")
+
+        self.mock_openai_service.analyze_match.assert_not_awaited()
+        mock_print.assert_called_with("[ANALYSIS] ERRO: Meta description não encontrada")
+
+    @patch('builtins.print')
+    async def test_analyze_batch(self, mock_print):
+        async def fetch(position):
+            return None if position.endswith("/missing") else "Vaga"
+
+        self.mock_web_scraper.fetch_meta_description.side_effect = fetch
+        self.service.batch_max_concurrency = 1
+
+        request = BatchAnalysisRequest(
+            positions=["https://example.com/a", "https://example.com/a#x", "https://example.com/missing"],
+            skills=["Python"]
+        )
+        results = await self.service.analyze_batch(request, "api-key", "https://test-api.com")
+
+        self.assertEqual(list(results.keys()), ["https://example.com/a", "https://example.com/missing"])
+        self.assertEqual(results["https://example.com/a"], {"message": "Match de 85%"})
+        self.assertIsInstance(results["https://example.com/missing"], ValueError)
+        self.mock_openai_service.analyze_match.assert_awaited_once()
+
+    @patch('builtins.print')
+    async def test_analyze_batch_reports_malformed_position_per_item(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga"
+
+        request = BatchAnalysisRequest(positions=["https://example.com/a", "https://a.example.com:99999/x"], skills=["Python"])
+        results = await self.service.analyze_batch(request, "api-key", "https://test-api.com")
+
+        self.assertEqual(results["https://example.com/a"], {"message": "Match de 85%"})
+        self.assertIsInstance(results["https://a.example.com:99999/x"], ValueError)
+
+    async def test_analyze_position_coalesces_concurrent_requests(self):
+        import asyncio
+
+        async def slow_fetch(position):
+            await asyncio.sleep(0.01)
+            return "Vaga"
+
+        async def slow_analysis(skills, description, api_key, api_url):
+            await asyncio.sleep(0.01)
+            return "Match de 85%"
+
+        self.mock_web_scraper.fetch_meta_description.side_effect = slow_fetch
+        self.mock_openai_service.analyze_match.side_effect = slow_analysis
+
+        requests = [
+            AnalysisRequest(position="https://example.com/job", skills=["Python", "SQL"]),
+            AnalysisRequest(position="https://example.com/job#apply", skills=["sql", "python"]),
+            AnalysisRequest(position="https://example.com/job", skills=["Java"])
+        ]
+        results = await asyncio.gather(*(self.service.analyze_position(r, "api-key") for r in requests))
+
+        self.assertEqual(results, [{"message": "Match de 85%"}] * 3)
+        self.mock_web_scraper.fetch_meta_description.assert_awaited_once()
+        self.assertEqual(self.mock_openai_service.analyze_match.await_count, 2)
+        self.assertEqual(self.service.analysis_flight.coalesced, 1)
+
+    @patch('builtins.print')
+    async def test_analyze_position_records_stage_metrics(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga"
+
+        await self.service.analyze_position(AnalysisRequest(position="https://example.com/a", skills=[]), "api-key")
+
+        self.mock_web_scraper.fetch_meta_description.side_effect = httpx.ConnectError("falhou")
+        with self.assertRaises(httpx.ConnectError):
+            await self.service.analyze_position(AnalysisRequest(position="https://example.com/b", skills=[]), "api-key")
+
+        self.assertEqual(self.service.metrics.stage_duration.snapshot()[('completion',)][2], 1)
+        self.assertEqual(self.service.metrics.stage_errors.snapshot(), {('fetch',): 1})
+
+    def test_default_scraper_shares_metrics(self):
+        service = AsyncAnalysisService()
+
+        self.assertIs(service.web_scraper.metrics, service.metrics)
+
+    async def test_stream_position(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga"
+        sentinel = object()
+        self.mock_openai_service.stream_match = Mock(return_value=sentinel)
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
+        result = await self.service.stream_position(request, "api-key", "https://test-api.com")
+
+        self.assertIs(result, sentinel)
+        self.mock_openai_service.stream_match.assert_called_once_with(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+    async def test_stream_position_keeps_skills_with_taxonomy(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga"
+        self.mock_openai_service.stream_match = Mock()
+        self.service.taxonomy = SkillTaxonomy.compile({'PostgreSQL': ['postgres']})
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Postgres", "postgresql"])
+        await self.service.stream_position(request, "api-key")
+
+        self.assertEqual(self.mock_openai_service.stream_match.call_args[0][0], ["Postgres", "postgresql"])
+
+    async def test_fast_mode_scores_locally(self):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga Python"
+        self.mock_openai_service.stream_match = Mock()
+
+        request = AnalysisRequest(position="https://example.com/job", skills=["Python"], mode='fast')
+        result = await self.service.analyze_position(request, "api-key")
+        chunks = [chunk async for chunk in await self.service.stream_position(request, "api-key")]
+
+        self.assertEqual(result['match_percentage'], 100)
+        self.assertEqual(chunks, [result['message']])
+        self.mock_openai_service.analyze_match.assert_not_awaited()
+        self.mock_openai_service.stream_match.assert_not_called()
+
+    @patch('builtins.print')
+    async def test_analyze_batch_forwards_mode(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = "Vaga Java"
+
+        request = BatchAnalysisRequest(positions=["https://example.com/a"], skills=["Python"], mode='fast')
+        results = await self.service.analyze_batch(request, "api-key")
+
+        self.assertEqual(results["https://example.com/a"]['missing_skills'], ["Python"])
+        self.mock_openai_service.analyze_match.assert_not_awaited()
+
+    @patch('builtins.print')
+    async def test_stream_position_no_meta_description(self, mock_print):
+        self.mock_web_scraper.fetch_meta_description.return_value = None
+
+        with self.assertRaises(ValueError):
+            await self.service.stream_position(AnalysisRequest(position="https://example.com/job", skills=[]), "api-key")
+
+    async def test_analyze_position_uses_description_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.service.description_store = DescriptionStoreService(os.path.join(tmp, 'd.sqlite3'))
+            self.mock_web_scraper.fetch_description = AsyncMock(return_value=FetchedDescription("Vaga", '"v1"'))
+            request = AnalysisRequest(position="https://example.com/job", skills=["Python"])
+
+            await self.service.analyze_position(request, "api-key")
+            await self.service.analyze_position(request, "api-key")
+
+            self.mock_web_scraper.fetch_description.assert_awaited_once_with("https://example.com/job")
+            self.mock_web_scraper.fetch_meta_description.assert_not_called()
+            self.mock_openai_service.analyze_match.assert_awaited_with(["Python"], "Vaga", "api-key", None)
+
+    async def test_refresher_starts_on_warm_description_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.service.description_store = DescriptionStoreService(os.path.join(tmp, 'd.sqlite3'))
+            self.service.description_store.put("https://example.com/job", "Vaga", '"v1"', None)
+            self.service.refresher = Mock()
+            self.mock_web_scraper.fetch_description = AsyncMock()
+
+            await self.service.analyze_position(AnalysisRequest(position="https://example.com/job", skills=["Python"]), "api-key")
+
+            self.mock_web_scraper.fetch_description.assert_not_awaited()
+            self.service.refresher.ensure_started.assert_called_once()
+            self.service.description_store.close()
+
+    async def test_from_config_creates_description_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            service = AsyncAnalysisService.from_config({
+                'DESCRIPTION_STORE_ENABLED': True,
+                'DESCRIPTION_STORE_PATH': os.path.join(tmp, 'descriptions.sqlite3'),
+                'DESCRIPTION_REFRESH_ENABLED': True
+            })
+
+            self.assertIsInstance(service.description_store, DescriptionStoreService)
+            self.assertNotIsInstance(service.refresher.web_scraper, AsyncWebScrapingService)
+            service.refresher.ensure_started()
+            await service.aclose()
+            self.assertFalse(service.refresher.stats()['running'])
+
+    def test_from_config_sets_batch_concurrency(self):
+        service = AsyncAnalysisService.from_config({'BATCH_MAX_CONCURRENCY': 8})
+        self.assertEqual(service.batch_max_concurrency, 8)
+
+    async def test_aclose_closes_clients(self):
+        await self.service.aclose()
+
+        self.mock_web_scraper.aclose.assert_awaited_once()
+        self.mock_openai_service.aclose.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncCircuitBreaker, CircuitOpenError
+
+
+class TestAsyncCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+
+    @patch('builtins.print')
+    async def test_opens_after_failures_and_fails_fast(self, mock_print):
+        breaker = AsyncCircuitBreaker('openai', failure_threshold=1, recovery_timeout=30)
+
+        async def failing():
+            raise ConnectionError("reset")
+
+        with self.assertRaises(ConnectionError):
+            await breaker.call(failing, lambda e: True)
+        with self.assertRaises(CircuitOpenError):
+            await breaker.call(failing, lambda e: True)
+
+        self.assertEqual(breaker.stats()['rejected'], 1)
+
+    @patch('builtins.print')
+    async def test_cancelled_probe_releases_slot(self, mock_print):
+        breaker = AsyncCircuitBreaker('openai', failure_threshold=1, recovery_timeout=0)
+        breaker.record(True)
+
+        async def slow():
+            await asyncio.sleep(5)
+
+        task = asyncio.ensure_future(breaker.call(slow, lambda e: True))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        async def ok():
+            return "ok"
+
+        self.assertEqual(await breaker.call(ok, lambda e: True), "ok")
+        self.assertEqual(breaker.state, AsyncCircuitBreaker.CLOSED)
+
+
+if __name__ == '__main__':
+    unittest.main()
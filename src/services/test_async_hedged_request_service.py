@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncHedgedRequestService, RetryBudget
+
+
+class TestAsyncHedgedRequestService(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fast_primary_is_not_hedged(self):
+        hedging = AsyncHedgedRequestService(initial_delay=1)
+
+        async def operation():
+            return "ok"
+
+        self.assertEqual(await hedging.run(operation), "ok")
+        self.assertEqual(hedging.stats()['hedged'], 0)
+
+    @patch('builtins.print')
+    async def test_slow_primary_is_hedged_and_cancelled(self, mock_print):
+        hedging = AsyncHedgedRequestService(initial_delay=0.01, min_delay=0.01)
+        cancelled = []
+        calls = []
+
+        async def operation():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+            return f"call {len(calls)}"
+
+        result = await hedging.run(operation)
+        await asyncio.sleep(0)
+
+        self.assertEqual(result, "call 2")
+        self.assertEqual(hedging.stats()['hedge_wins'], 1)
+        self.assertEqual(cancelled, [1])
+
+    @patch('builtins.print')
+    async def test_raises_when_both_requests_fail(self, mock_print):
+        hedging = AsyncHedgedRequestService(initial_delay=0.01, min_delay=0.01)
+
+        async def operation():
+            await asyncio.sleep(0.02)
+            raise ConnectionError("reset")
+
+        with self.assertRaises(ConnectionError):
+            await hedging.run(operation)
+
+    async def test_exhausted_budget_waits_for_primary(self):
+        budget = RetryBudget(ratio=0, min_per_second=0, max_balance=0)
+        hedging = AsyncHedgedRequestService(initial_delay=0.01, min_delay=0.01, budget=budget)
+
+        async def operation():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        self.assertEqual(await hedging.run(operation), "ok")
+        self.assertEqual(hedging.stats()['hedged'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,362 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import json
+import httpx
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncOpenAIService, AnalysisCacheService, SemanticCacheService, PromptBudgetService, AsyncProfileBatcherService, AsyncAdaptiveLimiterService, UpstreamOverloadedError, AsyncRetryPolicy, AsyncCircuitBreaker, CircuitOpenError
+
+
+class TestAsyncOpenAIService(unittest.IsolatedAsyncioTestCase):
+
+    def _service(self, handler, cache=None):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncOpenAIService(cache=cache, client=client)
+
+    async def test_init_defaults(self):
+        service = AsyncOpenAIService()
+        self.assertIsNone(service.cache)
+        self.assertIsInstance(service._get_client(), httpx.AsyncClient)
+        await service.aclose()
+        self.assertIsNone(service.client)
+
+    @patch('builtins.print')
+    async def test_analyze_match_success(self, mock_print):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Match de 85%"}}]})
+
+        service = self._service(handler)
+
+        result = await service.analyze_match(["Python", "Flask"], "Vaga Python", "api-key", "https://test-api.com")
+
+        self.assertEqual(result, "Match de 85%")
+        payload = json.loads(requests_seen[0].content)
+        self.assertEqual(payload["messages"][1]["content"], "Habilidades do candidato: Python, Flask\nDescrição da vaga: Vaga Python")
+        self.assertEqual(payload["max_completion_tokens"], 1000)
+        self.assertEqual(requests_seen[0].headers["api-key"], "api-key")
+        mock_print.assert_any_call("[OPENAI] Análise concluída com sucesso")
+
+    @patch('builtins.print')
+    async def test_analyze_match_applies_prompt_budget(self, mock_print):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Match"}}]})
+
+        service = AsyncOpenAIService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                     budget=PromptBudgetService())
+
+        await service.analyze_match(["Python"], "Vaga Python. Aceite os cookies.", "api-key", "https://test-api.com")
+
+        payload = json.loads(requests_seen[0].content)
+        self.assertEqual(payload["messages"][1]["content"], "Habilidades do candidato: Python\nDescrição da vaga: Vaga Python.")
+        self.assertEqual(payload["max_completion_tokens"], 288)
+        await service.aclose()
+
+    @patch('builtins.print')
+    async def test_concurrent_profiles_share_one_completion(self, mock_print):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            content = {"analyses": [{"profile": 1, "analysis": "Match A"}, {"profile": 2, "analysis": "Match B"}]}
+            return httpx.Response(200, json={"choices": [{"message": {"content": json.dumps(content)}}]})
+
+        service = AsyncOpenAIService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                     batcher=AsyncProfileBatcherService(window=0.01))
+
+        results = await asyncio.gather(
+            service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com"),
+            service.analyze_match(["Java"], "Vaga", "api-key", "https://test-api.com")
+        )
+
+        self.assertEqual(results, ["Match A", "Match B"])
+        self.assertEqual(len(requests_seen), 1)
+        self.assertEqual(service.batcher.stats()['calls_saved'], 1)
+        await service.aclose()
+
+    @patch('builtins.print')
+    async def test_analyze_match_no_api_url_configured(self, mock_print):
+        service = self._service(lambda request: httpx.Response(200))
+        service.api_url = ""
+
+        with self.assertRaises(ValueError):
+            await service.analyze_match(["Python"], "Vaga", "api-key", None)
+
+    @patch('builtins.print')
+    async def test_analyze_match_http_error(self, mock_print):
+        service = self._service(lambda request: httpx.Response(503, text="Service Unavailable"))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        mock_print.assert_any_call("[OPENAI] ERRO: Status code 503")
+        mock_print.assert_any_call("[OPENAI] Response Content: Service Unavailable")
+
+    @patch('builtins.print')
+    async def test_analyze_match_request_error(self, mock_print):
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        service = self._service(handler)
+
+        with self.assertRaises(httpx.ConnectError):
+            await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        mock_print.assert_any_call("[OPENAI] ERRO de requisição: Connection failed")
+
+    @patch('builtins.print')
+    async def test_analyze_match_invalid_response(self, mock_print):
+        service = self._service(lambda request: httpx.Response(200, json={"choices": []}))
+
+        with self.assertRaises(ValueError):
+            await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        mock_print.assert_any_call("[OPENAI] ERRO: Resposta da OpenAI inválida")
+
+    @patch('builtins.print')
+    async def test_analyze_match_uses_cache(self, mock_print):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Match de 70%"}}]})
+
+        service = self._service(handler, cache=AnalysisCacheService())
+
+        await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+        result = await service.analyze_match(["python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(result, "Match de 70%")
+        self.assertEqual(len(calls), 1)
+
+    @patch('builtins.print')
+    async def test_analyze_match_uses_semantic_cache(self, mock_print):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Match de 70%"}}]})
+
+        semantic_cache = SemanticCacheService()
+        service = AsyncOpenAIService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                     semantic_cache=semantic_cache)
+
+        await service.analyze_match(["Python", "Flask", "Docker"], "Vaga", "api-key", "https://test-api.com")
+        result = await service.analyze_match(["python", "flask", "docker", "git"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(result, "Match de 70%")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(semantic_cache.stats()['hits'], 1)
+
+
+class TestAsyncOpenAIServiceStreaming(unittest.IsolatedAsyncioTestCase):
+
+    def _service(self, handler, cache=None):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncOpenAIService(cache=cache, client=client)
+
+    async def _collect(self, iterator):
+        return [chunk async for chunk in iterator]
+
+    @patch('builtins.print')
+    async def test_stream_match_yields_deltas(self, mock_print):
+        body = (
+            'data: {"choices": [{"delta": {"content": "Match "}}]}\n\n'
+            'data: {"choices": []}\n\n'
+            'data: {"choices": [{"delta": {"content": "de 90%"}}]}\n\n'
+            'data: [DONE]\n\n'
+        )
+        received = []
+
+        def handler(request):
+            received.append(json.loads(request.content))
+            return httpx.Response(200, text=body, headers={'Content-Type': 'text/event-stream'})
+
+        cache = AnalysisCacheService()
+        service = self._service(handler, cache=cache)
+
+        chunks = await self._collect(service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+        cached = await self._collect(service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertEqual(chunks, ["Match ", "de 90%"])
+        self.assertEqual(cached, ["Match de 90%"])
+        self.assertTrue(received[0]["stream"])
+        self.assertEqual(len(received), 1)
+
+    @patch('builtins.print')
+    async def test_stream_match_http_error(self, mock_print):
+        service = self._service(lambda request: httpx.Response(503, text="Service Unavailable"))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self._collect(service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        mock_print.assert_any_call("[OPENAI] Response Content: Service Unavailable")
+
+    @patch('builtins.print')
+    async def test_stream_match_request_error(self, mock_print):
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        with self.assertRaises(httpx.ConnectError):
+            await self._collect(self._service(handler).stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        mock_print.assert_any_call("[OPENAI] ERRO de requisição: Connection failed")
+
+    @patch('builtins.print')
+    async def test_stream_match_invalid_chunk(self, mock_print):
+        service = self._service(lambda request: httpx.Response(200, text="data: not-json\n\n"))
+
+        with self.assertRaises(ValueError):
+            await self._collect(service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+
+class TestAsyncOpenAIServiceWithLimiter(unittest.IsolatedAsyncioTestCase):
+
+    def _service(self, handler):
+        self.limiter = AsyncAdaptiveLimiterService(initial_limit=4)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncOpenAIService(client=client, limiter=self.limiter)
+
+    @patch('builtins.print')
+    async def test_analyze_match_records_success(self, mock_print):
+        service = self._service(lambda request: httpx.Response(200, json={"choices": [{"message": {"content": "Match"}}]}))
+
+        self.assertEqual(await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com"), "Match")
+
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+        self.assertEqual(self.limiter.stats()['limit'], 4.25)
+
+    @patch('builtins.print')
+    async def test_analyze_match_throttled_raises_overloaded(self, mock_print):
+        service = self._service(lambda request: httpx.Response(429, headers={'retry-after-ms': '2500'}))
+
+        with self.assertRaises(UpstreamOverloadedError) as context:
+            await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(context.exception.retry_after_seconds, 3)
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+        self.assertEqual(self.limiter.stats()['throttled'], 1)
+
+    @patch('builtins.print')
+    async def test_stream_match_throttled_raises_overloaded(self, mock_print):
+        service = self._service(lambda request: httpx.Response(429))
+
+        with self.assertRaises(UpstreamOverloadedError):
+            async for _ in service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"):
+                pass
+
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+
+    @patch('builtins.print')
+    async def test_stream_match_releases_slot_on_request_error(self, mock_print):
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        service = self._service(handler)
+
+        with self.assertRaises(httpx.ConnectError):
+            async for _ in service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"):
+                pass
+
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+
+
+class TestAsyncOpenAIServiceWithRetries(unittest.IsolatedAsyncioTestCase):
+
+    def _service(self, outcomes):
+        self.calls = []
+
+        def handler(request):
+            self.calls.append(request)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncOpenAIService(client=client, retry_policy=AsyncRetryPolicy('openai', max_attempts=2, base_delay=0))
+
+    @patch('builtins.print')
+    async def test_analyze_match_retries_unavailable(self, mock_print):
+        service = self._service([
+            httpx.Response(503, text="Service Unavailable"),
+            httpx.Response(200, json={"choices": [{"message": {"content": "Match"}}]})
+        ])
+
+        self.assertEqual(await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com"), "Match")
+        self.assertEqual(len(self.calls), 2)
+
+    @patch('builtins.print')
+    async def test_analyze_match_does_not_retry_read_timeouts(self, mock_print):
+        service = self._service([httpx.ReadTimeout("slow"), httpx.Response(200)])
+
+        with self.assertRaises(httpx.ReadTimeout):
+            await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(len(self.calls), 1)
+
+    @patch('builtins.print')
+    async def test_stream_match_retries_opening_the_stream(self, mock_print):
+        service = self._service([
+            httpx.ConnectError("reset"),
+            httpx.Response(502, text="Bad Gateway"),
+            httpx.Response(200, text='data: {"choices": [{"delta": {"content": "Match"}}]}\n\n')
+        ])
+        service.retry_policy.max_attempts = 3
+
+        chunks = [chunk async for chunk in service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com")]
+
+        self.assertEqual(chunks, ["Match"])
+        self.assertEqual(len(self.calls), 3)
+        mock_print.assert_any_call("[OPENAI] Response Content: Bad Gateway")
+
+
+class TestAsyncOpenAIServiceWithCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+
+    @patch('builtins.print')
+    async def test_open_circuit_fails_fast_without_calling_api(self, mock_print):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502, text="Bad Gateway")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = AsyncOpenAIService(client=client, circuit_breaker=AsyncCircuitBreaker('openai', failure_threshold=1))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+        with self.assertRaises(CircuitOpenError):
+            async for _ in service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"):
+                pass
+
+        self.assertEqual(len(calls), 1)
+
+
+    @patch('builtins.print')
+    async def test_limiter_rejection_does_not_close_half_open_circuit(self, mock_print):
+        calls = []
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: calls.append(request)))
+        breaker = AsyncCircuitBreaker('openai', failure_threshold=1, recovery_timeout=0)
+        breaker.state = AsyncCircuitBreaker.OPEN
+        limiter = AsyncAdaptiveLimiterService(initial_limit=1, max_queue=0)
+        limiter.in_flight = 1
+        service = AsyncOpenAIService(client=client, limiter=limiter, circuit_breaker=breaker)
+
+        with self.assertRaises(UpstreamOverloadedError):
+            await service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(breaker.state, AsyncCircuitBreaker.HALF_OPEN)
+        self.assertEqual(breaker.stats()['failures'], 0)
+        self.assertEqual(calls, [])
+
+if __name__ == '__main__':
+    unittest.main()
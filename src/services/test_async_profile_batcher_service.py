@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncProfileBatcherService
+
+
+class TestAsyncProfileBatcherService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.batcher = AsyncProfileBatcherService(window=0.01, max_profiles=8)
+        self.calls = []
+
+    async def _run_batch(self, profiles):
+        self.calls.append(profiles)
+        await asyncio.sleep(0)
+        return [f"análise {', '.join(skills)}" for skills in profiles]
+
+    @patch('builtins.print')
+    async def test_requests_within_window_share_one_call(self, mock_print):
+        results = await asyncio.gather(*(
+            self.batcher.submit('vaga', skills, self._run_batch) for skills in (["Python"], ["Java"], ["Python"])
+        ))
+
+        self.assertEqual(results, ["análise Python", "análise Java", "análise Python"])
+        self.assertEqual(self.calls, [[["Python"], ["Java"]]])
+        self.assertEqual(self.batcher.stats()['calls_saved'], 1)
+
+    async def test_single_request_is_not_batched(self):
+        self.assertIsNone(await self.batcher.submit('vaga', ["Python"], self._run_batch))
+        self.assertEqual(self.calls, [])
+
+    async def test_different_keys_are_not_batched(self):
+        results = await asyncio.gather(
+            self.batcher.submit('vaga-a', ["Python"], self._run_batch),
+            self.batcher.submit('vaga-b', ["Java"], self._run_batch)
+        )
+
+        self.assertEqual(results, [None, None])
+        self.assertEqual(self.calls, [])
+
+    @patch('builtins.print')
+    async def test_full_batch_skips_the_window(self, mock_print):
+        batcher = AsyncProfileBatcherService(window=10, max_profiles=2)
+
+        results = await asyncio.wait_for(asyncio.gather(
+            batcher.submit('vaga', ["Python"], self._run_batch),
+            batcher.submit('vaga', ["Java"], self._run_batch)
+        ), 1)
+
+        self.assertEqual(results, ["análise Python", "análise Java"])
+
+    async def test_batch_error_reaches_every_caller(self):
+        async def failing_batch(profiles):
+            raise ValueError("falhou")
+
+        results = await asyncio.gather(
+            self.batcher.submit('vaga', ["Python"], failing_batch),
+            self.batcher.submit('vaga', ["Java"], failing_batch),
+            return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(self.batcher.stats()['pending'], 0)
+
+
+    async def test_leader_cancellation_lets_followers_fall_back(self):
+        started = asyncio.Event()
+
+        async def slow_batch(profiles):
+            started.set()
+            await asyncio.sleep(10)
+
+        leader = asyncio.ensure_future(self.batcher.submit('vaga', ["Python"], slow_batch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(self.batcher.submit('vaga', ["Java"], slow_batch))
+        await started.wait()
+
+        leader.cancel()
+
+        self.assertIsNone(await asyncio.wait_for(follower, 1))
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(self.batcher.stats()['pending'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncRetryPolicy
+
+
+class TestAsyncRetryPolicy(unittest.IsolatedAsyncioTestCase):
+
+    @patch('builtins.print')
+    async def test_run_retries_until_success(self, mock_print):
+        policy = AsyncRetryPolicy('scrape', max_attempts=3, base_delay=0)
+        outcomes = [ConnectionError("reset"), "ok"]
+
+        async def operation():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.assertEqual(await policy.run(operation, lambda e: True), "ok")
+        self.assertEqual(policy.stats()['retries'], 1)
+
+    async def test_run_does_not_retry_permanent_errors(self):
+        policy = AsyncRetryPolicy('scrape', max_attempts=3)
+
+        async def operation():
+            raise ValueError("404")
+
+        with self.assertRaises(ValueError):
+            await policy.run(operation, lambda e: False)
+
+        self.assertEqual(policy.stats()['retries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
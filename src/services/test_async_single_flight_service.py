@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncSingleFlightService
+
+
+class TestAsyncSingleFlightService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.flight = AsyncSingleFlightService()
+
+    async def test_concurrent_calls_share_one_execution(self):
+        calls = []
+
+        async def slow_call(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        results = await asyncio.gather(*(self.flight.do('key', slow_call, 21) for _ in range(5)))
+
+        self.assertEqual(results, [42] * 5)
+        self.assertEqual(calls, [21])
+        self.assertEqual(self.flight.stats(), {'in_flight': 0, 'executions': 1, 'coalesced': 4})
+
+    async def test_concurrent_calls_share_exception(self):
+        async def failing_call():
+            await asyncio.sleep(0.01)
+            raise ValueError("falhou")
+
+        results = await asyncio.gather(*(self.flight.do('key', failing_call) for _ in range(3)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(self.flight.executions, 1)
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    async def test_sequential_calls_are_not_coalesced(self):
+        async def call():
+            return "ok"
+
+        await self.flight.do('key', call)
+        await self.flight.do('key', call)
+
+        self.assertEqual(self.flight.executions, 2)
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        release = asyncio.Event()
+
+        async def slow_call():
+            await release.wait()
+            return "ok"
+
+        first = asyncio.ensure_future(self.flight.do('key', slow_call))
+        second = asyncio.ensure_future(self.flight.do('key', slow_call))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "ok")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,325 @@
+import unittest
+from unittest.mock import patch
+import httpx
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import AsyncWebScrapingService, FetchedDescription, PageCacheService, CachedPage, MetricsService, AsyncRetryPolicy, AsyncHedgedRequestService, AsyncCircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+
+
+class TestAsyncWebScrapingService(unittest.IsolatedAsyncioTestCase):
+
+    def _service(self, handler, cache=None):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncWebScrapingService(timeout=5, cache=cache, client=client)
+
+    async def test_init_defaults(self):
+        service = AsyncWebScrapingService()
+        self.assertEqual(service.timeout, 10)
+        self.assertIsNone(service.client)
+        self.assertIsInstance(service._get_client(), httpx.AsyncClient)
+        await service.aclose()
+        self.assertIsNone(service.client)
+
+    async def test_fetch_page_content_success(self):
+        service = self._service(lambda request: httpx.Response(200, content=b"<html></html>"))
+
+        result = await service.fetch_page_content("https://example.com/job")
+
+        self.assertEqual(result, b"<html></html>")
+
+    @patch('builtins.print')
+    async def test_fetch_page_content_http_error(self, mock_print):
+        service = self._service(lambda request: httpx.Response(502))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await service.fetch_page_content("https://example.com/job")
+
+        self.assertTrue(mock_print.call_args[0][0].startswith("[WEB_SCRAPING] ERRO HTTP:"))
+
+    @patch('builtins.print')
+    async def test_fetch_page_content_timeout(self, mock_print):
+        def handler(request):
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        service = self._service(handler)
+
+        with self.assertRaises(httpx.TimeoutException):
+            await service.fetch_page_content("https://example.com/job")
+
+        mock_print.assert_called_with("[WEB_SCRAPING] ERRO: Timeout após 5s")
+
+    @patch('builtins.print')
+    async def test_fetch_page_content_request_error(self, mock_print):
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        service = self._service(handler)
+
+        with self.assertRaises(httpx.ConnectError):
+            await service.fetch_page_content("https://example.com/job")
+
+        mock_print.assert_called_with("[WEB_SCRAPING] ERRO de requisição: Connection failed")
+
+    async def test_fetch_page_content_uses_cache(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, content=b"page", headers={'ETag': '"v1"'})
+
+        cache = PageCacheService(ttl=60)
+        service = self._service(handler, cache=cache)
+
+        await service.fetch_page_content("https://example.com/job")
+        result = await service.fetch_page_content("https://EXAMPLE.com/job")
+
+        self.assertEqual(result, b"page")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.get("https://example.com/job").etag, '"v1"')
+
+    async def test_fetch_page_content_conditional_get_not_modified(self):
+        received_headers = {}
+
+        def handler(request):
+            received_headers.update(request.headers)
+            return httpx.Response(304)
+
+        cache = PageCacheService(ttl=60)
+        cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=b"cached", etag='"v1"', stored_at=0
+        ))
+        service = self._service(handler, cache=cache)
+
+        result = await service.fetch_page_content("https://example.com/job")
+
+        self.assertEqual(result, b"cached")
+        self.assertEqual(received_headers['if-none-match'], '"v1"')
+        self.assertEqual(cache.stats()['revalidations'], 1)
+
+    async def test_fetch_meta_description_streams_head(self):
+        html = b'<html><head><meta name="description" content="Vaga Async"></head><body>' + b"x" * 100000
+        cache = PageCacheService(ttl=60)
+        service = self._service(lambda request: httpx.Response(200, content=html), cache=cache)
+
+        result = await service.fetch_meta_description("https://example.com/job")
+
+        self.assertEqual(result, "Vaga Async")
+        entry = cache.get("https://example.com/job")
+        self.assertFalse(entry.complete)
+        self.assertLess(len(entry.content), len(html))
+
+    async def test_fetch_meta_description_uses_fresh_cache(self):
+        cache = PageCacheService(ttl=60)
+        cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=b'<meta name="description" content="Cache">'
+        ))
+        service = self._service(lambda request: httpx.Response(500), cache=cache)
+
+        self.assertEqual(await service.fetch_meta_description("https://example.com/job"), "Cache")
+
+    async def test_fetch_meta_description_not_modified(self):
+        cache = PageCacheService(ttl=60)
+        cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=b'<meta name="description" content="Cache">',
+            etag='"v1"', stored_at=0, complete=False
+        ))
+        service = self._service(lambda request: httpx.Response(304), cache=cache)
+
+        self.assertEqual(await service.fetch_meta_description("https://example.com/job"), "Cache")
+        self.assertEqual(cache.stats()['revalidations'], 1)
+
+    async def test_fetch_page_content_ignores_partial_entry(self):
+        cache = PageCacheService(ttl=60)
+        cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=b"<head>", complete=False
+        ))
+        service = self._service(lambda request: httpx.Response(200, content=b"full"), cache=cache)
+
+        self.assertEqual(await service.fetch_page_content("https://example.com/job"), b"full")
+
+    async def test_fetch_meta_description_without_cache(self):
+        service = self._service(lambda request: httpx.Response(200, content=b"<head></head>"))
+
+        self.assertIsNone(await service.fetch_meta_description("https://example.com/job"))
+
+    @patch('builtins.print')
+    async def test_fetch_meta_description_http_error(self, mock_print):
+        service = self._service(lambda request: httpx.Response(404))
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await service.fetch_meta_description("https://example.com/job")
+
+    @patch('builtins.print')
+    async def test_fetch_meta_description_timeout(self, mock_print):
+        def handler(request):
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        with self.assertRaises(httpx.TimeoutException):
+            await self._service(handler).fetch_meta_description("https://example.com/job")
+
+        mock_print.assert_called_with("[WEB_SCRAPING] ERRO: Timeout após 5s")
+
+    @patch('builtins.print')
+    async def test_fetch_meta_description_request_error(self, mock_print):
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        with self.assertRaises(httpx.ConnectError):
+            await self._service(handler).fetch_meta_description("https://example.com/job")
+
+        mock_print.assert_called_with("[WEB_SCRAPING] ERRO de requisição: Connection failed")
+
+    async def test_fetch_description_returns_validators(self):
+        service = self._service(lambda request: httpx.Response(
+            200, content=b'<meta name="description" content="Vaga">', headers={'ETag': '"v1"'}
+        ))
+
+        result = await service.fetch_description("https://example.com/job")
+
+        self.assertEqual(result, FetchedDescription("Vaga", '"v1"', None))
+
+    async def test_fetch_description_not_modified(self):
+        seen = []
+
+        def handler(request):
+            seen.append(dict(request.headers))
+            return httpx.Response(304)
+
+        result = await self._service(handler).fetch_description("https://example.com/job", '"v1"', 'Mon')
+
+        self.assertIsNone(result)
+        self.assertEqual(seen[0]['if-none-match'], '"v1"')
+        self.assertEqual(seen[0]['if-modified-since'], 'Mon')
+
+    @patch('builtins.print')
+    async def test_fetch_description_errors(self, mock_print):
+        def timeout(request):
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        def unreachable(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        cases = [
+            (timeout, httpx.TimeoutException, "[WEB_SCRAPING] ERRO: Timeout após 5s"),
+            (lambda request: httpx.Response(410), httpx.HTTPStatusError, None),
+            (unreachable, httpx.ConnectError, "[WEB_SCRAPING] ERRO de requisição: Connection failed")
+        ]
+        for handler, error, message in cases:
+            with self.assertRaises(error):
+                await self._service(handler).fetch_description("https://example.com/job")
+
+            if message:
+                mock_print.assert_called_with(message)
+            else:
+                self.assertTrue(mock_print.call_args[0][0].startswith("[WEB_SCRAPING] ERRO HTTP:"))
+
+    def test_extract_meta_description_is_inherited(self):
+        service = AsyncWebScrapingService()
+        html = '<html><head><meta name="description" content="Vaga Python"></head></html>'
+        self.assertEqual(service.extract_meta_description(html), "Vaga Python")
+
+
+    async def test_fetch_meta_description_records_stage_metrics(self):
+        page = b'<html><head><meta name="description" content="Vaga"></head><body>'
+        metrics = MetricsService()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=page, headers={'ETag': '"v1"'})
+        ))
+        service = AsyncWebScrapingService(cache=PageCacheService(), client=client, metrics=metrics)
+
+        await service.fetch_meta_description("https://example.com/job")
+        await service.fetch_meta_description("https://example.com/job")
+
+        durations = metrics.stage_duration.snapshot()
+        self.assertEqual(durations[('fetch',)][2], 1)
+        self.assertEqual(durations[('extract',)][2], 2)
+
+
+class TestAsyncWebScrapingServiceResilience(unittest.IsolatedAsyncioTestCase):
+
+    HEAD = b'<html><head><meta name="description" content="Vaga Python"></head>'
+
+    def _service(self, responses, cache=None, hedging=None):
+        self.calls = []
+
+        def handler(request):
+            self.calls.append(request)
+            outcome = responses.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return httpx.Response(outcome, content=self.HEAD)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncWebScrapingService(
+            cache=cache,
+            client=client,
+            retry_policy=AsyncRetryPolicy('scrape', max_attempts=3, base_delay=0),
+            hedging=hedging
+        )
+
+    @patch('builtins.print')
+    async def test_fetch_meta_description_retries_transient_errors(self, mock_print):
+        service = self._service([503, httpx.ConnectError("reset"), 200])
+
+        self.assertEqual(await service.fetch_meta_description("https://example.com/job"), "Vaga Python")
+        self.assertEqual(len(self.calls), 3)
+
+    @patch('builtins.print')
+    async def test_fetch_meta_description_does_not_retry_not_found(self, mock_print):
+        service = self._service([404, 200])
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await service.fetch_meta_description("https://example.com/job")
+
+        self.assertEqual(len(self.calls), 1)
+
+    @patch('builtins.print')
+    async def test_fetch_meta_description_does_not_retry_read_timeout(self, mock_print):
+        service = self._service([httpx.ReadTimeout("slow"), 200])
+
+        with self.assertRaises(httpx.TimeoutException):
+            await service.fetch_meta_description("https://example.com/job")
+
+        self.assertEqual(len(self.calls), 1)
+
+    @patch('builtins.print')
+    async def test_open_host_circuit_fails_fast(self, mock_print):
+        service = self._service([503, 503, 503])
+        service.retry_policy = None
+        service.circuit_breakers = CircuitBreakerRegistry(failure_threshold=2, breaker_class=AsyncCircuitBreaker)
+
+        for _ in range(2):
+            with self.assertRaises(httpx.HTTPStatusError):
+                await service.fetch_meta_description("https://down.example.com/job")
+        with self.assertRaises(CircuitOpenError):
+            await service.fetch_meta_description("https://down.example.com/job")
+
+        self.assertEqual(len(self.calls), 2)
+
+    @patch('builtins.print')
+    async def test_fetch_page_content_retries_with_and_without_cache(self, mock_print):
+        service = self._service([502, 200, 504, 200], hedging=AsyncHedgedRequestService(initial_delay=1))
+
+        self.assertEqual(await service.fetch_page_content("https://example.com/a"), self.HEAD)
+        service.cache = PageCacheService()
+        self.assertEqual(await service.fetch_page_content("https://example.com/b"), self.HEAD)
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(service.hedging.stats()['samples'], 2)
+
+
+    async def test_from_config_uses_async_resilience(self):
+        config = {'REQUEST_TIMEOUT': 3, 'SCRAPE_RETRY_MAX_ATTEMPTS': 2, 'SCRAPE_HEDGE_ENABLED': True,
+                  'CIRCUIT_BREAKER_ENABLED': True}
+
+        service = AsyncWebScrapingService.from_config(config)
+
+        self.assertIsInstance(service.retry_policy, AsyncRetryPolicy)
+        self.assertIsInstance(service.hedging, AsyncHedgedRequestService)
+        self.assertIs(service.circuit_breakers.breaker_class, AsyncCircuitBreaker)
+        self.assertTrue(service.client.follow_redirects)
+        await service.client.aclose()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import CacheBackend, MemoryCacheBackend, SqliteCacheBackend
+
+
+class FailingCacheBackend(CacheBackend):
+
+    name = 'failing'
+
+    def _get(self, key):
+        raise OSError("indisponível")
+
+    def _set(self, key, value, ttl):
+        raise OSError("indisponível")
+
+    def _delete(self, key):
+        raise OSError("indisponível")
+
+    def _clear(self):
+        raise OSError("indisponível")
+
+
+class TestCacheBackend(unittest.TestCase):
+
+    def test_backend_operations_must_be_implemented(self):
+        with self.assertRaises(TypeError):
+            CacheBackend()
+
+    @patch('builtins.print')
+    def test_errors_degrade_to_miss(self, mock_print):
+        backend = FailingCacheBackend()
+
+        self.assertIsNone(backend.get('a'))
+        backend.set('a', b'1')
+        backend.delete('a')
+        backend.clear()
+        backend.close()
+
+        self.assertEqual(backend.stats(), {'backend': 'failing', 'hits': 0, 'misses': 0, 'errors': 4})
+        mock_print.assert_any_call("[CACHE] ERRO ao ler no backend failing: indisponível")
+
+
+class TestMemoryCacheBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = MemoryCacheBackend(max_entries=2)
+
+    def test_set_and_get(self):
+        self.backend.set('a', b'1')
+
+        self.assertEqual(self.backend.get('a'), b'1')
+        self.assertIsNone(self.backend.get('b'))
+        self.assertEqual(self.backend.stats()['hits'], 1)
+        self.assertEqual(self.backend.stats()['misses'], 1)
+
+    def test_lru_eviction(self):
+        self.backend.set('a', b'1')
+        self.backend.set('b', b'2')
+        self.backend.get('a')
+        self.backend.set('c', b'3')
+
+        self.assertIsNone(self.backend.get('b'))
+        self.assertEqual(self.backend.stats()['entries'], 2)
+
+    def test_ttl_expiration(self):
+        self.backend.set('a', b'1', ttl=60)
+
+        with patch('time.time', return_value=time.time() + 61):
+            self.assertIsNone(self.backend.get('a'))
+
+    def test_delete_and_clear(self):
+        self.backend.set('a', b'1')
+        self.backend.set('b', b'2')
+        self.backend.delete('a')
+
+        self.assertIsNone(self.backend.get('a'))
+        self.backend.clear()
+        self.assertEqual(self.backend.stats()['entries'], 0)
+
+
+class TestSqliteCacheBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'nested', 'cache.sqlite3')
+        self.backend = SqliteCacheBackend(self.path, max_entries=3)
+
+    def tearDown(self):
+        self.backend.close()
+        self.tmp_dir.cleanup()
+
+    def test_set_and_get(self):
+        self.backend.set('a', b'\x00\x01binary')
+
+        self.assertEqual(self.backend.get('a'), b'\x00\x01binary')
+        self.assertIsNone(self.backend.get('b'))
+        self.assertEqual(self.backend.stats()['entries'], 1)
+        self.assertEqual(self.backend.stats()['path'], self.path)
+
+    def test_shared_between_instances(self):
+        self.backend.set('a', b'1')
+        other = SqliteCacheBackend(self.path)
+
+        self.assertEqual(other.get('a'), b'1')
+        other.close()
+
+    def test_ttl_expiration_removes_entry(self):
+        self.backend.set('a', b'1', ttl=60)
+
+        with patch('time.time', return_value=time.time() + 61):
+            self.assertIsNone(self.backend.get('a'))
+        self.assertEqual(self.backend.stats()['entries'], 0)
+
+    def test_evicts_least_recently_used(self):
+        with patch.object(SqliteCacheBackend, 'EVICT_EVERY', 1):
+            for index, key in enumerate(['a', 'b', 'c']):
+                with patch('time.time', return_value=1000.0 + index):
+                    self.backend.set(key, b'1')
+            with patch('time.time', return_value=1010.0):
+                self.backend.get('a')
+            with patch('time.time', return_value=1020.0):
+                self.backend.set('d', b'1')
+
+        self.assertIsNone(self.backend.get('b'))
+        self.assertEqual(self.backend.get('a'), b'1')
+        self.assertEqual(self.backend.stats()['entries'], 3)
+
+    def test_delete_and_clear(self):
+        self.backend.set('a', b'1')
+        self.backend.set('b', b'2')
+        self.backend.delete('a')
+
+        self.assertIsNone(self.backend.get('a'))
+        self.backend.clear()
+        self.assertEqual(self.backend.stats()['entries'], 0)
+
+    @patch('builtins.print')
+    def test_database_error_is_reported(self, mock_print):
+        with patch.object(self.backend._db, 'get', side_effect=sqlite3.OperationalError("database is locked")):
+            self.assertIsNone(self.backend.get('a'))
+            self.assertIsNone(self.backend.stats()['entries'])
+
+        self.assertEqual(self.backend.stats()['errors'], 1)
+        mock_print.assert_called_with("[CACHE] ERRO ao ler no backend sqlite: database is locked")
+
+    def test_reconnects_after_fork(self):
+        self.backend.set('a', b'1')
+        parent_connection = self.backend._db.get()
+
+        with patch('os.getpid', return_value=-1):
+            self.assertEqual(self.backend.get('a'), b'1')
+            self.assertIsNot(self.backend._db.get(), parent_connection)
+
+        self.assertEqual(self.backend._db._inherited, [parent_connection])
+        self.assertEqual(parent_connection.execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0], 1)
+        parent_connection.close()
+
+    def test_connection_is_opened_on_first_use(self):
+        backend = SqliteCacheBackend(os.path.join(self.tmp_dir.name, 'lazy.sqlite3'))
+
+        self.assertIsNone(backend._db._connection)
+        self.assertIsNone(backend.get('a'))
+        self.assertIsNotNone(backend._db._connection)
+        backend.close()
+
+if __name__ == '__main__':
+    unittest.main()
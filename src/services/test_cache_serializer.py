@@ -0,0 +1,76 @@
+import unittest
+import zlib
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import CacheSerializer
+
+
+class TestCacheSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.serializer = CacheSerializer(compress_threshold=64)
+
+    def test_small_body_is_not_compressed(self):
+        data = self.serializer.dumps(CacheSerializer.KIND_TEXT, b'curto')
+
+        self.assertEqual(data[:2], b'JB')
+        self.assertEqual(data[4], 0)
+        self.assertEqual(self.serializer.loads(CacheSerializer.KIND_TEXT, data), b'curto')
+
+    def test_large_body_is_compressed(self):
+        body = b'<p>Lorem ipsum dolor sit amet</p>' * 100
+
+        data = self.serializer.dumps(CacheSerializer.KIND_PAGE, body)
+
+        self.assertEqual(data[4], CacheSerializer.FLAG_ZLIB)
+        self.assertLess(len(data), len(body))
+        self.assertEqual(self.serializer.loads(CacheSerializer.KIND_PAGE, data), body)
+        self.assertEqual(self.serializer.stats()['compressed'], 1)
+        self.assertEqual(self.serializer.stats()['bytes_saved'], len(body) - len(data) + CacheSerializer.HEADER.size)
+
+    def test_incompressible_body_is_stored_raw(self):
+        body = os.urandom(256)
+
+        data = self.serializer.dumps(CacheSerializer.KIND_PAGE, body)
+
+        self.assertEqual(data[4], 0)
+        self.assertEqual(self.serializer.stats()['compressed'], 0)
+
+    def test_zero_threshold_disables_compression(self):
+        serializer = CacheSerializer(compress_threshold=0)
+
+        data = serializer.dumps(CacheSerializer.KIND_PAGE, b'a' * 4096)
+
+        self.assertEqual(len(data), 4096 + CacheSerializer.HEADER.size)
+
+    def test_rejects_wrong_kind(self):
+        data = self.serializer.dumps(CacheSerializer.KIND_TEXT, b'texto')
+
+        with self.assertRaises(ValueError):
+            self.serializer.loads(CacheSerializer.KIND_PAGE, data)
+
+    def test_rejects_truncated_entry(self):
+        with self.assertRaises(ValueError):
+            self.serializer.loads(CacheSerializer.KIND_TEXT, b'JB')
+
+    def test_rejects_corrupted_compressed_body(self):
+        header = CacheSerializer.HEADER.pack(b'JB', 1, CacheSerializer.KIND_TEXT, CacheSerializer.FLAG_ZLIB)
+
+        with self.assertRaises(ValueError):
+            self.serializer.loads(CacheSerializer.KIND_TEXT, header + zlib.compress(b'texto')[:-3])
+
+    def test_optional_strings_round_trip(self):
+        body = CacheSerializer.pack_optional('ação') + CacheSerializer.pack_optional(None) + CacheSerializer.pack_optional('')
+
+        first, offset = CacheSerializer.unpack_optional(body, 0)
+        second, offset = CacheSerializer.unpack_optional(body, offset)
+        third, offset = CacheSerializer.unpack_optional(body, offset)
+
+        self.assertEqual((first, second, third), ('ação', None, ''))
+        self.assertEqual(offset, len(body))
+
+
+if __name__ == '__main__':
+    unittest.main()
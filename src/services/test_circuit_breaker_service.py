@@ -0,0 +1,149 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, UpstreamOverloadedError
+
+
+def failing():
+    raise ConnectionError("reset")
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def _trip(self, breaker, times):
+        for _ in range(times):
+            with self.assertRaises(ConnectionError):
+                breaker.call(failing, lambda e: True)
+
+    @patch('builtins.print')
+    def test_opens_after_consecutive_failures(self, mock_print):
+        breaker = CircuitBreaker('jobs.example.com', failure_threshold=3, recovery_timeout=30)
+
+        self._trip(breaker, 3)
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        mock_print.assert_called_with("[CIRCUIT] jobs.example.com: aberto após 3 falhas consecutivas")
+
+        calls = []
+        with self.assertRaises(CircuitOpenError) as context:
+            breaker.call(lambda: calls.append(1), lambda e: True)
+
+        self.assertEqual(calls, [])
+        self.assertIsInstance(context.exception, UpstreamOverloadedError)
+        self.assertEqual(context.exception.retry_after_seconds, 30)
+        self.assertEqual(str(context.exception), "Circuito aberto para jobs.example.com, tente novamente em instantes")
+        stats = breaker.stats()
+        self.assertEqual(stats['state'], 'open')
+        self.assertEqual(stats['opened'], 1)
+        self.assertEqual(stats['rejected'], 1)
+        self.assertGreater(stats['retry_after'], 29)
+
+    @patch('builtins.print')
+    def test_success_resets_failure_count(self, mock_print):
+        breaker = CircuitBreaker('host', failure_threshold=2)
+
+        self._trip(breaker, 1)
+        self.assertEqual(breaker.call(lambda: "ok", lambda e: True), "ok")
+        self._trip(breaker, 1)
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_non_failure_errors_do_not_trip(self):
+        breaker = CircuitBreaker('host', failure_threshold=1)
+
+        def not_found():
+            raise ValueError("404")
+
+        with self.assertRaises(ValueError):
+            breaker.call(not_found, lambda e: False)
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @patch('builtins.print')
+    def test_half_open_probe_closes_on_success(self, mock_print):
+        breaker = CircuitBreaker('host', failure_threshold=1, recovery_timeout=0)
+        self._trip(breaker, 1)
+
+        self.assertEqual(breaker.call(lambda: "ok", lambda e: True), "ok")
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        mock_print.assert_any_call("[CIRCUIT] host: meio-aberto, testando recuperação")
+        mock_print.assert_called_with("[CIRCUIT] host: fechado, dependência recuperada")
+
+    @patch('builtins.print')
+    def test_half_open_probe_reopens_on_failure(self, mock_print):
+        breaker = CircuitBreaker('host', failure_threshold=1, recovery_timeout=0)
+        self._trip(breaker, 2)
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.opened, 2)
+
+    @patch('builtins.print')
+    def test_half_open_limits_concurrent_probes(self, mock_print):
+        breaker = CircuitBreaker('host', failure_threshold=1, recovery_timeout=0, half_open_max_calls=1)
+        self._trip(breaker, 1)
+
+        self.assertTrue(breaker.before_call())
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record(None, probe=True)
+        self.assertTrue(breaker.before_call())
+
+    @patch('builtins.print')
+    def test_late_success_does_not_close_open_circuit(self, mock_print):
+        breaker = CircuitBreaker('host', failure_threshold=1, recovery_timeout=30)
+        probe = breaker.before_call()
+        self._trip(breaker, 1)
+
+        breaker.record(False, probe)
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+
+class TestCircuitBreakerRegistry(unittest.TestCase):
+
+    def test_breakers_are_per_host(self):
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+
+        first = registry.for_url("https://Jobs.Example.com/vaga/1")
+        second = registry.for_url("https://jobs.example.com/vaga/2")
+        other = registry.for_url("https://ats.example.org/x")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first.name, "jobs.example.com")
+        self.assertEqual(first.failure_threshold, 2)
+
+    def test_registry_is_bounded(self):
+        registry = CircuitBreakerRegistry(max_hosts=2)
+
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")
+        registry.get("c")
+
+        self.assertEqual(registry.stats()['hosts'], 2)
+        self.assertIsNot(registry.get("a"), None)
+
+    @patch('builtins.print')
+    def test_stats_lists_only_unhealthy_hosts(self, mock_print):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.get("healthy.example.com")
+        broken = registry.get("broken.example.com")
+        with self.assertRaises(ConnectionError):
+            broken.call(failing, lambda e: True)
+
+        stats = registry.stats()
+
+        self.assertEqual(stats['hosts'], 2)
+        self.assertEqual(stats['open'], 1)
+        self.assertEqual(list(stats['breakers']), ["broken.example.com"])
+        self.assertEqual(registry.open_count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+import requests
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import DescriptionRefresherService, DescriptionStoreService, FetchedDescription
+
+
+class TestDescriptionRefresherService(unittest.TestCase):
+
+    URL = "https://example.com/job"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DescriptionStoreService(os.path.join(self.tmp.name, 'd.sqlite3'), refresh_interval=600)
+        self.store.put(self.URL, "Antiga", '"v1"', None)
+        self.web_scraper = Mock()
+        self.refresher = DescriptionRefresherService(self.store, self.web_scraper, interval=0.01)
+
+    def tearDown(self):
+        self.refresher.stop()
+        self.store.close()
+        self.tmp.cleanup()
+
+    def _run_due(self):
+        with patch('time.time', return_value=time.time() + 601):
+            return self.refresher.run_once()
+
+    @patch('builtins.print')
+    def test_not_modified_extends_validity(self, mock_print):
+        self.web_scraper.fetch_description.return_value = None
+
+        self.assertEqual(self._run_due(), 1)
+
+        self.web_scraper.fetch_description.assert_called_once_with(self.URL, '"v1"', None)
+        self.assertEqual(self.store.get(self.URL).description, "Antiga")
+        self.assertEqual(self.refresher.stats()['unchanged'], 1)
+        self.assertEqual(self.store.stats()['due'], 0)
+        mock_print.assert_called_with("[REFRESHER] 1 descrições revalidadas")
+
+    @patch('builtins.print')
+    def test_changed_description_is_formatted_and_stored(self, mock_print):
+        self.web_scraper.fetch_description.return_value = FetchedDescription("  Nova   vaga ", '"v2"', 'Tue')
+
+        self._run_due()
+
+        record = self.store.get(self.URL)
+        self.assertEqual(record.description, "Nova vaga")
+        self.assertEqual((record.etag, record.last_modified), ('"v2"', 'Tue'))
+        self.assertEqual(self.refresher.stats()['updated'], 1)
+
+    @patch('builtins.print')
+    def test_removed_posting_is_dropped(self, mock_print):
+        response = Mock(status_code=410)
+        self.web_scraper.fetch_description.side_effect = requests.exceptions.HTTPError("410", response=response)
+
+        self._run_due()
+
+        self.assertIsNone(self.store.get(self.URL))
+        self.assertEqual(self.refresher.stats()['removed'], 1)
+        mock_print.assert_any_call(f"[REFRESHER] Removendo {self.URL}: vaga removida (410)")
+
+    @patch('builtins.print')
+    def test_missing_description_is_dropped(self, mock_print):
+        self.web_scraper.fetch_description.return_value = FetchedDescription(None)
+
+        self._run_due()
+
+        self.assertIsNone(self.store.get(self.URL))
+
+    @patch('builtins.print')
+    def test_failures_keep_entry_and_back_off(self, mock_print):
+        self.web_scraper.fetch_description.side_effect = [
+            requests.exceptions.HTTPError("503", response=Mock(status_code=503)),
+            requests.exceptions.ConnectionError("down")
+        ]
+
+        self._run_due()
+        with patch('time.time', return_value=time.time() + 1200):
+            self.refresher.run_once()
+
+        self.assertEqual(self.store.get(self.URL).description, "Antiga")
+        self.assertEqual(self.refresher.stats()['failed'], 2)
+        mock_print.assert_any_call(f"[REFRESHER] ERRO ao revalidar {self.URL}: down")
+
+    def test_nothing_due(self):
+        self.assertEqual(self.refresher.run_once(), 0)
+        self.web_scraper.fetch_description.assert_not_called()
+        self.assertEqual(self.refresher.stats()['runs'], 1)
+
+    def test_background_thread_runs_until_stopped(self):
+        ran = []
+        self.refresher.run_once = lambda: ran.append(1)
+
+        self.refresher.ensure_started()
+        self.refresher.ensure_started()
+        deadline = time.time() + 2
+        while not ran and time.time() < deadline:
+            time.sleep(0.01)
+
+        self.assertTrue(self.refresher.stats()['running'])
+        self.refresher.stop()
+        self.assertTrue(ran)
+        self.assertFalse(self.refresher.stats()['running'])
+
+    @patch('builtins.print')
+    def test_loop_survives_errors(self, mock_print):
+        calls = []
+
+        def run_once():
+            calls.append(1)
+            raise RuntimeError("db locked")
+
+        self.refresher.run_once = run_once
+        self.refresher.ensure_started()
+        deadline = time.time() + 2
+        while len(calls) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.refresher.stop()
+
+        self.assertGreaterEqual(len(calls), 2)
+        mock_print.assert_any_call("[REFRESHER] ERRO: db locked")
+
+    def test_restarts_in_forked_child(self):
+        self.refresher.ensure_started()
+        first = self.refresher._thread
+
+        with patch('os.getpid', return_value=os.getpid() + 1):
+            self.refresher.ensure_started()
+            second = self.refresher._thread
+            self.refresher.stop()
+
+        self.assertIsNot(first, second)
+        first.join(timeout=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import DescriptionStoreService, DescriptionRecord
+
+
+class TestDescriptionStoreService(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'descriptions.sqlite3')
+        self.store = DescriptionStoreService(self.path, max_age=3600, refresh_interval=600, lease=30)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_put_and_get_by_normalized_url(self):
+        self.store.put("HTTPS://Example.com:443/job", "Vaga Python", '"v1"', 'Mon')
+
+        record = self.store.get("https://example.com/job")
+
+        self.assertEqual(record.url, "HTTPS://Example.com:443/job")
+        self.assertEqual(record.description, "Vaga Python")
+        self.assertEqual((record.etag, record.last_modified, record.failures), ('"v1"', 'Mon', 0))
+        self.assertIsNone(self.store.get("https://example.com/other"))
+        self.assertEqual(self.store.stats()['hits'], 1)
+        self.assertEqual(self.store.stats()['misses'], 1)
+
+    def test_persists_across_instances(self):
+        self.store.put("https://example.com/job", "Vaga Python")
+
+        other = DescriptionStoreService(self.path)
+        self.assertEqual(other.get("https://example.com/job").description, "Vaga Python")
+        other.close()
+
+    def test_entries_not_checked_within_max_age_are_not_served(self):
+        self.store.put("https://example.com/job", "Vaga Python")
+
+        with patch('time.time', return_value=time.time() + 3601):
+            self.assertIsNone(self.store.get("https://example.com/job"))
+
+        self.assertEqual(self.store.stats()['stale'], 1)
+
+    def test_claim_due_leases_each_entry_once(self):
+        self.store.put("https://example.com/a", "A")
+        self.store.put("https://example.com/b", "B")
+        other = DescriptionStoreService(self.path, lease=30)
+
+        with patch('time.time', return_value=time.time() + 601):
+            self.assertEqual(self.store.stats()['due'], 2)
+            claimed = self.store.claim_due(1)
+            claimed += other.claim_due(10)
+            self.assertEqual(other.claim_due(10), [])
+
+        self.assertEqual(sorted(record.url for record in claimed), ["https://example.com/a", "https://example.com/b"])
+        self.assertIsInstance(claimed[0], DescriptionRecord)
+        other.close()
+
+    def test_mark_unchanged_extends_validity(self):
+        self.store.put("https://example.com/job", "Vaga Python")
+        later = time.time() + 3000
+
+        with patch('time.time', return_value=later):
+            self.store.mark_unchanged("https://example.com/job")
+        with patch('time.time', return_value=later + 601):
+            record = self.store.get("https://example.com/job")
+            self.assertEqual(len(self.store.claim_due(10)), 1)
+
+        self.assertEqual(record.checked_at, later)
+
+    def test_mark_failed_backs_off_exponentially(self):
+        self.store.put("https://example.com/job", "Vaga Python")
+        now = time.time()
+
+        with patch('time.time', return_value=now):
+            self.store.mark_failed("https://example.com/job", 2)
+        with patch('time.time', return_value=now + 119):
+            self.assertEqual(self.store.claim_due(10), [])
+        with patch('time.time', return_value=now + 121):
+            self.assertEqual(self.store.claim_due(10)[0].failures, 3)
+
+    def test_remove(self):
+        self.store.put("https://example.com/job", "Vaga Python")
+        self.store.remove("https://example.com/job")
+
+        self.assertIsNone(self.store.get("https://example.com/job"))
+        self.assertEqual(self.store.stats()['entries'], 0)
+
+    def test_evicts_least_recently_used(self):
+        store = DescriptionStoreService(os.path.join(self.tmp.name, 'small.sqlite3'), max_entries=2)
+        store.EVICT_EVERY = 1
+        now = time.time()
+        for offset, url in enumerate(["https://example.com/a", "https://example.com/b"]):
+            with patch('time.time', return_value=now + offset):
+                store.put(url, url)
+        with patch('time.time', return_value=now + 2):
+            store.get("https://example.com/a")
+        with patch('time.time', return_value=now + 3):
+            store.put("https://example.com/c", "C")
+
+        self.assertIsNone(store.get("https://example.com/b"))
+        self.assertIsNotNone(store.get("https://example.com/a"))
+        self.assertEqual(store.stats()['entries'], 2)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import threading
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import HedgedRequestService, RetryBudget
+
+
+class TestHedgedRequestService(unittest.TestCase):
+
+    def test_delay_uses_initial_delay_until_enough_samples(self):
+        hedging = HedgedRequestService(initial_delay=0.5, min_samples=3)
+        hedging.observe(0.1)
+
+        self.assertEqual(hedging.delay(), 0.5)
+
+    def test_delay_tracks_quantile_with_floor(self):
+        hedging = HedgedRequestService(quantile=0.9, min_delay=0.05, min_samples=10)
+        for i in range(1, 11):
+            hedging.observe(i / 10)
+
+        self.assertEqual(hedging.delay(), 1.0)
+
+        fast = HedgedRequestService(min_delay=0.05, min_samples=1)
+        fast.observe(0.001)
+        self.assertEqual(fast.delay(), 0.05)
+
+    def test_fast_primary_is_not_hedged(self):
+        hedging = HedgedRequestService(initial_delay=1)
+        calls = []
+
+        result = hedging.run(lambda: calls.append(1) or "ok")
+
+        self.assertEqual(result, "ok")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(hedging.stats()['hedged'], 0)
+        self.assertEqual(hedging.stats()['samples'], 1)
+
+    @patch('builtins.print')
+    def test_slow_primary_is_hedged_and_secondary_wins(self, mock_print):
+        hedging = HedgedRequestService(initial_delay=0.01, min_delay=0.01)
+        release = threading.Event()
+        calls = []
+
+        def operation():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        result = hedging.run(operation)
+        release.set()
+
+        self.assertEqual(result, "fast")
+        self.assertEqual(hedging.stats()['hedged'], 1)
+        self.assertEqual(hedging.stats()['hedge_wins'], 1)
+        mock_print.assert_called_with("[HEDGE] Sem resposta após 0.01s, disparando requisição redundante")
+
+    @patch('builtins.print')
+    def test_failed_hedge_falls_back_to_primary(self, mock_print):
+        hedging = HedgedRequestService(initial_delay=0.01, min_delay=0.01)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            if len(calls) == 1:
+                threading.Event().wait(0.05)
+                return "primary"
+            raise ConnectionError("reset")
+
+        self.assertEqual(hedging.run(operation), "primary")
+        self.assertEqual(hedging.stats()['hedge_wins'], 0)
+
+    @patch('builtins.print')
+    def test_raises_when_both_requests_fail(self, mock_print):
+        hedging = HedgedRequestService(initial_delay=0.01, min_delay=0.01)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            if len(calls) == 1:
+                threading.Event().wait(0.05)
+            raise ConnectionError(f"reset {len(calls)}")
+
+        with self.assertRaises(ConnectionError):
+            hedging.run(operation)
+
+    def test_primary_error_is_raised_without_hedging(self):
+        hedging = HedgedRequestService(initial_delay=1)
+
+        def operation():
+            raise ConnectionError("reset")
+
+        with self.assertRaises(ConnectionError):
+            hedging.run(operation)
+        self.assertEqual(hedging.stats()['samples'], 0)
+
+    def test_exhausted_budget_disables_hedging(self):
+        budget = RetryBudget(ratio=0, min_per_second=0, max_balance=0)
+        hedging = HedgedRequestService(initial_delay=0.01, min_delay=0.01, budget=budget)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            threading.Event().wait(0.03)
+            return "ok"
+
+        self.assertEqual(hedging.run(operation), "ok")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(hedging.stats()['budget']['exhausted'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
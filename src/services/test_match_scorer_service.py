@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import MatchScorerService, MatchScore, SkillTaxonomy
+
+
+class TestMatchScorerService(unittest.TestCase):
+
+    DESCRIPTION = ("Buscamos pessoa desenvolvedora Node.js com experiência em JS, Kubernetes (k8s) e Postgres. "
+                   "Inglês avançado, CI/CD e Machine Learning são diferenciais.")
+
+    def setUp(self):
+        self.scorer = MatchScorerService()
+
+    def test_phrase_normalizes_case_accents_and_punctuation(self):
+        self.assertEqual(MatchScorerService.phrase("Inglês, C++ e C#."), ("ingles", "c++", "e", "c#"))
+        self.assertEqual(MatchScorerService.phrase("Node.js."), ("node.js",))
+        self.assertEqual(MatchScorerService.phrase("  "), ())
+
+    def test_ngrams_include_multi_word_phrases(self):
+        grams = MatchScorerService.ngrams("Experiência com machine learning em produção", 3)
+
+        self.assertIn(("machine", "learning"), grams)
+        self.assertIn(("experiencia",), grams)
+        self.assertNotIn(("com", "producao"), grams)
+
+    def test_score_matches_skills_and_aliases(self):
+        score = self.scorer.score(
+            ["JavaScript", "kubernetes", "PostgreSQL", "English", "ML", "Docker", "node"], self.DESCRIPTION
+        )
+
+        self.assertEqual(score.matched_skills, ["JavaScript", "kubernetes", "PostgreSQL", "English", "ML", "node"])
+        self.assertEqual(score.missing_skills, ["Docker"])
+        self.assertEqual(score.percentage, 86)
+
+    def test_score_falls_back_to_phrases_for_unknown_skills(self):
+        score = self.scorer.score(["Kafka Streams", "Avançado", "Jira"], "Experiência com kafka streams; nível avançado")
+
+        self.assertEqual(score.matched_skills, ["Kafka Streams", "Avançado"])
+        self.assertEqual(score.missing_skills, ["Jira"])
+
+    def test_score_requires_whole_tokens(self):
+        score = self.scorer.score(["Java", "React", "Go"], "Vaga para JavaScript com Reactive Streams e Django")
+
+        self.assertEqual(score.matched_skills, [])
+        self.assertEqual(score.percentage, 0)
+
+    def test_score_ignores_common_words_and_single_letters(self):
+        score = self.scorer.score(['C', 'Go'], 'Reporting to C-level executives, you will go above and beyond')
+
+        self.assertEqual((score.percentage, score.matched_skills), (0, []))
+        self.assertEqual(self.scorer.score(['UI', 'IA', 'React'], 'ui tweaks, dia de folga, react quickly').percentage, 0)
+        self.assertEqual(self.scorer.score(['R', 'Q'], 'Time de R&D com foco em Q&A').percentage, 0)
+        self.assertEqual(self.scorer.score(['C', 'Go', 'R'], 'Experiência com C, Go e R').percentage, 100)
+
+    @patch('builtins.print')
+    def test_gate_is_not_fooled_by_common_words(self, mock_print):
+        scorer = MatchScorerService(gate_below=50)
+
+        score = scorer.score(['Go', 'Rust'], 'You will go above and beyond to rust-proof our processes')
+        self.assertTrue(scorer.should_skip_completion(score))
+
+        score = scorer.score(['Go', 'Kubernetes'], 'Serviços em Go rodando em Kubernetes; go live em 2025')
+        self.assertFalse(scorer.should_skip_completion(score))
+
+    def test_score_deduplicates_and_ignores_blank_skills(self):
+        score = self.scorer.score(["CI/CD", "CI/CD", " ", ""], self.DESCRIPTION)
+
+        self.assertEqual((score.percentage, score.matched_skills, score.missing_skills), (100, ["CI/CD"], []))
+        self.assertEqual(self.scorer.score([], self.DESCRIPTION).percentage, 0)
+
+    def test_custom_taxonomy(self):
+        scorer = MatchScorerService(taxonomy=SkillTaxonomy.compile({'AWS': ['amazon web services']}))
+
+        self.assertEqual(scorer.score(["AWS"], "Experiência com Amazon Web Services").percentage, 100)
+        self.assertEqual(scorer.score(["JS"], "JavaScript").percentage, 0)
+
+    def test_to_dict(self):
+        result = MatchScore(50, ["Python"], ["Docker"]).to_dict()
+
+        self.assertEqual(result, {
+            'message': "Match estimado de 50% (1 de 2 habilidades encontradas na descrição da vaga). "
+                       "Habilidades não encontradas: Docker.",
+            'mode': 'fast',
+            'match_percentage': 50,
+            'matched_skills': ["Python"],
+            'missing_skills': ["Docker"]
+        })
+        self.assertNotIn("não encontradas", MatchScore(100, ["Python"], []).message())
+
+    @patch('builtins.print')
+    def test_should_skip_completion_below_gate(self, mock_print):
+        scorer = MatchScorerService(gate_below=30)
+
+        self.assertTrue(scorer.should_skip_completion(MatchScore(25, ["Python"], ["a", "b"])))
+        self.assertFalse(scorer.should_skip_completion(MatchScore(30, ["Python"], ["a"])))
+        self.assertFalse(scorer.should_skip_completion(MatchScore(0, [], [])))
+        self.assertFalse(MatchScorerService().should_skip_completion(MatchScore(0, [], ["a"])))
+        mock_print.assert_called_once_with("[PRESCORE] Match estimado de 25% abaixo de 30%, análise por IA dispensada")
+        self.assertEqual(scorer.stats(), {'gate_below': 30, 'scored': 0, 'gated': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
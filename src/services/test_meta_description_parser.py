@@ -0,0 +1,402 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.meta_description_parser import MetaDescriptionParser, RegexMetaDescriptionParser, LxmlMetaDescriptionParser, MetaDescriptionStream, StructuredDataScanner, etree
+
+
+class TestMetaDescriptionParser(unittest.TestCase):
+
+    def test_finds_description_and_stops(self):
+        parser = MetaDescriptionParser()
+        parser.feed('<html><head><meta name="description" content="Vaga Python">')
+
+        self.assertTrue(parser.done)
+        self.assertEqual(parser.description, "Vaga Python")
+
+    def test_first_description_wins(self):
+        parser = MetaDescriptionParser()
+        parser.feed('<head><meta name="description" content="Primeira"><meta name="description" content="Segunda"></head>')
+
+        self.assertEqual(parser.description, "Primeira")
+
+    def test_empty_content_returns_none(self):
+        parser = MetaDescriptionParser()
+        parser.feed('<head><meta name="description" content=""></head>')
+
+        self.assertTrue(parser.done)
+        self.assertIsNone(parser.description)
+
+    def test_name_is_case_sensitive(self):
+        parser = MetaDescriptionParser()
+        parser.feed('<head><meta name="DESCRIPTION" content="Maiúscula"></head>')
+
+        self.assertIsNone(parser.description)
+
+    def test_stops_at_head_end(self):
+        parser = MetaDescriptionParser()
+        parser.feed('<head><title>Vaga</title></head>')
+
+        self.assertTrue(parser.done)
+        self.assertIsNone(parser.description)
+
+    def test_stops_at_body_start(self):
+        parser = MetaDescriptionParser()
+        parser.feed('<html><body><meta name="description" content="No body">')
+
+        self.assertTrue(parser.done)
+        self.assertIsNone(parser.description)
+
+    def test_unescapes_entities(self):
+        parser = MetaDescriptionParser()
+        parser.feed('<meta name="description" content="Dev &amp; Ops">')
+
+        self.assertEqual(parser.description, "Dev & Ops")
+
+
+class TestMetaDescriptionStream(unittest.TestCase):
+
+    def test_tag_split_across_chunks(self):
+        stream = MetaDescriptionStream()
+        html = '<html><head><meta name="description" content="Descrição da vaga"></head><body>'.encode('utf-8')
+
+        for i in range(0, len(html), 7):
+            if stream.feed(html[i:i + 7]):
+                break
+
+        self.assertEqual(stream.description, "Descrição da vaga")
+        self.assertTrue(len(stream.consumed) < len(html))
+
+    def test_multibyte_character_split_across_chunks(self):
+        stream = MetaDescriptionStream('utf-8')
+        html = '<meta name="description" content="ção">'.encode('utf-8')
+        split = html.index('ç'.encode('utf-8')) + 1
+
+        stream.feed(html[:split])
+        stream.feed(html[split:])
+
+        self.assertEqual(stream.description, "ção")
+
+    def test_feed_after_done_is_ignored(self):
+        stream = MetaDescriptionStream()
+        stream.feed(b'</head>')
+
+        self.assertTrue(stream.feed(b'<meta name="description" content="x">'))
+        self.assertEqual(stream.consumed, b'</head>')
+
+    def test_latin1_encoding(self):
+        stream = MetaDescriptionStream('iso-8859-1')
+        stream.feed('<meta name="description" content="Programação">'.encode('iso-8859-1'))
+
+        self.assertEqual(stream.description, "Programação")
+
+    def test_meta_charset_without_header(self):
+        html = '<html><head><meta charset="iso-8859-1"><meta name="description" content="Programação em Python, remuneração">'
+
+        for backend in ('html.parser', 'regex'):
+            stream = MetaDescriptionStream(backend=backend)
+            stream.feed(html.encode('iso-8859-1'))
+
+            self.assertEqual(stream.description, "Programação em Python, remuneração")
+            self.assertEqual(stream.encoding, 'iso-8859-1')
+
+    def test_http_equiv_charset_in_later_chunk(self):
+        stream = MetaDescriptionStream()
+        stream.feed(b'<html><head><title>Vaga</title>')
+        stream.feed(b'<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1">')
+        stream.feed('<meta name="description" content="Programação">'.encode('iso-8859-1'))
+
+        self.assertEqual(stream.description, "Programação")
+
+    def test_header_charset_wins_over_meta_charset(self):
+        stream = MetaDescriptionStream('utf-8')
+        stream.feed('<meta charset="iso-8859-1"><meta name="description" content="ação">'.encode('utf-8'))
+
+        self.assertEqual(stream.description, "ação")
+
+    def test_unknown_encoding_falls_back_to_utf8(self):
+        stream = MetaDescriptionStream('not-a-charset')
+        stream.feed('<meta name="description" content="ação">'.encode('utf-8'))
+
+        self.assertEqual(stream.description, "ação")
+
+    def test_encoding_from_headers(self):
+        self.assertEqual(MetaDescriptionStream.encoding_from_headers({'Content-Type': 'text/html; charset="ISO-8859-1"'}), 'ISO-8859-1')
+        self.assertIsNone(MetaDescriptionStream.encoding_from_headers({'Content-Type': 'text/html'}))
+        self.assertIsNone(MetaDescriptionStream.encoding_from_headers({}))
+
+
+    def test_feed_accumulates_parse_time(self):
+        stream = MetaDescriptionStream()
+
+        self.assertEqual(stream.parse_seconds, 0.0)
+        stream.feed(b'<html><head><title>Vaga</title>')
+
+        self.assertGreater(stream.parse_seconds, 0.0)
+
+    def test_backend_selection(self):
+        html = b'<head><meta content="Vaga" name="description"></head>'
+
+        for backend in MetaDescriptionStream.available_backends():
+            stream = MetaDescriptionStream(backend=backend)
+            stream.feed(html)
+
+            self.assertEqual(stream.description, "Vaga")
+            self.assertFalse(stream.fell_back)
+
+    def test_falls_back_to_soup_when_parser_raises(self):
+        stream = MetaDescriptionStream(backend='regex')
+        with patch.object(RegexMetaDescriptionParser, 'feed', side_effect=RuntimeError("bug")):
+            self.assertTrue(stream.feed(b'<meta name="description" content="Vaga">'))
+
+        self.assertEqual(stream.finish(), "Vaga")
+        self.assertTrue(stream.fell_back)
+
+    def test_falls_back_when_fast_parser_is_inconclusive(self):
+        stream = MetaDescriptionStream(backend='regex')
+        stream.feed(b'<meta name="description" content="Vaga sem fim')
+
+        self.assertIsNone(stream.description)
+        self.assertTrue(stream.fell_back)
+
+    def test_concluded_fast_parser_is_trusted(self):
+        stream = MetaDescriptionStream(backend='regex')
+        stream.feed(b'<head><title>t</title></head><body><meta name="description" content="No body">')
+
+        self.assertIsNone(stream.description)
+        self.assertFalse(stream.fell_back)
+
+    def test_default_backend_does_not_fall_back_on_missing_description(self):
+        stream = MetaDescriptionStream()
+        stream.feed(b'<meta name="keywords" content="python">')
+
+        self.assertIsNone(stream.finish())
+        self.assertFalse(stream.fell_back)
+
+    @patch('builtins.print')
+    def test_resolve_backend(self, mock_print):
+        self.assertEqual(MetaDescriptionStream.resolve_backend(None), 'html.parser')
+        self.assertEqual(MetaDescriptionStream.resolve_backend('regex'), 'regex')
+        with self.assertRaises(ValueError):
+            MetaDescriptionStream.resolve_backend('selectolax')
+
+        with patch('src.services.meta_description_parser.etree', None):
+            self.assertNotIn('lxml', MetaDescriptionStream.available_backends())
+            self.assertEqual(MetaDescriptionStream.resolve_backend('lxml'), 'html.parser')
+        mock_print.assert_called_with("[WEB_SCRAPING] Parser lxml indisponível, usando html.parser")
+
+    def test_parse_text(self):
+        self.assertEqual(MetaDescriptionStream.parse_text('<meta name="description" content="Vaga">', 'regex'), "Vaga")
+        self.assertIsNone(MetaDescriptionStream.parse_text(None, 'regex'))
+
+    def test_soup_description(self):
+        self.assertEqual(MetaDescriptionStream.soup_description('<body><meta name="description" content="x">'), "x")
+        self.assertIsNone(MetaDescriptionStream.soup_description('<meta name="description" content="">'))
+        self.assertIsNone(MetaDescriptionStream.soup_description('<p>sem meta</p>'))
+
+
+class TestRegexMetaDescriptionParser(unittest.TestCase):
+
+    def _parse(self, *chunks):
+        parser = RegexMetaDescriptionParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        return parser
+
+    def test_finds_description_and_stops(self):
+        parser = self._parse('<html><head><meta name="description" content="Vaga Python">')
+
+        self.assertTrue(parser.done)
+        self.assertEqual(parser.description, "Vaga Python")
+
+    def test_attribute_styles(self):
+        cases = [
+            "<meta content='Simples' name='description'>",
+            '<META NAME="description" CONTENT="Simples">',
+            '<meta name=description content=Simples />',
+            '<meta\n  name = "description"\n  content = "Simples">'
+        ]
+        for html in cases:
+            self.assertEqual(self._parse(html).description, "Simples", html)
+
+    def test_matches_reference_parser_semantics(self):
+        cases = [
+            '<head><meta name="description" content="Primeira"><meta name="description" content="Segunda">',
+            '<head><meta name="description" content=""></head>',
+            '<head><meta name="description"></head>',
+            '<head><meta name="DESCRIPTION" content="Maiúscula"></head>',
+            '<head><title>Vaga</title></head><meta name="description" content="depois">',
+            '<html><body><meta name="description" content="No body">',
+            '<meta name="description" content="Dev &amp; Ops &#8211; S&atilde;o Paulo">',
+            '<meta name="description" content="a > b">',
+            '<!DOCTYPE html><head><meta name="description" content="Doctype">'
+        ]
+        for html in cases:
+            reference = MetaDescriptionParser()
+            reference.feed(html)
+            self.assertEqual(self._parse(html).description, reference.description, html)
+
+    def test_ignores_comments_and_raw_text(self):
+        parser = self._parse(
+            '<head><!-- <meta name="description" content="comentada"> -->'
+            '<script>var s = "<meta name=\'description\' content=\'falsa\'></head>"; if (a < b) {}</script>'
+            '<STYLE>.a > .b { }</style><meta name="description" content="Real">'
+        )
+
+        self.assertEqual(parser.description, "Real")
+
+    def test_tokens_split_across_chunks(self):
+        html = ('<head><!-- comentário --><script>x = "</head>";</script>'
+                '<meta name="description" content="Dividida">')
+
+        for size in (1, 2, 3, 5, 8):
+            chunks = [html[i:i + size] for i in range(0, len(html), size)]
+            self.assertEqual(self._parse(*chunks).description, "Dividida", size)
+
+    def test_stray_angle_bracket_in_text(self):
+        parser = self._parse('<head><title>1 < 2 <> 3</title><meta name="description" content="Texto">')
+
+        self.assertEqual(parser.description, "Texto")
+
+    def test_gives_up_on_endless_head(self):
+        parser = RegexMetaDescriptionParser()
+        parser.MAX_CHARS = 100
+
+        parser.feed('<head>' + '<link rel="x">' * 10)
+
+        self.assertTrue(parser.done)
+        self.assertTrue(parser.failed)
+        parser.feed('<meta name="description" content="tarde">')
+        self.assertIsNone(parser.description)
+
+    def test_parse_attributes(self):
+        self.assertEqual(
+            RegexMetaDescriptionParser.parse_attributes(' Name="description" content=\'a &amp; b\' async'),
+            {'name': 'description', 'content': 'a & b', 'async': ''}
+        )
+
+
+class TestStructuredDataScanner(unittest.TestCase):
+
+    JOB_POSTING = ('<script type="application/ld+json">'
+                   '{"@context": "https://schema.org", "@type": "JobPosting", "title": "Dev",'
+                   ' "description": "&lt;p&gt;Python &amp;amp; Django&lt;/p&gt;&lt;ul&gt;&lt;li&gt;SQL&lt;/li&gt;&lt;/ul&gt;"}'
+                   '</script>')
+
+    def test_extracts_job_posting_description_as_text(self):
+        scanner = StructuredDataScanner()
+        scanner.feed(self.JOB_POSTING)
+
+        self.assertTrue(scanner.done)
+        self.assertEqual(scanner.job_posting, "Python & Django\n• SQL")
+
+    def test_html_to_text_keeps_block_boundaries(self):
+        self.assertEqual(
+            StructuredDataScanner.html_to_text('<h3>Requisitos</h3><ul><li>Python <b>avançado</b></li><li></li></ul>'
+                                               '<p>Remoto<br>CLT</p>Linha\n  com   espaços'),
+            "Requisitos\n• Python avançado\nRemoto\nCLT\nLinha\ncom espaços"
+        )
+
+    def test_finds_job_posting_in_graph_and_type_lists(self):
+        scanner = StructuredDataScanner()
+        scanner.feed('<script type="application/ld+json">{"@graph": [{"@type": "WebPage", "description": "Site"},'
+                     ' {"@type": ["Thing", "schema:JobPosting"], "description": "Vaga completa"}]}</script>')
+
+        self.assertEqual(scanner.job_posting, "Vaga completa")
+
+    def test_skips_other_scripts_and_invalid_json(self):
+        scanner = StructuredDataScanner()
+        scanner.feed('<script>var s = "<script type=application/ld+json>";</script>'
+                     '<script type="application/ld+json">{invalido</script>'
+                     '<script type="application/ld+json"><!--{"@type": "Organization", "description": "Empresa"}--></script>')
+
+        self.assertFalse(scanner.done)
+        self.assertIsNone(scanner.job_posting)
+        self.assertEqual(scanner.invalid_json, 1)
+
+    def test_script_split_across_chunks(self):
+        scanner = StructuredDataScanner()
+        for start in range(0, len(self.JOB_POSTING), 7):
+            scanner.feed(self.JOB_POSTING[start:start + 7])
+
+        self.assertEqual(scanner.job_posting, "Python & Django\n• SQL")
+
+    def test_collects_og_description(self):
+        scanner = StructuredDataScanner()
+        scanner.feed('<meta property="og:description" content="Resumo &amp; mais">'
+                     '<meta property="og:description" content="Segundo">')
+
+        self.assertEqual(scanner.candidates(), {'json-ld': None, 'og': "Resumo & mais"})
+
+
+class TestStructuredDataStream(unittest.TestCase):
+
+    HEAD = (b'<html><head><meta name="description" content="Resumo truncado">'
+            b'<meta property="og:description" content="Resumo og"></head><body>')
+    JOB_POSTING = b'<script type="application/ld+json">{"@type": "JobPosting", "description": "Completa"}</script>'
+
+    def test_disabled_by_default(self):
+        stream = MetaDescriptionStream()
+
+        self.assertTrue(stream.feed(self.HEAD))
+        self.assertEqual(stream.finish(), "Resumo truncado")
+        self.assertEqual(stream.source, 'meta')
+
+    def test_job_posting_in_body_outranks_meta(self):
+        stream = MetaDescriptionStream(structured_data_max_bytes=1024)
+
+        self.assertFalse(stream.feed(self.HEAD))
+        self.assertTrue(stream.feed(b'<p>texto</p>' + self.JOB_POSTING))
+        self.assertEqual(stream.finish(), "Completa")
+        self.assertEqual(stream.source, 'json-ld')
+
+    def test_stops_scanning_at_byte_budget(self):
+        stream = MetaDescriptionStream(structured_data_max_bytes=len(self.HEAD) + 10)
+        stream.feed(self.HEAD)
+
+        self.assertTrue(stream.feed(b'x' * 20))
+        self.assertEqual(stream.finish(), "Resumo truncado")
+
+    def test_og_description_is_last_resort(self):
+        stream = MetaDescriptionStream(structured_data_max_bytes=1024)
+        stream.feed(b'<head><meta property="og:description" content="Resumo og"></head>')
+
+        self.assertEqual(stream.finish(), "Resumo og")
+        self.assertEqual(stream.source, 'og')
+
+    def test_job_posting_skips_soup_fallback(self):
+        stream = MetaDescriptionStream(backend='regex', structured_data_max_bytes=1024)
+        stream.feed(self.JOB_POSTING + b'<meta name="description" content="Truncada')
+
+        self.assertEqual(stream.finish(), "Completa")
+        self.assertFalse(stream.fell_back)
+
+    def test_rank(self):
+        self.assertEqual(MetaDescriptionStream.rank({'og': "og", 'meta': "meta"}), ('meta', "meta"))
+        self.assertEqual(MetaDescriptionStream.rank({'json-ld': "", 'og': "og"}), ('og', "og"))
+        self.assertEqual(MetaDescriptionStream.rank({}), (None, None))
+
+
+@unittest.skipIf(etree is None, "lxml não instalado")
+class TestLxmlMetaDescriptionParser(unittest.TestCase):
+
+    def test_finds_description_in_chunks(self):
+        parser = LxmlMetaDescriptionParser()
+        parser.feed('<html><head><meta name="descr')
+        parser.feed('iption" content="Vaga &amp; Ops"></head>')
+
+        self.assertTrue(parser.done)
+        self.assertEqual(parser.description, "Vaga & Ops")
+
+    def test_stops_at_body(self):
+        parser = LxmlMetaDescriptionParser()
+        parser.feed('<html><head><title>t</title></head><body><meta name="description" content="x">')
+
+        self.assertTrue(parser.done)
+        self.assertIsNone(parser.description)
+
+
+if __name__ == '__main__':
+    unittest.main()
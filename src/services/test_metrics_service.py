@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import MetricsService
+
+
+class TestMetricsService(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = MetricsService(buckets=(0.1, 1.0))
+
+    def test_observe_stage_fills_buckets(self):
+        self.metrics.observe_stage('fetch', 0.05)
+        self.metrics.observe_stage('fetch', 0.1)
+        self.metrics.observe_stage('fetch', 0.5)
+        self.metrics.observe_stage('fetch', 3.0)
+
+        counts, total, count = self.metrics.stage_duration.snapshot()[('fetch',)]
+
+        self.assertEqual(counts, [2, 1, 1])
+        self.assertAlmostEqual(total, 3.65)
+        self.assertEqual(count, 4)
+
+    def test_render_histogram_is_cumulative(self):
+        self.metrics.observe_stage('completion', 0.05)
+        self.metrics.observe_stage('completion', 0.5)
+
+        output = self.metrics.render()
+
+        self.assertIn('# TYPE analysis_stage_duration_seconds histogram', output)
+        self.assertIn('analysis_stage_duration_seconds_bucket{stage="completion",le="0.1"} 1', output)
+        self.assertIn('analysis_stage_duration_seconds_bucket{stage="completion",le="1.0"} 2', output)
+        self.assertIn('analysis_stage_duration_seconds_bucket{stage="completion",le="+Inf"} 2', output)
+        self.assertIn('analysis_stage_duration_seconds_sum{stage="completion"} 0.55', output)
+        self.assertIn('analysis_stage_duration_seconds_count{stage="completion"} 2', output)
+        self.assertTrue(output.endswith('\n'))
+
+    def test_observe_request(self):
+        self.metrics.observe_request('/analyse', 200, 0.2)
+        self.metrics.observe_request('/analyse', 200, 0.3)
+        self.metrics.observe_request('/analyse', 404, 0.01)
+
+        output = self.metrics.render()
+
+        self.assertIn('analysis_http_requests_total{route="/analyse",status="200"} 2', output)
+        self.assertIn('analysis_http_requests_total{route="/analyse",status="404"} 1', output)
+        self.assertIn('analysis_http_request_duration_seconds_count{route="/analyse"} 3', output)
+
+    def test_track_times_and_counts_errors(self):
+        with self.metrics.track('format'):
+            pass
+
+        with self.assertRaises(ValueError):
+            with self.metrics.track('format'):
+                raise ValueError("falhou")
+
+        self.assertEqual(self.metrics.stage_duration.snapshot()[('format',)][2], 2)
+        self.assertEqual(self.metrics.stage_errors.snapshot(), {('format',): 1})
+
+    def test_count_errors_only_counts(self):
+        with self.metrics.count_errors('fetch'):
+            pass
+
+        with self.assertRaises(RuntimeError):
+            with self.metrics.count_errors('fetch'):
+                raise RuntimeError("falhou")
+
+        self.assertEqual(self.metrics.stage_errors.snapshot(), {('fetch',): 1})
+        self.assertEqual(self.metrics.stage_duration.snapshot(), {})
+        self.assertIn('analysis_stage_errors_total{stage="fetch"} 1', self.metrics.render())
+
+    def test_count_parser_fallback(self):
+        self.metrics.count_parser_fallback('regex')
+        self.metrics.count_parser_fallback('regex')
+
+        self.assertEqual(self.metrics.parser_fallbacks.snapshot(), {('regex',): 2})
+        self.assertIn('analysis_parser_fallbacks_total{backend="regex"} 2', self.metrics.render())
+
+    def test_count_description_source(self):
+        self.metrics.count_description_source('json-ld')
+
+        self.assertIn('analysis_description_sources_total{source="json-ld"} 1', self.metrics.render())
+
+    def test_render_without_observations(self):
+        output = self.metrics.render()
+
+        self.assertIn('# HELP analysis_stage_errors_total', output)
+        self.assertIn('# TYPE analysis_http_requests_total counter', output)
+        self.assertNotIn('_bucket', output)
+
+    def test_escape_label(self):
+        self.assertEqual(MetricsService.escape_label('a"b\\c\nd'), 'a\\"b\\\\c\\nd')
+        self.assertEqual(MetricsService.format_labels(('route', 'status'), ('/x', 200)), 'route="/x",status="200"')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import Mock, patch
 import requests
@@ -5,7 +6,7 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.services import OpenAIService
+from src.services import OpenAIService, AnalysisCacheService, SemanticCacheService, PromptBudgetService, ProfileBatcherService, AdaptiveLimiterService, UpstreamOverloadedError, RetryPolicy, CircuitBreaker, CircuitOpenError
 
 
 class TestOpenAIService(unittest.TestCase):
@@ -26,6 +27,19 @@ class TestOpenAIService(unittest.TestCase):
         service = OpenAIService()
         self.assertEqual(service.api_url, '')
 
+    def test_analyze_match_uses_session(self):
+        mock_session = Mock()
+        mock_session.post.return_value.status_code = 200
+        mock_session.post.return_value.json.return_value = {"choices": [{"message": {"content": "Match"}}]}
+        service = OpenAIService(session=mock_session)
+
+        with patch('builtins.print'):
+            result = service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(result, "Match")
+        mock_session.post.assert_called_once()
+        self.assertIsNone(self.service.session)
+
     def test_system_prompt_initialization(self):
         expected_content = ("Você é um assistente de IA e trabalha fazendo match de habilidades com descrição de vagas. "
                           "As habilidades chegam no seguinte formato JSON para você: {\"skills\":[]}, a descrição da vaga chega em formato de texto. "
@@ -241,5 +255,477 @@ class TestOpenAIService(unittest.TestCase):
         self.assertIn(long_description, payload['messages'][1]['content'])
 
 
+class TestOpenAIServiceWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = AnalysisCacheService(max_entries=10, ttl=60)
+        self.service = OpenAIService(cache=self.cache)
+
+        self.mock_response = Mock()
+        self.mock_response.status_code = 200
+        self.mock_response.json.return_value = {
+            "choices": [{"message": {"content": "Match de 80%"}}]
+        }
+        self.mock_response.raise_for_status.return_value = None
+
+    def test_init_with_cache(self):
+        self.assertIs(self.service.cache, self.cache)
+        self.assertIsNone(OpenAIService().cache)
+
+    @patch('services.openai_service.requests.post')
+    @patch('builtins.print')
+    def test_analyze_match_returns_cached_analysis(self, mock_print, mock_post):
+        mock_post.return_value = self.mock_response
+
+        first = self.service.analyze_match(["Python", "Flask"], "Vaga Python", "api-key", "https://test-api.com")
+        second = self.service.analyze_match([" flask", "PYTHON", "python"], "Vaga Python", "api-key", "https://test-api.com")
+
+        self.assertEqual(first, "Match de 80%")
+        self.assertEqual(second, "Match de 80%")
+        mock_post.assert_called_once()
+        mock_print.assert_any_call("[OPENAI] Análise obtida do cache")
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    @patch('services.openai_service.requests.post')
+    def test_analyze_match_different_description_misses_cache(self, mock_post):
+        mock_post.return_value = self.mock_response
+
+        self.service.analyze_match(["Python"], "Vaga Python", "api-key", "https://test-api.com")
+        self.service.analyze_match(["Python"], "Vaga Java", "api-key", "https://test-api.com")
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('services.openai_service.requests.post')
+    def test_analyze_match_different_api_url_misses_cache(self, mock_post):
+        mock_post.return_value = self.mock_response
+
+        self.service.analyze_match(["Python"], "Vaga Python", "api-key", "https://test-api.com")
+        self.service.analyze_match(["Python"], "Vaga Python", "api-key", "https://other-api.com")
+
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('services.openai_service.requests.post')
+    @patch('builtins.print')
+    def test_analyze_match_invalid_response_is_not_cached(self, mock_print, mock_post):
+        self.mock_response.json.return_value = {"choices": []}
+        mock_post.return_value = self.mock_response
+
+        with self.assertRaises(ValueError):
+            self.service.analyze_match(["Python"], "Vaga Python", "api-key", "https://test-api.com")
+
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+class TestOpenAIServiceWithSemanticCache(unittest.TestCase):
+
+    def setUp(self):
+        self.semantic_cache = SemanticCacheService(threshold=0.85)
+        self.mock_session = Mock()
+        self.mock_session.post.return_value.status_code = 200
+        self.mock_session.post.return_value.json.return_value = {"choices": [{"message": {"content": "Match de 80%"}}]}
+        self.service = OpenAIService(session=self.mock_session, semantic_cache=self.semantic_cache)
+
+    @patch('builtins.print')
+    def test_similar_profile_reuses_analysis(self, mock_print):
+        self.service.analyze_match(["Python", "Flask", "Docker"], "Vaga Python", "api-key", "https://test-api.com")
+        result = self.service.analyze_match(["python", "flask", "docker", "git"], "Vaga Python", "api-key", "https://test-api.com")
+
+        self.assertEqual(result, "Match de 80%")
+        self.mock_session.post.assert_called_once()
+        self.assertEqual(self.semantic_cache.stats()['hits'], 1)
+
+    @patch('builtins.print')
+    def test_scope_includes_description_and_api_url(self, mock_print):
+        self.service.analyze_match(["Python"], "Vaga Python", "api-key", "https://test-api.com")
+        self.service.analyze_match(["Python"], "Vaga Java", "api-key", "https://test-api.com")
+        self.service.analyze_match(["Python"], "Vaga Python", "api-key", "https://other-api.com")
+
+        self.assertEqual(self.mock_session.post.call_count, 3)
+
+    @patch('builtins.print')
+    def test_exact_cache_is_checked_first(self, mock_print):
+        self.service.cache = AnalysisCacheService()
+        self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+        self.service.analyze_match(["python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(self.semantic_cache.stats()['hits'], 0)
+        self.assertEqual(self.service.cache.stats()['hits'], 1)
+
+    @patch('builtins.print')
+    def test_stream_match_uses_similar_analysis(self, mock_print):
+        self.mock_session.post.return_value.iter_lines.return_value = iter([
+            b'data: {"choices": [{"delta": {"content": "Match de 80%"}}]}',
+            b'data: [DONE]'
+        ])
+
+        list(self.service.stream_match(["Python", "Flask", "Docker"], "Vaga", "api-key", "https://test-api.com"))
+        cached = list(self.service.stream_match(["Python", "Flask", "Docker", "Git"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertEqual(cached, ["Match de 80%"])
+        self.mock_session.post.assert_called_once()
+
+
+class TestOpenAIServiceWithPromptBudget(unittest.TestCase):
+
+    def setUp(self):
+        self.budget = PromptBudgetService(min_completion_tokens=200, completion_tokens_per_skill=50)
+        self.session = Mock()
+        self.session.post.return_value.status_code = 200
+        self.session.post.return_value.json.return_value = {"choices": [{"message": {"content": "Match"}}]}
+        self.service = OpenAIService(session=self.session, budget=self.budget)
+
+    @patch('builtins.print')
+    def test_payload_uses_compressed_description_and_adaptive_cap(self, mock_print):
+        self.service.analyze_match(["Python", "Flask"], "Vaga Python. Vaga Python. Plano de saúde.", "key", "https://test-api.com")
+
+        payload = self.session.post.call_args[1]['json']
+        self.assertEqual(payload["messages"][1]["content"], "Habilidades do candidato: Python, Flask\nDescrição da vaga: Vaga Python.")
+        self.assertEqual(payload["max_completion_tokens"], 300)
+        self.assertEqual(self.budget.stats()['requests'], 1)
+
+    def test_cache_key_depends_on_budget_settings(self):
+        cached = OpenAIService(cache=AnalysisCacheService())
+        budgeted = OpenAIService(cache=AnalysisCacheService(), budget=self.budget)
+
+        self.assertNotEqual(
+            cached._build_cache_key(["Python"], "Vaga", "https://test-api.com"),
+            budgeted._build_cache_key(["Python"], "Vaga", "https://test-api.com")
+        )
+
+
+class TestOpenAIServiceWithBatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.session = Mock()
+        self.session.post.return_value.status_code = 200
+        self.service = OpenAIService(session=self.session, batcher=ProfileBatcherService(window=0.001))
+
+    def _reply(self, content):
+        self.session.post.return_value.json.return_value = {"choices": [{"message": {"content": content}}]}
+
+    @patch('builtins.print')
+    def test_single_profile_uses_regular_payload(self, mock_print):
+        self._reply("Match")
+
+        self.assertEqual(self.service.analyze_match(["Python"], "Vaga", "key", "https://test-api.com"), "Match")
+        self.assertNotIn("response_format", self.session.post.call_args[1]['json'])
+
+    @patch('builtins.print')
+    def test_complete_profiles_sends_one_structured_prompt(self, mock_print):
+        self._reply(json.dumps({"analyses": [{"profile": 2, "analysis": "Match Java"}, {"profile": 1, "analysis": "Match Python"}]}))
+
+        results = self.service._complete_profiles([["Python", "Flask"], ["Java"]], "Vaga", "key", "https://test-api.com")
+
+        self.assertEqual(results, ["Match Python", "Match Java"])
+        payload = self.session.post.call_args[1]['json']
+        self.assertEqual(payload["max_completion_tokens"], 2000)
+        self.assertEqual(payload["response_format"], {"type": "json_object"})
+        self.assertTrue(payload["messages"][1]["content"].startswith(
+            "Perfis de habilidades:\n1. Python, Flask\n2. Java\nDescrição da vaga: Vaga\n"
+        ))
+        mock_print.assert_any_call("[OPENAI] Analisando match em lote para 2 perfis de habilidades")
+
+    @patch('builtins.print')
+    def test_parse_batch_result_leaves_missing_profiles_empty(self, mock_print):
+        content = json.dumps({"analyses": [{"profile": 1, "analysis": "Match"}, {"profile": 5, "analysis": "x"}, "lixo"]})
+
+        self.assertEqual(OpenAIService._parse_batch_result({"choices": [{"message": {"content": content}}]}, 2), ["Match", None])
+        self.assertEqual(OpenAIService._parse_batch_result({"choices": [{"message": {"content": "texto"}}]}, 2), [None, None])
+        mock_print.assert_any_call("[OPENAI] Resposta em lote sem análise para 1 perfis, refazendo individualmente")
+
+    @patch('builtins.print')
+    def test_missing_batch_analysis_falls_back_to_single_call(self, mock_print):
+        self._reply("Match individual")
+        self.service.batcher.submit = Mock(return_value=None)
+
+        result = self.service.analyze_match(["Python"], "Vaga", "key", "https://test-api.com")
+
+        self.assertEqual(result, "Match individual")
+        self.assertEqual(self.service.batcher.submit.call_args[0][0], ("https://test-api.com", "key", "Vaga"))
+        self.session.post.assert_called_once()
+
+
+class TestOpenAIServiceStreaming(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_session = Mock()
+        self.service = OpenAIService(session=self.mock_session)
+
+    def _stream_response(self, lines, status_code=200):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.text = "error body"
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_lines.return_value = iter(lines)
+        return mock_response
+
+    @patch('builtins.print')
+    def test_stream_match_yields_deltas(self, mock_print):
+        mock_response = self._stream_response([
+            b'data: {"choices": []}',
+            b'',
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b'data: {"choices": [{"delta": {"content": "Match "}}]}',
+            b': keep-alive',
+            b'data: {"choices": [{"delta": {"content": "de 80%"}}]}',
+            b'data: [DONE]',
+            b'data: {"choices": [{"delta": {"content": "ignorado"}}]}'
+        ])
+        self.mock_session.post.return_value = mock_response
+
+        chunks = list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertEqual(chunks, ["Match ", "de 80%"])
+        payload = self.mock_session.post.call_args[1]['json']
+        self.assertTrue(payload['stream'])
+        self.assertTrue(self.mock_session.post.call_args[1]['stream'])
+        mock_response.close.assert_called_once()
+        mock_print.assert_any_call("[OPENAI] Análise em streaming concluída com sucesso")
+
+    @patch('builtins.print')
+    def test_stream_match_caches_full_message(self, mock_print):
+        self.service.cache = AnalysisCacheService()
+        self.mock_session.post.return_value = self._stream_response([
+            b'data: {"choices": [{"delta": {"content": "Match de 80%"}}]}',
+            b'data: [DONE]'
+        ])
+
+        list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+        cached = list(self.service.stream_match(["python"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertEqual(cached, ["Match de 80%"])
+        self.mock_session.post.assert_called_once()
+        self.assertEqual(self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com"), "Match de 80%")
+
+    @patch('builtins.print')
+    def test_stream_match_http_error(self, mock_print):
+        mock_response = self._stream_response([], status_code=500)
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
+        self.mock_session.post.return_value = mock_response
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        mock_print.assert_any_call("[OPENAI] ERRO: Status code 500")
+        mock_response.close.assert_called_once()
+
+    @patch('builtins.print')
+    def test_stream_match_request_exception(self, mock_print):
+        self.mock_session.post.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with self.assertRaises(requests.exceptions.RequestException):
+            list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        mock_print.assert_any_call("[OPENAI] ERRO de requisição: Connection failed")
+
+    @patch('builtins.print')
+    def test_stream_match_invalid_chunk(self, mock_print):
+        self.mock_session.post.return_value = self._stream_response([b'data: not-json'])
+
+        with self.assertRaises(ValueError):
+            list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertTrue(any(call[0][0].startswith("[OPENAI] ERRO:") for call in mock_print.call_args_list))
+
+
+class TestOpenAIServiceWithLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_session = Mock()
+        self.limiter = AdaptiveLimiterService(initial_limit=4)
+        self.service = OpenAIService(session=self.mock_session, limiter=self.limiter)
+
+    def _response(self, status_code, headers=None):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.headers = headers or {}
+        mock_response.text = "body"
+        mock_response.json.return_value = {"choices": [{"message": {"content": "Match"}}]}
+        mock_response.iter_lines.return_value = iter([b'data: {"choices": [{"delta": {"content": "Match"}}]}'])
+        return mock_response
+
+    @patch('builtins.print')
+    def test_analyze_match_releases_slot_and_records_success(self, mock_print):
+        self.mock_session.post.return_value = self._response(200)
+
+        result = self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(result, "Match")
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+        self.assertEqual(self.limiter.stats()['limit'], 4.25)
+
+    @patch('builtins.print')
+    def test_analyze_match_throttled_raises_overloaded(self, mock_print):
+        self.mock_session.post.return_value = self._response(429, {'retry-after': '7'})
+
+        with self.assertRaises(UpstreamOverloadedError) as context:
+            self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(context.exception.retry_after_seconds, 7)
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+        self.assertEqual(self.limiter.stats()['throttled'], 1)
+        self.assertEqual(self.limiter.stats()['limit'], 2)
+
+    @patch('builtins.print')
+    def test_analyze_match_releases_slot_on_request_exception(self, mock_print):
+        self.mock_session.post.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with self.assertRaises(requests.exceptions.RequestException):
+            self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+
+    @patch('builtins.print')
+    def test_stream_match_holds_slot_until_stream_ends(self, mock_print):
+        self.mock_session.post.return_value = self._response(200)
+
+        chunks = self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+        self.assertEqual(next(chunks), "Match")
+        self.assertEqual(self.limiter.stats()['in_flight'], 1)
+
+        self.assertEqual(list(chunks), [])
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+
+    @patch('builtins.print')
+    def test_stream_match_throttled_raises_overloaded(self, mock_print):
+        self.mock_session.post.return_value = self._response(429)
+
+        with self.assertRaises(UpstreamOverloadedError) as context:
+            list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertEqual(context.exception.retry_after_seconds, 1)
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+
+    @patch('builtins.print')
+    def test_stream_match_releases_slot_on_request_exception(self, mock_print):
+        self.mock_session.post.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with self.assertRaises(requests.exceptions.RequestException):
+            list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertEqual(self.limiter.stats()['in_flight'], 0)
+
+
+class TestOpenAIServiceWithRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_session = Mock()
+        self.service = OpenAIService(
+            session=self.mock_session,
+            retry_policy=RetryPolicy('openai', max_attempts=2, base_delay=0, retry_statuses=(502,))
+        )
+
+    def _response(self, status_code):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.headers = {}
+        mock_response.text = "body"
+        mock_response.json.return_value = {"choices": [{"message": {"content": "Match"}}]}
+        mock_response.iter_lines.return_value = iter([b'data: {"choices": [{"delta": {"content": "Match"}}]}'])
+        if status_code != 200:
+            mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                f"{status_code}", response=Mock(status_code=status_code)
+            )
+        return mock_response
+
+    @patch('builtins.print')
+    def test_analyze_match_retries_bad_gateway(self, mock_print):
+        self.mock_session.post.side_effect = [self._response(502), self._response(200)]
+
+        self.assertEqual(self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com"), "Match")
+        self.assertEqual(self.mock_session.post.call_count, 2)
+
+    @patch('builtins.print')
+    def test_analyze_match_retries_connection_errors(self, mock_print):
+        self.mock_session.post.side_effect = [requests.exceptions.ConnectionError("reset"), self._response(200)]
+
+        self.assertEqual(self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com"), "Match")
+
+    @patch('builtins.print')
+    def test_analyze_match_does_not_retry_read_timeouts_or_client_errors(self, mock_print):
+        self.mock_session.post.side_effect = requests.exceptions.ReadTimeout("slow")
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.mock_session.post.side_effect = [self._response(400), self._response(200)]
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(self.mock_session.post.call_count, 2)
+
+    @patch('builtins.print')
+    def test_stream_match_retries_opening_the_stream(self, mock_print):
+        failed = self._response(502)
+        self.mock_session.post.side_effect = [failed, self._response(200)]
+
+        chunks = list(self.service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        self.assertEqual(chunks, ["Match"])
+        failed.close.assert_called_once()
+
+
+class TestOpenAIServiceWithCircuitBreaker(unittest.TestCase):
+
+    @patch('builtins.print')
+    def test_open_circuit_fails_fast_without_calling_api(self, mock_print):
+        mock_session = Mock()
+        mock_session.post.side_effect = requests.exceptions.ConnectionError("reset")
+        service = OpenAIService(session=mock_session, circuit_breaker=CircuitBreaker('openai', failure_threshold=1))
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+        with self.assertRaises(CircuitOpenError):
+            service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+        with self.assertRaises(CircuitOpenError):
+            list(service.stream_match(["Python"], "Vaga", "api-key", "https://test-api.com"))
+
+        mock_session.post.assert_called_once()
+
+    @patch('builtins.print')
+    def test_server_errors_count_as_failures(self, mock_print):
+        mock_response = Mock(status_code=500, headers={}, text="boom")
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500", response=mock_response)
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
+        breaker = CircuitBreaker('openai', failure_threshold=1)
+        service = OpenAIService(session=mock_session, circuit_breaker=breaker)
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+
+    @patch('builtins.print')
+    def test_limiter_rejection_does_not_close_half_open_circuit(self, mock_print):
+        mock_session = Mock()
+        breaker = CircuitBreaker('openai', failure_threshold=1, recovery_timeout=0)
+        breaker.state = CircuitBreaker.OPEN
+        limiter = AdaptiveLimiterService(initial_limit=1, max_queue=0)
+        limiter.in_flight = 1
+        service = OpenAIService(session=mock_session, limiter=limiter, circuit_breaker=breaker)
+
+        with self.assertRaises(UpstreamOverloadedError):
+            service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(breaker.stats()['failures'], 0)
+        mock_session.post.assert_not_called()
+
+    @patch('builtins.print')
+    def test_throttled_response_is_neutral_for_circuit(self, mock_print):
+        mock_response = Mock(status_code=429, headers={'retry-after': '2'}, text="slow down")
+        mock_session = Mock()
+        mock_session.post.return_value = mock_response
+        breaker = CircuitBreaker('openai', failure_threshold=2)
+        breaker.failures = 1
+        service = OpenAIService(session=mock_session, circuit_breaker=breaker)
+
+        with self.assertRaises(UpstreamOverloadedError):
+            service.analyze_match(["Python"], "Vaga", "api-key", "https://test-api.com")
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.failures, 1)
+
 if __name__ == '__main__':
     unittest.main()
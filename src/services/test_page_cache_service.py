@@ -0,0 +1,270 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import PageCacheService, CachedPage, MemoryCacheBackend, CacheSerializer
+
+
+class TestCachedPage(unittest.TestCase):
+
+    def test_is_fresh_within_ttl(self):
+        page = CachedPage(url="https://example.com", content=b"html")
+        self.assertTrue(page.is_fresh(60))
+
+    def test_is_fresh_expired(self):
+        page = CachedPage(url="https://example.com", content=b"html", stored_at=time.time() - 120)
+        self.assertFalse(page.is_fresh(60))
+
+    def test_conditional_headers(self):
+        page = CachedPage(url="https://example.com", content=b"html", etag='"abc"',
+                          last_modified="Wed, 21 Oct 2026 07:28:00 GMT")
+
+        self.assertEqual(page.conditional_headers(), {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': "Wed, 21 Oct 2026 07:28:00 GMT"
+        })
+
+    def test_conditional_headers_without_validators(self):
+        page = CachedPage(url="https://example.com", content=b"html")
+        self.assertFalse(page.has_validators())
+        self.assertEqual(page.conditional_headers(), {})
+
+
+class TestPageCacheService(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = PageCacheService(max_entries=2, max_bytes=100, ttl=60)
+
+    def test_get_missing_key_counts_miss(self):
+        self.assertIsNone(self.cache.get("https://example.com/"))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_set_and_get_counts_hit(self):
+        self.cache.set("a", CachedPage(url="a", content=b"html"))
+
+        entry = self.cache.get("a")
+
+        self.assertEqual(entry.content, b"html")
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['bytes'], 4)
+
+    def test_lru_eviction_by_entries(self):
+        self.cache.set("a", CachedPage(url="a", content=b"1"))
+        self.cache.set("b", CachedPage(url="b", content=b"2"))
+        self.cache.get("a")
+        self.cache.set("c", CachedPage(url="c", content=b"3"))
+
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_eviction_by_bytes(self):
+        self.cache.set("a", CachedPage(url="a", content=b"x" * 60))
+        self.cache.set("b", CachedPage(url="b", content=b"y" * 60))
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats()['bytes'], 60)
+
+    def test_entry_larger_than_limit_is_not_stored(self):
+        self.cache.set("a", CachedPage(url="a", content=b"x" * 101))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_replacing_entry_updates_size(self):
+        self.cache.set("a", CachedPage(url="a", content=b"x" * 10))
+        self.cache.set("a", CachedPage(url="a", content=b"x" * 20))
+        self.assertEqual(self.cache.stats()['bytes'], 20)
+
+    def test_expired_entry_without_validators_is_dropped(self):
+        self.cache.set("a", CachedPage(url="a", content=b"1", stored_at=time.time() - 120))
+
+        self.assertIsNone(self.cache.get("a"))
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['evictions'], 1)
+
+    def test_expired_entry_with_validators_is_kept_for_revalidation(self):
+        self.cache.set("a", CachedPage(url="a", content=b"1", etag='"v1"', stored_at=time.time() - 120))
+
+        entry = self.cache.get("a")
+
+        self.assertIsNotNone(entry)
+        self.assertFalse(entry.is_fresh(self.cache.ttl))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_revalidate_refreshes_entry(self):
+        self.cache.set("a", CachedPage(url="a", content=b"1", etag='"v1"', stored_at=time.time() - 120))
+
+        self.cache.revalidate("a")
+
+        self.assertTrue(self.cache.get("a").is_fresh(self.cache.ttl))
+        self.assertEqual(self.cache.stats()['revalidations'], 1)
+
+    def test_revalidate_missing_key_is_noop(self):
+        self.cache.revalidate("missing")
+        self.assertEqual(self.cache.stats()['revalidations'], 0)
+
+    def test_clear(self):
+        self.cache.set("a", CachedPage(url="a", content=b"1"))
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        self.assertEqual(self.cache.stats()['bytes'], 0)
+
+
+class TestPageCacheServiceDisk(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = PageCacheService(ttl=60, disk_dir=self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_disk_tier_survives_memory_clear(self):
+        self.cache.set("a", CachedPage(url="https://example.com", content=b"<html>\n</html>", etag='"v1"'))
+        self.cache.clear()
+
+        entry = self.cache.get("a")
+
+        self.assertEqual(entry.content, b"<html>\n</html>")
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertEqual(self.cache.stats()['disk_hits'], 1)
+
+    def test_disk_tier_shared_between_instances(self):
+        self.cache.set("a", CachedPage(url="https://example.com", content=b"html"))
+
+        other = PageCacheService(ttl=60, disk_dir=self.tmp_dir.name)
+
+        self.assertEqual(other.get("a").content, b"html")
+
+    def test_expired_disk_entry_without_validators_is_removed(self):
+        self.cache.set("a", CachedPage(url="a", content=b"1", stored_at=time.time() - 120))
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_disk_tier_evicts_files_by_entries(self):
+        cache = PageCacheService(max_entries=2, ttl=60, disk_dir=self.tmp_dir.name)
+        cache.set("a", CachedPage(url="a", content=b"1"))
+        cache.set("b", CachedPage(url="b", content=b"2"))
+        cache.set("c", CachedPage(url="c", content=b"3"))
+
+        self.assertFalse(os.path.exists(cache._disk_path("a")))
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+        self.assertEqual(cache.stats()['disk_entries'], 2)
+
+    def test_disk_tier_evicts_files_by_bytes(self):
+        cache = PageCacheService(max_bytes=100, ttl=60, disk_dir=self.tmp_dir.name)
+        cache.set("a", CachedPage(url="a", content=b"x" * 60))
+        cache.set("b", CachedPage(url="b", content=b"y" * 60))
+
+        self.assertEqual(os.listdir(self.tmp_dir.name), [os.path.basename(cache._disk_path("b"))])
+        self.assertEqual(cache.stats()['disk_bytes'], 60)
+
+    def test_disk_tier_limits_apply_to_files_from_previous_runs(self):
+        for key in ("a", "b", "c"):
+            self.cache.set(key, CachedPage(url=key, content=b"html"))
+            os.utime(self.cache._disk_path(key), (time.time(), time.time() + ord(key)))
+
+        cache = PageCacheService(max_entries=1, ttl=60, disk_dir=self.tmp_dir.name)
+
+        self.assertEqual(os.listdir(self.tmp_dir.name), [os.path.basename(cache._disk_path("c"))])
+        self.assertEqual(cache.get("c").content, b"html")
+
+    @patch('builtins.print')
+    def test_corrupted_disk_entry_is_ignored(self, mock_print):
+        self.cache.set("a", CachedPage(url="a", content=b"1"))
+        self.cache.clear()
+        path = self.cache._disk_path("a")
+        with open(path, 'wb') as f:
+            f.write(b"not json")
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertTrue(mock_print.call_args[0][0].startswith("[PAGE_CACHE] ERRO ao ler cache em disco:"))
+
+    @patch('builtins.print')
+    @patch('services.page_cache_service.os.replace')
+    def test_disk_write_error_is_logged(self, mock_replace, mock_print):
+        mock_replace.side_effect = OSError("disk full")
+
+        self.cache.set("a", CachedPage(url="a", content=b"1"))
+
+        mock_print.assert_called_with("[PAGE_CACHE] ERRO ao gravar cache em disco: disk full")
+
+
+class TestPageCacheServiceBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = MemoryCacheBackend()
+        self.cache = PageCacheService(ttl=60, backend=self.backend, serializer=CacheSerializer(compress_threshold=64))
+
+    def test_set_writes_through_to_backend(self):
+        self.cache.set("a", CachedPage(url="https://example.com", content=b"<p>vaga</p>" * 100, etag='"v1"'))
+
+        data = self.backend.get(PageCacheService.KEY_PREFIX + "a")
+
+        self.assertIsNotNone(data)
+        self.assertLess(len(data), 1100)
+        self.assertEqual(self.cache.decode(data).etag, '"v1"')
+
+    def test_backend_shared_between_replicas(self):
+        self.cache.set("a", CachedPage(url="https://example.com", content=b"html", encoding='latin-1', complete=False))
+        replica = PageCacheService(ttl=60, backend=self.backend)
+
+        entry = replica.get("a")
+
+        self.assertEqual(entry.content, b"html")
+        self.assertEqual(entry.encoding, 'latin-1')
+        self.assertFalse(entry.complete)
+        self.assertIsNone(entry.last_modified)
+        stats = replica.stats()
+        self.assertEqual(stats['backend_hits'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['entries'], 1)
+
+        replica.get("a")
+        self.assertEqual(replica.stats()['backend_hits'], 1)
+
+    def test_backend_miss_counts_miss(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+        self.assertEqual(self.cache.stats()['backend_hits'], 0)
+
+    def test_backend_ttl_keeps_entries_with_validators_for_revalidation(self):
+        plain = CachedPage(url="a", content=b"1")
+        validated = CachedPage(url="a", content=b"1", etag='"v1"')
+
+        self.assertLessEqual(self.cache._backend_ttl(plain), 60)
+        self.assertGreater(self.cache._backend_ttl(validated), PageCacheService.STALE_RETENTION)
+
+    def test_stale_backend_entry_without_validators_is_dropped(self):
+        self.backend.set(PageCacheService.KEY_PREFIX + "a",
+                         self.cache.encode(CachedPage(url="a", content=b"1", stored_at=time.time() - 120)))
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_revalidate_writes_through(self):
+        self.cache.set("a", CachedPage(url="a", content=b"1", etag='"v1"', stored_at=time.time() - 120))
+
+        self.cache.revalidate("a")
+
+        entry = PageCacheService(ttl=60, backend=self.backend).get("a")
+        self.assertTrue(entry.is_fresh(60))
+
+    @patch('builtins.print')
+    def test_corrupted_backend_entry_is_ignored(self, mock_print):
+        self.backend.set(PageCacheService.KEY_PREFIX + "a", b"not a cache entry")
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertTrue(mock_print.call_args[0][0].startswith("[PAGE_CACHE] ERRO ao ler cache compartilhado:"))
+
+
+if __name__ == '__main__':
+    unittest.main()
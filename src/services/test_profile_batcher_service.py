@@ -0,0 +1,87 @@
+import threading
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import ProfileBatcherService
+
+
+class TestProfileBatcherService(unittest.TestCase):
+
+    def setUp(self):
+        self.batcher = ProfileBatcherService(window=5, max_profiles=3)
+        self.calls = []
+
+    def _run_batch(self, profiles):
+        self.calls.append(profiles)
+        return [f"análise {', '.join(skills)}" for skills in profiles]
+
+    def _submit_concurrently(self, profiles, run_batch):
+        results = {}
+
+        def submit(skills):
+            try:
+                results[tuple(skills)] = self.batcher.submit('vaga', skills, run_batch)
+            except Exception as e:
+                results[tuple(skills)] = e
+
+        threads = [threading.Thread(target=submit, args=(skills,)) for skills in profiles]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        return results
+
+    def test_single_request_is_not_batched(self):
+        batcher = ProfileBatcherService(window=0.001)
+
+        self.assertIsNone(batcher.submit('vaga', ["Python"], self._run_batch))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(batcher.stats()['requests'], 1)
+        self.assertEqual(batcher.stats()['pending'], 0)
+
+    @patch('builtins.print')
+    def test_full_batch_runs_once_and_splits_results(self, mock_print):
+        results = self._submit_concurrently([["Python"], ["Java"], ["Go"]], self._run_batch)
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertCountEqual(self.calls[0], [["Python"], ["Java"], ["Go"]])
+        self.assertEqual(results, {("Python",): "análise Python", ("Java",): "análise Java", ("Go",): "análise Go"})
+        self.assertEqual(self.batcher.stats()['calls_saved'], 2)
+        mock_print.assert_called_once_with("[OPENAI_BATCH] 3 perfis de habilidades analisados em uma única chamada")
+
+    @patch('builtins.print')
+    def test_equivalent_profiles_share_one_slot(self, mock_print):
+        batcher = ProfileBatcherService(window=0.2, max_profiles=2)
+        barrier = threading.Barrier(3)
+        results = []
+
+        def submit(skills):
+            barrier.wait()
+            results.append(batcher.submit('vaga', skills, self._run_batch))
+
+        threads = [threading.Thread(target=submit, args=(skills,)) for skills in (["Python"], ["python "], ["Java"])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len(self.calls[0]), 2)
+        self.assertEqual(len(results), 3)
+
+    def test_batch_error_reaches_every_caller(self):
+        def failing_batch(profiles):
+            raise ValueError("falhou")
+
+        results = self._submit_concurrently([["Python"], ["Java"], ["Go"]], failing_batch)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results.values()))
+        self.assertEqual(self.batcher.stats()['batches'], 0)
+        self.assertEqual(self.batcher.stats()['pending'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
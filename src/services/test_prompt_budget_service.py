@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import PromptBudgetService, PromptBudget, TextProcessingService
+from src.services.meta_description_parser import StructuredDataScanner
+
+
+class TestPromptBudgetService(unittest.TestCase):
+
+    DESCRIPTION = ("Buscamos pessoa desenvolvedora Python para APIs em Flask. Experiência com Docker e AWS. "
+                   "Benefícios: vale-refeição, plano de saúde e Gympass. "
+                   "Somos uma empresa que valoriza a diversidade e inclusão. "
+                   "Experiência com Docker e AWS! "
+                   "Este site usa cookies para melhorar sua experiência.")
+
+    def setUp(self):
+        self.budget = PromptBudgetService()
+
+    def test_count_tokens_approximates_subword_pieces(self):
+        self.assertEqual(PromptBudgetService.count_tokens(""), 0)
+        self.assertEqual(PromptBudgetService.count_tokens("Vaga Python"), 3)
+        self.assertEqual(PromptBudgetService.count_tokens("Node.js, C#"), 6)
+
+    def test_compress_strips_boilerplate_and_repeated_sentences(self):
+        self.assertEqual(
+            self.budget.compress(self.DESCRIPTION),
+            "Buscamos pessoa desenvolvedora Python para APIs em Flask. Experiência com Docker e AWS."
+        )
+
+    def test_compress_truncates_at_sentence_boundary(self):
+        budget = PromptBudgetService(max_description_tokens=12)
+
+        self.assertEqual(budget.compress("Vaga para Python. Experiência com Flask e Docker. Inglês avançado."), "Vaga para Python.")
+        self.assertEqual(PromptBudgetService(max_description_tokens=3).compress("um dois três quatro cinco"), "um dois três")
+
+    def test_compress_keeps_description_without_useful_sentences(self):
+        self.assertEqual(self.budget.compress("Aceitar todos os cookies."), "Aceitar todos os cookies.")
+
+    def test_compress_json_ld_description_drops_only_boilerplate_blocks(self):
+        description = TextProcessingService.format_description(StructuredDataScanner.html_to_text(
+            '<p>Buscamos pessoa desenvolvedora backend</p>'
+            '<h3>Requisitos</h3><ul><li>Python e Flask</li><li>Experiência com cookies e sessões HTTP</li>'
+            '<li>Conhecimento de benefícios fiscais em sistemas de folha</li></ul>'
+            '<h3>Benefícios</h3><ul><li>Vale-refeição</li><li>Plano de saúde e plano odontológico</li><li>Gympass</li></ul>'
+        ))
+
+        self.assertEqual(
+            self.budget.compress(description),
+            "Buscamos pessoa desenvolvedora backend Requisitos • Python e Flask • Experiência com cookies e sessões HTTP "
+            "• Conhecimento de benefícios fiscais em sistemas de folha Benefícios"
+        )
+
+    def test_compress_keeps_flattened_json_ld_run(self):
+        description = ("Requisitos Python Django PostgreSQL e AWS Benefícios vale-refeição plano de saúde "
+                       "Diferenciais Kubernetes")
+
+        self.assertEqual(self.budget.compress(description), description)
+
+    def test_completion_tokens_scale_with_skills(self):
+        budget = PromptBudgetService(min_completion_tokens=200, completion_tokens_per_skill=50, max_completion_tokens=400)
+
+        self.assertEqual(budget.completion_tokens([]), 200)
+        self.assertEqual(budget.completion_tokens(["Python", "Flask"]), 300)
+        self.assertEqual(budget.completion_tokens(["a"] * 10), 400)
+
+    @patch('builtins.print')
+    def test_plan_reports_tokens_saved(self, mock_print):
+        plan = self.budget.plan(["Python", "Flask"], self.DESCRIPTION, "prompt")
+
+        self.assertIsInstance(plan, PromptBudget)
+        self.assertEqual(plan.max_completion_tokens, 320)
+        self.assertGreater(plan.tokens_saved, 0)
+        self.assertEqual(plan.original_tokens - plan.prompt_tokens, plan.tokens_saved)
+        mock_print.assert_called_once_with(
+            f"[PROMPT_BUDGET] Prompt com ~{plan.prompt_tokens} tokens ({plan.tokens_saved} economizados), "
+            f"limite de resposta 320"
+        )
+
+        stats = self.budget.stats()
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['tokens_saved'], plan.tokens_saved)
+        self.assertEqual(stats['completion_tokens_saved'], 680)
+        self.assertLess(stats['compression_ratio'], 1)
+
+    def test_stats_without_requests(self):
+        self.assertEqual(self.budget.stats()['compression_ratio'], 1.0)
+        self.assertEqual(self.budget.tokens_saved(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
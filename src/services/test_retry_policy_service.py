@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import RetryBudget, RetryPolicy
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def test_withdraw_until_exhausted(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_balance=2)
+
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        self.assertEqual(budget.stats(), {'balance': 0, 'exhausted': 1})
+
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+    def test_deposit_is_capped(self):
+        budget = RetryBudget(ratio=5, min_per_second=0, max_balance=3)
+
+        budget.deposit()
+
+        self.assertEqual(budget.stats()['balance'], 3)
+
+    def test_refills_over_time(self):
+        budget = RetryBudget(ratio=0, min_per_second=1000, max_balance=1)
+        budget.withdraw()
+
+        with patch('time.monotonic', return_value=budget._refilled_at + 1):
+            self.assertTrue(budget.withdraw())
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_backoff_uses_full_jitter_with_cap(self):
+        policy = RetryPolicy('test', base_delay=0.1, max_delay=0.3)
+
+        for _ in range(50):
+            self.assertLessEqual(policy.backoff(1), 0.1)
+            self.assertLessEqual(policy.backoff(5), 0.3)
+            self.assertGreaterEqual(policy.backoff(5), 0)
+
+    def test_retries_status(self):
+        policy = RetryPolicy('test', retry_statuses=(503,))
+
+        self.assertTrue(policy.retries_status(503))
+        self.assertFalse(policy.retries_status(500))
+
+    @patch('builtins.print')
+    @patch('time.sleep')
+    def test_run_retries_until_success(self, mock_sleep, mock_print):
+        policy = RetryPolicy('scrape', max_attempts=3, base_delay=0.1)
+        outcomes = [ConnectionError("reset"), ConnectionError("reset"), "ok"]
+
+        def operation():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.assertEqual(policy.run(operation, lambda e: True), "ok")
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(policy.stats()['retries'], 2)
+        self.assertEqual(policy.stats()['calls'], 1)
+        self.assertTrue(mock_print.call_args_list[0][0][0].startswith("[RETRY] scrape: tentativa 2 de 3 em "))
+
+    @patch('builtins.print')
+    @patch('time.sleep')
+    def test_run_gives_up_after_max_attempts(self, mock_sleep, mock_print):
+        policy = RetryPolicy('scrape', max_attempts=2)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise ConnectionError("reset")
+
+        with self.assertRaises(ConnectionError):
+            policy.run(operation, lambda e: True)
+
+        self.assertEqual(len(calls), 2)
+
+    def test_run_does_not_retry_permanent_errors(self):
+        policy = RetryPolicy('scrape', max_attempts=3)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise ValueError("404")
+
+        with self.assertRaises(ValueError):
+            policy.run(operation, lambda e: False)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(policy.stats()['retries'], 0)
+
+    @patch('builtins.print')
+    @patch('time.sleep')
+    def test_run_stops_when_budget_is_exhausted(self, mock_sleep, mock_print):
+        budget = RetryBudget(ratio=0, min_per_second=0, max_balance=1)
+        policy = RetryPolicy('openai', max_attempts=5, budget=budget)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise ConnectionError("reset")
+
+        with self.assertRaises(ConnectionError):
+            policy.run(operation, lambda e: True)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(policy.stats()['budget'], {'balance': 0, 'exhausted': 1})
+        mock_print.assert_called_with("[RETRY] openai: orçamento de retentativas esgotado")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import SemanticCacheService, SkillVectorizer
+
+
+class TestSkillVectorizer(unittest.TestCase):
+
+    def setUp(self):
+        self.vectorizer = SkillVectorizer()
+
+    def test_vector_is_normalized_and_canonical(self):
+        vector = self.vectorizer.vectorize(["Python", " flask ", "PYTHON"])
+
+        self.assertAlmostEqual(SkillVectorizer.cosine(vector, vector), 1.0)
+        self.assertEqual(vector, self.vectorizer.vectorize(["flask", "python"]))
+
+    def test_empty_skills_give_empty_vector(self):
+        self.assertEqual(self.vectorizer.vectorize([]), {})
+        self.assertEqual(self.vectorizer.vectorize(["", "  "]), {})
+
+    def test_similarity_orders_profiles(self):
+        base = self.vectorizer.vectorize(["Python", "Flask", "Docker"])
+        superset = self.vectorizer.vectorize(["python", "flask", "docker", "git"])
+        partial = self.vectorizer.vectorize(["Python", "Django"])
+        unrelated = self.vectorizer.vectorize(["Excel", "Vendas"])
+
+        self.assertGreater(SkillVectorizer.cosine(base, superset), 0.85)
+        self.assertGreater(SkillVectorizer.cosine(base, superset), SkillVectorizer.cosine(base, partial))
+        self.assertAlmostEqual(SkillVectorizer.cosine(base, unrelated), 0.0)
+
+    def test_trigrams_relate_skill_variants(self):
+        postgres = self.vectorizer.vectorize(["postgres"])
+
+        self.assertGreater(SkillVectorizer.cosine(postgres, self.vectorizer.vectorize(["postgresql"])), 0.0)
+        self.assertLess(SkillVectorizer.cosine(postgres, self.vectorizer.vectorize(["postgresql"])), 0.5)
+
+
+@patch('builtins.print')
+class TestSemanticCacheService(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = SemanticCacheService(threshold=0.85, max_descriptions=2, max_profiles=2, ttl=60)
+
+    def test_serves_similar_profile_for_same_scope(self, mock_print):
+        self.cache.set("vaga", ["Python", "Flask", "Docker"], "Match de 80%")
+
+        self.assertEqual(self.cache.get("vaga", ["python", "flask", "docker", "git"]), "Match de 80%")
+        self.assertIsNone(self.cache.get("outra", ["python", "flask", "docker", "git"]))
+        self.assertIsNone(self.cache.get("vaga", ["Java", "Spring"]))
+
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+        self.assertAlmostEqual(stats['reuse_rate'], 0.3333)
+        self.assertGreater(stats['mean_similarity'], 0.85)
+        self.assertEqual(stats['min_similarity'], stats['mean_similarity'])
+        self.assertTrue(mock_print.call_args[0][0].startswith("[SEMANTIC_CACHE] Análise reaproveitada"))
+
+    def test_picks_nearest_profile(self, mock_print):
+        cache = SemanticCacheService(threshold=0.5)
+        cache.set("vaga", ["Python", "Flask"], "Flask")
+        cache.set("vaga", ["Python", "Django"], "Django")
+
+        self.assertEqual(cache.get("vaga", ["python", "django", "git"]), "Django")
+
+    def test_threshold_controls_reuse(self, mock_print):
+        strict = SemanticCacheService(threshold=0.95)
+        strict.set("vaga", ["Python", "Flask", "Docker"], "Match")
+
+        self.assertIsNone(strict.get("vaga", ["python", "flask", "docker", "git"]))
+        self.assertEqual(strict.get("vaga", ["docker", "FLASK", "python"]), "Match")
+
+    def test_ignores_empty_profiles_and_answers(self, mock_print):
+        self.cache.set("vaga", [], "Match")
+        self.cache.set("vaga", ["Python"], "")
+
+        self.assertIsNone(self.cache.get("vaga", []))
+        self.assertEqual(self.cache.stats()['profiles'], 0)
+        self.assertEqual(self.cache.stats()['misses'], 0)
+
+    def test_limits_profiles_and_descriptions(self, mock_print):
+        self.cache.set("a", ["Python"], "1")
+        self.cache.set("a", ["python"], "1b")
+        self.cache.set("a", ["Java"], "2")
+        self.cache.set("a", ["Go"], "3")
+
+        self.assertEqual(self.cache.stats()['profiles'], 2)
+        self.assertIsNone(self.cache.get("a", ["Python"]))
+
+        self.cache.set("b", ["Python"], "4")
+        self.cache.set("c", ["Python"], "5")
+
+        self.assertIsNone(self.cache.get("a", ["Go"]))
+        self.assertEqual(self.cache.stats()['descriptions'], 2)
+        self.assertEqual(self.cache.stats()['evictions'], 3)
+
+    @patch('services.semantic_cache_service.time.time')
+    def test_expired_profiles_are_evicted(self, mock_time, mock_print):
+        mock_time.return_value = 1000
+        self.cache.set("vaga", ["Python"], "Match")
+
+        mock_time.return_value = 1060
+
+        self.assertIsNone(self.cache.get("vaga", ["Python"]))
+        self.assertEqual(self.cache.stats()['descriptions'], 0)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_clear(self, mock_print):
+        self.cache.set("vaga", ["Python"], "Match")
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("vaga", ["Python"]))
+        self.assertEqual(self.cache.stats()['min_similarity'], None)
+
+
+if __name__ == '__main__':
+    unittest.main()
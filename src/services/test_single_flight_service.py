@@ -0,0 +1,105 @@
+import threading
+import time
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import SingleFlightService
+
+
+class TestSingleFlightService(unittest.TestCase):
+
+    def setUp(self):
+        self.flight = SingleFlightService()
+
+    def _run_concurrently(self, count, target):
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def test_do_returns_result(self):
+        self.assertEqual(self.flight.do('key', lambda a, b: a + b, 1, b=2), 3)
+        self.assertEqual(self.flight.stats(), {'in_flight': 0, 'executions': 1, 'coalesced': 0})
+
+    def test_sequential_calls_are_not_coalesced(self):
+        self.flight.do('key', lambda: 1)
+        self.flight.do('key', lambda: 2)
+
+        self.assertEqual(self.flight.executions, 2)
+        self.assertEqual(self.flight.coalesced, 0)
+
+    def test_concurrent_calls_share_one_execution(self):
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def slow_call():
+            calls.append(1)
+            release.wait(5)
+            return "resultado"
+
+        threads = self._run_concurrently(5, lambda: results.append(self.flight.do('key', slow_call)))
+        while self.flight.executions + self.flight.coalesced < 5:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["resultado"] * 5)
+        self.assertEqual(self.flight.stats(), {'in_flight': 0, 'executions': 1, 'coalesced': 4})
+
+    def test_concurrent_calls_share_exception(self):
+        release = threading.Event()
+        errors = []
+
+        def failing_call():
+            release.wait(5)
+            raise ValueError("falhou")
+
+        def worker():
+            try:
+                self.flight.do('key', failing_call)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = self._run_concurrently(3, worker)
+        while self.flight.executions + self.flight.coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(len({id(error) for error in errors}), 1)
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def test_different_keys_run_independently(self):
+        release = threading.Event()
+        calls = []
+
+        def slow_call(value):
+            calls.append(value)
+            release.wait(5)
+            return value
+
+        threads = [
+            threading.Thread(target=self.flight.do, args=(key, slow_call, key))
+            for key in ('a', 'b')
+        ]
+        for thread in threads:
+            thread.start()
+        while self.flight.executions < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(calls), ['a', 'b'])
+        self.assertEqual(self.flight.coalesced, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
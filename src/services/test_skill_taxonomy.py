@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services import SkillTaxonomy
+
+
+class TestSkillTaxonomy(unittest.TestCase):
+
+    SKILLS = {
+        'JavaScript': ['js', 'ecmascript'],
+        'Java': [],
+        'Node.js': ['node', 'nodejs'],
+        'C++': ['cpp'],
+        'C#': ['csharp'],
+        'Machine Learning': ['ml', 'aprendizado de máquina'],
+        'React Native': ['react-native']
+    }
+
+    def setUp(self):
+        self.taxonomy = SkillTaxonomy.compile(self.SKILLS)
+
+    def test_normalize_folds_case_accents_and_separators(self):
+        self.assertEqual(SkillTaxonomy.normalize("  Aprendizado  de MÁQUINA "), "aprendizado de maquina")
+        self.assertEqual(SkillTaxonomy.normalize("React-Native\tscikit_learn"), "react native scikit learn")
+
+    def test_mentions_finds_aliases_in_one_pass(self):
+        text = "Vaga para Node com JS (ECMAScript), C++/C# e aprendizado de máquina; React-Native é diferencial"
+
+        self.assertEqual(
+            self.taxonomy.mentions(text),
+            {'Node.js', 'JavaScript', 'C++', 'C#', 'Machine Learning', 'React Native'}
+        )
+
+    def test_mentions_respects_word_boundaries(self):
+        self.assertEqual(self.taxonomy.mentions("JavaScript, Nodemon, C, HTML"), {'JavaScript'})
+        self.assertEqual(self.taxonomy.mentions("java."), {'Java'})
+        self.assertEqual(self.taxonomy.mentions(""), set())
+
+    def test_matches_reports_overlapping_patterns(self):
+        taxonomy = SkillTaxonomy.compile({'SQL': [], 'SQL Server': ['mssql'], 'Server': []})
+
+        self.assertEqual(
+            [skill for _, _, skill in taxonomy.matches("sql server")],
+            ['SQL', 'SQL Server', 'Server']
+        )
+
+    def test_short_and_common_word_aliases_need_their_spelling(self):
+        taxonomy = SkillTaxonomy.compile({'C': [], 'Go': ['golang'], 'UI': [], 'Inteligência Artificial': ['ia'],
+                                          'Node.js': ['node']})
+
+        self.assertEqual(taxonomy.mentions("Reporting to C-level executives, you will go above and beyond"), set())
+        self.assertEqual(taxonomy.mentions("Objective-C, a node in the graph, ui tweaks and a dia de folga"), set())
+        self.assertEqual(
+            taxonomy.mentions("Experiência com C, Go (golang), UI, IA e Node"),
+            {'C', 'Go', 'UI', 'Inteligência Artificial', 'Node.js'}
+        )
+
+    def test_canonical_and_normalize_skills(self):
+        self.assertEqual(self.taxonomy.canonical("NODEJS"), 'Node.js')
+        self.assertIsNone(self.taxonomy.canonical("Flask"))
+        self.assertEqual(
+            self.taxonomy.normalize_skills(["js", "JavaScript", "flask", "Flask", " ", "ML"]),
+            ['JavaScript', 'flask', 'Machine Learning']
+        )
+
+    def test_bundled_taxonomy_keeps_distinct_skills_apart(self):
+        self.assertEqual(
+            SkillTaxonomy.default().normalize_skills(['DRF', 'Django', 'ELK', 'ELT', 'ES6', 'ml']),
+            ['DRF', 'Django', 'ELK', 'ELT', 'ES6', 'Machine Learning']
+        )
+
+    def test_first_skill_keeps_duplicate_alias(self):
+        taxonomy = SkillTaxonomy.compile({'Go': ['golang'], 'Golang Tools': ['golang']})
+
+        self.assertEqual(taxonomy.canonical("golang"), 'Go')
+
+    def test_encode_decode_roundtrip(self):
+        decoded = SkillTaxonomy.decode(self.taxonomy.encode())
+
+        self.assertEqual(decoded.skills, self.taxonomy.skills)
+        self.assertEqual(decoded.patterns, self.taxonomy.patterns)
+        self.assertEqual(decoded.mentions("Node, cpp e ML"), {'Node.js', 'C++', 'Machine Learning'})
+        self.assertEqual(decoded.stats()['loaded_from'], 'compiled')
+
+    def test_decode_rejects_invalid_data(self):
+        with self.assertRaises(ValueError):
+            SkillTaxonomy.decode(b'XXXX' + self.taxonomy.encode()[4:])
+        with self.assertRaises(ValueError):
+            SkillTaxonomy.decode(self.taxonomy.encode()[:SkillTaxonomy.HEADER.size + 8])
+
+    @patch('builtins.print')
+    def test_load_compiles_once_and_recompiles_when_source_changes(self, mock_print):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_path = os.path.join(tmp_dir, 'taxonomy.json')
+            compiled_path = os.path.join(tmp_dir, 'compiled', 'taxonomy.bin')
+            with open(source_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'skills': {'Kubernetes': ['k8s']}}, f)
+
+            self.assertEqual(SkillTaxonomy.load(source_path, compiled_path).loaded_from, 'source')
+            cached = SkillTaxonomy.load(source_path, compiled_path)
+            self.assertEqual((cached.loaded_from, cached.mentions("k8s")), ('compiled', {'Kubernetes'}))
+
+            with open(source_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'skills': {'Docker': []}}, f)
+            reloaded = SkillTaxonomy.load(source_path, compiled_path)
+            self.assertEqual((reloaded.loaded_from, reloaded.skills), ('source', ['Docker']))
+
+            with open(compiled_path, 'wb') as f:
+                f.write(b'corrompido')
+            self.assertEqual(SkillTaxonomy.load(source_path, compiled_path).loaded_from, 'source')
+            mock_print.assert_called_once()
+
+    def test_default_uses_bundled_taxonomy(self):
+        taxonomy = SkillTaxonomy.default()
+
+        self.assertIs(SkillTaxonomy.default(), taxonomy)
+        self.assertEqual(taxonomy.canonical("k8s"), 'Kubernetes')
+        self.assertEqual(taxonomy.canonical("postgres"), 'PostgreSQL')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.services import WebScrapingService
+from src.services import WebScrapingService, FetchedDescription, PageCacheService, CachedPage, MetricsService, RetryPolicy, HedgedRequestService, CircuitBreakerRegistry, CircuitOpenError
+from src.utils import normalize_url
 
 
 class TestWebScrapingService(unittest.TestCase):
@@ -22,6 +23,20 @@ class TestWebScrapingService(unittest.TestCase):
         service = WebScrapingService(timeout=5)
         self.assertEqual(service.timeout, 5)
 
+    def test_init_without_session_uses_requests_module(self):
+        self.assertIsNone(self.service.session)
+        self.assertIs(self.service._http(), requests)
+
+    def test_fetch_page_content_uses_session(self):
+        mock_session = Mock()
+        mock_session.get.return_value.content = b"content"
+        service = WebScrapingService(session=mock_session)
+
+        result = service.fetch_page_content("https://example.com")
+
+        self.assertEqual(result, b"content")
+        mock_session.get.assert_called_once_with("https://example.com", timeout=10)
+
     @patch('services.web_scraping_service.requests.get')
     def test_fetch_page_content_success(self, mock_get):
         mock_response = Mock()
@@ -198,5 +213,482 @@ class TestWebScrapingService(unittest.TestCase):
         self.assertEqual(result, "   ")
 
 
+class TestWebScrapingServiceWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = PageCacheService(ttl=60)
+        self.service = WebScrapingService(cache=self.cache)
+
+    def _mock_response(self, status_code=200, content=b"<html></html>", headers=None):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.content = content
+        mock_response.headers = headers or {}
+        mock_response.raise_for_status.return_value = None
+        return mock_response
+
+    def test_init_with_cache(self):
+        self.assertIs(self.service.cache, self.cache)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_page_content_caches_by_normalized_url(self, mock_get):
+        mock_get.return_value = self._mock_response(content=b"page")
+
+        first = self.service.fetch_page_content("https://Example.com/job?b=2&a=1#apply")
+        second = self.service.fetch_page_content("https://example.com/job?a=1&b=2")
+
+        self.assertEqual(first, b"page")
+        self.assertEqual(second, b"page")
+        mock_get.assert_called_once_with("https://Example.com/job?b=2&a=1#apply", timeout=10, headers={})
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_page_content_conditional_get_not_modified(self, mock_get):
+        self.cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=b"cached", etag='"v1"',
+            last_modified="Wed, 21 Oct 2026 07:28:00 GMT", stored_at=0
+        ))
+        mock_get.return_value = self._mock_response(status_code=304, content=b"")
+
+        result = self.service.fetch_page_content("https://example.com/job")
+
+        self.assertEqual(result, b"cached")
+        mock_get.assert_called_once_with("https://example.com/job", timeout=10, headers={
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': "Wed, 21 Oct 2026 07:28:00 GMT"
+        })
+        self.assertEqual(self.cache.stats()['revalidations'], 1)
+        self.assertTrue(self.cache.get("https://example.com/job").is_fresh(60))
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_page_content_conditional_get_modified(self, mock_get):
+        self.cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=b"old", etag='"v1"', stored_at=0
+        ))
+        mock_get.return_value = self._mock_response(content=b"new", headers={'ETag': '"v2"'})
+
+        result = self.service.fetch_page_content("https://example.com/job")
+
+        self.assertEqual(result, b"new")
+        entry = self.cache.get("https://example.com/job")
+        self.assertEqual(entry.content, b"new")
+        self.assertEqual(entry.etag, '"v2"')
+
+    @patch('services.web_scraping_service.requests.get')
+    @patch('builtins.print')
+    def test_fetch_page_content_http_error_is_not_cached(self, mock_print, mock_get):
+        mock_response = self._mock_response(status_code=500)
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.service.fetch_page_content("https://example.com/job")
+
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+class TestWebScrapingServiceStreaming(unittest.TestCase):
+
+    HEAD = b'<html><head><meta name="description" content="Vaga Python"></head>'
+
+    def _stream_response(self, chunks, status_code=200, headers=None):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.headers = headers or {}
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_content.return_value = iter(chunks)
+        return mock_response
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_meta_description_stops_reading_after_head(self, mock_get):
+        body_chunks = [b"<body>" + b"x" * 100 for _ in range(3)]
+        mock_response = self._stream_response([self.HEAD] + body_chunks)
+        mock_get.return_value = mock_response
+
+        result = WebScrapingService().fetch_meta_description("https://example.com/job")
+
+        self.assertEqual(result, "Vaga Python")
+        mock_get.assert_called_once_with("https://example.com/job", timeout=10, headers={}, stream=True)
+        mock_response.iter_content.assert_called_once_with(WebScrapingService.STREAM_CHUNK_SIZE)
+        mock_response.close.assert_called_once()
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_meta_description_not_found(self, mock_get):
+        mock_get.return_value = self._stream_response([b"<html><head><title>t</title></head><body>"])
+
+        self.assertIsNone(WebScrapingService().fetch_meta_description("https://example.com/job"))
+
+    @patch('services.web_scraping_service.requests.get')
+    @patch('builtins.print')
+    def test_fetch_meta_description_http_error(self, mock_print, mock_get):
+        mock_response = self._stream_response([])
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            WebScrapingService().fetch_meta_description("https://example.com/job")
+
+        mock_response.close.assert_called_once()
+        mock_print.assert_called_with("[WEB_SCRAPING] ERRO HTTP: 404 Not Found")
+
+    @patch('services.web_scraping_service.requests.get')
+    @patch('builtins.print')
+    def test_fetch_meta_description_timeout(self, mock_print, mock_get):
+        mock_get.side_effect = requests.exceptions.Timeout("Timeout")
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            WebScrapingService().fetch_meta_description("https://example.com/job")
+
+        mock_print.assert_called_with("[WEB_SCRAPING] ERRO: Timeout após 10s")
+
+    @patch('services.web_scraping_service.requests.get')
+    @patch('builtins.print')
+    def test_fetch_meta_description_request_exception(self, mock_print, mock_get):
+        mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with self.assertRaises(requests.exceptions.RequestException):
+            WebScrapingService().fetch_meta_description("https://example.com/job")
+
+        mock_print.assert_called_with("[WEB_SCRAPING] ERRO de requisição: Connection failed")
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_meta_description_caches_partial_page(self, mock_get):
+        cache = PageCacheService(ttl=60)
+        service = WebScrapingService(cache=cache)
+        mock_get.return_value = self._stream_response(
+            [self.HEAD, b"<body>rest"], headers={'ETag': '"v1"', 'Content-Type': 'text/html; charset=utf-8'}
+        )
+
+        first = service.fetch_meta_description("https://example.com/job")
+        second = service.fetch_meta_description("https://example.com/job")
+
+        self.assertEqual(first, "Vaga Python")
+        self.assertEqual(second, "Vaga Python")
+        mock_get.assert_called_once()
+        entry = cache.get("https://example.com/job")
+        self.assertEqual(entry.content, self.HEAD)
+        self.assertFalse(entry.complete)
+        self.assertEqual(entry.encoding, 'utf-8')
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_meta_description_revalidates_stale_entry(self, mock_get):
+        cache = PageCacheService(ttl=60)
+        cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=self.HEAD, etag='"v1"', stored_at=0, complete=False
+        ))
+        mock_response = self._stream_response([], status_code=304)
+        mock_get.return_value = mock_response
+
+        result = WebScrapingService(cache=cache).fetch_meta_description("https://example.com/job")
+
+        self.assertEqual(result, "Vaga Python")
+        mock_get.assert_called_once_with("https://example.com/job", timeout=10,
+                                         headers={'If-None-Match': '"v1"'}, stream=True)
+        mock_response.close.assert_called_once()
+        self.assertEqual(cache.stats()['revalidations'], 1)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_page_content_ignores_partial_entry(self, mock_get):
+        cache = PageCacheService(ttl=60)
+        cache.set("https://example.com/job", CachedPage(
+            url="https://example.com/job", content=self.HEAD, etag='"v1"', complete=False
+        ))
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"full page"
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        result = WebScrapingService(cache=cache).fetch_page_content("https://example.com/job")
+
+        self.assertEqual(result, b"full page")
+        mock_get.assert_called_once_with("https://example.com/job", timeout=10, headers={})
+        self.assertTrue(cache.get("https://example.com/job").complete)
+
+    def test_extract_meta_description_streaming(self):
+        html = b'<html><head><meta name="description" content="Vaga"></head><body>' + b"x" * 50000
+
+        self.assertEqual(WebScrapingService.extract_meta_description_streaming(html), "Vaga")
+        self.assertIsNone(WebScrapingService.extract_meta_description_streaming(b""))
+
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_meta_description_records_stage_metrics(self, mock_get):
+        mock_get.return_value = self._stream_response([self.HEAD])
+        metrics = MetricsService()
+
+        WebScrapingService(metrics=metrics).fetch_meta_description("https://example.com/job")
+
+        durations = metrics.stage_duration.snapshot()
+        self.assertEqual(durations[('fetch',)][2], 1)
+        self.assertEqual(durations[('extract',)][2], 1)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_cached_meta_description_records_extract_only(self, mock_get):
+        mock_get.return_value = self._stream_response([self.HEAD], headers={'ETag': '"v1"'})
+        metrics = MetricsService()
+        service = WebScrapingService(cache=PageCacheService(), metrics=metrics)
+
+        service.fetch_meta_description("https://example.com/job")
+        service.fetch_meta_description("https://example.com/job")
+
+        durations = metrics.stage_duration.snapshot()
+        self.assertEqual(durations[('fetch',)][2], 1)
+        self.assertEqual(durations[('extract',)][2], 2)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_description_returns_validators(self, mock_get):
+        mock_get.return_value = self._stream_response([self.HEAD], headers={'ETag': '"v1"', 'Last-Modified': 'Mon'})
+
+        result = WebScrapingService().fetch_description("https://example.com/job")
+
+        self.assertEqual(result, FetchedDescription("Vaga Python", '"v1"', 'Mon'))
+        mock_get.assert_called_once_with("https://example.com/job", timeout=10, headers={}, stream=True)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_description_sends_conditional_headers(self, mock_get):
+        mock_response = self._stream_response([], status_code=304)
+        mock_get.return_value = mock_response
+
+        result = WebScrapingService().fetch_description("https://example.com/job", '"v1"', 'Mon')
+
+        self.assertIsNone(result)
+        mock_get.assert_called_once_with(
+            "https://example.com/job", timeout=10,
+            headers={'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon'}, stream=True
+        )
+        mock_response.close.assert_called_once()
+
+    @patch('services.web_scraping_service.requests.get')
+    @patch('builtins.print')
+    def test_fetch_description_errors(self, mock_print, mock_get):
+        errors = [
+            (requests.exceptions.Timeout("t"), "[WEB_SCRAPING] ERRO: Timeout após 10s"),
+            (requests.exceptions.HTTPError("404"), "[WEB_SCRAPING] ERRO HTTP: 404"),
+            (requests.exceptions.ConnectionError("down"), "[WEB_SCRAPING] ERRO de requisição: down")
+        ]
+        for error, message in errors:
+            mock_get.side_effect = error
+
+            with self.assertRaises(type(error)):
+                WebScrapingService().fetch_description("https://example.com/job")
+
+            mock_print.assert_called_with(message)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_revalidated_meta_description_records_fetch_and_extract(self, mock_get):
+        metrics = MetricsService()
+        cache = PageCacheService(ttl=0)
+        cache.set(normalize_url("https://example.com/job"), CachedPage(url="https://example.com/job", content=self.HEAD, etag='"v1"'))
+        mock_get.return_value = self._stream_response([], status_code=304)
+
+        result = WebScrapingService(cache=cache, metrics=metrics).fetch_meta_description("https://example.com/job")
+
+        durations = metrics.stage_duration.snapshot()
+        self.assertEqual(result, "Vaga Python")
+        self.assertEqual(durations[('fetch',)][2], 1)
+        self.assertEqual(durations[('extract',)][2], 1)
+
+
+class TestWebScrapingServiceParserBackends(unittest.TestCase):
+
+    HEAD = b'<html><head><script>var a = "<meta name=description content=x>";</script><meta content="Vaga" name="description"></head>'
+
+    def _stream_response(self, chunks, headers=None):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = headers or {}
+        mock_response.iter_content.return_value = iter(chunks)
+        return mock_response
+
+    def test_init_resolves_backend(self):
+        self.assertEqual(WebScrapingService().parser_backend, 'html.parser')
+        self.assertEqual(WebScrapingService(parser_backend=None).parser_backend, 'html.parser')
+        self.assertEqual(WebScrapingService(parser_backend='regex').parser_backend, 'regex')
+        with self.assertRaises(ValueError):
+            WebScrapingService(parser_backend='selectolax')
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_fetch_meta_description_with_regex_backend(self, mock_get):
+        mock_get.return_value = self._stream_response([self.HEAD, b'<body>' + b'x' * 100])
+        metrics = MetricsService()
+
+        result = WebScrapingService(metrics=metrics, parser_backend='regex').fetch_meta_description("https://example.com/job")
+
+        self.assertEqual(result, "Vaga")
+        self.assertEqual(metrics.parser_fallbacks.snapshot(), {})
+        self.assertEqual(metrics.stage_duration.snapshot()[('extract',)][2], 1)
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_inconclusive_fast_path_falls_back_and_is_counted(self, mock_get):
+        mock_get.return_value = self._stream_response([b'<meta name="description" content="Truncada'])
+        metrics = MetricsService()
+
+        result = WebScrapingService(metrics=metrics, parser_backend='regex').fetch_meta_description("https://example.com/job")
+
+        self.assertIsNone(result)
+        self.assertEqual(metrics.parser_fallbacks.snapshot(), {('regex',): 1})
+
+    @patch('services.web_scraping_service.requests.get')
+    def test_job_posting_description_is_preferred_and_counted(self, mock_get):
+        mock_get.return_value = self._stream_response([
+            self.HEAD,
+            b'<body><script type="application/ld+json">{"@type": "JobPosting", "description": "Completa"}</script>'
+        ])
+        metrics = MetricsService()
+        service = WebScrapingService(metrics=metrics, structured_data_max_bytes=64 * 1024)
+
+        self.assertEqual(service.fetch_meta_description("https://example.com/job"), "Completa")
+        self.assertEqual(metrics.description_sources.snapshot(), {('json-ld',): 1})
+
+    def test_cached_page_uses_backend_and_counts_fallback(self):
+        metrics = MetricsService()
+        cache = PageCacheService(ttl=60)
+        cache.set(normalize_url("https://example.com/job"), CachedPage(
+            url="https://example.com/job", content=b'<meta name="description" content="Cache', complete=False
+        ))
+        service = WebScrapingService(cache=cache, metrics=metrics, parser_backend='regex')
+
+        self.assertIsNone(service.fetch_meta_description("https://example.com/job"))
+        self.assertEqual(metrics.parser_fallbacks.snapshot(), {('regex',): 1})
+
+    def test_extract_meta_description_with_fast_backend(self):
+        service = WebScrapingService(parser_backend='regex')
+
+        self.assertEqual(service.extract_meta_description(self.HEAD.decode()), "Vaga")
+        self.assertEqual(service.extract_meta_description(
+            '<html><head></head><body><meta name="description" content="No body"></body></html>'
+        ), "No body")
+
+    def test_extract_meta_description_streaming_backend(self):
+        self.assertEqual(WebScrapingService.extract_meta_description_streaming(self.HEAD, backend='regex'), "Vaga")
+
+
+class TestWebScrapingServiceResilience(unittest.TestCase):
+
+    HEAD = b'<html><head><meta name="description" content="Vaga Python"></head>'
+
+    def _response(self, status_code=200, chunks=None):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.headers = {}
+        mock_response.content = self.HEAD
+        mock_response.iter_content.return_value = iter(chunks or [self.HEAD])
+        if status_code >= 400:
+            error_response = Mock(status_code=status_code)
+            mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code}", response=error_response)
+        return mock_response
+
+    @patch('builtins.print')
+    def test_fetch_meta_description_retries_transient_errors(self, mock_print):
+        session = Mock()
+        session.get.side_effect = [self._response(502), requests.exceptions.ConnectionError("reset"), self._response()]
+        service = WebScrapingService(session=session, retry_policy=RetryPolicy('scrape', max_attempts=3, base_delay=0))
+
+        self.assertEqual(service.fetch_meta_description("https://example.com/job"), "Vaga Python")
+        self.assertEqual(session.get.call_count, 3)
+
+    @patch('builtins.print')
+    def test_fetch_meta_description_does_not_retry_not_found(self, mock_print):
+        session = Mock()
+        session.get.return_value = self._response(404)
+        service = WebScrapingService(session=session, retry_policy=RetryPolicy('scrape', max_attempts=3, base_delay=0))
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            service.fetch_meta_description("https://example.com/job")
+
+        session.get.assert_called_once()
+
+    @patch('builtins.print')
+    def test_fetch_page_content_does_not_retry_read_timeout(self, mock_print):
+        session = Mock()
+        session.get.side_effect = [requests.exceptions.ReadTimeout("slow"), self._response()]
+        service = WebScrapingService(session=session, retry_policy=RetryPolicy('scrape', max_attempts=3, base_delay=0))
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            service.fetch_page_content("https://example.com/job")
+
+        session.get.assert_called_once()
+
+    @patch('builtins.print')
+    def test_fetch_page_content_retries_with_and_without_cache(self, mock_print):
+        session = Mock()
+        session.get.side_effect = [requests.exceptions.ConnectTimeout("slow"), self._response()] * 2
+        policy = RetryPolicy('scrape', max_attempts=2, base_delay=0)
+
+        self.assertEqual(WebScrapingService(session=session, retry_policy=policy).fetch_page_content("https://example.com/a"), self.HEAD)
+        cached_service = WebScrapingService(session=session, retry_policy=policy, cache=PageCacheService())
+        self.assertEqual(cached_service.fetch_page_content("https://example.com/b"), self.HEAD)
+        self.assertEqual(session.get.call_count, 4)
+
+    @patch('builtins.print')
+    def test_open_host_circuit_fails_fast(self, mock_print):
+        session = Mock()
+        session.get.side_effect = requests.exceptions.ConnectTimeout("timeout")
+        breakers = CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=60)
+        service = WebScrapingService(session=session, circuit_breakers=breakers)
+
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.Timeout):
+                service.fetch_meta_description("https://down.example.com/job/1")
+
+        with self.assertRaises(CircuitOpenError):
+            service.fetch_meta_description("https://down.example.com/job/2")
+        with self.assertRaises(CircuitOpenError):
+            service.fetch_page_content("https://down.example.com/job/3")
+
+        self.assertEqual(session.get.call_count, 2)
+        session.get.side_effect = None
+        session.get.return_value = self._response()
+        self.assertEqual(service.fetch_meta_description("https://up.example.com/job"), "Vaga Python")
+
+    @patch('builtins.print')
+    def test_client_errors_do_not_open_host_circuit(self, mock_print):
+        session = Mock()
+        session.get.return_value = self._response(404)
+        breakers = CircuitBreakerRegistry(failure_threshold=1)
+        service = WebScrapingService(session=session, circuit_breakers=breakers)
+
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.HTTPError):
+                service.fetch_meta_description("https://jobs.example.com/missing")
+
+        self.assertEqual(breakers.open_count(), 0)
+
+    def test_fetch_meta_description_runs_through_hedging(self):
+        session = Mock()
+        session.get.return_value = self._response()
+        hedging = HedgedRequestService(initial_delay=1)
+        service = WebScrapingService(session=session, hedging=hedging)
+
+        self.assertEqual(service.fetch_meta_description("https://example.com/job"), "Vaga Python")
+        self.assertEqual(hedging.stats()['samples'], 1)
+
+
+    def test_from_config_builds_resilient_scraper(self):
+        config = {'REQUEST_TIMEOUT': 3, 'SCRAPE_RETRY_MAX_ATTEMPTS': 2, 'SCRAPE_HEDGE_ENABLED': True,
+                  'CIRCUIT_BREAKER_ENABLED': True, 'STRUCTURED_DATA_ENABLED': True}
+        cache = PageCacheService()
+
+        service = WebScrapingService.from_config(config, cache=cache)
+
+        self.assertEqual(service.timeout, 3)
+        self.assertIs(service.cache, cache)
+        self.assertEqual(service.retry_policy.name, 'scrape')
+        self.assertEqual(service.retry_policy.retry_statuses, frozenset(WebScrapingService.RETRY_STATUSES))
+        self.assertIsInstance(service.hedging, HedgedRequestService)
+        self.assertIsInstance(service.circuit_breakers, CircuitBreakerRegistry)
+        self.assertEqual(service.structured_data_max_bytes, 256 * 1024)
+        self.assertIsNotNone(service.session)
+
+    def test_from_config_without_resilience(self):
+        session = Mock()
+        service = WebScrapingService.from_config({'SCRAPE_RETRY_MAX_ATTEMPTS': 3, 'CIRCUIT_BREAKER_ENABLED': True},
+                                                 resilient=False, session=session)
+
+        self.assertIs(service.session, session)
+        self.assertIsNone(service.retry_policy)
+        self.assertIsNone(service.circuit_breakers)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,18 +1,139 @@
+import time
 import requests
-from bs4 import BeautifulSoup
+from dataclasses import dataclass
 from typing import Optional
+from src.utils import HttpSessionUtils, normalize_url
+from .page_cache_service import PageCacheService, CachedPage
+from .metrics_service import MetricsService
+from .meta_description_parser import MetaDescriptionStream
+from .retry_policy_service import RetryBudget, RetryPolicy
+from .hedged_request_service import HedgedRequestService
+from .circuit_breaker_service import CircuitBreaker, CircuitBreakerRegistry
+
+
+@dataclass
+class FetchedDescription:
+    description: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class WebScrapingService:
 
-    def __init__(self, timeout: int = 10):
+    STREAM_CHUNK_SIZE = 16 * 1024
+    RETRY_STATUSES = (502, 503, 504)
+    RETRY_POLICY_CLASS = RetryPolicy
+    HEDGING_CLASS = HedgedRequestService
+    BREAKER_CLASS = CircuitBreaker
+
+    def __init__(self, timeout: int = 10, cache: Optional[PageCacheService] = None,
+                 session: Optional[requests.Session] = None, metrics: Optional[MetricsService] = None,
+                 retry_policy: Optional[RetryPolicy] = None, hedging: Optional[HedgedRequestService] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 parser_backend: str = MetaDescriptionStream.DEFAULT_BACKEND, structured_data_max_bytes: int = 0):
         self.timeout = timeout
+        self.cache = cache
+        self.session = session
+        self.metrics = metrics
+        self.retry_policy = retry_policy
+        self.hedging = hedging
+        self.circuit_breakers = circuit_breakers
+        self.parser_backend = MetaDescriptionStream.resolve_backend(parser_backend)
+        self.structured_data_max_bytes = structured_data_max_bytes
+
+    @classmethod
+    def from_config(cls, config, cache: Optional[PageCacheService] = None, metrics: Optional[MetricsService] = None,
+                    resilient: bool = True, **transport) -> 'WebScrapingService':
+        timeout = config.get('REQUEST_TIMEOUT', 10)
+        resilience = {}
+        if resilient:
+            resilience = {
+                'retry_policy': cls.RETRY_POLICY_CLASS.from_config(config, 'SCRAPE', cls.RETRY_STATUSES),
+                'hedging': cls._hedging_from_config(config),
+                'circuit_breakers': cls._circuit_breakers_from_config(config)
+            }
+        return cls(
+            timeout=timeout,
+            cache=cache,
+            metrics=metrics,
+            parser_backend=config.get('HTML_PARSER_BACKEND'),
+            structured_data_max_bytes=cls._structured_data_from_config(config),
+            **resilience,
+            **(transport or cls._transport_from_config(config, timeout))
+        )
+
+    @staticmethod
+    def _transport_from_config(config, timeout: float) -> dict:
+        return {'session': HttpSessionUtils.create_session_from_config(config)}
+
+    @classmethod
+    def _hedging_from_config(cls, config) -> Optional[HedgedRequestService]:
+        if not config.get('SCRAPE_HEDGE_ENABLED'):
+            return None
+
+        return cls.HEDGING_CLASS(
+            quantile=config.get('SCRAPE_HEDGE_QUANTILE', 0.95),
+            min_delay=config.get('SCRAPE_HEDGE_MIN_DELAY', 0.05),
+            initial_delay=config.get('SCRAPE_HEDGE_INITIAL_DELAY', 1.0),
+            budget=RetryBudget(ratio=config.get('SCRAPE_HEDGE_BUDGET_RATIO', 0.1))
+        )
+
+    @classmethod
+    def _circuit_breakers_from_config(cls, config) -> Optional[CircuitBreakerRegistry]:
+        if not config.get('CIRCUIT_BREAKER_ENABLED'):
+            return None
+
+        return CircuitBreakerRegistry(
+            failure_threshold=config.get('SCRAPE_CIRCUIT_FAILURE_THRESHOLD', 5),
+            recovery_timeout=config.get('SCRAPE_CIRCUIT_RECOVERY_TIMEOUT', 30.0),
+            half_open_max_calls=config.get('SCRAPE_CIRCUIT_HALF_OPEN_MAX_CALLS', 1),
+            max_hosts=config.get('SCRAPE_CIRCUIT_MAX_HOSTS', 1024),
+            breaker_class=cls.BREAKER_CLASS
+        )
+
+    @staticmethod
+    def _structured_data_from_config(config) -> int:
+        if not config.get('STRUCTURED_DATA_ENABLED'):
+            return 0
+        return config.get('STRUCTURED_DATA_MAX_BYTES', 256 * 1024)
+
+    def _http(self):
+        return self.session or requests
+
+    def _resilient(self, url: str, operation):
+        attempt = self._guarded(url, self._hedged(operation))
+        if self.retry_policy is None:
+            return attempt()
+        return self.retry_policy.run(attempt, self._is_retryable)
+
+    def _hedged(self, operation):
+        if self.hedging is None:
+            return operation
+        return lambda: self.hedging.run(operation)
+
+    def _guarded(self, url: str, operation):
+        if self.circuit_breakers is None:
+            return operation
+        breaker = self.circuit_breakers.for_url(url)
+        return lambda: breaker.call(operation, self._is_breaker_failure)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and self.retry_policy.retries_status(error.response.status_code)
+        return isinstance(error, requests.exceptions.ConnectionError)
+
+    @staticmethod
+    def _is_breaker_failure(error: Exception) -> bool:
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and error.response.status_code >= 500
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
 
     def fetch_page_content(self, url: str) -> str:
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.content
+            if self.cache is None:
+                return self._resilient(url, lambda: self._get_content(url))
+
+            return self._fetch_with_cache(url)
 
         except requests.exceptions.Timeout:
             print(f"[WEB_SCRAPING] ERRO: Timeout após {self.timeout}s")
@@ -24,17 +145,197 @@ class WebScrapingService:
             print(f"[WEB_SCRAPING] ERRO de requisição: {e}")
             raise
 
-    def extract_meta_description(self, html_content: str) -> Optional[str]:
+    def _get_content(self, url: str) -> bytes:
+        response = self._http().get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+
+    def _fetch_with_cache(self, url: str) -> bytes:
+        key = normalize_url(url)
+        cached = self.cache.get(key)
+
+        if cached is not None and not cached.complete:
+            cached = None
+
+        if cached is not None and cached.is_fresh(self.cache.ttl):
+            return cached.content
+
+        return self._resilient(url, lambda: self._revalidate_content(url, key, cached))
+
+    def _revalidate_content(self, url: str, key: str, cached: Optional[CachedPage]) -> bytes:
+        headers = cached.conditional_headers() if cached is not None else {}
+        response = self._http().get(url, timeout=self.timeout, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.revalidate(key)
+            return cached.content
+
+        response.raise_for_status()
+        self._store_page(key, url, response.content, response.headers)
+        return response.content
+
+    def fetch_meta_description(self, url: str) -> Optional[str]:
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            meta_description = soup.find('meta', attrs={'name': 'description'})
+            key, cached = self._lookup_cache(url)
 
-            if meta_description:
-                content = meta_description.get('content')
-                if content:
-                    return content
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                return self._extract_cached(cached)
 
-            return None
+            return self._resilient(url, lambda: self._download_description(url, key, cached))
+
+        except requests.exceptions.Timeout:
+            print(f"[WEB_SCRAPING] ERRO: Timeout após {self.timeout}s")
+            raise
+        except requests.exceptions.HTTPError as e:
+            print(f"[WEB_SCRAPING] ERRO HTTP: {e}")
+            raise
+        except requests.exceptions.RequestException as e:
+            print(f"[WEB_SCRAPING] ERRO de requisição: {e}")
+            raise
+
+    def fetch_description(self, url: str, etag: Optional[str] = None,
+                          last_modified: Optional[str] = None) -> Optional[FetchedDescription]:
+        try:
+            headers = self._conditional_headers(etag, last_modified)
+            return self._resilient(url, lambda: self._download_fetched(url, headers))
+
+        except requests.exceptions.Timeout:
+            print(f"[WEB_SCRAPING] ERRO: Timeout após {self.timeout}s")
+            raise
+        except requests.exceptions.HTTPError as e:
+            print(f"[WEB_SCRAPING] ERRO HTTP: {e}")
+            raise
+        except requests.exceptions.RequestException as e:
+            print(f"[WEB_SCRAPING] ERRO de requisição: {e}")
+            raise
+
+    @staticmethod
+    def _conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> dict:
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _download_fetched(self, url: str, headers: dict) -> Optional[FetchedDescription]:
+        started = time.perf_counter()
+        response = self._http().get(url, timeout=self.timeout, headers=headers, stream=True)
+
+        try:
+            if response.status_code == 304:
+                self._observe('fetch', time.perf_counter() - started)
+                return None
+
+            response.raise_for_status()
+
+            stream = self._stream(response.headers)
+            for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                if stream.feed(chunk):
+                    break
+        finally:
+            response.close()
+
+        self._observe_stream(started, stream)
+        return FetchedDescription(stream.description, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+    def _download_description(self, url: str, key: Optional[str], cached: Optional[CachedPage]) -> Optional[str]:
+        started = time.perf_counter()
+        headers = cached.conditional_headers() if cached is not None else {}
+        response = self._http().get(url, timeout=self.timeout, headers=headers, stream=True)
+
+        try:
+            if response.status_code == 304 and cached is not None:
+                self.cache.revalidate(key)
+                self._observe('fetch', time.perf_counter() - started)
+                return self._extract_cached(cached)
+
+            response.raise_for_status()
+
+            stream = self._stream(response.headers)
+            for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                if stream.feed(chunk):
+                    break
+        finally:
+            response.close()
+
+        if key is not None:
+            self._store_page(key, url, stream.consumed, response.headers, complete=not stream.done)
+
+        self._observe_stream(started, stream)
+        return stream.description
+
+    def _stream(self, headers) -> MetaDescriptionStream:
+        return MetaDescriptionStream(MetaDescriptionStream.encoding_from_headers(headers), self.parser_backend,
+                                     self.structured_data_max_bytes)
+
+    def _extract_cached(self, cached: CachedPage) -> Optional[str]:
+        started = time.perf_counter()
+        stream = self.stream_content(cached.content, cached.encoding, self.parser_backend,
+                                     self.structured_data_max_bytes)
+        description = stream.finish()
+        self._observe('extract', time.perf_counter() - started)
+        self._count_stream(stream)
+        return description
+
+    def _observe_stream(self, started: float, stream: MetaDescriptionStream) -> None:
+        stream.finish()
+        self._observe('fetch', time.perf_counter() - started - stream.parse_seconds)
+        self._observe('extract', stream.parse_seconds)
+        self._count_stream(stream)
+
+    def _count_stream(self, stream: MetaDescriptionStream) -> None:
+        if self.metrics is None:
+            return
+        if stream.fell_back:
+            self.metrics.count_parser_fallback(stream.backend)
+        if stream.source is not None:
+            self.metrics.count_description_source(stream.source)
+
+    def _observe(self, stage: str, seconds: float) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_stage(stage, seconds)
+
+    def _lookup_cache(self, url: str):
+        if self.cache is None:
+            return None, None
+
+        key = normalize_url(url)
+        return key, self.cache.get(key)
+
+    def _store_page(self, key: str, url: str, content: bytes, headers, complete: bool = True) -> None:
+        self.cache.set(key, CachedPage(
+            url=url,
+            content=content,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            complete=complete,
+            encoding=MetaDescriptionStream.encoding_from_headers(headers)
+        ))
+
+    @staticmethod
+    def stream_content(html_content: bytes, encoding: Optional[str] = None,
+                       backend: str = MetaDescriptionStream.DEFAULT_BACKEND,
+                       structured_data_max_bytes: int = 0) -> MetaDescriptionStream:
+        stream = MetaDescriptionStream(encoding, backend, structured_data_max_bytes)
+        for start in range(0, len(html_content), WebScrapingService.STREAM_CHUNK_SIZE):
+            if stream.feed(html_content[start:start + WebScrapingService.STREAM_CHUNK_SIZE]):
+                break
+        return stream
+
+    @staticmethod
+    def extract_meta_description_streaming(html_content: bytes, encoding: Optional[str] = None,
+                                           backend: str = MetaDescriptionStream.DEFAULT_BACKEND,
+                                           structured_data_max_bytes: int = 0) -> Optional[str]:
+        return WebScrapingService.stream_content(html_content, encoding, backend, structured_data_max_bytes).finish()
+
+    def extract_meta_description(self, html_content: str) -> Optional[str]:
+        try:
+            description = None
+            if self.parser_backend != MetaDescriptionStream.DEFAULT_BACKEND:
+                description = MetaDescriptionStream.parse_text(html_content, self.parser_backend)
+
+            return description if description is not None else MetaDescriptionStream.soup_description(html_content)
 
         except Exception as e:
             print(f"[META_EXTRACTION] ERRO: {e}")
@@ -1,5 +1,8 @@
 from .logging_utils import LoggingUtils
 from .validation_utils import ValidationUtils
+from .http_session_utils import HttpSessionUtils
+from .sse_utils import SseUtils
+from .sqlite_utils import SqliteUtils, ForkSafeConnection
 
 def setup_logging(log_level: str = 'INFO') -> None:
     return LoggingUtils.setup_logging(log_level)
@@ -7,13 +10,25 @@ def setup_logging(log_level: str = 'INFO') -> None:
 def validate_url(url: str) -> bool:
     return ValidationUtils.validate_url(url)
 
+def normalize_url(url: str) -> str:
+    return ValidationUtils.normalize_url(url)
+
+def is_public_url(url: str) -> bool:
+    return ValidationUtils.is_public_url(url)
+
 def sanitize_input(data):
     return ValidationUtils.sanitize_input(data)
 
 __all__ = [
     'LoggingUtils',
     'ValidationUtils',
+    'HttpSessionUtils',
+    'SseUtils',
+    'SqliteUtils',
+    'ForkSafeConnection',
     'setup_logging',
     'validate_url',
+    'normalize_url',
+    'is_public_url',
     'sanitize_input'
 ]
@@ -0,0 +1,77 @@
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional
+
+
+class HttpSessionUtils:
+
+    @staticmethod
+    def create_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                       max_retries: int = 0, backoff_factor: float = 0.0) -> requests.Session:
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=retry
+        )
+
+        session = requests.Session()
+        session.headers['Connection'] = 'keep-alive'
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def create_session_from_config(config) -> requests.Session:
+        return HttpSessionUtils.create_session(
+            pool_connections=config.get('HTTP_POOL_CONNECTIONS', 10),
+            pool_maxsize=config.get('HTTP_POOL_MAXSIZE', 10),
+            pool_block=config.get('HTTP_POOL_BLOCK', False),
+            max_retries=config.get('HTTP_MAX_RETRIES', 0),
+            backoff_factor=config.get('HTTP_RETRY_BACKOFF', 0.0)
+        )
+
+    @staticmethod
+    def create_async_client_from_config(config, timeout: float, **kwargs) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=config.get('HTTP_POOL_CONNECTIONS', 10) * config.get('HTTP_POOL_MAXSIZE', 10),
+            max_keepalive_connections=config.get('HTTP_POOL_MAXSIZE', 10),
+            keepalive_expiry=config.get('HTTP_KEEPALIVE_EXPIRY', 30.0)
+        )
+        transport = httpx.AsyncHTTPTransport(limits=limits, retries=config.get('HTTP_MAX_RETRIES', 0))
+        return httpx.AsyncClient(timeout=timeout, transport=transport, **kwargs)
+
+    @staticmethod
+    def pool_stats(session: Optional[requests.Session]) -> Optional[dict]:
+        if session is None:
+            return None
+
+        stats = {
+            'hosts': 0,
+            'connections_created': 0,
+            'requests': 0,
+            'idle_connections': 0
+        }
+
+        adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats['hosts'] += 1
+                stats['connections_created'] += pool.num_connections
+                stats['requests'] += pool.num_requests
+                stats['idle_connections'] += sum(conn is not None for conn in pool.pool.queue) if pool.pool is not None else 0
+
+        return stats
@@ -0,0 +1,48 @@
+import os
+import sqlite3
+
+
+class SqliteUtils:
+
+    @staticmethod
+    def connect(path: str, mmap_size: int = 256 * 1024 * 1024, timeout: float = 5.0) -> sqlite3.Connection:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(f'PRAGMA mmap_size={int(mmap_size)}')
+        return connection
+
+
+class ForkSafeConnection:
+
+    def __init__(self, path: str, mmap_size: int = 256 * 1024 * 1024, schema: tuple = ()):
+        self.path = path
+        self.mmap_size = mmap_size
+        self.schema = schema
+        self._connection = None
+        self._pid = None
+        self._inherited = []
+
+    def get(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            self._abandon_inherited()
+            self._connection = SqliteUtils.connect(self.path, self.mmap_size)
+            self._pid = os.getpid()
+            for statement in self.schema:
+                self._connection.execute(statement)
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._abandon_inherited()
+        self._connection = None
+
+    def _abandon_inherited(self) -> None:
+        if self._connection is not None and self._pid != os.getpid():
+            self._inherited.append(self._connection)
+            self._connection = None
@@ -0,0 +1,14 @@
+import json
+
+
+class SseUtils:
+
+    @staticmethod
+    def format_event(event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    @staticmethod
+    def parse_data_line(line: str):
+        if not line or not line.startswith('data:'):
+            return None
+        return line[len('data:'):].strip()
@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import Mock
+import httpx
+import requests
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import HttpSessionUtils
+
+
+class TestHttpSessionUtils(unittest.TestCase):
+
+    def test_create_session_mounts_pooled_adapter(self):
+        session = HttpSessionUtils.create_session(pool_connections=3, pool_maxsize=7, max_retries=2, backoff_factor=0.5)
+
+        adapter = session.get_adapter("https://example.com")
+        self.assertIs(adapter, session.get_adapter("http://example.com"))
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertEqual(adapter.max_retries.backoff_factor, 0.5)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertNotIn('POST', adapter.max_retries.allowed_methods)
+        self.assertEqual(session.headers['Connection'], 'keep-alive')
+
+    def test_create_session_from_config(self):
+        session = HttpSessionUtils.create_session_from_config({'HTTP_POOL_MAXSIZE': 20, 'HTTP_POOL_BLOCK': True})
+
+        adapter = session.get_adapter("https://example.com")
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(adapter.max_retries.total, 0)
+
+    def test_create_async_client_from_config(self):
+        client = HttpSessionUtils.create_async_client_from_config(
+            {'HTTP_POOL_CONNECTIONS': 2, 'HTTP_POOL_MAXSIZE': 5}, 12, follow_redirects=True
+        )
+
+        self.assertIsInstance(client, httpx.AsyncClient)
+        self.assertEqual(client.timeout.connect, 12)
+        self.assertTrue(client.follow_redirects)
+
+    def test_pool_stats_none_session(self):
+        self.assertIsNone(HttpSessionUtils.pool_stats(None))
+
+    def test_pool_stats_empty_session(self):
+        session = HttpSessionUtils.create_session()
+
+        self.assertEqual(HttpSessionUtils.pool_stats(session), {
+            'hosts': 0,
+            'connections_created': 0,
+            'requests': 0,
+            'idle_connections': 0
+        })
+
+    def test_pool_stats_counts_connection_pools(self):
+        session = HttpSessionUtils.create_session()
+        adapter = session.get_adapter("https://example.com")
+        pool = adapter.poolmanager.connection_from_url("https://example.com")
+        pool.num_connections = 2
+        pool.num_requests = 5
+
+        stats = HttpSessionUtils.pool_stats(session)
+
+        self.assertEqual(stats['hosts'], 1)
+        self.assertEqual(stats['connections_created'], 2)
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['idle_connections'], 0)
+
+        pool.pool.queue[-1] = Mock()
+        self.assertEqual(HttpSessionUtils.pool_stats(session)['idle_connections'], 1)
+
+    def test_pool_stats_skips_missing_pool(self):
+        session = requests.Session()
+        adapter = Mock()
+        adapter.poolmanager.pools.keys.return_value = ['key']
+        adapter.poolmanager.pools.get.return_value = None
+        session.adapters = {'https://': adapter}
+
+        self.assertEqual(HttpSessionUtils.pool_stats(session)['hosts'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import SqliteUtils, ForkSafeConnection
+
+
+class TestSqliteUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'nested', 'db.sqlite3')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_connect_enables_wal_and_mmap(self):
+        connection = SqliteUtils.connect(self.path, mmap_size=1024 * 1024)
+
+        self.assertEqual(connection.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        self.assertEqual(connection.execute('PRAGMA mmap_size').fetchone()[0], 1024 * 1024)
+        connection.close()
+
+    def test_fork_safe_connection_applies_schema_once_per_process(self):
+        db = ForkSafeConnection(self.path, schema=('CREATE TABLE IF NOT EXISTS items (id INTEGER)',))
+
+        first = db.get()
+        self.assertIs(db.get(), first)
+        first.execute('INSERT INTO items VALUES (1)')
+
+        with patch('os.getpid', return_value=-1):
+            child = db.get()
+            self.assertIsNot(child, first)
+            self.assertEqual(child.execute('SELECT COUNT(*) FROM items').fetchone()[0], 1)
+            db.close()
+
+        self.assertIsNone(db._connection)
+        self.assertEqual(db._inherited, [first])
+        self.assertEqual(first.execute('SELECT COUNT(*) FROM items').fetchone()[0], 1)
+        first.close()
+
+    def test_inherited_connection_is_kept_open_after_fork(self):
+        db = ForkSafeConnection(self.path)
+        parent = db.get()
+
+        with patch('os.getpid', return_value=-1):
+            db.close()
+
+        self.assertIsNone(db._connection)
+        self.assertEqual(parent.execute('SELECT 1').fetchone()[0], 1)
+        parent.close()
+
+    def test_close_reopens_on_next_use(self):
+        db = ForkSafeConnection(self.path)
+        db.get()
+        db.close()
+
+        self.assertEqual(db.get().execute('SELECT 1').fetchone()[0], 1)
+        db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
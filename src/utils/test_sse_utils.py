@@ -0,0 +1,26 @@
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import SseUtils
+
+
+class TestSseUtils(unittest.TestCase):
+
+    def test_format_event(self):
+        result = SseUtils.format_event('delta', {'delta': 'Análise'})
+        self.assertEqual(result, 'event: delta\ndata: {"delta": "Análise"}\n\n')
+
+    def test_parse_data_line(self):
+        self.assertEqual(SseUtils.parse_data_line('data: {"a": 1}'), '{"a": 1}')
+        self.assertEqual(SseUtils.parse_data_line('data:[DONE]'), '[DONE]')
+
+    def test_parse_data_line_ignores_other_lines(self):
+        self.assertIsNone(SseUtils.parse_data_line(''))
+        self.assertIsNone(SseUtils.parse_data_line(': keep-alive'))
+        self.assertIsNone(SseUtils.parse_data_line('event: message'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import socket
 import unittest
 from unittest.mock import patch
 import sys
@@ -118,6 +119,22 @@ class TestValidationUtils(unittest.TestCase):
         result = ValidationUtils.validate_url("https://example.com")
         self.assertTrue(result)
 
+    def test_normalize_url_lowercases_scheme_and_host(self):
+        result = ValidationUtils.normalize_url("HTTPS://Example.COM/Job/123")
+        self.assertEqual(result, "https://example.com/Job/123")
+
+    def test_normalize_url_removes_default_port_and_fragment(self):
+        result = ValidationUtils.normalize_url("https://example.com:443/job#apply")
+        self.assertEqual(result, "https://example.com/job")
+
+    def test_normalize_url_keeps_custom_port(self):
+        result = ValidationUtils.normalize_url("http://localhost:3000")
+        self.assertEqual(result, "http://localhost:3000/")
+
+    def test_normalize_url_sorts_query_params(self):
+        result = ValidationUtils.normalize_url("https://example.com/job?lang=pt&id=1&empty=")
+        self.assertEqual(result, "https://example.com/job?empty=&id=1&lang=pt")
+
     def test_sanitize_input_simple_dict(self):
         data = {"name": "  John  ", "age": "  25  "}
         result = ValidationUtils.sanitize_input(data)
@@ -340,5 +357,27 @@ class TestValidationUtils(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+    @patch('socket.getaddrinfo', return_value=[(2, 1, 6, '', ('93.184.216.34', 443))])
+    def test_is_public_url_accepts_public_address(self, mock_getaddrinfo):
+        self.assertTrue(ValidationUtils.is_public_url("https://client.example.com/hook"))
+        mock_getaddrinfo.assert_called_once()
+        self.assertEqual(mock_getaddrinfo.call_args[0][:2], ("client.example.com", None))
+
+    def test_is_public_url_rejects_internal_addresses(self):
+        for url in ("http://127.0.0.1/hook", "http://169.254.169.254/latest/meta-data", "http://10.0.0.5:8080/hook",
+                    "http://192.168.1.10/hook", "http://[::1]/hook", "http://[::ffff:127.0.0.1]/hook"):
+            self.assertFalse(ValidationUtils.is_public_url(url), url)
+
+    @patch('socket.getaddrinfo', return_value=[(2, 1, 6, '', ('93.184.216.34', 443)), (2, 1, 6, '', ('10.0.0.5', 443))])
+    def test_is_public_url_rejects_host_with_any_internal_address(self, mock_getaddrinfo):
+        self.assertFalse(ValidationUtils.is_public_url("https://client.example.com/hook"))
+
+    @patch('socket.getaddrinfo', side_effect=socket.gaierror("Name or service not known"))
+    def test_is_public_url_rejects_unresolvable_host(self, mock_getaddrinfo):
+        self.assertFalse(ValidationUtils.is_public_url("https://missing.example.com/hook"))
+
+    def test_is_public_url_rejects_invalid_port(self):
+        self.assertFalse(ValidationUtils.is_public_url("https://client.example.com:99999/hook"))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,6 @@
-from urllib.parse import urlparse
+import ipaddress
+import socket
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from typing import Any, Dict
 
 
@@ -12,6 +14,33 @@ class ValidationUtils:
         except Exception:
             return False
 
+    @staticmethod
+    def is_public_url(url: str) -> bool:
+        try:
+            result = urlparse(url)
+            addresses = socket.getaddrinfo(result.hostname, result.port, proto=socket.IPPROTO_TCP)
+        except (ValueError, UnicodeError, OSError):
+            return False
+
+        return bool(addresses) and all(
+            ipaddress.ip_address(address[4][0].split('%', 1)[0]).is_global for address in addresses
+        )
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        result = urlparse(url.strip())
+        scheme = result.scheme.lower()
+        hostname = (result.hostname or '').lower()
+        default_ports = {'http': 80, 'https': 443}
+
+        netloc = hostname
+        if result.port and result.port != default_ports.get(scheme):
+            netloc = f"{hostname}:{result.port}"
+
+        path = result.path or '/'
+        query = urlencode(sorted(parse_qsl(result.query, keep_blank_values=True)))
+        return urlunparse((scheme, netloc, path, result.params, query, ''))
+
     @staticmethod
     def sanitize_input(data: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(data, dict):